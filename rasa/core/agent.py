@@ -112,7 +112,7 @@ async def _pull_model_and_fingerprint(
 
     logger.debug(f"Requesting model from server {model_server.url}...")
 
-    async with model_server.session() as session:
+    async with model_server.request_session() as session:
         try:
             params = model_server.combine_parameters()
             async with session.request(
@@ -441,6 +441,17 @@ class Agent:
             tracker, verbosity
         )
 
+    @agent_must_be_ready
+    def predict_next_with_trackers(
+        self,
+        trackers: List[DialogueStateTracker],
+        verbosity: EventVerbosity = EventVerbosity.AFTER_RESTART,
+    ) -> List[Optional[Dict[Text, Any]]]:
+        """Predicts the next action for several trackers at once."""
+        return self.processor.predict_next_with_trackers(  # type: ignore[union-attr]
+            trackers, verbosity
+        )
+
     @agent_must_be_ready
     async def log_message(self, message: UserMessage) -> DialogueStateTracker:
         """Append a message to a dialogue - does not predict actions."""
@@ -0,0 +1,115 @@
+import asyncio
+import contextlib
+import logging
+from typing import Callable, Generic, List, Optional, Tuple, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class MicroBatcher(Generic[T, R]):
+    """Processes the items of concurrent callers together in small batches.
+
+    `submit` waits until its item was processed. The first item of a batch waits at
+    most `max_wait_in_seconds` for further items before the batch is processed, or
+    less if `max_batch_size` items are collected earlier. One batch is processed at
+    a time in a worker thread, so that the event loop keeps collecting the items of
+    the next batch meanwhile.
+    """
+
+    def __init__(
+        self,
+        process_batch: Callable[[List[T]], List[R]],
+        max_batch_size: int,
+        max_wait_in_seconds: float,
+    ) -> None:
+        """Creates the batcher.
+
+        Args:
+            process_batch: Function which processes a batch of items. It has to
+                return one result per item in the order of the items.
+            max_batch_size: Maximum number of items which are processed at once.
+            max_wait_in_seconds: Maximum number of seconds which the first item of a
+                batch waits for further items.
+        """
+        self.process_batch = process_batch
+        self.max_batch_size = max_batch_size
+        self.max_wait_in_seconds = max_wait_in_seconds
+
+        self._pending: List[Tuple[T, asyncio.Future, float]] = []
+
+        # created by the worker as they are bound to the event loop
+        self._worker: Optional[asyncio.Task] = None
+        self._batch_is_full: Optional[asyncio.Event] = None
+
+    async def submit(self, item: T) -> R:
+        """Adds the item to the next batch and waits for its result.
+
+        Args:
+            item: The item to process.
+
+        Returns:
+            The result which `process_batch` returned for the item.
+        """
+        loop = asyncio.get_running_loop()
+        result = loop.create_future()
+        self._pending.append((item, result, loop.time()))
+
+        self._ensure_worker()
+        if len(self._pending) >= self.max_batch_size:
+            self._batch_is_full.set()
+
+        return await result
+
+    def _ensure_worker(self) -> None:
+        if self._worker is not None and not self._worker.done():
+            return
+
+        self._batch_is_full = asyncio.Event()
+        self._worker = asyncio.get_running_loop().create_task(self._run())
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+
+        while self._pending:
+            if len(self._pending) < self.max_batch_size:
+                # items which arrived while the previous batch was processed have
+                # already waited for part of the time
+                _, _, first_arrival = self._pending[0]
+                timeout = first_arrival + self.max_wait_in_seconds - loop.time()
+                if timeout > 0:
+                    with contextlib.suppress(asyncio.TimeoutError):
+                        await asyncio.wait_for(self._batch_is_full.wait(), timeout)
+
+            batch = [
+                (item, result)
+                for item, result, _ in self._pending[: self.max_batch_size]
+                # the callers of cancelled items don't wait for them anymore
+                if not result.done()
+            ]
+            del self._pending[: self.max_batch_size]
+            if len(self._pending) < self.max_batch_size:
+                self._batch_is_full.clear()
+
+            if batch:
+                await self._process(batch)
+
+    async def _process(self, batch: List[Tuple[T, asyncio.Future]]) -> None:
+        items = [item for item, _ in batch]
+        try:
+            results = await asyncio.get_running_loop().run_in_executor(
+                None, self.process_batch, items
+            )
+        except Exception as e:
+            logger.debug(f"Failed to process a batch of {len(items)} items: {e}")
+            for _, result in batch:
+                if not result.done():
+                    result.set_exception(e)
+            return
+
+        logger.debug(f"Processed a batch of {len(items)} items.")
+        for (_, result), value in zip(batch, results):
+            if not result.done():
+                result.set_result(value)
@@ -0,0 +1,411 @@
+import asyncio
+import contextlib
+import dataclasses
+import json
+import logging
+import os
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Text, Tuple
+
+from rasa.core.brokers.broker import EventBroker
+from rasa.shared.exceptions import RasaException
+from rasa.shared.utils.io import DEFAULT_ENCODING
+
+logger = logging.getLogger(__name__)
+
+# keys of the event broker endpoint configuration which enable the
+# `BatchingEventBroker`
+USE_PUBLISH_QUEUE_KEY = "use_publish_queue"
+PUBLISH_QUEUE_MAX_SIZE_KEY = "publish_queue_max_size"
+PUBLISH_BATCH_SIZE_KEY = "publish_batch_size"
+PUBLISH_FLUSH_INTERVAL_KEY = "publish_flush_interval"
+PUBLISH_QUEUE_OVERFLOW_KEY = "publish_queue_overflow"
+PUBLISH_SPILL_PATH_KEY = "publish_spill_path"
+PUBLISH_QUEUE_KEYS = [
+    USE_PUBLISH_QUEUE_KEY,
+    PUBLISH_QUEUE_MAX_SIZE_KEY,
+    PUBLISH_BATCH_SIZE_KEY,
+    PUBLISH_FLUSH_INTERVAL_KEY,
+    PUBLISH_QUEUE_OVERFLOW_KEY,
+    PUBLISH_SPILL_PATH_KEY,
+]
+
+DEFAULT_PUBLISH_QUEUE_MAX_SIZE = 10_000
+DEFAULT_PUBLISH_BATCH_SIZE = 100
+DEFAULT_PUBLISH_FLUSH_INTERVAL = 0.1
+# number of seconds to wait before a batch which failed is published again
+FAILED_BATCH_RETRY_INTERVAL = 1.0
+# suffix of the file which stores how far the spill file was read
+SPILL_OFFSET_SUFFIX = ".offset"
+
+# what happens to events which are published while the queue is full
+OVERFLOW_DROP_NEWEST = "drop_newest"
+OVERFLOW_DROP_OLDEST = "drop_oldest"
+OVERFLOW_SPILL = "spill"
+OVERFLOW_POLICIES = [OVERFLOW_DROP_NEWEST, OVERFLOW_DROP_OLDEST, OVERFLOW_SPILL]
+
+
+@dataclasses.dataclass
+class PublishQueueMetrics:
+    """Metrics of the publish queue of a `BatchingEventBroker`."""
+
+    queue_depth: int = 0
+    published_events: int = 0
+    dropped_events: int = 0
+    spilled_events: int = 0
+    failed_events: int = 0
+    flushes: int = 0
+    last_flush_latency: float = 0.0
+    max_flush_latency: float = 0.0
+    total_flush_latency: float = 0.0
+
+    @property
+    def mean_flush_latency(self) -> float:
+        """Average number of seconds which the wrapped broker took per batch."""
+        if not self.flushes:
+            return 0.0
+
+        return self.total_flush_latency / self.flushes
+
+
+class BatchingEventBroker(EventBroker):
+    """Publishes the events of another event broker in batches in the background.
+
+    `publish` only appends the event to a bounded in-memory queue and returns
+    immediately, so that the latency of the wrapped event broker doesn't add to the
+    response time. A background task passes the queued events to `publish_batch` of
+    the wrapped event broker once `batch_size` events are queued or `flush_interval`
+    seconds after the first event of a batch was queued.
+    """
+
+    def __init__(
+        self,
+        event_broker: EventBroker,
+        max_queue_size: int = DEFAULT_PUBLISH_QUEUE_MAX_SIZE,
+        batch_size: int = DEFAULT_PUBLISH_BATCH_SIZE,
+        flush_interval: float = DEFAULT_PUBLISH_FLUSH_INTERVAL,
+        overflow: Text = OVERFLOW_DROP_NEWEST,
+        spill_path: Optional[Text] = None,
+    ) -> None:
+        """Creates the broker.
+
+        Args:
+            event_broker: The event broker which publishes the batches.
+            max_queue_size: Maximum number of events which are queued.
+            batch_size: Maximum number of events which are published at once.
+            flush_interval: Maximum number of seconds which an event waits for
+                further events before its batch is published.
+            overflow: What happens to events which are published while the queue is
+                full: `drop_newest` drops these events, `drop_oldest` drops the
+                oldest queued event instead and `spill` appends the events to the
+                file at `spill_path`. Spilled events are published once the queue
+                is empty again. With `spill`, batches which the wrapped broker fails
+                to publish are retried and are spilled if they still fail when the
+                broker is closed. Events are published in the order in which they
+                were published to this broker, hence events are spilled as long as
+                there are spilled events.
+            spill_path: File to which events are spilled. The events are only
+                appended to it, the position up to which it was read is stored in
+                a file with the suffix `.offset`.
+
+        Raises:
+            RasaException: If the overflow policy is unknown or if events should be
+                spilled without a `spill_path`.
+        """
+        if overflow not in OVERFLOW_POLICIES:
+            raise RasaException(
+                f"Unknown publish queue overflow policy '{overflow}'. Valid "
+                f"policies are: {', '.join(OVERFLOW_POLICIES)}."
+            )
+        if overflow == OVERFLOW_SPILL and not spill_path:
+            raise RasaException(
+                f"The '{OVERFLOW_SPILL}' overflow policy requires a file to spill "
+                f"events to. Please set '{PUBLISH_SPILL_PATH_KEY}'."
+            )
+
+        self.event_broker = event_broker
+        self.max_queue_size = max_queue_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.overflow = overflow
+        self.spill_path = spill_path
+
+        self._queue: Deque[Dict[Text, Any]] = deque()
+        self._metrics = PublishQueueMetrics()
+        self._is_overflowing = False
+        self._closing = False
+        self._last_batch_failed = False
+        # events which are spilled, but not written to the spill file yet
+        self._spill_buffer: List[Dict[Text, Any]] = []
+        # position up to which the spill file was read, `None` if not known yet
+        self._spill_offset: Optional[int] = None
+        # spilled events of a previous run are published first
+        self._has_spilled_events = overflow == OVERFLOW_SPILL and os.path.exists(
+            spill_path
+        )
+
+        # created by the worker as they are bound to the event loop
+        self._worker: Optional[asyncio.Task] = None
+        self._has_events: Optional[asyncio.Event] = None
+        self._batch_is_full: Optional[asyncio.Event] = None
+        self._is_closing: Optional[asyncio.Event] = None
+
+    @property
+    def metrics(self) -> PublishQueueMetrics:
+        """Returns the current metrics of the publish queue."""
+        return dataclasses.replace(self._metrics, queue_depth=len(self._queue))
+
+    def publish(self, event: Dict[Text, Any]) -> None:
+        """Queues the event without waiting for the wrapped event broker."""
+        if self._has_spilled_events:
+            # newer events must not overtake the spilled events
+            self._spill([event])
+        elif len(self._queue) >= self.max_queue_size:
+            self._on_overflow(event)
+        else:
+            self._is_overflowing = False
+            self._queue.append(event)
+
+        self._ensure_worker()
+        if self._has_events is not None:
+            self._has_events.set()
+            if len(self._queue) >= self.batch_size:
+                self._batch_is_full.set()
+
+    def _on_overflow(self, event: Dict[Text, Any]) -> None:
+        if not self._is_overflowing:
+            logger.warning(
+                f"The publish queue of the event broker is full "
+                f"({self.max_queue_size} events). Applying the overflow policy "
+                f"'{self.overflow}' until the queue has space again."
+            )
+            self._is_overflowing = True
+
+        if self.overflow == OVERFLOW_SPILL:
+            self._spill([event])
+            return
+
+        if self.overflow == OVERFLOW_DROP_OLDEST:
+            self._queue.popleft()
+            self._queue.append(event)
+        self._metrics.dropped_events += 1
+
+    def _ensure_worker(self) -> None:
+        if self._worker is not None and not self._worker.done():
+            return
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # the events are published once there is a running event loop or when
+            # the broker is closed
+            return
+
+        self._has_events = asyncio.Event()
+        self._batch_is_full = asyncio.Event()
+        self._is_closing = asyncio.Event()
+        if self._queue or self._has_spilled_events:
+            self._has_events.set()
+        self._worker = loop.create_task(self._run())
+
+    async def _run(self) -> None:
+        while True:
+            await self._has_events.wait()
+            if len(self._queue) < self.batch_size and not self._closing:
+                # give further events the chance to make it into the batch
+                with contextlib.suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(
+                        self._batch_is_full.wait(), self.flush_interval
+                    )
+
+            await self._publish_next_batch()
+
+            if self._closing and (self._is_done() or self._must_keep_failed_batch()):
+                return
+
+            if self._must_keep_failed_batch():
+                # give the wrapped broker time to recover
+                with contextlib.suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(
+                        self._is_closing.wait(), FAILED_BATCH_RETRY_INTERVAL
+                    )
+
+    def _is_done(self) -> bool:
+        return not self._queue and not self._has_spilled_events
+
+    def _must_keep_failed_batch(self) -> bool:
+        return self._last_batch_failed and self.overflow == OVERFLOW_SPILL
+
+    async def _publish_next_batch(self) -> None:
+        # the spill file is only accessed here, so that the writes are batched
+        await self._write_spill_buffer()
+        if not self._queue and self._has_spilled_events:
+            await self._restore_spilled_events()
+
+        batch = [
+            self._queue.popleft() for _ in range(min(self.batch_size, len(self._queue)))
+        ]
+        if batch:
+            await self._publish_batch(batch)
+
+        if self._has_events is not None:
+            if self._is_done():
+                self._has_events.clear()
+            if len(self._queue) < self.batch_size:
+                self._batch_is_full.clear()
+
+    async def _publish_batch(self, batch: List[Dict[Text, Any]]) -> bool:
+        start = time.perf_counter()
+        try:
+            await self.event_broker.publish_batch(batch)
+        except Exception as e:
+            logger.error(
+                f"Failed to publish a batch of {len(batch)} events with the "
+                f"'{self.event_broker.__class__.__name__}'. Error: {e}"
+            )
+            if self.overflow == OVERFLOW_SPILL:
+                # the batch is retried before any newer event is published
+                self._queue.extendleft(reversed(batch))
+            else:
+                self._metrics.failed_events += len(batch)
+            self._last_batch_failed = True
+            return False
+
+        self._last_batch_failed = False
+
+        latency = time.perf_counter() - start
+        self._metrics.published_events += len(batch)
+        self._metrics.flushes += 1
+        self._metrics.last_flush_latency = latency
+        self._metrics.max_flush_latency = max(self._metrics.max_flush_latency, latency)
+        self._metrics.total_flush_latency += latency
+
+        logger.debug(
+            f"Published {len(batch)} events in {latency * 1000:.1f} ms. "
+            f"{len(self._queue)} events are queued."
+        )
+        return True
+
+    def _spill(self, events: List[Dict[Text, Any]]) -> None:
+        """Buffers events until the worker appends them to the spill file."""
+        self._spill_buffer.extend(events)
+        self._has_spilled_events = True
+        self._metrics.spilled_events += len(events)
+
+    async def _write_spill_buffer(self) -> None:
+        if not self._spill_buffer:
+            return
+
+        events, self._spill_buffer = self._spill_buffer, []
+        await asyncio.get_running_loop().run_in_executor(
+            None, self._append_to_spill_file, events
+        )
+
+    def _append_to_spill_file(self, events: List[Dict[Text, Any]]) -> None:
+        with open(self.spill_path, "a", encoding=DEFAULT_ENCODING) as spill_file:
+            spill_file.writelines(json.dumps(event) + "\n" for event in events)
+
+    async def _restore_spilled_events(self) -> None:
+        """Queues spilled events again as soon as the queue is empty."""
+        events, is_exhausted = await asyncio.get_running_loop().run_in_executor(
+            None, self._read_from_spill_file, self.max_queue_size
+        )
+        self._queue.extend(events)
+        logger.debug(f"Restored {len(events)} spilled events.")
+
+        if is_exhausted and not self._spill_buffer:
+            await asyncio.get_running_loop().run_in_executor(
+                None, self._remove_spill_file
+            )
+            # events might have been spilled while the file was removed
+            self._has_spilled_events = bool(self._spill_buffer)
+
+    def _read_from_spill_file(
+        self, max_number_of_events: Optional[int] = None
+    ) -> Tuple[List[Dict[Text, Any]], bool]:
+        """Reads the next spilled events and stores how far the file was read.
+
+        Args:
+            max_number_of_events: Maximum number of events to read. All remaining
+                events are read if `None`.
+
+        Returns:
+            The events and whether the spill file was read completely.
+        """
+        if not os.path.exists(self.spill_path):
+            return [], True
+
+        offset_path = self.spill_path + SPILL_OFFSET_SUFFIX
+        if self._spill_offset is None:
+            self._spill_offset = 0
+            if os.path.exists(offset_path):
+                with open(offset_path, encoding=DEFAULT_ENCODING) as offset_file:
+                    self._spill_offset = int(offset_file.read() or 0)
+
+        events = []
+        with open(self.spill_path, "rb") as spill_file:
+            spill_file.seek(self._spill_offset)
+            for line in iter(spill_file.readline, b""):
+                events.append(json.loads(line))
+                if max_number_of_events and len(events) >= max_number_of_events:
+                    break
+            self._spill_offset = spill_file.tell()
+            is_exhausted = not spill_file.read(1)
+
+        with open(offset_path, "w", encoding=DEFAULT_ENCODING) as offset_file:
+            offset_file.write(str(self._spill_offset))
+
+        return events, is_exhausted
+
+    def _remove_spill_file(self) -> None:
+        for path in [self.spill_path, self.spill_path + SPILL_OFFSET_SUFFIX]:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(path)
+        self._spill_offset = None
+
+    def _keep_queued_events(self) -> None:
+        """Stores queued events in front of the spilled events for the next run.
+
+        This rewrites the spill file, but only happens when the broker is closed
+        while the wrapped broker fails.
+        """
+        remaining = []
+        if os.path.exists(self.spill_path):
+            remaining, _ = self._read_from_spill_file()
+
+        events = list(self._queue) + remaining + self._spill_buffer
+        self._metrics.spilled_events += len(self._queue)
+        self._queue.clear()
+        self._spill_buffer = []
+
+        self._remove_spill_file()
+        self._append_to_spill_file(events)
+
+    def is_ready(self) -> bool:
+        """Determines whether the wrapped event broker is ready."""
+        return self.event_broker.is_ready()
+
+    async def close(self) -> None:
+        """Publishes all queued events and closes the wrapped event broker.
+
+        With the `spill` overflow policy, events which can't be published are kept
+        in the spill file for the next run.
+        """
+        self._closing = True
+
+        if self._worker is not None and not self._worker.done():
+            self._has_events.set()
+            self._batch_is_full.set()
+            self._is_closing.set()
+            await self._worker
+
+        while not self._is_done() and not self._must_keep_failed_batch():
+            await self._publish_next_batch()
+
+        if self._must_keep_failed_batch():
+            await asyncio.get_running_loop().run_in_executor(
+                None, self._keep_queued_events
+            )
+
+        await self.event_broker.close()
@@ -1,7 +1,8 @@
 from __future__ import annotations
+import copy
 import logging
 from asyncio import AbstractEventLoop
-from typing import Any, Dict, Text, Optional, Union, TypeVar, Type
+from typing import Any, Dict, List, Text, Optional, Union, TypeVar, Type
 
 import aiormq
 
@@ -30,9 +31,12 @@ class EventBroker:
 
         import aio_pika.exceptions
         import sqlalchemy.exc
+        from rasa.core.brokers import batching
 
         try:
-            return await _create_from_endpoint_config(obj, loop)
+            broker = await _create_from_endpoint_config(
+                _without_publish_queue_keys(obj), loop
+            )
         except (
             sqlalchemy.exc.OperationalError,
             aio_pika.exceptions.AMQPConnectionError,
@@ -41,6 +45,29 @@ class EventBroker:
         ) as error:
             raise ConnectionException("Cannot connect to event broker.") from error
 
+        if broker is not None and obj.kwargs.get(batching.USE_PUBLISH_QUEUE_KEY):
+            broker = batching.BatchingEventBroker(
+                broker,
+                max_queue_size=obj.kwargs.get(
+                    batching.PUBLISH_QUEUE_MAX_SIZE_KEY,
+                    batching.DEFAULT_PUBLISH_QUEUE_MAX_SIZE,
+                ),
+                batch_size=obj.kwargs.get(
+                    batching.PUBLISH_BATCH_SIZE_KEY,
+                    batching.DEFAULT_PUBLISH_BATCH_SIZE,
+                ),
+                flush_interval=obj.kwargs.get(
+                    batching.PUBLISH_FLUSH_INTERVAL_KEY,
+                    batching.DEFAULT_PUBLISH_FLUSH_INTERVAL,
+                ),
+                overflow=obj.kwargs.get(
+                    batching.PUBLISH_QUEUE_OVERFLOW_KEY, batching.OVERFLOW_DROP_NEWEST
+                ),
+                spill_path=obj.kwargs.get(batching.PUBLISH_SPILL_PATH_KEY),
+            )
+
+        return broker
+
     @classmethod
     async def from_endpoint_config(
         cls: Type[EB],
@@ -64,6 +91,19 @@ class EventBroker:
         """Publishes a json-formatted Rasa Core event into an event queue."""
         raise NotImplementedError("Event broker must implement the `publish` method.")
 
+    async def publish_batch(self, events: List[Dict[Text, Any]]) -> None:
+        """Publishes several json-formatted Rasa Core events at once.
+
+        Event brokers should override this method to send the whole batch with a
+        single request and to wait until it was delivered. The default
+        implementation publishes one event after another.
+
+        Args:
+            events: The serialised events to publish.
+        """
+        for event in events:
+            self.publish(event)
+
     def is_ready(self) -> bool:
         """Determine whether or not the event broker is ready.
 
@@ -78,6 +118,27 @@ class EventBroker:
         pass
 
 
+def _without_publish_queue_keys(
+    endpoint_config: Optional[EndpointConfig],
+) -> Optional[EndpointConfig]:
+    """Removes the configuration of the `BatchingEventBroker` from `endpoint_config`.
+
+    Event brokers are created with the remaining keyword arguments.
+    """
+    from rasa.core.brokers.batching import PUBLISH_QUEUE_KEYS
+
+    if endpoint_config is None:
+        return None
+
+    endpoint_config = copy.copy(endpoint_config)
+    endpoint_config.kwargs = {
+        key: value
+        for key, value in endpoint_config.kwargs.items()
+        if key not in PUBLISH_QUEUE_KEYS
+    }
+    return endpoint_config
+
+
 async def _create_from_endpoint_config(
     endpoint_config: Optional[EndpointConfig], event_loop: Optional[AbstractEventLoop]
 ) -> Optional[EventBroker]:
@@ -98,9 +159,16 @@ async def _create_from_endpoint_config(
 
         broker = await FileEventBroker.from_endpoint_config(endpoint_config)
     elif endpoint_config.type.lower() == "kafka":
-        from rasa.core.brokers.kafka import KafkaEventBroker
+        from rasa.core.brokers.kafka import (
+            AsyncKafkaEventBroker,
+            KafkaEventBroker,
+            USE_ASYNC_PRODUCER_KEY,
+        )
 
-        broker = await KafkaEventBroker.from_endpoint_config(endpoint_config)
+        if endpoint_config.kwargs.get(USE_ASYNC_PRODUCER_KEY):
+            broker = await AsyncKafkaEventBroker.from_endpoint_config(endpoint_config)
+        else:
+            broker = await KafkaEventBroker.from_endpoint_config(endpoint_config)
     else:
         broker = await _load_from_module_name_in_endpoint_config(endpoint_config)
 
@@ -2,7 +2,7 @@ import json
 import logging
 import typing
 from asyncio import AbstractEventLoop
-from typing import Optional, Text, Dict
+from typing import Any, Dict, List, Optional, Text
 
 from rasa.core.brokers.broker import EventBroker
 
@@ -57,3 +57,11 @@ class FileEventBroker(EventBroker):
 
         self.event_logger.info(json.dumps(event))
         self.event_logger.handlers[0].flush()
+
+    async def publish_batch(self, events: List[Dict[Text, Any]]) -> None:
+        """Writes the events to the file at once and flushes it a single time."""
+        if not events:
+            return
+
+        self.event_logger.info("\n".join(json.dumps(event) for event in events))
+        self.event_logger.handlers[0].flush()
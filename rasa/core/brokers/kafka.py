@@ -1,21 +1,28 @@
+import asyncio
 import os
 import json
 import logging
 from asyncio import AbstractEventLoop
-from typing import Any, Text, List, Optional, Union, Dict, TYPE_CHECKING
+from typing import Any, Text, List, Optional, Set, Tuple, Union, Dict, TYPE_CHECKING
 import time
 
 from rasa.core.brokers.broker import EventBroker
 from rasa.shared.utils.io import DEFAULT_ENCODING
 from rasa.utils.endpoints import EndpointConfig
-from rasa.shared.exceptions import RasaException
+from rasa.shared.exceptions import ConnectionException, RasaException
 import rasa.shared.utils.common
 
 if TYPE_CHECKING:
+    from aiokafka import AIOKafkaProducer
     from kafka import KafkaProducer
 
 logger = logging.getLogger(__name__)
 
+# key of the event broker endpoint configuration which selects the
+# `AsyncKafkaEventBroker`
+USE_ASYNC_PRODUCER_KEY = "use_async_producer"
+KAFKA_COMPRESSION_TYPES = ["gzip", "snappy", "lz4", "zstd"]
+
 
 class KafkaProducerInitializationError(RasaException):
     """Raised if the Kafka Producer cannot be properly initialized."""
@@ -107,14 +114,8 @@ class KafkaEventBroker(EventBroker):
         retry_delay_in_seconds: float = 5,
     ) -> None:
         """Publishes events."""
-        if self.producer is None:
-            self.producer = self._create_producer()
-            connected = self.producer.bootstrap_connected()
-            if connected:
-                logger.debug("Connection to kafka successful.")
-            else:
-                logger.debug("Failed to connect kafka.")
-                return
+        if not self._ensure_producer():
+            return
         while retries:
             try:
                 self._publish(event)
@@ -138,9 +139,56 @@ class KafkaEventBroker(EventBroker):
 
         logger.error("Failed to publish Kafka event.")
 
+    async def publish_batch(self, events: List[Dict[Text, Any]]) -> None:
+        """Sends the events and waits until the producer delivered all of them.
+
+        The producer sends the events in batches. Waiting for the delivery happens
+        in a thread so that it doesn't block the event loop.
+        """
+        if not events or not self._ensure_producer():
+            return
+
+        for event in events:
+            self._publish(event)
+
+        await asyncio.get_running_loop().run_in_executor(None, self.producer.flush)
+
+    def _ensure_producer(self) -> bool:
+        """Creates the producer if it doesn't exist yet.
+
+        Returns:
+            `False` if a new producer couldn't connect to Kafka.
+        """
+        if self.producer is not None:
+            return True
+
+        self.producer = self._create_producer()
+        connected = self.producer.bootstrap_connected()
+        if connected:
+            logger.debug("Connection to kafka successful.")
+        else:
+            logger.debug("Failed to connect kafka.")
+        return connected
+
     def _create_producer(self) -> "KafkaProducer":
         import kafka
 
+        authentication_params = self._authentication_params()
+
+        try:
+            return kafka.KafkaProducer(
+                client_id=self.client_id,
+                bootstrap_servers=self.url,
+                value_serializer=lambda v: json.dumps(v).encode(DEFAULT_ENCODING),
+                **authentication_params,
+            )
+        except AssertionError as e:
+            raise KafkaProducerInitializationError(
+                f"Cannot initialise `KafkaEventBroker`: {e}"
+            )
+
+    def _authentication_params(self) -> Dict[Text, Any]:
+        """Returns the `kafka-python` producer arguments for the security protocol."""
         if self.security_protocol == "PLAINTEXT":
             authentication_params = dict(
                 security_protocol=self.security_protocol, ssl_check_hostname=False
@@ -177,32 +225,11 @@ class KafkaEventBroker(EventBroker):
                 f"Invalid `security_protocol` ('{self.security_protocol}')."
             )
 
-        try:
-            return kafka.KafkaProducer(
-                client_id=self.client_id,
-                bootstrap_servers=self.url,
-                value_serializer=lambda v: json.dumps(v).encode(DEFAULT_ENCODING),
-                **authentication_params,
-            )
-        except AssertionError as e:
-            raise KafkaProducerInitializationError(
-                f"Cannot initialise `KafkaEventBroker`: {e}"
-            )
+        return authentication_params
 
     def _publish(self, event: Dict[Text, Any]) -> None:
-        if self.partition_by_sender:
-            partition_key = bytes(event.get("sender_id"), encoding=DEFAULT_ENCODING)
-        else:
-            partition_key = None
-
-        headers = []
-        if self.rasa_environment:
-            headers = [
-                (
-                    "RASA_ENVIRONMENT",
-                    bytes(self.rasa_environment, encoding=DEFAULT_ENCODING),
-                )
-            ]
+        partition_key = self._partition_key(event)
+        headers = self._headers()
 
         logger.debug(
             f"Calling kafka send({self.topic}, value={event},"
@@ -214,6 +241,23 @@ class KafkaEventBroker(EventBroker):
                 self.topic, value=event, key=partition_key, headers=headers
             )
 
+    def _partition_key(self, event: Dict[Text, Any]) -> Optional[bytes]:
+        if not self.partition_by_sender:
+            return None
+
+        return bytes(event.get("sender_id"), encoding=DEFAULT_ENCODING)
+
+    def _headers(self) -> List[Tuple[Text, bytes]]:
+        if not self.rasa_environment:
+            return []
+
+        return [
+            (
+                "RASA_ENVIRONMENT",
+                bytes(self.rasa_environment, encoding=DEFAULT_ENCODING),
+            )
+        ]
+
     def _close(self) -> None:
         if self.producer is not None:
             self.producer.close()
@@ -222,3 +266,230 @@ class KafkaEventBroker(EventBroker):
     def rasa_environment(self) -> Optional[Text]:
         """Get value of the `RASA_ENVIRONMENT` environment variable."""
         return os.environ.get("RASA_ENVIRONMENT", "RASA_ENVIRONMENT_NOT_SET")
+
+
+class AsyncKafkaEventBroker(KafkaEventBroker):
+    """Kafka event broker which publishes events without blocking the event loop.
+
+    Uses the `aiokafka` producer, which collects the events of each partition in
+    batches and sends them in the background. Events are partitioned by sender id
+    by default so that the events of a conversation keep their order.
+    """
+
+    def __init__(
+        self,
+        url: Union[Text, List[Text], None],
+        topic: Text = "rasa_core_events",
+        client_id: Optional[Text] = None,
+        partition_by_sender: bool = True,
+        linger_ms: int = 5,
+        max_batch_size: int = 16384,
+        compression_type: Optional[Text] = None,
+        enable_idempotence: bool = False,
+        acks: Union[int, Text, None] = None,
+        **kwargs: Any,
+    ) -> None:
+        """Kafka event broker which uses `aiokafka`.
+
+        Args:
+            url: 'url[:port]' string (or list of 'url[:port]' strings) of the Kafka
+                brokers to bootstrap the cluster metadata from.
+            topic: Topic to which the events are published.
+            client_id: A name for this client.
+            partition_by_sender: Whether to use the sender id as message key. The
+                events of a conversation are then published to the same partition
+                and keep their order.
+            linger_ms: Number of milliseconds the producer waits for further events
+                before it sends a batch.
+            max_batch_size: Maximum size of a batch in bytes.
+            compression_type: Compression of the batches. Valid values are: `gzip`,
+                `snappy`, `lz4`, `zstd`. The batches are not compressed by default.
+            enable_idempotence: Whether the producer makes sure that every event is
+                written exactly once to the topic. Requires `acks` to be `all`.
+            acks: Number of acknowledgments the producer requires from the Kafka
+                brokers. Defaults to `all` with `enable_idempotence` and to `1`
+                otherwise.
+            kwargs: Authentication parameters, see `KafkaEventBroker`.
+        """
+        if compression_type and compression_type not in KAFKA_COMPRESSION_TYPES:
+            raise KafkaProducerInitializationError(
+                f"Cannot initialise `AsyncKafkaEventBroker`: Invalid "
+                f"`compression_type` ('{compression_type}'). Valid values are: "
+                f"{', '.join(KAFKA_COMPRESSION_TYPES)}."
+            )
+
+        # skipcq: PYL-E1003
+        # Skip `KafkaEventBroker` constructor which requires `kafka-python`
+        super(KafkaEventBroker, self).__init__()
+
+        self.producer: Optional["AIOKafkaProducer"] = None  # type: ignore[assignment]
+        self.url = url
+        self.topic = topic
+        self.client_id = client_id
+        self.partition_by_sender = partition_by_sender
+        self.security_protocol = kwargs.get(
+            "security_protocol", "SASL_PLAINTEXT"
+        ).upper()
+        self.sasl_username = kwargs.get("sasl_username")
+        self.sasl_password = kwargs.get("sasl_password")
+        self.sasl_mechanism = kwargs.get("sasl_mechanism", "PLAIN")
+        self.ssl_cafile = kwargs.get("ssl_cafile")
+        self.ssl_certfile = kwargs.get("ssl_certfile")
+        self.ssl_keyfile = kwargs.get("ssl_keyfile")
+        self.ssl_check_hostname = kwargs.get("ssl_check_hostname", False)
+
+        self.linger_ms = linger_ms
+        self.max_batch_size = max_batch_size
+        self.compression_type = compression_type
+        self.enable_idempotence = enable_idempotence
+        self.acks = acks
+
+        # events which were published but not delivered yet
+        self._pending_sends: Set[asyncio.Task] = set()
+        self._send_lock: Optional[asyncio.Lock] = None
+
+    @classmethod
+    async def from_endpoint_config(
+        cls,
+        broker_config: EndpointConfig,
+        event_loop: Optional[AbstractEventLoop] = None,
+    ) -> Optional["AsyncKafkaEventBroker"]:
+        """Creates broker and connects to Kafka."""
+        if broker_config is None:
+            return None
+
+        broker = cls(broker_config.url, **broker_config.kwargs)
+        await broker.connect()
+
+        return broker
+
+    async def connect(self) -> None:
+        """Starts the producer.
+
+        Raises:
+            ConnectionException: If the producer can't connect to Kafka.
+        """
+        if self.producer is not None:
+            return
+
+        producer = self._create_async_producer()
+
+        from aiokafka.errors import KafkaError
+
+        try:
+            await producer.start()
+        except KafkaError as e:
+            await producer.stop()
+            raise ConnectionException(
+                f"Cannot connect to Kafka at '{self.url}'."
+            ) from e
+
+        self.producer = producer
+        logger.debug("Connection to kafka successful.")
+
+    def _create_async_producer(self) -> "AIOKafkaProducer":
+        try:
+            import aiokafka
+        except ImportError as e:
+            raise RasaException(
+                "The `AsyncKafkaEventBroker` requires the 'aiokafka' package. "
+                "Please install it or use the `KafkaEventBroker` instead."
+            ) from e
+
+        producer_params: Dict[Text, Any] = {}
+        if self.acks is not None:
+            producer_params["acks"] = self.acks
+
+        try:
+            return aiokafka.AIOKafkaProducer(
+                client_id=self.client_id,
+                bootstrap_servers=self.url,
+                value_serializer=lambda v: json.dumps(v).encode(DEFAULT_ENCODING),
+                linger_ms=self.linger_ms,
+                max_batch_size=self.max_batch_size,
+                compression_type=self.compression_type,
+                enable_idempotence=self.enable_idempotence,
+                **producer_params,
+                **self._async_authentication_params(),
+            )
+        except (AssertionError, ValueError, RuntimeError) as e:
+            raise KafkaProducerInitializationError(
+                f"Cannot initialise `AsyncKafkaEventBroker`: {e}"
+            )
+
+    def _async_authentication_params(self) -> Dict[Text, Any]:
+        """Returns the `aiokafka` producer arguments for the security protocol.
+
+        `aiokafka` expects an SSL context instead of the paths to the certificates.
+        """
+        from aiokafka.helpers import create_ssl_context
+
+        params = self._authentication_params()
+        params.pop("ssl_check_hostname", None)
+        ssl_files = {
+            name: params.pop(f"ssl_{name}", None)
+            for name in ["cafile", "certfile", "keyfile"]
+        }
+        if self.security_protocol in ["SSL", "SASL_SSL"]:
+            ssl_context = create_ssl_context(**ssl_files)
+            ssl_context.check_hostname = self.ssl_check_hostname
+            params["ssl_context"] = ssl_context
+
+        return params
+
+    def publish(self, event: Dict[Text, Any], **kwargs: Any) -> None:
+        """Hands the event to the producer without waiting for its delivery.
+
+        Delivery failures are logged. Use `close` to wait for the delivery of all
+        published events.
+        """
+        task = asyncio.get_running_loop().create_task(self._send_and_wait(event))
+        self._pending_sends.add(task)
+        task.add_done_callback(self._pending_sends.discard)
+
+    async def publish_batch(self, events: List[Dict[Text, Any]]) -> None:
+        """Hands the events to the producer and waits until all were delivered."""
+        deliveries = [await self._send(event) for event in events]
+        await asyncio.gather(*deliveries)
+
+    async def _send_and_wait(self, event: Dict[Text, Any]) -> None:
+        try:
+            await (await self._send(event))
+        except Exception as e:
+            logger.error(
+                f"Could not publish message to kafka url '{self.url}'. "
+                f"Failed with error: {e}"
+            )
+
+    async def _send(self, event: Dict[Text, Any]) -> "asyncio.Future":
+        """Appends the event to the batch of its partition.
+
+        Returns:
+            Future which is done once Kafka acknowledged the event.
+        """
+        if self._send_lock is None:
+            self._send_lock = asyncio.Lock()
+
+        # the lock makes sure that the events are appended in the order in which
+        # they were published
+        async with self._send_lock:
+            await self.connect()
+            return await self.producer.send(
+                self.topic,
+                value=event,
+                key=self._partition_key(event),
+                headers=self._headers(),
+            )
+
+    def is_ready(self) -> bool:
+        """Returns `True` if the producer was started."""
+        return self.producer is not None
+
+    async def close(self) -> None:
+        """Waits until all published events were delivered and stops the producer."""
+        if self._pending_sends:
+            await asyncio.gather(*self._pending_sends)
+
+        if self.producer is not None:
+            await self.producer.stop()
+            self.producer = None
@@ -263,6 +263,14 @@ class PikaEventBroker(EventBroker):
         """
         self._loop.create_task(self._publish(event, headers))
 
+    async def publish_batch(self, events: List[Dict[Text, Any]]) -> None:
+        """Publishes the events concurrently and waits for their publisher confirms.
+
+        The channel is opened with publisher confirms enabled, hence RabbitMQ
+        confirms every message once it took responsibility for it.
+        """
+        await asyncio.gather(*[self._publish(event) for event in events])
+
     async def _publish(
         self, event: Dict[Text, Any], headers: Optional[Dict[Text, Text]] = None
     ) -> None:
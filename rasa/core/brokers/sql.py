@@ -1,12 +1,13 @@
+import asyncio
 import contextlib
 import json
 import logging
 from asyncio import AbstractEventLoop
-from typing import Any, Dict, Optional, Text, Generator
+from typing import Any, Dict, List, Optional, Text, Generator
 
 from sqlalchemy.orm import Session
 from sqlalchemy.ext.declarative import declarative_base, DeclarativeMeta
-from sqlalchemy import Column, Integer, String
+from sqlalchemy import Column, Integer, String, insert
 from sqlalchemy import Text as SqlAlchemyText  # to avoid name clash with typing.Text
 
 from rasa.core.brokers.broker import EventBroker
@@ -82,3 +83,26 @@ class SQLEventBroker(EventBroker):
                 )
             )
             session.commit()
+
+    async def publish_batch(self, events: List[Dict[Text, Any]]) -> None:
+        """Inserts the events within a single transaction.
+
+        The database is accessed in a thread so that it doesn't block the event loop.
+        """
+        if not events:
+            return
+
+        await asyncio.get_running_loop().run_in_executor(
+            None, self._insert_batch, events
+        )
+
+    def _insert_batch(self, events: List[Dict[Text, Any]]) -> None:
+        with self.session_scope() as session:
+            session.execute(
+                insert(self.SQLBrokerEvent.__table__),
+                [
+                    {"sender_id": event.get("sender_id"), "data": json.dumps(event)}
+                    for event in events
+                ],
+            )
+            session.commit()
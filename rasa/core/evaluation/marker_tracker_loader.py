@@ -99,5 +99,5 @@ class MarkerTrackerLoader:
             self.count = len(stored_keys)
 
         keys = self.strategy(stored_keys, self.count)
-        for sender in keys:
-            yield await self.tracker_store.retrieve_full_tracker(sender)
+        async for tracker in self.tracker_store.retrieve_full_trackers(keys):
+            yield tracker
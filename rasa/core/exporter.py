@@ -211,27 +211,37 @@ class Exporter:
         )
 
         events = []
-
-        for conversation_id in tqdm(conversation_ids_to_process, "conversation IDs"):
-            tracker = await self.tracker_store.retrieve_full_tracker(conversation_id)
-            if not tracker:
-                logger.info(
-                    f"Could not retrieve tracker for conversation ID "
-                    f"'{conversation_id}'. Skipping."
-                )
-                continue
-
-            _events = tracker.current_state(EventVerbosity.ALL)["events"]
-
-            if not _events:
-                logger.info(
-                    f"No events to migrate for conversation ID '{conversation_id}'."
+        retrieved_conversation_ids = set()
+
+        with tqdm(
+            total=len(conversation_ids_to_process), desc="conversation IDs"
+        ) as bar:
+            async for tracker in self.tracker_store.retrieve_full_trackers(
+                conversation_ids_to_process
+            ):
+                bar.update()
+                conversation_id = tracker.sender_id
+                retrieved_conversation_ids.add(conversation_id)
+                _events = tracker.current_state(EventVerbosity.ALL)["events"]
+
+                if not _events:
+                    logger.info(
+                        f"No events to migrate for conversation ID "
+                        f"'{conversation_id}'."
+                    )
+                    continue
+
+                # the conversation IDs are needed in the event publishing
+                events.extend(
+                    self._get_events_for_conversation_id(_events, conversation_id)
                 )
-                continue
 
-            # the conversation IDs are needed in the event publishing
-            events.extend(
-                self._get_events_for_conversation_id(_events, conversation_id)
+        for conversation_id in (
+            set(conversation_ids_to_process) - retrieved_conversation_ids
+        ):
+            logger.info(
+                f"Could not retrieve tracker for conversation ID "
+                f"'{conversation_id}'. Skipping."
             )
 
         return self._sort_and_select_events_by_timestamp(events)
@@ -206,16 +206,27 @@ class TrackerFeaturizer:
         both are present in a state, the user text is removed so that only the intent
         is featurized.
 
-        `trackers_as_states` is modified in place.
+        `trackers_as_states` is modified in place. The states themselves are replaced
+        instead of modified as they are shared with the tracker's cache.
 
         Args:
             trackers_as_states: States produced by a `DialogueStateTracker` instance.
         """
         for states in trackers_as_states:
-            for state in states:
+            for index, state in enumerate(states):
                 # remove text features to only use intent
                 if state.get(USER, {}).get(INTENT) and state.get(USER, {}).get(TEXT):
-                    del state[USER][TEXT]
+                    states[index] = TrackerFeaturizer._without_user_features(
+                        state, TEXT
+                    )
+
+    @staticmethod
+    def _without_user_features(state: State, *keys: Text) -> State:
+        """Copies the state without the given features of the user sub state."""
+        user_sub_state = {
+            key: value for key, value in state[USER].items() if key not in keys
+        }
+        return {**state, USER: user_sub_state}
 
     def training_states_and_labels(
         self,
@@ -365,17 +376,19 @@ class TrackerFeaturizer:
             if not rasa.shared.core.trackers.is_prev_action_listen_in_state(last_state):
                 continue
 
+            user_sub_state = last_state.get(USER, {})
             if use_text_for_last_user_input:
-                # remove intent features to only use text
-                if last_state.get(USER, {}).get(INTENT):
-                    del last_state[USER][INTENT]
+                # remove intent features to only use text and
                 # don't add entities if text is used for featurization
-                if last_state.get(USER, {}).get(ENTITIES):
-                    del last_state[USER][ENTITIES]
+                removed_features = [
+                    key for key in (INTENT, ENTITIES) if user_sub_state.get(key)
+                ]
             else:
                 # remove text features to only use intent
-                if last_state.get(USER, {}).get(TEXT):
-                    del last_state[USER][TEXT]
+                removed_features = [TEXT] if user_sub_state.get(TEXT) else []
+
+            if removed_features:
+                states[-1] = self._without_user_features(last_state, *removed_features)
 
         # make sure that all dialogue steps are either intent or text based
         self._remove_user_text_if_intent(trackers_as_states)
@@ -1,5 +1,3 @@
-import aiohttp
-
 import logging
 
 from typing import Text, Dict, Any, Optional
@@ -63,7 +61,7 @@ class RasaNLUHttpInterpreter:
 
         # noinspection PyBroadException
         try:
-            async with aiohttp.ClientSession() as session:
+            async with self.endpoint_config.request_session() as session:
                 async with session.post(url, json=params) as resp:
                     if resp.status == 200:
                         return await resp.json()
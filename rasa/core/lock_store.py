@@ -4,8 +4,18 @@ from contextlib import asynccontextmanager
 import json
 import logging
 import os
-
-from typing import AsyncGenerator, Dict, Optional, Text, Union
+import weakref
+
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncGenerator,
+    Dict,
+    MutableMapping,
+    Optional,
+    Text,
+    Union,
+)
 
 from rasa.shared.exceptions import RasaException, ConnectionException
 import rasa.shared.utils.common
@@ -13,6 +23,9 @@ from rasa.core.constants import DEFAULT_LOCK_LIFETIME
 from rasa.core.lock import TicketLock
 from rasa.utils.endpoints import EndpointConfig
 
+if TYPE_CHECKING:
+    from redis.asyncio import Redis as AsyncRedis
+
 logger = logging.getLogger(__name__)
 
 
@@ -24,6 +37,7 @@ LOCK_LIFETIME = _get_lock_lifetime()
 DEFAULT_SOCKET_TIMEOUT_IN_SECONDS = 10
 
 DEFAULT_REDIS_LOCK_STORE_KEY_PREFIX = "lock:"
+REDIS_LOCK_RELEASE_CHANNEL_SUFFIX = "released:"
 
 
 # noinspection PyUnresolvedReferences
@@ -95,8 +109,10 @@ class LockStore:
     ) -> AsyncGenerator[TicketLock, None]:
         """Acquire lock with lifetime `lock_lifetime`for `conversation_id`.
 
-        Try acquiring lock with a wait time of `wait_time_in_seconds` seconds
-        between attempts. Raise a `LockError` if lock has expired.
+        Try acquiring lock with a wait time of at most `wait_time_in_seconds`
+        seconds between attempts. Lock stores which support release notifications
+        retry as soon as the previous ticket was served. Raise a `LockError` if
+        lock has expired.
         """
         ticket = self.issue_ticket(conversation_id, lock_lifetime)
         try:
@@ -106,6 +122,7 @@ class LockStore:
             )
         finally:
             self.cleanup(conversation_id, ticket)
+            await self._notify_release(conversation_id)
 
     async def _acquire_lock(
         self, conversation_id: Text, ticket: int, wait_time_in_seconds: float
@@ -133,14 +150,33 @@ class LockStore:
                 f"Retrying in {wait_time_in_seconds} seconds ..."
             )
 
-            # sleep and update lock
-            await asyncio.sleep(wait_time_in_seconds)
+            # wait for the current ticket to be released and update lock
+            await self._wait_for_release(conversation_id, ticket, wait_time_in_seconds)
             self.update_lock(conversation_id)
 
         raise LockError(
             f"Could not acquire lock for conversation_id '{conversation_id}'."
         )
 
+    async def _wait_for_release(
+        self, conversation_id: Text, ticket: int, timeout: float
+    ) -> None:
+        """Wait until a ticket for `conversation_id` was released.
+
+        Lock stores which can't notify waiting tickets fall back to polling, i.e.
+        they wait `timeout` seconds before the lock is checked again.
+
+        Args:
+            conversation_id: The conversation ID whose lock is awaited.
+            ticket: The ticket number which is waiting to be served.
+            timeout: Maximum number of seconds to wait for a release.
+        """
+        await asyncio.sleep(timeout)
+
+    async def _notify_release(self, conversation_id: Text) -> None:
+        """Wake up tickets waiting for the lock of `conversation_id`."""
+        pass
+
     def update_lock(self, conversation_id: Text) -> None:
         """Fetch lock for `conversation_id`, remove expired tickets and save lock."""
         lock = self.get_lock(conversation_id)
@@ -224,7 +260,7 @@ class RedisLockStore(LockStore):
         """
         import redis
 
-        self.red = redis.StrictRedis(
+        connection_kwargs = dict(
             host=host,
             port=int(port),
             db=int(db),
@@ -232,6 +268,14 @@ class RedisLockStore(LockStore):
             ssl=use_ssl,
             socket_timeout=socket_timeout,
         )
+        self.red = redis.StrictRedis(**connection_kwargs)
+
+        # waiting tickets subscribe to release notifications with an asyncio client
+        # per event loop since its connections can't be shared between loops
+        self._connection_kwargs: Optional[Dict[Text, Any]] = connection_kwargs
+        self._pubsub_clients: MutableMapping[
+            asyncio.AbstractEventLoop, "AsyncRedis"
+        ] = weakref.WeakKeyDictionary()
 
         self.key_prefix = DEFAULT_REDIS_LOCK_STORE_KEY_PREFIX
         if key_prefix:
@@ -265,6 +309,79 @@ class RedisLockStore(LockStore):
     def save_lock(self, lock: TicketLock) -> None:
         self.red.set(self.key_prefix + lock.conversation_id, lock.dumps())
 
+    def _release_channel(self, conversation_id: Text) -> Text:
+        return self.key_prefix + REDIS_LOCK_RELEASE_CHANNEL_SUFFIX + conversation_id
+
+    def _pubsub_client(self) -> Optional["AsyncRedis"]:
+        """Returns the asyncio Redis client of the running event loop.
+
+        Returns:
+            The client or `None` if the installed `redis` version doesn't support
+            asyncio, in which case waiting tickets poll the lock instead.
+        """
+        connection_kwargs = getattr(self, "_connection_kwargs", None)
+        if not connection_kwargs:
+            return None
+
+        try:
+            from redis import asyncio as aioredis
+        except ImportError:
+            return None
+
+        loop = asyncio.get_running_loop()
+        client = self._pubsub_clients.get(loop)
+        if client is None:
+            client = aioredis.Redis(**connection_kwargs)
+            self._pubsub_clients[loop] = client
+
+        return client
+
+    async def _wait_for_release(
+        self, conversation_id: Text, ticket: int, timeout: float
+    ) -> None:
+        """Waits for a release notification published by any Rasa instance.
+
+        Falls back to polling if notifications aren't available.
+        """
+        client = self._pubsub_client()
+        if client is None:
+            await super()._wait_for_release(conversation_id, ticket, timeout)
+            return
+
+        from redis.exceptions import RedisError
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        pubsub = client.pubsub(ignore_subscribe_messages=True)
+        try:
+            await pubsub.subscribe(self._release_channel(conversation_id))
+
+            # the ticket might have been released before the subscription was active
+            lock = self.get_lock(conversation_id)
+            if not lock or not lock.is_locked(ticket):
+                return
+
+            remaining = deadline - loop.time()
+            while remaining > 0:
+                message = await pubsub.get_message(
+                    ignore_subscribe_messages=True, timeout=remaining
+                )
+                if message is not None:
+                    return
+                remaining = deadline - loop.time()
+        except (RedisError, OSError) as e:
+            logger.debug(
+                f"Failed to subscribe to lock releases for conversation "
+                f"'{conversation_id}'. Falling back to polling. Error: {e}"
+            )
+            await asyncio.sleep(max(deadline - loop.time(), 0))
+        finally:
+            await pubsub.reset()
+
+    async def _notify_release(self, conversation_id: Text) -> None:
+        """Publishes a release notification for `conversation_id`."""
+        self.red.publish(self._release_channel(conversation_id), conversation_id)
+
 
 class InMemoryLockStore(LockStore):
     """In-memory store for ticket locks."""
@@ -272,6 +389,7 @@ class InMemoryLockStore(LockStore):
     def __init__(self) -> None:
         """Initialise dictionary of locks."""
         self.conversation_locks: Dict[Text, TicketLock] = {}
+        self._release_conditions: Dict[Text, asyncio.Condition] = {}
         super().__init__()
 
     def get_lock(self, conversation_id: Text) -> Optional[TicketLock]:
@@ -289,6 +407,39 @@ class InMemoryLockStore(LockStore):
         """Save lock in store."""
         self.conversation_locks[lock.conversation_id] = lock
 
+    async def _wait_for_release(
+        self, conversation_id: Text, ticket: int, timeout: float
+    ) -> None:
+        """Waits until the lock for `conversation_id` is released.
+
+        The timeout still applies as expired tickets don't notify waiting tickets.
+        """
+        condition = self._release_conditions.get(conversation_id)
+        if condition is None:
+            condition = asyncio.Condition()
+            self._release_conditions[conversation_id] = condition
+
+        async with condition:
+            # the ticket might have been released while acquiring the condition
+            lock = self.get_lock(conversation_id)
+            if not lock or not lock.is_locked(ticket):
+                return
+
+            try:
+                await asyncio.wait_for(condition.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _notify_release(self, conversation_id: Text) -> None:
+        """Wakes up all tickets waiting for the lock of `conversation_id`."""
+        # waiting tickets subscribe to a new condition in case they are not served
+        condition = self._release_conditions.pop(conversation_id, None)
+        if condition is None:
+            return
+
+        async with condition:
+            condition.notify_all()
+
 
 def _create_from_endpoint_config(
     endpoint_config: Optional[EndpointConfig] = None,
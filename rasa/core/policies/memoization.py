@@ -2,11 +2,13 @@ from __future__ import annotations
 import zlib
 
 import base64
+import hashlib
 import json
 import logging
+from collections import OrderedDict
 
 from tqdm import tqdm
-from typing import Optional, Any, Dict, List, Text
+from typing import Optional, Any, Dict, List, Text, Tuple
 from pathlib import Path
 
 import rasa.utils.io
@@ -35,6 +37,11 @@ from rasa.shared.core.constants import ACTION_LISTEN_NAME
 
 logger = logging.getLogger(__name__)
 
+# number of bytes of the digests which key the in-memory lookup (128 bits)
+FEATURE_KEY_DIGEST_SIZE = 16
+# number of the most recently used state encodings which are kept for reuse
+MAX_CACHED_STATE_ENCODINGS = 1_000
+
 
 @DefaultV1Recipe.register(
     DefaultV1Recipe.ComponentType.POLICY_WITHOUT_END_TO_END_SUPPORT, is_trainable=True
@@ -88,7 +95,11 @@ class MemoizationPolicy(Policy):
     ) -> None:
         """Initialize the policy."""
         super().__init__(config, model_storage, resource, execution_context, featurizer)
-        self.lookup = lookup or {}
+        # the readable lookup is only persisted, predictions use a lookup which is
+        # keyed by the digests of the feature strings instead
+        self._hashed_lookup: Dict[bytes, Text] = {}
+        self._state_encodings: OrderedDict[Tuple, Text] = OrderedDict()
+        self._memorize(lookup or {})
 
     def _create_lookup_from_states(
         self,
@@ -139,16 +150,58 @@ class MemoizationPolicy(Policy):
                     lookup[feature_key] = action
             pbar.set_postfix({"# examples": "{:d}".format(len(lookup))})
 
+        # states mostly reoccur within the training data
+        self._state_encodings.clear()
+
         return lookup
 
-    def _create_feature_key(self, states: List[State]) -> Optional[Text]:
-        if not states:
-            return None
+    def _encode_state(self, state: State) -> Text:
+        """Encodes a single state as it appears in the feature string.
+
+        The encodings of the most recently used states are interned by the frozen
+        state, so that states which reoccur across turns and conversations are only
+        serialized once.
+
+        Args:
+            state: The state to encode.
+
+        Returns:
+            The json representation of the state without quotes.
+        """
+        try:
+            # unlike `DialogueStateTracker.freeze_current_state` this keeps the
+            # order of the items which is cheaper and only leads to additional
+            # cache entries for states which are equal but ordered differently
+            frozen_state = tuple(
+                (key, tuple(sub_state.items())) for key, sub_state in state.items()
+            )
+            encoded_state = self._state_encodings.get(frozen_state)
+        except (AttributeError, TypeError):
+            # the state contains values which can't be frozen
+            return json.dumps(state, sort_keys=True).replace('"', "")
+
+        if encoded_state is not None:
+            self._state_encodings.move_to_end(frozen_state)
+            return encoded_state
 
         # we sort keys to make sure that the same states
         # represented as dictionaries have the same json strings
         # quotes are removed for aesthetic reasons
-        feature_str = json.dumps(states, sort_keys=True).replace('"', "")
+        encoded_state = json.dumps(state, sort_keys=True).replace('"', "")
+        self._state_encodings[frozen_state] = encoded_state
+        if len(self._state_encodings) > MAX_CACHED_STATE_ENCODINGS:
+            self._state_encodings.popitem(last=False)
+        return encoded_state
+
+    def _create_feature_string(self, states: List[State]) -> Text:
+        # equals `json.dumps(states, sort_keys=True)` without quotes
+        return "[" + ", ".join(self._encode_state(state) for state in states) + "]"
+
+    def _create_feature_key(self, states: List[State]) -> Optional[Text]:
+        if not states:
+            return None
+
+        feature_str = self._create_feature_string(states)
         if self.config["enable_feature_string_compression"]:
             compressed = zlib.compress(
                 bytes(feature_str, rasa.shared.utils.io.DEFAULT_ENCODING)
@@ -179,16 +232,50 @@ class MemoizationPolicy(Policy):
             trackers_as_states,
             trackers_as_actions,
         ) = self.featurizer.training_states_and_labels(training_trackers, domain)
-        self.lookup = self._create_lookup_from_states(
+        lookup = self._create_lookup_from_states(
             trackers_as_states, trackers_as_actions
         )
-        logger.debug(f"Memorized {len(self.lookup)} unique examples.")
+        logger.debug(f"Memorized {len(lookup)} unique examples.")
 
-        self.persist()
+        self._memorize(lookup)
+        self.persist(lookup)
         return self._resource
 
+    @staticmethod
+    def _digest(feature_str: Text) -> bytes:
+        return hashlib.blake2b(
+            feature_str.encode(rasa.shared.utils.io.DEFAULT_ENCODING),
+            digest_size=FEATURE_KEY_DIGEST_SIZE,
+        ).digest()
+
+    def _feature_key_to_string(self, feature_key: Text) -> Text:
+        """Reverts the compression of a feature key of the readable lookup."""
+        if not self.config["enable_feature_string_compression"]:
+            return feature_key
+
+        compressed = base64.b64decode(feature_key)
+        return zlib.decompress(compressed).decode(rasa.shared.utils.io.DEFAULT_ENCODING)
+
+    def _memorize(self, lookup: Dict[Text, Text]) -> None:
+        """Replaces the memorized turns with the ones of a readable lookup.
+
+        Only the digests of the feature strings are kept in memory.
+
+        Args:
+            lookup: Mapping of the (compressed) feature keys to the actions.
+        """
+        self._hashed_lookup = {
+            self._digest(self._feature_key_to_string(feature_key)): action
+            for feature_key, action in lookup.items()
+        }
+
     def _recall_states(self, states: List[State]) -> Optional[Text]:
-        return self.lookup.get(self._create_feature_key(states))
+        if not states:
+            return None
+
+        return self._hashed_lookup.get(
+            self._digest(self._create_feature_string(states))
+        )
 
     def recall(
         self,
@@ -263,15 +350,17 @@ class MemoizationPolicy(Policy):
 
         return self._prediction(result)
 
-    def _metadata(self) -> Dict[Text, Any]:
-        return {"lookup": self.lookup}
-
     @classmethod
     def _metadata_filename(cls) -> Text:
         return "memorized_turns.json"
 
-    def persist(self) -> None:
-        """Persists the policy to storage."""
+    def persist(self, lookup: Dict[Text, Any]) -> None:
+        """Persists the policy to storage.
+
+        Args:
+            lookup: The readable lookup. Only the digests of its feature keys are
+                kept in memory, so it has to be passed when the policy is trained.
+        """
         with self._model_storage.write_to(self._resource) as path:
             # not all policies have a featurizer
             if self.featurizer is not None:
@@ -280,7 +369,7 @@ class MemoizationPolicy(Policy):
             file = Path(path) / self._metadata_filename()
 
             rasa.shared.utils.io.create_directory_for_file(file)
-            rasa.shared.utils.io.dump_obj_as_json_to_file(file, self._metadata())
+            rasa.shared.utils.io.dump_obj_as_json_to_file(file, {"lookup": lookup})
 
     @classmethod
     def load(
@@ -1,7 +1,19 @@
 from __future__ import annotations
 import functools
 import logging
-from typing import Any, List, DefaultDict, Dict, Text, Optional, Set, Tuple, cast
+from pathlib import Path
+from typing import (
+    Any,
+    List,
+    DefaultDict,
+    Dict,
+    Iterable,
+    Text,
+    Optional,
+    Set,
+    Tuple,
+    cast,
+)
 
 from tqdm import tqdm
 import numpy as np
@@ -13,7 +25,7 @@ from rasa.engine.recipes.default_recipe import DefaultV1Recipe
 from rasa.engine.storage.resource import Resource
 from rasa.engine.storage.storage import ModelStorage
 from rasa.shared.constants import DOCS_URL_RULES
-from rasa.shared.exceptions import RasaException
+from rasa.shared.exceptions import FileIOException, RasaException
 import rasa.shared.utils.io
 from rasa.shared.core.events import LoopInterrupted, UserUttered, ActionExecuted
 from rasa.core.featurizers.tracker_featurizers import TrackerFeaturizer
@@ -75,6 +87,11 @@ DEFAULT_RULES = "predicting default action with intent "
 LOOP_RULES = "handling active loops and forms - "
 LOOP_RULES_SEPARATOR = " - "
 
+RULE_INDEX_FILE = "rule_index.json"
+
+# a feature of a state, e.g. `("user", "intent", "greet")`
+StateFeature = Tuple[Text, Text, Any]
+
 
 class InvalidRule(RasaException):
     """Exception that can be raised when rules are not valid."""
@@ -90,6 +107,151 @@ class InvalidRule(RasaException):
         )
 
 
+def _hashable(value: Any) -> Any:
+    # json dumps and loads tuples as lists, so we need to convert them back
+    if isinstance(value, list):
+        return tuple(_hashable(item) for item in value)
+    return value
+
+
+class RuleIndex:
+    """Index of rule keys by the features of the last state of each rule.
+
+    A rule can only be applicable if its last state matches the current state of
+    the conversation. Hence, every rule is indexed by the least common feature which
+    its last state requires, and only rules which are indexed by one of the features
+    of the current state need to be checked.
+    """
+
+    def __init__(
+        self,
+        conversation_start_rules: List[Text],
+        unconstrained_rules: List[Text],
+        rules_by_feature: Dict[StateFeature, List[Text]],
+    ) -> None:
+        """Creates the index.
+
+        Args:
+            conversation_start_rules: Rules which end with the start of a
+                conversation, i.e. their last state has no previous action.
+            unconstrained_rules: Rules whose last state doesn't require any feature.
+            rules_by_feature: Rules by the feature which their last state requires.
+        """
+        self.conversation_start_rules = conversation_start_rules
+        self.unconstrained_rules = unconstrained_rules
+        self.rules_by_feature = rules_by_feature
+        self._number_of_rules = (
+            len(conversation_start_rules)
+            + len(unconstrained_rules)
+            + sum(len(rules) for rules in rules_by_feature.values())
+        )
+
+    def __len__(self) -> int:
+        return self._number_of_rules
+
+    @staticmethod
+    def _required_features(rule_state: State) -> List[StateFeature]:
+        return [
+            (state_type, key, _hashable(value))
+            for state_type, rule_sub_state in rule_state.items()
+            for key, value in rule_sub_state.items()
+            # see `RulePolicy._does_rule_match_state` for the features which have to
+            # be present in the conversation state
+            if value and value != SHOULD_NOT_BE_SET
+        ]
+
+    @classmethod
+    def create(cls, rule_keys: Iterable[Text]) -> RuleIndex:
+        """Indexes rules.
+
+        Args:
+            rule_keys: The textual representations of the rules.
+
+        Returns:
+            The index of the rules.
+        """
+        conversation_start_rules = []
+        unconstrained_rules = []
+        required_features: Dict[Text, List[StateFeature]] = {}
+        for rule_key in rule_keys:
+            last_rule_state = json.loads(rule_key)[-1]
+            if not last_rule_state.get(PREVIOUS_ACTION):
+                conversation_start_rules.append(rule_key)
+                continue
+
+            features = cls._required_features(last_rule_state)
+            if features:
+                required_features[rule_key] = features
+            else:
+                unconstrained_rules.append(rule_key)
+
+        feature_counts: DefaultDict[StateFeature, int] = defaultdict(int)
+        for features in required_features.values():
+            for feature in features:
+                feature_counts[feature] += 1
+
+        rules_by_feature: DefaultDict[StateFeature, List[Text]] = defaultdict(list)
+        for rule_key, features in required_features.items():
+            least_common_feature = min(
+                features, key=lambda feature: (feature_counts[feature], repr(feature))
+            )
+            rules_by_feature[least_common_feature].append(rule_key)
+
+        return cls(conversation_start_rules, unconstrained_rules, rules_by_feature)
+
+    def candidates(self, conversation_state: State) -> Set[Text]:
+        """Finds the rules which might be applicable to the current state.
+
+        Args:
+            conversation_state: The current state of the conversation.
+
+        Returns:
+            The keys of rules whose last state might match the current state.
+        """
+        if not conversation_state.get(PREVIOUS_ACTION):
+            return set(self.conversation_start_rules)
+
+        candidates = set(self.unconstrained_rules)
+        for state_type, sub_state in conversation_state.items():
+            for key, value in sub_state.items():
+                try:
+                    rules = self.rules_by_feature.get(
+                        (state_type, key, _hashable(value))
+                    )
+                except TypeError:
+                    # unhashable values are never required by rules
+                    continue
+                if rules:
+                    candidates.update(rules)
+
+        return candidates
+
+    def as_dict(self) -> Dict[Text, Any]:
+        """Returns a json serializable representation of the index."""
+        return {
+            "conversation_start_rules": self.conversation_start_rules,
+            "unconstrained_rules": self.unconstrained_rules,
+            "rules_by_feature": [
+                [list(feature), rules]
+                for feature, rules in sorted(
+                    self.rules_by_feature.items(), key=lambda item: repr(item[0])
+                )
+            ],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[Text, Any]) -> RuleIndex:
+        """Loads the index from its json serializable representation."""
+        return cls(
+            data["conversation_start_rules"],
+            data["unconstrained_rules"],
+            {
+                (state_type, key, _hashable(value)): rules
+                for (state_type, key, value), rules in data["rules_by_feature"]
+            },
+        )
+
+
 @DefaultV1Recipe.register(
     DefaultV1Recipe.ComponentType.POLICY_WITHOUT_END_TO_END_SUPPORT, is_trainable=True
 )
@@ -150,9 +312,9 @@ class RulePolicy(MemoizationPolicy):
         # max history is set to `None` in order to capture any lengths of rule stories
         config[POLICY_MAX_HISTORY] = None
 
-        super().__init__(
-            config, model_storage, resource, execution_context, featurizer, lookup
-        )
+        super().__init__(config, model_storage, resource, execution_context, featurizer)
+        # the rule index parses the keys, hence the rules are kept readable
+        self.lookup = lookup or {}
 
         self._fallback_action_name = config["core_fallback_action_name"]
         self._enable_fallback_prediction = config["enable_fallback_prediction"]
@@ -161,6 +323,8 @@ class RulePolicy(MemoizationPolicy):
         self._rules_sources: DefaultDict[Text, List[Tuple[Text, Text]]] = defaultdict(
             list
         )
+        # rule indices by the name of the lookup whose rules they index
+        self._rule_indices: Dict[Text, Tuple[Dict[Text, Text], RuleIndex]] = {}
 
     @classmethod
     def raise_if_incompatible_with_domain(
@@ -907,11 +1071,33 @@ class RulePolicy(MemoizationPolicy):
             reversed_rule_states[turn_index], conversation_state
         )
 
-    def _get_possible_keys(
-        self, lookup: Dict[Text, Text], states: List[State]
-    ) -> Set[Text]:
-        possible_keys = set(lookup.keys())
+    def _rule_index(self, lookup_name: Text) -> RuleIndex:
+        lookup = self.lookup[lookup_name]
+        if lookup_name in self._rule_indices:
+            indexed_lookup, rule_index = self._rule_indices[lookup_name]
+            # rules are only removed from the lookup while they are checked for
+            # contradictions during training, otherwise the lookup is replaced
+            if indexed_lookup is lookup and len(rule_index) == len(lookup):
+                return rule_index
+
+        rule_index = RuleIndex.create(lookup.keys())
+        self._rule_indices[lookup_name] = (lookup, rule_index)
+        return rule_index
+
+    def _get_possible_keys(self, lookup_name: Text, states: List[State]) -> Set[Text]:
+        lookup = self.lookup[lookup_name]
+        if not states:
+            return set(lookup.keys())
+
+        # only rules whose last state can match the current state need to be checked
+        possible_keys = {
+            key
+            for key in self._rule_index(lookup_name).candidates(states[-1])
+            if key in lookup
+        }
         for i, state in enumerate(reversed(states)):
+            if not possible_keys:
+                break
             # find rule keys that correspond to current state
             possible_keys = set(
                 filter(
@@ -1028,7 +1214,7 @@ class RulePolicy(MemoizationPolicy):
         # to skip the validation of slots for its first execution after an unhappy path.
         returning_from_unhappy_path = False
 
-        rule_keys = self._get_possible_keys(self.lookup[RULES], states)
+        rule_keys = self._get_possible_keys(RULES, states)
         predicted_action_name = None
         best_rule_key = ""
         if rule_keys:
@@ -1042,7 +1228,7 @@ class RulePolicy(MemoizationPolicy):
         if active_loop_name:
             # find rules for unhappy path of the loop
             loop_unhappy_keys = self._get_possible_keys(
-                self.lookup[RULES_FOR_LOOP_UNHAPPY_PATH], states
+                RULES_FOR_LOOP_UNHAPPY_PATH, states
             )
             # there could be several unhappy path conditions
             unhappy_path_conditions = [
@@ -1235,17 +1421,65 @@ class RulePolicy(MemoizationPolicy):
             ]
         return result
 
-    def persist(self) -> None:
-        """Persists trained `RulePolicy`."""
-        super().persist()
+    def persist(self, lookup: Optional[Dict[Text, Any]] = None) -> None:
+        """Persists trained `RulePolicy`.
+
+        Args:
+            lookup: The lookup to persist, defaults to the rules of the policy.
+        """
+        super().persist(self.lookup if lookup is None else lookup)
         with self._model_storage.write_to(self._resource) as directory:
             rule_only_data = self._get_rule_only_data()
             rasa.shared.utils.io.dump_obj_as_json_to_file(
                 directory / "rule_only_data.json", rule_only_data
             )
+            rasa.shared.utils.io.dump_obj_as_json_to_file(
+                directory / RULE_INDEX_FILE,
+                {
+                    lookup_name: self._rule_index(lookup_name).as_dict()
+                    for lookup_name in [RULES, RULES_FOR_LOOP_UNHAPPY_PATH]
+                    if lookup_name in self.lookup
+                },
+            )
 
-    def _metadata(self) -> Dict[Text, Any]:
-        return {"lookup": self.lookup}
+    @classmethod
+    def load(
+        cls,
+        config: Dict[Text, Any],
+        model_storage: ModelStorage,
+        resource: Resource,
+        execution_context: ExecutionContext,
+        **kwargs: Any,
+    ) -> RulePolicy:
+        """Loads a trained policy (see parent class for full docstring)."""
+        policy = cast(
+            RulePolicy,
+            super().load(config, model_storage, resource, execution_context, **kwargs),
+        )
+
+        try:
+            with model_storage.read_from(resource) as path:
+                rule_index_file = Path(path) / RULE_INDEX_FILE
+                # models trained with older versions index their rules when they
+                # are used for the first time
+                if rule_index_file.is_file():
+                    rule_indices = rasa.shared.utils.io.read_json_file(rule_index_file)
+                    policy._load_rule_indices(rule_indices)
+        except (ValueError, FileNotFoundError, FileIOException):
+            logger.warning(
+                f"Couldn't load the rule index for policy '{cls.__name__}'. The rules "
+                f"will be indexed again."
+            )
+
+        return policy
+
+    def _load_rule_indices(self, rule_indices: Dict[Text, Dict[Text, Any]]) -> None:
+        for lookup_name, rule_index in rule_indices.items():
+            if lookup_name in self.lookup:
+                self._rule_indices[lookup_name] = (
+                    self.lookup[lookup_name],
+                    RuleIndex.from_dict(rule_index),
+                )
 
     @classmethod
     def _metadata_filename(cls) -> Text:
@@ -829,6 +829,128 @@ class TEDPolicy(Policy):
         model_data = self._create_model_data(tracker_state_features)
         outputs: Dict[Text, np.ndarray] = self.model.run_inference(model_data)
 
+        return self._prediction_from_outputs(outputs, domain, precomputations, tracker)
+
+    def predict_action_probabilities_for_batch(
+        self, batch: List[Dict[Text, Any]]
+    ) -> List[PolicyPrediction]:
+        """Predicts the next action for several trackers at once.
+
+        The trackers are featurized together and the model is run once for all of
+        them. Trackers whose prediction can contain entities are predicted on their
+        own, as the entity predictions of a batch can't be assigned to its trackers.
+
+        Args:
+            batch: The keyword arguments of `predict_action_probabilities` for every
+                tracker.
+
+        Returns:
+            The predictions in the order of the trackers.
+        """
+        if self.model is None:
+            return [self.predict_action_probabilities(**inputs) for inputs in batch]
+
+        predictions: List[Optional[PolicyPrediction]] = [None] * len(batch)
+        tracker_state_features: List[List[Dict[Text, List[Features]]]] = []
+        # position of the tracker in the batch and the range of its examples
+        examples_per_tracker: List[Tuple[int, int, int]] = []
+
+        for position, inputs in enumerate(batch):
+            tracker = inputs["tracker"]
+            if self._can_predict_entities(tracker):
+                predictions[position] = self.predict_action_probabilities(**inputs)
+                continue
+
+            features = self._featurize_tracker(
+                tracker,
+                inputs["domain"],
+                inputs.get("precomputations"),
+                rule_only_data=inputs.get("rule_only_data"),
+            )
+            start = len(tracker_state_features)
+            tracker_state_features += features
+            examples_per_tracker.append((position, start, len(tracker_state_features)))
+
+        if tracker_state_features:
+            model_data = self._create_model_data(tracker_state_features)
+            outputs: Dict[Text, np.ndarray] = self.model.run_inference(
+                model_data, batch_size=len(tracker_state_features)
+            )
+
+            for position, start, end in examples_per_tracker:
+                inputs = batch[position]
+                # all examples of a tracker have the same number of dialogue turns
+                tracker_outputs = self._slice_batch_output(
+                    outputs, start, end, len(tracker_state_features[start])
+                )
+                predictions[position] = self._prediction_from_outputs(
+                    tracker_outputs,
+                    inputs["domain"],
+                    inputs.get("precomputations"),
+                    inputs["tracker"],
+                )
+
+        return predictions  # type: ignore[return-value]
+
+    def _can_predict_entities(self, tracker: DialogueStateTracker) -> bool:
+        """Checks if the prediction for the tracker can contain entities.
+
+        Entities are only predicted for the latest user message if user text was used
+        for the prediction (see `_create_optional_event_for_entities`).
+        """
+        return (
+            self.config[ENTITY_RECOGNITION]
+            and tracker.latest_action_name == ACTION_LISTEN_NAME
+            and (self.only_e2e or TEXT in self.fake_features)
+        )
+
+    @staticmethod
+    def _slice_batch_output(
+        batch_out: Dict[Text, Any], start: int, end: int, dialogue_length: int
+    ) -> Dict[Text, Any]:
+        """Extracts the output of the examples of a tracker from a batch output.
+
+        The attention weights are padded to the longest dialogue of the batch. They
+        are cut to the dialogue of the tracker, so that the output is the same as if
+        the tracker was predicted on its own.
+
+        Args:
+            batch_out: The model output for the batch.
+            start: Position of the first example of the tracker in the batch.
+            end: Position after the last example of the tracker in the batch.
+            dialogue_length: Number of dialogue turns of the tracker's examples.
+
+        Returns:
+            The model output for the examples of the tracker.
+        """
+        tracker_out: Dict[Text, Any] = {}
+        for key, value in batch_out.items():
+            if value is None:
+                tracker_out[key] = None
+            elif key == DIAGNOSTIC_DATA:
+                diagnostic_data: Dict[Text, Any] = {}
+                for name, data in value.items():
+                    if data is None:
+                        diagnostic_data[name] = None
+                    elif name == "attention_weights":
+                        diagnostic_data[name] = data[
+                            start:end, ..., :dialogue_length, :dialogue_length
+                        ]
+                    else:
+                        diagnostic_data[name] = data[start:end]
+                tracker_out[key] = diagnostic_data
+            elif key in ("scores", "similarities"):
+                tracker_out[key] = value[start:end]
+
+        return tracker_out
+
+    def _prediction_from_outputs(
+        self,
+        outputs: Dict[Text, Any],
+        domain: Domain,
+        precomputations: Optional[MessageContainerForCoreFeaturization],
+        tracker: DialogueStateTracker,
+    ) -> PolicyPrediction:
         # take the last prediction in the sequence
         similarities = outputs["similarities"][:, -1, :]
         confidences = outputs["scores"][:, -1, :]
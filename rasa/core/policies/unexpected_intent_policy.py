@@ -1,7 +1,7 @@
 import dataclasses
 import logging
 from pathlib import Path
-from typing import Any, List, Optional, Text, Dict, Type
+from typing import Any, List, Optional, Text, Dict, Tuple, Type
 
 import numpy as np
 import tensorflow as tf
@@ -607,6 +607,70 @@ class UnexpecTEDIntentPolicy(TEDPolicy):
         all_similarities: np.ndarray = output["similarities"]
         sequence_similarities = all_similarities[:, -1, :]
 
+        return self._prediction_from_similarities(
+            sequence_similarities, domain, tracker
+        )
+
+    def predict_action_probabilities_for_batch(
+        self, batch: List[Dict[Text, Any]]
+    ) -> List[PolicyPrediction]:
+        """Predicts the next action for several trackers at once.
+
+        The trackers are featurized together and the model is run once for all of
+        them.
+
+        Args:
+            batch: The keyword arguments of `predict_action_probabilities` for every
+                tracker.
+
+        Returns:
+            The predictions in the order of the trackers.
+        """
+        if self.model is None:
+            return [self.predict_action_probabilities(**inputs) for inputs in batch]
+
+        predictions: List[Optional[PolicyPrediction]] = [None] * len(batch)
+        tracker_state_features: List[List[Dict[Text, List[Features]]]] = []
+        # position of the tracker in the batch and the range of its examples
+        examples_per_tracker: List[Tuple[int, int, int]] = []
+
+        for position, inputs in enumerate(batch):
+            if self._should_skip_prediction(inputs["tracker"], inputs["domain"]):
+                predictions[position] = self.predict_action_probabilities(**inputs)
+                continue
+
+            start = len(tracker_state_features)
+            tracker_state_features += self._featurize_for_prediction(
+                inputs["tracker"],
+                inputs["domain"],
+                inputs.get("precomputations"),
+                rule_only_data=inputs.get("rule_only_data"),
+            )
+            examples_per_tracker.append((position, start, len(tracker_state_features)))
+
+        if tracker_state_features:
+            model_data = self._create_model_data(tracker_state_features)
+            output = self.model.run_inference(
+                model_data, batch_size=len(tracker_state_features)
+            )
+
+            # take the last prediction in the sequence
+            all_similarities: np.ndarray = output["similarities"]
+            for position, start, end in examples_per_tracker:
+                predictions[position] = self._prediction_from_similarities(
+                    all_similarities[start:end, -1, :],
+                    batch[position]["domain"],
+                    batch[position]["tracker"],
+                )
+
+        return predictions  # type: ignore[return-value]
+
+    def _prediction_from_similarities(
+        self,
+        sequence_similarities: np.ndarray,
+        domain: Domain,
+        tracker: DialogueStateTracker,
+    ) -> PolicyPrediction:
         # Check for unlikely intent
         last_user_uttered_event = tracker.get_last_event_for(UserUttered)
         query_intent = (
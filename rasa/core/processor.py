@@ -10,7 +10,7 @@ from typing import Any, Dict, List, Optional, Text, Tuple, Union
 from rasa.core.http_interpreter import RasaNLUHttpInterpreter
 from rasa.engine import loader
 from rasa.engine.constants import PLACEHOLDER_MESSAGE, PLACEHOLDER_TRACKER
-from rasa.engine.runner.dask import DaskGraphRunner
+from rasa.engine.runner.compiled import CompiledGraphRunner
 from rasa.engine.storage.local_model_storage import LocalModelStorage
 from rasa.engine.storage.storage import ModelMetadata
 from rasa.model import get_latest_model
@@ -18,6 +18,7 @@ from rasa.shared.data import TrainingType
 import rasa.shared.utils.io
 import rasa.core.actions.action
 from rasa.core import jobs
+from rasa.core.batching import MicroBatcher
 from rasa.core.actions.action import Action
 from rasa.core.channels.channel import (
     CollectingOutputChannel,
@@ -58,6 +59,7 @@ import rasa.core.tracker_store
 import rasa.core.actions.action
 import rasa.shared.core.trackers
 from rasa.shared.core.trackers import DialogueStateTracker, EventVerbosity
+from rasa.shared.nlu.training_data.message import Message
 from rasa.shared.nlu.constants import (
     ENTITIES,
     INTENT,
@@ -70,6 +72,13 @@ from rasa.utils.endpoints import EndpointConfig
 logger = logging.getLogger(__name__)
 
 MAX_NUMBER_OF_PREDICTIONS = int(os.environ.get("MAX_NUMBER_OF_PREDICTIONS", "10"))
+# messages of concurrent requests are parsed together in batches of up to this size
+NLU_MAX_BATCH_SIZE = int(os.environ.get("NLU_MAX_BATCH_SIZE", "1"))
+NLU_MAX_BATCH_WAIT_IN_MS = float(os.environ.get("NLU_MAX_BATCH_WAIT_IN_MS", "5"))
+# next actions of concurrent conversations are predicted together in batches of up to
+# this size
+CORE_MAX_BATCH_SIZE = int(os.environ.get("CORE_MAX_BATCH_SIZE", "1"))
+CORE_MAX_BATCH_WAIT_IN_MS = float(os.environ.get("CORE_MAX_BATCH_WAIT_IN_MS", "5"))
 
 
 class MessageProcessor:
@@ -85,8 +94,19 @@ class MessageProcessor:
         max_number_of_predictions: int = MAX_NUMBER_OF_PREDICTIONS,
         on_circuit_break: Optional[LambdaType] = None,
         http_interpreter: Optional[RasaNLUHttpInterpreter] = None,
+        nlu_max_batch_size: int = NLU_MAX_BATCH_SIZE,
+        nlu_max_batch_wait_in_ms: float = NLU_MAX_BATCH_WAIT_IN_MS,
+        core_max_batch_size: int = CORE_MAX_BATCH_SIZE,
+        core_max_batch_wait_in_ms: float = CORE_MAX_BATCH_WAIT_IN_MS,
     ) -> None:
-        """Initializes a `MessageProcessor`."""
+        """Initializes a `MessageProcessor`.
+
+        Messages are parsed in batches if `nlu_max_batch_size` is greater than 1. The
+        first message of a batch then waits up to `nlu_max_batch_wait_in_ms` for
+        messages of concurrent requests. Likewise, the next actions of concurrent
+        conversations are predicted in batches if `core_max_batch_size` is greater
+        than 1.
+        """
         self.nlg = generator
         self.tracker_store = tracker_store
         self.lock_store = lock_store
@@ -99,6 +119,22 @@ class MessageProcessor:
         self.model_path = Path(model_path)
         self.domain = self.model_metadata.domain
         self.http_interpreter = http_interpreter
+        self.nlu_batcher: Optional[MicroBatcher[UserMessage, Message]] = None
+        if nlu_max_batch_size > 1:
+            self.nlu_batcher = MicroBatcher(
+                self._run_nlu_graph,
+                max_batch_size=nlu_max_batch_size,
+                max_wait_in_seconds=nlu_max_batch_wait_in_ms / 1000,
+            )
+        self.core_batcher: Optional[
+            MicroBatcher[DialogueStateTracker, PolicyPrediction]
+        ] = None
+        if core_max_batch_size > 1:
+            self.core_batcher = MicroBatcher(
+                self._run_core_graph,
+                max_batch_size=core_max_batch_size,
+                max_wait_in_seconds=core_max_batch_wait_in_ms / 1000,
+            )
 
     @staticmethod
     def _load_model(
@@ -123,7 +159,7 @@ class MessageProcessor:
                     Path(temporary_directory),
                     Path(model_tar),
                     LocalModelStorage,
-                    DaskGraphRunner,
+                    CompiledGraphRunner,
                 )
                 return os.path.basename(model_tar), metadata, runner
             except tarfile.ReadError:
@@ -228,6 +264,56 @@ class MessageProcessor:
 
         prediction = self._predict_next_with_tracker(tracker)
 
+        return self._prediction_result(prediction, tracker, verbosity)
+
+    def predict_next_with_trackers(
+        self,
+        trackers: List[DialogueStateTracker],
+        verbosity: EventVerbosity = EventVerbosity.AFTER_RESTART,
+    ) -> List[Optional[Dict[Text, Any]]]:
+        """Predicts the next action for several conversation states at once.
+
+        The policies featurize the trackers together and run their model once for
+        all of them where they support this.
+
+        Args:
+            trackers: Trackers representing conversation states.
+            verbosity: Verbosity for the returned conversation states.
+
+        Returns:
+            The prediction for the next action of every tracker in the order of the
+            trackers. `None` if no domain or policies loaded.
+        """
+        if self.model_metadata.training_type == TrainingType.NLU:
+            rasa.shared.utils.io.raise_warning(
+                "No core model. Skipping action prediction and execution.",
+                docs=DOCS_URL_POLICIES,
+            )
+            return [None] * len(trackers)
+
+        predictions = [self._predict_followup_action(tracker) for tracker in trackers]
+        trackers_to_predict = [
+            tracker
+            for tracker, prediction in zip(trackers, predictions)
+            if prediction is None
+        ]
+        if trackers_to_predict:
+            graph_predictions = iter(self._run_core_graph(trackers_to_predict))
+            predictions = [
+                prediction or next(graph_predictions) for prediction in predictions
+            ]
+
+        return [
+            self._prediction_result(prediction, tracker, verbosity)
+            for prediction, tracker in zip(predictions, trackers)
+        ]
+
+    def _prediction_result(
+        self,
+        prediction: PolicyPrediction,
+        tracker: DialogueStateTracker,
+        verbosity: EventVerbosity,
+    ) -> Dict[Text, Any]:
         scores = [
             {"action": a, "score": p}
             for a, p in zip(self.domain.action_names_or_texts, prediction.probabilities)
@@ -442,6 +528,38 @@ class MessageProcessor:
         Raises:
             ActionLimitReached if the limit of actions to predict has been reached.
         """
+        self._check_action_limit(tracker)
+
+        prediction = self._predict_next_with_tracker(tracker)
+
+        return self._action_for_prediction(prediction), prediction
+
+    async def _predict_next_action_if_should(
+        self, tracker: DialogueStateTracker
+    ) -> Tuple[rasa.core.actions.action.Action, PolicyPrediction]:
+        """Predicts the next action like `predict_next_with_tracker_if_should`.
+
+        If batching is enabled, the prediction is made together with the predictions
+        for concurrent conversations.
+
+        Returns:
+             The next action and prediction of the policy.
+
+        Raises:
+            ActionLimitReached if the limit of actions to predict has been reached.
+        """
+        if not self.core_batcher:
+            return self.predict_next_with_tracker_if_should(tracker)
+
+        self._check_action_limit(tracker)
+
+        prediction = self._predict_followup_action(tracker)
+        if prediction is None:
+            prediction = await self.core_batcher.submit(tracker)
+
+        return self._action_for_prediction(prediction), prediction
+
+    def _check_action_limit(self, tracker: DialogueStateTracker) -> None:
         should_predict_another_action = self.should_predict_another_action(
             tracker.latest_action_name
         )
@@ -451,8 +569,9 @@ class MessageProcessor:
                 "The limit of actions to predict has been reached."
             )
 
-        prediction = self._predict_next_with_tracker(tracker)
-
+    def _action_for_prediction(
+        self, prediction: PolicyPrediction
+    ) -> rasa.core.actions.action.Action:
         action = rasa.core.actions.action.action_for_index(
             prediction.max_confidence_index, self.domain, self.action_endpoint
         )
@@ -462,7 +581,7 @@ class MessageProcessor:
             f"{prediction.max_confidence:.2f}."
         )
 
-        return action, prediction
+        return action
 
     @staticmethod
     def _is_reminder(e: Event, name: Text) -> bool:
@@ -636,6 +755,9 @@ class MessageProcessor:
         """
         if self.http_interpreter:
             parse_data = await self.http_interpreter.parse(message)
+        elif self.nlu_batcher:
+            parsed_message = await self.nlu_batcher.submit(message)
+            parse_data = self._parse_data(parsed_message, only_output_properties)
         else:
             parse_data = self._parse_message_with_graph(message, only_output_properties)
 
@@ -661,12 +783,28 @@ class MessageProcessor:
         Returns:
             Parsed data extracted from the message.
         """
+        parsed_message = self._run_nlu_graph([message])[0]
+        return self._parse_data(parsed_message, only_output_properties)
+
+    def _run_nlu_graph(self, messages: List[UserMessage]) -> List[Message]:
+        """Runs the NLU part of the graph once for all messages.
+
+        Arguments:
+            messages: Messages to handle.
+
+        Returns:
+            The parsed messages in the order of `messages`.
+        """
         results = self.graph_runner.run(
-            inputs={PLACEHOLDER_MESSAGE: [message]},
+            inputs={PLACEHOLDER_MESSAGE: messages},
             targets=[self.model_metadata.nlu_target],
         )
-        parsed_messages = results[self.model_metadata.nlu_target]
-        parsed_message = parsed_messages[0]
+        return results[self.model_metadata.nlu_target]
+
+    @staticmethod
+    def _parse_data(
+        parsed_message: Message, only_output_properties: bool = True
+    ) -> Dict[Text, Any]:
         parse_data = {
             TEXT: "",
             INTENT: {INTENT_NAME_KEY: None, PREDICTED_CONFIDENCE_KEY: 0.0},
@@ -753,7 +891,7 @@ class MessageProcessor:
         while should_predict_another_action and self._should_handle_message(tracker):
             # this actually just calls the policy's method by the same name
             try:
-                action, prediction = self.predict_next_with_tracker_if_should(tracker)
+                action, prediction = await self._predict_next_action_if_should(tracker)
             except ActionLimitReached:
                 logger.warning(
                     "Circuit breaker tripped. Stopped predicting "
@@ -983,27 +1121,58 @@ class MessageProcessor:
         self, tracker: DialogueStateTracker
     ) -> PolicyPrediction:
         """Collect predictions from ensemble and return action and predictions."""
-        followup_action = tracker.followup_action
-        if followup_action:
-            tracker.clear_followup_action()
-            if followup_action in self.domain.action_names_or_texts:
-                prediction = PolicyPrediction.for_action_name(
-                    self.domain, followup_action, FOLLOWUP_ACTION
-                )
-                return prediction
+        followup_action_prediction = self._predict_followup_action(tracker)
+        if followup_action_prediction:
+            return followup_action_prediction
 
-            logger.error(
-                f"Trying to run unknown follow-up action '{followup_action}'. "
-                "Instead of running that, Rasa Open Source will ignore the action "
-                "and predict the next action."
-            )
+        target = self._core_target()
+        results = self.graph_runner.run(
+            inputs={PLACEHOLDER_TRACKER: tracker}, targets=[target]
+        )
+        policy_prediction = results[target]
+        return policy_prediction
+
+    def _run_core_graph(
+        self, trackers: List[DialogueStateTracker]
+    ) -> List[PolicyPrediction]:
+        """Runs the core part of the graph once for all trackers.
+
+        Arguments:
+            trackers: Trackers to predict the next action for.
 
+        Returns:
+            The predictions in the order of `trackers`.
+        """
+        target = self._core_target()
+        results = self.graph_runner.run_batch(
+            inputs=[{PLACEHOLDER_TRACKER: tracker} for tracker in trackers],
+            targets=[target],
+        )
+        return [result[target] for result in results]
+
+    def _core_target(self) -> Text:
         target = self.model_metadata.core_target
         if not target:
             raise ValueError("Cannot predict next action if there is no core target.")
+        return target
 
-        results = self.graph_runner.run(
-            inputs={PLACEHOLDER_TRACKER: tracker}, targets=[target]
+    def _predict_followup_action(
+        self, tracker: DialogueStateTracker
+    ) -> Optional[PolicyPrediction]:
+        """Predicts the follow-up action of the tracker if it has one."""
+        followup_action = tracker.followup_action
+        if not followup_action:
+            return None
+
+        tracker.clear_followup_action()
+        if followup_action in self.domain.action_names_or_texts:
+            return PolicyPrediction.for_action_name(
+                self.domain, followup_action, FOLLOWUP_ACTION
+            )
+
+        logger.error(
+            f"Trying to run unknown follow-up action '{followup_action}'. "
+            "Instead of running that, Rasa Open Source will ignore the action "
+            "and predict the next action."
         )
-        policy_prediction = results[target]
-        return policy_prediction
+        return None
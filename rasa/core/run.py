@@ -18,6 +18,7 @@ from rasa.core.agent import Agent
 from rasa.core.channels import console
 from rasa.core.channels.channel import InputChannel
 from rasa.core.utils import AvailableEndpoints
+from rasa.utils.endpoints import EndpointConfig
 import rasa.shared.utils.io
 from sanic import Sanic
 from asyncio import AbstractEventLoop
@@ -269,3 +270,21 @@ async def close_resources(app: Sanic, _: AbstractEventLoop) -> None:
     event_broker = current_agent.tracker_store.event_broker
     if event_broker:
         await event_broker.close()
+
+    for endpoint in _http_endpoints(current_agent):
+        await endpoint.close()
+
+
+def _http_endpoints(current_agent: Agent) -> List[EndpointConfig]:
+    """Returns the HTTP endpoints of the agent which hold pooled connections."""
+    from rasa.core.nlg.callback import CallbackNaturalLanguageGenerator
+
+    endpoints = [current_agent.action_endpoint, current_agent.model_server]
+
+    if isinstance(current_agent.nlg, CallbackNaturalLanguageGenerator):
+        endpoints.append(current_agent.nlg.nlg_endpoint)
+
+    if current_agent.http_interpreter:
+        endpoints.append(current_agent.http_interpreter.endpoint_config)
+
+    return [endpoint for endpoint in endpoints if isinstance(endpoint, EndpointConfig)]
@@ -0,0 +1,216 @@
+import abc
+import json
+from typing import Any, Dict, List, Optional, Text, Type, Union
+
+from rasa.shared.exceptions import RasaException
+
+# Binary payloads start with this byte, followed by the version of the envelope and
+# the ID of the codec. Serialised JSON can't start with it since it's not valid
+# UTF-8, which allows to tell payloads which were written as plain JSON apart.
+ENVELOPE_MARKER = b"\xff"
+ENVELOPE_VERSION = 1
+ENVELOPE_HEADER_LENGTH = 3
+
+DEFAULT_TRACKER_SERIALISER = "json"
+
+
+class TrackerSerialisationException(RasaException):
+    """Raised when a serialised tracker can't be read."""
+
+
+class TrackerSerialiser(abc.ABC):
+    """Turns the serialised dialogue of a tracker into the payload which is stored.
+
+    Subclasses with a `codec_id` write binary payloads with a header containing the
+    version of the envelope and the codec. Payloads of any known codec and plain
+    JSON payloads can be read by every serialiser, so that the serialiser of a
+    tracker store can be changed without migrating the stored conversations.
+    """
+
+    name: Text = ""
+    codec_id: Optional[int] = None
+
+    @staticmethod
+    def create(name: Optional[Text] = None) -> "TrackerSerialiser":
+        """Creates the serialiser with the given name.
+
+        Args:
+            name: Name of the serialiser. Defaults to the plain JSON serialiser.
+
+        Returns:
+            The serialiser.
+
+        Raises:
+            RasaException: If there is no serialiser with this name or if the package
+                it requires isn't installed.
+        """
+        name = name or DEFAULT_TRACKER_SERIALISER
+        serialisers = {
+            serialiser.name: serialiser for serialiser in _tracker_serialisers()
+        }
+        if name not in serialisers:
+            raise RasaException(
+                f"Unknown tracker serialiser '{name}'. Valid serialisers are: "
+                f"{', '.join(serialisers)}."
+            )
+
+        return serialisers[name]()
+
+    @abc.abstractmethod
+    def encode(self, data: Dict[Text, Any]) -> Union[Text, bytes]:
+        """Encodes the data without the envelope header."""
+        ...
+
+    @abc.abstractmethod
+    def decode(self, body: bytes) -> Dict[Text, Any]:
+        """Decodes data which was encoded by `encode`."""
+        ...
+
+    def dumps(self, data: Dict[Text, Any]) -> Union[Text, bytes]:
+        """Serialises the data including the envelope header.
+
+        Args:
+            data: The serialised dialogue of a tracker.
+
+        Returns:
+            The payload which can be read with `loads`.
+        """
+        if self.codec_id is None:
+            return self.encode(data)
+
+        return (
+            ENVELOPE_MARKER
+            + bytes([ENVELOPE_VERSION, self.codec_id])
+            + self.encode(data)
+        )
+
+    @staticmethod
+    def loads(payload: Union[Text, bytes]) -> Dict[Text, Any]:
+        """Deserialises a payload of any serialiser.
+
+        Args:
+            payload: A payload which was created with `dumps` or by `json.dumps`.
+
+        Returns:
+            The serialised dialogue of the tracker.
+
+        Raises:
+            TrackerSerialisationException: If the payload has an envelope which
+                can't be read.
+        """
+        if isinstance(payload, str) or not payload.startswith(ENVELOPE_MARKER):
+            return json.loads(payload)
+
+        if len(payload) < ENVELOPE_HEADER_LENGTH:
+            raise TrackerSerialisationException(
+                "Tracker payload is shorter than the envelope header."
+            )
+        version, codec_id = payload[1], payload[2]
+        if version != ENVELOPE_VERSION:
+            raise TrackerSerialisationException(
+                f"Tracker was serialised with the unknown envelope version {version}."
+            )
+        serialiser = _serialiser_for_codec_id(codec_id)
+
+        return serialiser.decode(payload[ENVELOPE_HEADER_LENGTH:])
+
+
+class JsonTrackerSerialiser(TrackerSerialiser):
+    """Serialises trackers as plain JSON text without envelope.
+
+    The payloads can also be read by Rasa versions without tracker serialisers.
+    """
+
+    name = "json"
+
+    def encode(self, data: Dict[Text, Any]) -> Text:
+        """Encodes the data as JSON."""
+        return json.dumps(data)
+
+    def decode(self, body: bytes) -> Dict[Text, Any]:
+        """Decodes JSON."""
+        return json.loads(body)
+
+
+class OrjsonTrackerSerialiser(TrackerSerialiser):
+    """Serialises trackers as JSON using the `orjson` package."""
+
+    name = "orjson"
+    codec_id = 1
+
+    def __init__(self) -> None:
+        """Imports `orjson`."""
+        try:
+            import orjson
+        except ImportError as e:
+            raise RasaException(
+                f"The '{self.name}' tracker serialiser requires the 'orjson' package. "
+                f"Please install it or use the '{DEFAULT_TRACKER_SERIALISER}' "
+                f"tracker serialiser instead."
+            ) from e
+
+        self._orjson = orjson
+        # `json.dumps` converts non-string keys to strings as well
+        self._options = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+    def encode(self, data: Dict[Text, Any]) -> bytes:
+        """Encodes the data as JSON."""
+        return self._orjson.dumps(data, option=self._options)
+
+    def decode(self, body: bytes) -> Dict[Text, Any]:
+        """Decodes JSON."""
+        return self._orjson.loads(body)
+
+
+class MsgpackTrackerSerialiser(TrackerSerialiser):
+    """Serialises trackers as MessagePack using the `msgpack` package."""
+
+    name = "msgpack"
+    codec_id = 2
+
+    def __init__(self) -> None:
+        """Imports `msgpack`."""
+        try:
+            import msgpack
+        except ImportError as e:
+            raise RasaException(
+                f"The '{self.name}' tracker serialiser requires the 'msgpack' "
+                f"package. Please install it or use the "
+                f"'{DEFAULT_TRACKER_SERIALISER}' tracker serialiser instead."
+            ) from e
+
+        self._msgpack = msgpack
+
+    def encode(self, data: Dict[Text, Any]) -> bytes:
+        """Encodes the data as MessagePack."""
+        return self._msgpack.packb(data, use_bin_type=True)
+
+    def decode(self, body: bytes) -> Dict[Text, Any]:
+        """Decodes MessagePack."""
+        return self._msgpack.unpackb(body, raw=False, strict_map_key=False)
+
+
+def _tracker_serialisers() -> List[Type[TrackerSerialiser]]:
+    return [JsonTrackerSerialiser, OrjsonTrackerSerialiser, MsgpackTrackerSerialiser]
+
+
+_serialisers_by_codec_id: Dict[int, TrackerSerialiser] = {}
+
+
+def _serialiser_for_codec_id(codec_id: int) -> TrackerSerialiser:
+    if codec_id not in _serialisers_by_codec_id:
+        serialiser_class = next(
+            (
+                serialiser
+                for serialiser in _tracker_serialisers()
+                if serialiser.codec_id == codec_id
+            ),
+            None,
+        )
+        if serialiser_class is None:
+            raise TrackerSerialisationException(
+                f"Tracker was serialised with the unknown codec {codec_id}."
+            )
+        _serialisers_by_codec_id[codec_id] = serialiser_class()
+
+    return _serialisers_by_codec_id[codec_id]
@@ -1,9 +1,13 @@
 from __future__ import annotations
+import asyncio
+import collections
 import contextlib
+import functools
 import itertools
 import json
 import logging
 import os
+import time
 from inspect import isawaitable, iscoroutinefunction
 
 from time import sleep
@@ -21,6 +25,11 @@ from typing import (
     Generator,
     TypeVar,
     Generic,
+    Tuple,
+    AsyncGenerator,
+    AsyncIterator,
+    NamedTuple,
+    OrderedDict,
 )
 
 from boto3.dynamodb.conditions import Key
@@ -32,6 +41,7 @@ import rasa.shared.utils.common
 import rasa.shared.utils.io
 from rasa.shared.core.constants import ACTION_LISTEN_NAME
 from rasa.core.brokers.broker import EventBroker
+from rasa.core.tracker_serialisation import TrackerSerialiser
 from rasa.core.constants import (
     POSTGRESQL_SCHEMA,
     POSTGRESQL_MAX_OVERFLOW,
@@ -54,8 +64,12 @@ from sqlalchemy.ext.declarative import declarative_base, DeclarativeMeta
 if TYPE_CHECKING:
     import boto3.resources.factory.dynamodb.Table
     from sqlalchemy.engine.url import URL
-    from sqlalchemy.engine.base import Engine
+    from sqlalchemy.engine.base import Engine, Connection
+    from sqlalchemy.engine.interfaces import Dialect
+    from sqlalchemy.ext.asyncio import AsyncSession
     from sqlalchemy.orm import Session, Query
+    from sqlalchemy.sql.dml import Delete, Insert
+    from sqlalchemy.sql.selectable import Select
     from sqlalchemy import Sequence
 
 logger = logging.getLogger(__name__)
@@ -66,6 +80,44 @@ POSTGRESQL_DEFAULT_POOL_SIZE = 50
 
 # default value for key prefix in RedisTrackerStore
 DEFAULT_REDIS_TRACKER_STORE_KEY_PREFIX = "tracker:"
+# the RedisTrackerStore keeps the number of events of a conversation in a separate
+# key with this prefix so that it can be read without fetching the conversation
+REDIS_EVENT_COUNT_KEY_PREFIX = "event_count:"
+
+# default values for key prefixes in AsyncRedisTrackerStore
+DEFAULT_REDIS_EVENT_LIST_KEY_PREFIX = "tracker_events:"
+DEFAULT_REDIS_SESSION_START_KEY_PREFIX = "tracker_session_start:"
+
+# sort key of the items of the ChunkedDynamoTrackerStore
+DYNAMO_CHUNK_KEY = "chunk"
+# the item with this sort key keeps the number of chunks and the session index
+DYNAMO_METADATA_CHUNK = 0
+# DynamoDB limits the size of an item including the attribute names to 400 KB
+DYNAMO_MAX_CHUNK_SIZE = 350_000
+DEFAULT_DYNAMO_SCAN_SEGMENTS = 4
+# DynamoDB doesn't allow to get more items with a single `BatchGetItem` request
+DYNAMO_MAX_BATCH_GET_ITEMS = 100
+# attribute of the items of the DynamoTrackerStore which keeps the number of events
+DYNAMO_EVENT_COUNT_KEY = "event_count"
+
+# number of conversations which `retrieve_many` fetches with a single request
+DEFAULT_RETRIEVE_MANY_BATCH_SIZE = 100
+
+# fields of the conversation documents of the MongoTrackerStore which allow to only
+# fetch the events of the latest conversation session
+MONGO_NUMBER_OF_EVENTS_KEY = "number_of_events"
+MONGO_LAST_SESSION_START_INDEX_KEY = "last_session_start_index"
+# `$slice` requires a limit, this includes all remaining events
+MONGO_MAX_SLICE_LENGTH = 2**31 - 1
+
+# keys of the tracker store endpoint configuration which enable the
+# `CachedTrackerStore`
+USE_TRACKER_CACHE_KEY = "use_tracker_cache"
+TRACKER_CACHE_MAX_EVENTS_KEY = "tracker_cache_max_events"
+TRACKER_CACHE_TTL_KEY = "tracker_cache_ttl"
+VALIDATE_CACHED_TRACKERS_KEY = "validate_cached_trackers"
+DEFAULT_TRACKER_CACHE_MAX_EVENTS = 100_000
+DEFAULT_TRACKER_CACHE_TTL = 60
 
 
 def check_if_tracker_store_async(tracker_store: TrackerStore) -> bool:
@@ -133,6 +185,7 @@ class TrackerStore:
         self,
         domain: Optional[Domain],
         event_broker: Optional[EventBroker] = None,
+        tracker_serialiser: Optional[Text] = None,
         **kwargs: Dict[Text, Any],
     ) -> None:
         """Create a TrackerStore.
@@ -141,11 +194,15 @@ class TrackerStore:
             domain: The `Domain` to initialize the `DialogueStateTracker`.
             event_broker: An event broker to publish any new events to another
                 destination.
+            tracker_serialiser: Name of the serialiser which tracker stores that
+                store serialised trackers use (e.g. `orjson` or `msgpack`). Defaults
+                to plain JSON.
             kwargs: Additional kwargs.
         """
         self._domain = domain or Domain.empty()
         self.event_broker = event_broker
         self.max_event_history: Optional[int] = None
+        self.serialiser = TrackerSerialiser.create(tracker_serialiser)
 
     @staticmethod
     def create(
@@ -173,6 +230,19 @@ class TrackerStore:
                     f"{_get_async_tracker_store_methods()}"
                 )
                 tracker_store = AwaitableTrackerStore(tracker_store)
+            if obj is not None and obj.kwargs.get(USE_TRACKER_CACHE_KEY):
+                tracker_store = CachedTrackerStore(
+                    tracker_store,
+                    max_events=obj.kwargs.get(
+                        TRACKER_CACHE_MAX_EVENTS_KEY, DEFAULT_TRACKER_CACHE_MAX_EVENTS
+                    ),
+                    ttl=obj.kwargs.get(
+                        TRACKER_CACHE_TTL_KEY, DEFAULT_TRACKER_CACHE_TTL
+                    ),
+                    validate_cached_trackers=obj.kwargs.get(
+                        VALIDATE_CACHED_TRACKERS_KEY, True
+                    ),
+                )
             return tracker_store
         except (
             BotoCoreError,
@@ -244,6 +314,53 @@ class TrackerStore:
         """Save method that will be overridden by specific tracker."""
         raise NotImplementedError()
 
+    async def save_new_events(
+        self, sender_id: Text, events: List[Event], expected_offset: int
+    ) -> None:
+        """Persists events which were added to a conversation since it was loaded.
+
+        In contrast to `save` only the delta is written and published to the event
+        broker. This method should be overridden by the specific tracker store for
+        implementations which don't need to read the stored conversation. The
+        default implementation retrieves the stored tracker, updates it with the
+        new events and saves it.
+
+        Args:
+            sender_id: Conversation ID the events belong to.
+            events: The new events in the order in which they were applied.
+            expected_offset: Number of events of the conversation which the caller
+                expects to be persisted already.
+        """
+        tracker = await self.retrieve(sender_id)
+        if tracker is None:
+            tracker = self.init_tracker(sender_id)
+        if tracker.persisted_event_count is None:
+            tracker.persisted_event_count = len(tracker.events)
+
+        self._warn_if_offset_mismatch(
+            sender_id, expected_offset, tracker.persisted_event_count
+        )
+
+        for event in events:
+            tracker.update(event)
+
+        await self.save(tracker)
+
+    @staticmethod
+    def _warn_if_offset_mismatch(
+        sender_id: Text, expected_offset: int, number_of_stored_events: Optional[int]
+    ) -> None:
+        if (
+            number_of_stored_events is not None
+            and number_of_stored_events != expected_offset
+        ):
+            logger.warning(
+                f"Expected {expected_offset} stored events for conversation "
+                f"'{sender_id}' but found {number_of_stored_events}. The conversation "
+                f"might have been modified concurrently. New events will be "
+                f"appended after the stored events."
+            )
+
     async def exists(self, conversation_id: Text) -> bool:
         """Checks if tracker exists for the specified ID.
 
@@ -287,17 +404,150 @@ class TrackerStore:
         """
         return await self.retrieve(conversation_id)
 
+    async def retrieve_many(
+        self,
+        sender_ids: Iterable[Text],
+        batch_size: int = DEFAULT_RETRIEVE_MANY_BATCH_SIZE,
+    ) -> AsyncIterator[DialogueStateTracker]:
+        """Retrieves the trackers for the latest sessions of several conversations.
+
+        The trackers are fetched in batches with a single request per batch if the
+        specific tracker store supports it.
+
+        Args:
+            sender_ids: Conversation IDs to fetch the trackers for.
+            batch_size: Number of conversations which are fetched at once.
+
+        Yields:
+            The trackers in the order of `sender_ids`. Conversations which aren't
+            stored are skipped.
+        """
+        async for tracker in self._retrieve_many(
+            sender_ids, batch_size, fetch_events_from_all_sessions=False
+        ):
+            yield tracker
+
+    async def retrieve_full_trackers(
+        self,
+        sender_ids: Iterable[Text],
+        batch_size: int = DEFAULT_RETRIEVE_MANY_BATCH_SIZE,
+    ) -> AsyncIterator[DialogueStateTracker]:
+        """Retrieves the trackers with all sessions of several conversations.
+
+        Args:
+            sender_ids: Conversation IDs to fetch the trackers for.
+            batch_size: Number of conversations which are fetched at once.
+
+        Yields:
+            The trackers in the order of `sender_ids`. Conversations which aren't
+            stored are skipped.
+        """
+        async for tracker in self._retrieve_many(
+            sender_ids, batch_size, fetch_events_from_all_sessions=True
+        ):
+            yield tracker
+
+    async def _retrieve_many(
+        self,
+        sender_ids: Iterable[Text],
+        batch_size: int,
+        fetch_events_from_all_sessions: bool,
+    ) -> AsyncIterator[DialogueStateTracker]:
+        sender_ids = iter(sender_ids)
+        while True:
+            batch = list(itertools.islice(sender_ids, max(batch_size, 1)))
+            if not batch:
+                return
+
+            for tracker in await self._retrieve_batch(
+                batch, fetch_events_from_all_sessions
+            ):
+                yield tracker
+
+    async def _retrieve_batch(
+        self, sender_ids: List[Text], fetch_events_from_all_sessions: bool
+    ) -> List[DialogueStateTracker]:
+        """Retrieves the trackers of a batch of conversations.
+
+        This method should be overridden by the specific tracker store to fetch the
+        whole batch with a single request. The default implementation retrieves
+        one tracker after another.
+
+        Args:
+            sender_ids: The conversation IDs of the batch.
+            fetch_events_from_all_sessions: Whether to fetch events from all
+                conversation sessions. If `False`, only fetch events from the
+                latest conversation session.
+
+        Returns:
+            The trackers of the stored conversations in the order of `sender_ids`.
+        """
+        trackers = []
+        for sender_id in sender_ids:
+            if fetch_events_from_all_sessions:
+                tracker = await self.retrieve_full_tracker(sender_id)
+            else:
+                tracker = await self.retrieve(sender_id)
+            if tracker is not None:
+                trackers.append(tracker)
+
+        return trackers
+
+    def _trackers_from_serialised_events(
+        self, sender_ids: List[Text], events: Dict[Text, List[Dict[Text, Any]]]
+    ) -> List[DialogueStateTracker]:
+        """Creates the trackers of a batch of conversations from their events.
+
+        Args:
+            sender_ids: The conversation IDs of the batch.
+            events: The serialised events of the stored conversations.
+
+        Returns:
+            The trackers of the conversations with events in the order of
+            `sender_ids`.
+        """
+        trackers = []
+        for sender_id in sender_ids:
+            if not events.get(sender_id):
+                continue
+
+            tracker = DialogueStateTracker.from_dict(
+                sender_id, events[sender_id], self.domain.slots
+            )
+            tracker.persisted_event_count = len(tracker.events)
+            trackers.append(tracker)
+
+        return trackers
+
     async def stream_events(self, tracker: DialogueStateTracker) -> None:
         """Streams events to a message broker."""
         if self.event_broker is None:
             return None
 
-        offset = await self.number_of_existing_events(tracker.sender_id)
+        offset = await self.persisted_event_offset(tracker)
         events = tracker.events
         new_events = list(itertools.islice(events, offset, len(events)))
 
         await self._stream_new_events(self.event_broker, new_events, tracker.sender_id)
 
+    async def persisted_event_offset(self, tracker: DialogueStateTracker) -> int:
+        """Returns the number of events of `tracker` which are already persisted.
+
+        Uses the count the tracker remembered when it was loaded from or saved to
+        the tracker store and only falls back to `number_of_existing_events` in case
+        this count is unknown.
+
+        Args:
+            tracker: The tracker which is about to be saved.
+
+        Returns:
+            Index of the first event of `tracker.events` which is not persisted yet.
+        """
+        if tracker.persisted_event_count is not None:
+            return tracker.persisted_event_count
+
+        return await self.number_of_existing_events(tracker.sender_id)
+
     async def _stream_new_events(
         self,
         event_broker: EventBroker,
@@ -325,9 +575,11 @@ class TrackerStore:
     ) -> Optional[DialogueStateTracker]:
         """Deserializes the tracker and returns it."""
         tracker = self.init_tracker(sender_id)
+        # custom tracker stores might not call the constructor of `TrackerStore`
+        serialiser = getattr(self, "serialiser", None) or TrackerSerialiser.create()
 
         try:
-            dialogue = Dialogue.from_parameters(json.loads(serialised_tracker))
+            dialogue = Dialogue.from_parameters(serialiser.loads(serialised_tracker))
         except UnicodeDecodeError as e:
             raise TrackerDeserialisationException(
                 "Tracker cannot be deserialised. "
@@ -336,6 +588,7 @@ class TrackerStore:
             ) from e
 
         tracker.recreate_from_dialogue(dialogue)
+        tracker.persisted_event_count = len(tracker.events)
 
         return tracker
 
@@ -359,14 +612,46 @@ class InMemoryTrackerStore(TrackerStore, SerializedTrackerAsText):
         **kwargs: Dict[Text, Any],
     ) -> None:
         """Initializes the tracker store."""
-        self.store: Dict[Text, Text] = {}
+        self.store: Dict[Text, Union[Text, bytes]] = {}
+        # number of events of the serialised conversations in `store`
+        self._event_counts: Dict[Text, Tuple[Union[Text, bytes], int]] = {}
         super().__init__(domain, event_broker, **kwargs)
 
     async def save(self, tracker: DialogueStateTracker) -> None:
         """Updates and saves the current conversation state."""
         await self.stream_events(tracker)
-        serialised = InMemoryTrackerStore.serialise_tracker(tracker)
+        serialised = self.serialiser.dumps(tracker.as_dialogue().as_dict())
         self.store[tracker.sender_id] = serialised
+        self._event_counts[tracker.sender_id] = (serialised, len(tracker.events))
+        tracker.persisted_event_count = len(tracker.events)
+
+    async def save_new_events(
+        self, sender_id: Text, events: List[Event], expected_offset: int
+    ) -> None:
+        """Appends `events` to the conversation stored in memory."""
+        stored = self.serialiser.loads(self.store.get(sender_id, "{}"))
+        stored_events = stored.get("events", [])
+        self._warn_if_offset_mismatch(sender_id, expected_offset, len(stored_events))
+
+        if self.event_broker:
+            await self._stream_new_events(self.event_broker, events, sender_id)
+
+        stored_events.extend(event.as_dict() for event in events)
+        serialised = self.serialiser.dumps({"events": stored_events, "name": sender_id})
+        self.store[sender_id] = serialised
+        self._event_counts[sender_id] = (serialised, len(stored_events))
+
+    async def number_of_existing_events(self, sender_id: Text) -> int:
+        """Returns the number of stored events without deserialising the tracker."""
+        if sender_id not in self.store:
+            return 0
+
+        serialised, number_of_events = self._event_counts.get(sender_id, (None, 0))
+        if serialised is self.store[sender_id]:
+            return number_of_events
+
+        # the conversation was put into `store` directly
+        return await super().number_of_existing_events(sender_id)
 
     async def retrieve(self, sender_id: Text) -> Optional[DialogueStateTracker]:
         """Returns tracker matching sender_id."""
@@ -446,11 +731,64 @@ class RedisTrackerStore(TrackerStore, SerializedTrackerAsText):
         if not timeout and self.record_exp:
             timeout = self.record_exp
 
-        serialised_tracker = self.serialise_tracker(tracker)
-        self.red.set(
-            self.key_prefix + tracker.sender_id, serialised_tracker, ex=timeout
+        serialised_tracker = self.serialiser.dumps(tracker.as_dialogue().as_dict())
+        self._set_conversation(
+            tracker.sender_id, serialised_tracker, len(tracker.events), timeout
+        )
+        tracker.persisted_event_count = len(tracker.events)
+
+    def _set_conversation(
+        self,
+        sender_id: Text,
+        serialised_tracker: Text,
+        number_of_events: int,
+        timeout: Optional[float],
+    ) -> None:
+        """Stores the conversation together with its number of events."""
+        pipeline = self.red.pipeline()
+        pipeline.set(self.key_prefix + sender_id, serialised_tracker, ex=timeout)
+        pipeline.set(self._event_count_key(sender_id), number_of_events, ex=timeout)
+        pipeline.execute()
+
+    def _event_count_key(self, sender_id: Text) -> Text:
+        # the prefix keeps the key out of the tracker keys returned by `keys`
+        return REDIS_EVENT_COUNT_KEY_PREFIX + self.key_prefix + sender_id
+
+    async def save_new_events(
+        self, sender_id: Text, events: List[Event], expected_offset: int
+    ) -> None:
+        """Appends `events` to the conversation stored in Redis.
+
+        The stored conversation is updated without deserialising its events.
+        """
+        key = self.key_prefix + sender_id
+        stored = self.serialiser.loads(self.red.get(key) or "{}")
+        stored_events = stored.get("events", [])
+        self._warn_if_offset_mismatch(sender_id, expected_offset, len(stored_events))
+
+        if self.event_broker:
+            await self._stream_new_events(self.event_broker, events, sender_id)
+
+        stored_events.extend(event.as_dict() for event in events)
+        self._set_conversation(
+            sender_id,
+            self.serialiser.dumps({"events": stored_events, "name": sender_id}),
+            len(stored_events),
+            self.record_exp,
         )
 
+    async def number_of_existing_events(self, sender_id: Text) -> int:
+        """Reads the number of stored events without fetching the conversation."""
+        number_of_events = self.red.get(self._event_count_key(sender_id))
+        if number_of_events is not None:
+            return int(number_of_events)
+
+        if not self.red.exists(self.key_prefix + sender_id):
+            return 0
+
+        # conversations which were stored by older versions of Rasa have no count
+        return await super().number_of_existing_events(sender_id)
+
     async def retrieve(self, sender_id: Text) -> Optional[DialogueStateTracker]:
         """Retrieves tracker for the latest conversation session.
 
@@ -468,11 +806,232 @@ class RedisTrackerStore(TrackerStore, SerializedTrackerAsText):
         else:
             return None
 
+    async def _retrieve_batch(
+        self, sender_ids: List[Text], fetch_events_from_all_sessions: bool
+    ) -> List[DialogueStateTracker]:
+        """Fetches the stored conversations of the batch with a single `MGET`."""
+        stored = self.red.mget(
+            [self.key_prefix + sender_id for sender_id in sender_ids]
+        )
+
+        return [
+            self.deserialise_tracker(sender_id, serialised_tracker)
+            for sender_id, serialised_tracker in zip(sender_ids, stored)
+            if serialised_tracker is not None
+        ]
+
     async def keys(self) -> Iterable[Text]:
         """Returns keys of the Redis Tracker Store."""
         return self.red.keys(self.key_prefix + "*")
 
 
+class AsyncRedisTrackerStore(TrackerStore):
+    """Stores conversation history in Redis lists using the asyncio Redis client.
+
+    Every event is stored as separate list element. Saving a tracker only appends the
+    events which were added since the tracker was loaded, so the cost of a save
+    doesn't grow with the length of the conversation. The index of the latest
+    `SessionStarted` event is kept under a separate key so that retrieving a tracker
+    only transfers the events of the latest conversation session.
+    """
+
+    def __init__(
+        self,
+        domain: Domain,
+        host: Text = "localhost",
+        port: int = 6379,
+        db: int = 0,
+        password: Optional[Text] = None,
+        event_broker: Optional[EventBroker] = None,
+        record_exp: Optional[float] = None,
+        key_prefix: Optional[Text] = None,
+        use_ssl: bool = False,
+        ssl_keyfile: Optional[Text] = None,
+        ssl_certfile: Optional[Text] = None,
+        ssl_ca_certs: Optional[Text] = None,
+        **kwargs: Dict[Text, Any],
+    ) -> None:
+        """Initializes the tracker store."""
+        try:
+            from redis import asyncio as aioredis
+        except ImportError as e:
+            raise RasaException(
+                f"'{self.__class__.__name__}' requires version 4.2 or newer of the "
+                f"'redis' package. Please upgrade it or use the "
+                f"'{RedisTrackerStore.__name__}' instead."
+            ) from e
+
+        self.red = aioredis.Redis(
+            host=host,
+            port=port,
+            db=db,
+            password=password,
+            ssl=use_ssl,
+            ssl_keyfile=ssl_keyfile,
+            ssl_certfile=ssl_certfile,
+            ssl_ca_certs=ssl_ca_certs,
+            decode_responses=True,
+        )
+        self.record_exp = record_exp
+
+        self.key_prefix = DEFAULT_REDIS_EVENT_LIST_KEY_PREFIX
+        self.session_start_key_prefix = DEFAULT_REDIS_SESSION_START_KEY_PREFIX
+        if key_prefix:
+            logger.debug(f"Setting non-default redis key prefix: '{key_prefix}'.")
+            self._set_key_prefix(key_prefix)
+
+        super().__init__(domain, event_broker, **kwargs)
+
+    def _set_key_prefix(self, key_prefix: Text) -> None:
+        if isinstance(key_prefix, str) and key_prefix.isalnum():
+            self.key_prefix = f"{key_prefix}:{DEFAULT_REDIS_EVENT_LIST_KEY_PREFIX}"
+            self.session_start_key_prefix = (
+                f"{key_prefix}:{DEFAULT_REDIS_SESSION_START_KEY_PREFIX}"
+            )
+        else:
+            logger.warning(
+                f"Omitting provided non-alphanumeric redis key prefix: '{key_prefix}'. "
+                f"Using default '{self.key_prefix}' instead."
+            )
+
+    def _get_key_prefix(self) -> Text:
+        return self.key_prefix
+
+    def _events_key(self, sender_id: Text) -> Text:
+        return self.key_prefix + sender_id
+
+    def _session_start_key(self, sender_id: Text) -> Text:
+        return self.session_start_key_prefix + sender_id
+
+    async def save(self, tracker: DialogueStateTracker) -> None:
+        """Appends the events which aren't stored yet to the conversation."""
+        offset = await self.persisted_event_offset(tracker)
+        new_events = list(itertools.islice(tracker.events, offset, None))
+
+        await self.save_new_events(tracker.sender_id, new_events, offset)
+
+        tracker.persisted_event_count = len(tracker.events)
+
+    async def save_new_events(
+        self, sender_id: Text, events: List[Event], expected_offset: int
+    ) -> None:
+        """Appends `events` to the conversation and refreshes its expiry time."""
+        if not events:
+            return
+
+        if self.event_broker:
+            await self._stream_new_events(self.event_broker, events, sender_id)
+
+        events_key = self._events_key(sender_id)
+        session_start_key = self._session_start_key(sender_id)
+
+        async with self.red.pipeline(transaction=True) as pipeline:
+            pipeline.rpush(events_key, *[json.dumps(e.as_dict()) for e in events])
+            if self.record_exp:
+                pipeline.expire(events_key, int(self.record_exp))
+                pipeline.expire(session_start_key, int(self.record_exp))
+            number_of_events, *_ = await pipeline.execute()
+
+        session_starts = [
+            index
+            for index, event in enumerate(events)
+            if isinstance(event, SessionStarted)
+        ]
+        if session_starts:
+            first_new_event_index = number_of_events - len(events)
+            await self.red.set(
+                session_start_key,
+                first_new_event_index + session_starts[-1],
+                ex=int(self.record_exp) if self.record_exp else None,
+            )
+
+    async def _session_start_index(self, sender_id: Text) -> int:
+        index = await self.red.get(self._session_start_key(sender_id))
+        return int(index) if index is not None else 0
+
+    async def number_of_existing_events(self, sender_id: Text) -> int:
+        """Returns the number of stored events since the latest session start."""
+        session_start_index = await self._session_start_index(sender_id)
+        number_of_events = await self.red.llen(self._events_key(sender_id))
+
+        return max(number_of_events - session_start_index, 0)
+
+    async def _retrieve(
+        self, sender_id: Text, fetch_events_from_all_sessions: bool
+    ) -> Optional[DialogueStateTracker]:
+        start = (
+            0
+            if fetch_events_from_all_sessions
+            else await self._session_start_index(sender_id)
+        )
+        serialised_events = await self.red.lrange(
+            self._events_key(sender_id), start, -1
+        )
+
+        if not serialised_events:
+            return None
+
+        tracker = DialogueStateTracker.from_dict(
+            sender_id, [json.loads(e) for e in serialised_events], self.domain.slots
+        )
+        tracker.persisted_event_count = len(tracker.events)
+
+        return tracker
+
+    async def retrieve(self, sender_id: Text) -> Optional[DialogueStateTracker]:
+        """Retrieves tracker for the latest conversation session."""
+        return await self._retrieve(sender_id, fetch_events_from_all_sessions=False)
+
+    async def retrieve_full_tracker(
+        self, conversation_id: Text
+    ) -> Optional[DialogueStateTracker]:
+        """Fetching all tracker events across conversation sessions."""
+        return await self._retrieve(
+            conversation_id, fetch_events_from_all_sessions=True
+        )
+
+    async def _retrieve_batch(
+        self, sender_ids: List[Text], fetch_events_from_all_sessions: bool
+    ) -> List[DialogueStateTracker]:
+        """Fetches the events of the batch with a single pipeline.
+
+        The session start indices are fetched with a single `MGET` before.
+        """
+        starts = [0] * len(sender_ids)
+        if not fetch_events_from_all_sessions:
+            session_start_indices = await self.red.mget(
+                [self._session_start_key(sender_id) for sender_id in sender_ids]
+            )
+            starts = [int(index or 0) for index in session_start_indices]
+
+        async with self.red.pipeline(transaction=False) as pipeline:
+            for sender_id, start in zip(sender_ids, starts):
+                pipeline.lrange(self._events_key(sender_id), start, -1)
+            stored = await pipeline.execute()
+
+        return self._trackers_from_serialised_events(
+            sender_ids,
+            {
+                sender_id: [json.loads(e) for e in serialised_events]
+                for sender_id, serialised_events in zip(sender_ids, stored)
+            },
+        )
+
+    async def exists(self, conversation_id: Text) -> bool:
+        """Checks if a tracker exists for the specified ID."""
+        return await self.red.exists(self._events_key(conversation_id)) > 0
+
+    async def keys(self) -> Iterable[Text]:
+        """Returns sender_ids of the tracker store.
+
+        Uses `SCAN` instead of `KEYS` so that Redis isn't blocked while iterating.
+        """
+        return [
+            key[len(self.key_prefix) :]
+            async for key in self.red.scan_iter(match=self.key_prefix + "*")
+        ]
+
+
 class DynamoTrackerStore(TrackerStore, SerializedTrackerAsDict):
     """Stores conversation history in DynamoDB."""
 
@@ -482,6 +1041,7 @@ class DynamoTrackerStore(TrackerStore, SerializedTrackerAsDict):
         table_name: Text = "states",
         region: Text = "us-east-1",
         event_broker: Optional[EndpointConfig] = None,
+        scan_segments: int = DEFAULT_DYNAMO_SCAN_SEGMENTS,
         **kwargs: Dict[Text, Any],
     ) -> None:
         """Initialize `DynamoTrackerStore`.
@@ -493,6 +1053,8 @@ class DynamoTrackerStore(TrackerStore, SerializedTrackerAsDict):
             region: The name of the region associated with the client.
                 A client is associated with a single region.
             event_broker: An event broker used to publish events.
+            scan_segments: Number of segments of the table which are scanned in
+                parallel when listing the conversation IDs.
             kwargs: Additional kwargs.
         """
         import boto3
@@ -500,6 +1062,7 @@ class DynamoTrackerStore(TrackerStore, SerializedTrackerAsDict):
         self.client = boto3.client("dynamodb", region_name=region)
         self.region = region
         self.table_name = table_name
+        self.scan_segments = max(scan_segments, 1)
         self.db = self.get_or_create_table(table_name)
         super().__init__(domain, event_broker, **kwargs)
 
@@ -533,8 +1096,46 @@ class DynamoTrackerStore(TrackerStore, SerializedTrackerAsDict):
         """Saves the current conversation state."""
         await self.stream_events(tracker)
         serialized = self.serialise_tracker(tracker)
+        serialized[DYNAMO_EVENT_COUNT_KEY] = len(tracker.events)
 
         self.db.put_item(Item=serialized)
+        tracker.persisted_event_count = len(tracker.events)
+
+    async def save_new_events(
+        self, sender_id: Text, events: List[Event], expected_offset: int
+    ) -> None:
+        """Appends `events` to the conversation item stored in DynamoDB."""
+        item = self.db.get_item(Key={"sender_id": sender_id}).get("Item") or {
+            "name": sender_id,
+            "sender_id": sender_id,
+        }
+        stored_events = item.get("events", [])
+        self._warn_if_offset_mismatch(sender_id, expected_offset, len(stored_events))
+
+        if self.event_broker:
+            await self._stream_new_events(self.event_broker, events, sender_id)
+
+        item["events"] = stored_events + core_utils.replace_floats_with_decimals(
+            [event.as_dict() for event in events]
+        )
+        item[DYNAMO_EVENT_COUNT_KEY] = len(item["events"])
+        self.db.put_item(Item=item)
+
+    async def number_of_existing_events(self, sender_id: Text) -> int:
+        """Reads the number of stored events without reading the stored events."""
+        response = self.db.get_item(
+            Key={"sender_id": sender_id},
+            ProjectionExpression="#count",
+            ExpressionAttributeNames={"#count": DYNAMO_EVENT_COUNT_KEY},
+        )
+        if "Item" not in response:
+            return 0
+
+        if DYNAMO_EVENT_COUNT_KEY in response["Item"]:
+            return int(response["Item"][DYNAMO_EVENT_COUNT_KEY])
+
+        # conversations which were stored by older versions of Rasa have no count
+        return await super().number_of_existing_events(sender_id)
 
     @staticmethod
     def serialise_tracker(
@@ -572,51 +1173,439 @@ class DynamoTrackerStore(TrackerStore, SerializedTrackerAsDict):
         else:
             slots = self.domain.slots
 
-        return DialogueStateTracker.from_dict(sender_id, events_with_floats, slots)
+        tracker = DialogueStateTracker.from_dict(sender_id, events_with_floats, slots)
+        tracker.persisted_event_count = len(tracker.events)
+
+        return tracker
+
+    async def _retrieve_batch(
+        self, sender_ids: List[Text], fetch_events_from_all_sessions: bool
+    ) -> List[DialogueStateTracker]:
+        """Fetches the conversation items of the batch with `BatchGetItem`."""
+        events = {}
+        for start in range(0, len(sender_ids), DYNAMO_MAX_BATCH_GET_ITEMS):
+            keys = [
+                {"sender_id": sender_id}
+                for sender_id in sender_ids[start : start + DYNAMO_MAX_BATCH_GET_ITEMS]
+            ]
+            for item in self._batch_get_items(keys, ["sender_id", "events"]):
+                # `float`s are stored as `Decimal` objects - convert them back
+                events[item["sender_id"]] = core_utils.replace_decimals_with_floats(
+                    item.get("events", [])
+                )
+
+        return self._trackers_from_serialised_events(sender_ids, events)
+
+    def _batch_get_items(
+        self, keys: List[Dict[Text, Any]], attributes: List[Text]
+    ) -> List[Dict[Text, Any]]:
+        """Gets items with `BatchGetItem` and retries keys which weren't processed.
+
+        Args:
+            keys: The keys of the items. At most `DYNAMO_MAX_BATCH_GET_ITEMS`.
+            attributes: The attributes of the items to get.
+
+        Returns:
+            The items in an arbitrary order.
+        """
+        items = []
+        request = {
+            self.table_name: {
+                "Keys": keys,
+                "ProjectionExpression": ", ".join(f"#{a}" for a in attributes),
+                "ExpressionAttributeNames": {f"#{a}": a for a in attributes},
+            }
+        }
+        while request:
+            response = self.db.meta.client.batch_get_item(RequestItems=request)
+            items.extend(response["Responses"].get(self.table_name, []))
+            request = response.get("UnprocessedKeys")
+
+        return items
 
     async def keys(self) -> Iterable[Text]:
         """Returns sender_ids of the `DynamoTrackerStore`."""
-        response = self.db.scan(ProjectionExpression="sender_id")
-        sender_ids = [i["sender_id"] for i in response["Items"]]
+        return await self._scan_sender_ids()
 
-        while response.get("LastEvaluatedKey"):
-            response = self.db.scan(
-                ProjectionExpression="sender_id",
-                ExclusiveStartKey=response["LastEvaluatedKey"],
-            )
-            sender_ids.extend([i["sender_id"] for i in response["Items"]])
+    async def _scan_sender_ids(self, **scan_kwargs: Any) -> List[Text]:
+        """Scans the segments of the table in parallel and collects the sender_ids.
+
+        Args:
+            scan_kwargs: Additional parameters of the `Scan` requests, e.g. a filter.
+
+        Returns:
+            The sender_ids of the scanned items.
+        """
+        loop = asyncio.get_running_loop()
+        segments = await asyncio.gather(
+            *[
+                loop.run_in_executor(
+                    None, functools.partial(self._scan_segment, segment, **scan_kwargs)
+                )
+                for segment in range(self.scan_segments)
+            ]
+        )
+
+        return [sender_id for segment in segments for sender_id in segment]
+
+    def _scan_segment(self, segment: int, **scan_kwargs: Any) -> List[Text]:
+        # the low-level client is used since it's thread-safe in contrast to the
+        # table resource
+        paginator = self.client.get_paginator("scan")
+        sender_ids = []
+        for page in paginator.paginate(
+            TableName=self.table_name,
+            ProjectionExpression="sender_id",
+            Segment=segment,
+            TotalSegments=self.scan_segments,
+            **scan_kwargs,
+        ):
+            sender_ids.extend(item["sender_id"]["S"] for item in page["Items"])
 
         return sender_ids
 
 
-class MongoTrackerStore(TrackerStore, SerializedTrackerAsText):
-    """Stores conversation history in Mongo.
+class ChunkedDynamoTrackerStore(DynamoTrackerStore):
+    """Stores the events of a conversation as append-only chunk items in DynamoDB.
 
-    Property methods:
-        conversations: returns the current conversation
+    The items of a conversation share the `sender_id` as partition key and are
+    sorted by their chunk number. Saving a conversation only writes chunks with the
+    events which were added since it was loaded, so conversations aren't limited by
+    the maximum item size and the cost of a save doesn't grow with their length.
+    Every conversation session starts a new chunk. The chunk of the latest session
+    start is kept in a metadata item, so that retrieving a conversation only reads
+    the chunks of the latest conversation session.
     """
 
-    def __init__(
-        self,
-        domain: Domain,
-        host: Optional[Text] = "mongodb://localhost:27017",
-        db: Optional[Text] = "rasa",
-        username: Optional[Text] = None,
-        password: Optional[Text] = None,
-        auth_source: Optional[Text] = "admin",
-        collection: Optional[Text] = "conversations",
-        event_broker: Optional[EventBroker] = None,
-        **kwargs: Dict[Text, Any],
-    ) -> None:
-        from pymongo.database import Database
-        from pymongo import MongoClient
+    def get_or_create_table(
+        self, table_name: Text
+    ) -> "boto3.resources.factory.dynamodb.Table":
+        """Returns table or creates one if the table name is not in the table list.
 
-        self.client = MongoClient(
-            host,
-            username=username,
-            password=password,
-            authSource=auth_source,
-            # delay connect until process forking is done
+        Raises:
+            RasaException: If the table exists but doesn't have the chunk number as
+                sort key, e.g. because it was created by the `DynamoTrackerStore`.
+        """
+        import boto3
+
+        dynamo = boto3.resource("dynamodb", region_name=self.region)
+        try:
+            description = self.client.describe_table(TableName=table_name)
+        except self.client.exceptions.ResourceNotFoundException:
+            table = dynamo.create_table(
+                TableName=table_name,
+                KeySchema=[
+                    {"AttributeName": "sender_id", "KeyType": "HASH"},
+                    {"AttributeName": DYNAMO_CHUNK_KEY, "KeyType": "RANGE"},
+                ],
+                AttributeDefinitions=[
+                    {"AttributeName": "sender_id", "AttributeType": "S"},
+                    {"AttributeName": DYNAMO_CHUNK_KEY, "AttributeType": "N"},
+                ],
+                ProvisionedThroughput={"ReadCapacityUnits": 5, "WriteCapacityUnits": 5},
+            )
+
+            # Wait until the table exists.
+            table.meta.client.get_waiter("table_exists").wait(TableName=table_name)
+            return table
+
+        key_names = {key["AttributeName"] for key in description["Table"]["KeySchema"]}
+        if DYNAMO_CHUNK_KEY not in key_names:
+            raise RasaException(
+                f"The DynamoDB table '{table_name}' doesn't use '{DYNAMO_CHUNK_KEY}' "
+                f"as sort key. It was probably created by the "
+                f"'{DynamoTrackerStore.__name__}'. Please configure a different "
+                f"table for the '{self.__class__.__name__}'."
+            )
+
+        return dynamo.Table(table_name)
+
+    @staticmethod
+    def _chunks(serialized_events: List[Dict[Text, Any]]) -> List[List[Text]]:
+        """Splits events into chunks which fit into a DynamoDB item.
+
+        Every `SessionStarted` event starts a new chunk.
+
+        Args:
+            serialized_events: The events to split.
+
+        Returns:
+            The JSON dumps of the events of each chunk.
+        """
+        chunks: List[List[Text]] = []
+        chunk_size = 0
+        for event in serialized_events:
+            dumped = json.dumps(event)
+            size = len(dumped.encode("utf-8"))
+            if (
+                not chunks
+                or event["event"] == SessionStarted.type_name
+                or chunk_size + size > DYNAMO_MAX_CHUNK_SIZE
+            ):
+                chunks.append([])
+                chunk_size = 0
+            chunks[-1].append(dumped)
+            chunk_size += size
+
+        return chunks
+
+    def _metadata(self, sender_id: Text) -> Optional[Dict[Text, Any]]:
+        return self.db.get_item(
+            Key={"sender_id": sender_id, DYNAMO_CHUNK_KEY: DYNAMO_METADATA_CHUNK},
+            ConsistentRead=True,
+        ).get("Item")
+
+    def _append_events(self, sender_id: Text, events: List[Event]) -> None:
+        """Writes the events as new chunk items of the conversation.
+
+        The chunk numbers are reserved with an atomic counter first, so that
+        concurrent writers don't overwrite each other's chunks.
+
+        Args:
+            sender_id: The conversation ID.
+            events: The events to append.
+        """
+        serialized_events = [event.as_dict() for event in events]
+        chunks = self._chunks(serialized_events)
+        if not chunks:
+            return
+
+        metadata = self.db.update_item(
+            Key={"sender_id": sender_id, DYNAMO_CHUNK_KEY: DYNAMO_METADATA_CHUNK},
+            UpdateExpression=("ADD number_of_chunks :chunks, number_of_events :events"),
+            ExpressionAttributeValues={
+                ":chunks": len(chunks),
+                ":events": len(serialized_events),
+            },
+            ReturnValues="UPDATED_NEW",
+        )["Attributes"]
+        first_chunk = int(metadata["number_of_chunks"]) - len(chunks) + 1
+        first_event = int(metadata["number_of_events"]) - len(serialized_events)
+
+        # `batch_writer` sends `BatchWriteItem` requests and resends unprocessed items
+        with self.db.batch_writer() as batch:
+            for chunk_number, chunk in enumerate(chunks, start=first_chunk):
+                batch.put_item(
+                    Item={
+                        "sender_id": sender_id,
+                        DYNAMO_CHUNK_KEY: chunk_number,
+                        "events": "[" + ",".join(chunk) + "]",
+                    }
+                )
+
+        self._update_session_start(sender_id, chunks, first_chunk, first_event)
+
+    def _update_session_start(
+        self,
+        sender_id: Text,
+        chunks: List[List[Text]],
+        first_chunk: int,
+        first_event: int,
+    ) -> None:
+        """Moves the session index to the last new session start (if any).
+
+        Args:
+            sender_id: The conversation ID.
+            chunks: The new chunks.
+            first_chunk: The number of the first new chunk.
+            first_event: The index of the first event of the first new chunk.
+        """
+        session_start = None
+        event_index = first_event
+        for chunk_number, chunk in enumerate(chunks, start=first_chunk):
+            if json.loads(chunk[0])["event"] == SessionStarted.type_name:
+                session_start = (chunk_number, event_index)
+            event_index += len(chunk)
+
+        if session_start is None:
+            return
+
+        chunk_number, event_index = session_start
+        try:
+            # concurrent writers must not move the index back to an older session
+            self.db.update_item(
+                Key={"sender_id": sender_id, DYNAMO_CHUNK_KEY: DYNAMO_METADATA_CHUNK},
+                UpdateExpression=(
+                    "SET session_start_chunk = :chunk, session_start_event = :event"
+                ),
+                ConditionExpression=(
+                    "attribute_not_exists(session_start_chunk) "
+                    "OR session_start_chunk < :chunk"
+                ),
+                ExpressionAttributeValues={
+                    ":chunk": chunk_number,
+                    ":event": event_index,
+                },
+            )
+        except self.client.exceptions.ConditionalCheckFailedException:
+            pass
+
+    async def save(self, tracker: DialogueStateTracker) -> None:
+        """Writes the events which aren't stored yet as new chunks."""
+        offset = await self.persisted_event_offset(tracker)
+        new_events = list(itertools.islice(tracker.events, offset, None))
+
+        if self.event_broker:
+            await self._stream_new_events(
+                self.event_broker, new_events, tracker.sender_id
+            )
+
+        self._append_events(tracker.sender_id, new_events)
+        tracker.persisted_event_count = len(tracker.events)
+
+    async def save_new_events(
+        self, sender_id: Text, events: List[Event], expected_offset: int
+    ) -> None:
+        """Writes `events` as new chunks without reading the stored conversation."""
+        if self.event_broker:
+            await self._stream_new_events(self.event_broker, events, sender_id)
+
+        self._append_events(sender_id, events)
+
+    async def number_of_existing_events(self, sender_id: Text) -> int:
+        """Returns the number of stored events since the latest session start."""
+        metadata = self._metadata(sender_id)
+        if not metadata:
+            return 0
+
+        return int(metadata.get("number_of_events", 0)) - int(
+            metadata.get("session_start_event", 0)
+        )
+
+    def _query_events(self, sender_id: Text, first_chunk: int) -> List[Dict]:
+        """Reads the events of all chunks starting from `first_chunk`.
+
+        Args:
+            sender_id: The conversation ID.
+            first_chunk: The number of the first chunk to read.
+
+        Returns:
+            The events of the chunks in the order in which they were stored.
+        """
+        paginator = self.client.get_paginator("query")
+        events = []
+        for page in paginator.paginate(
+            TableName=self.table_name,
+            KeyConditionExpression="sender_id = :sender_id AND #chunk >= :chunk",
+            ExpressionAttributeNames={"#chunk": DYNAMO_CHUNK_KEY},
+            ExpressionAttributeValues={
+                ":sender_id": {"S": sender_id},
+                ":chunk": {"N": str(first_chunk)},
+            },
+            ProjectionExpression="events",
+            ConsistentRead=True,
+        ):
+            for item in page["Items"]:
+                events.extend(json.loads(item["events"]["S"]))
+
+        return events
+
+    def _retrieve(
+        self, sender_id: Text, fetch_events_from_all_sessions: bool
+    ) -> Optional[DialogueStateTracker]:
+        first_chunk = DYNAMO_METADATA_CHUNK + 1
+        if not fetch_events_from_all_sessions:
+            metadata = self._metadata(sender_id)
+            if not metadata:
+                return None
+            first_chunk = int(metadata.get("session_start_chunk", first_chunk))
+
+        events = self._query_events(sender_id, first_chunk)
+        if not events:
+            return None
+
+        tracker = DialogueStateTracker.from_dict(sender_id, events, self.domain.slots)
+        tracker.persisted_event_count = len(tracker.events)
+
+        return tracker
+
+    async def retrieve(self, sender_id: Text) -> Optional[DialogueStateTracker]:
+        """Retrieves tracker for the latest conversation session."""
+        return self._retrieve(sender_id, fetch_events_from_all_sessions=False)
+
+    async def retrieve_full_tracker(
+        self, conversation_id: Text
+    ) -> Optional[DialogueStateTracker]:
+        """Retrieves tracker for all conversation sessions."""
+        return self._retrieve(conversation_id, fetch_events_from_all_sessions=True)
+
+    async def _retrieve_batch(
+        self, sender_ids: List[Text], fetch_events_from_all_sessions: bool
+    ) -> List[DialogueStateTracker]:
+        """Fetches the metadata items of the batch with `BatchGetItem`.
+
+        DynamoDB can't query several partitions at once, hence the chunks of the
+        conversations are queried concurrently.
+        """
+        first_chunks = {}
+        for start in range(0, len(sender_ids), DYNAMO_MAX_BATCH_GET_ITEMS):
+            keys = [
+                {"sender_id": sender_id, DYNAMO_CHUNK_KEY: DYNAMO_METADATA_CHUNK}
+                for sender_id in sender_ids[start : start + DYNAMO_MAX_BATCH_GET_ITEMS]
+            ]
+            for item in self._batch_get_items(
+                keys, ["sender_id", "session_start_chunk"]
+            ):
+                first_chunk = DYNAMO_METADATA_CHUNK + 1
+                if not fetch_events_from_all_sessions:
+                    first_chunk = int(item.get("session_start_chunk", first_chunk))
+                first_chunks[item["sender_id"]] = first_chunk
+
+        stored_sender_ids = [
+            sender_id for sender_id in sender_ids if sender_id in first_chunks
+        ]
+        loop = asyncio.get_running_loop()
+        events = await asyncio.gather(
+            *[
+                loop.run_in_executor(
+                    None, self._query_events, sender_id, first_chunks[sender_id]
+                )
+                for sender_id in stored_sender_ids
+            ]
+        )
+
+        return self._trackers_from_serialised_events(
+            stored_sender_ids, dict(zip(stored_sender_ids, events))
+        )
+
+    async def keys(self) -> Iterable[Text]:
+        """Returns sender_ids of the `ChunkedDynamoTrackerStore`."""
+        # every conversation has exactly one metadata item
+        return await self._scan_sender_ids(
+            FilterExpression="#chunk = :chunk",
+            ExpressionAttributeNames={"#chunk": DYNAMO_CHUNK_KEY},
+            ExpressionAttributeValues={":chunk": {"N": str(DYNAMO_METADATA_CHUNK)}},
+        )
+
+
+class MongoTrackerStore(TrackerStore, SerializedTrackerAsText):
+    """Stores conversation history in Mongo.
+
+    Property methods:
+        conversations: returns the current conversation
+    """
+
+    def __init__(
+        self,
+        domain: Domain,
+        host: Optional[Text] = "mongodb://localhost:27017",
+        db: Optional[Text] = "rasa",
+        username: Optional[Text] = None,
+        password: Optional[Text] = None,
+        auth_source: Optional[Text] = "admin",
+        collection: Optional[Text] = "conversations",
+        event_broker: Optional[EventBroker] = None,
+        **kwargs: Dict[Text, Any],
+    ) -> None:
+        from pymongo.database import Database
+        from pymongo import MongoClient
+
+        self.client = MongoClient(
+            host,
+            username=username,
+            password=password,
+            authSource=auth_source,
+            # delay connect until process forking is done
             connect=False,
         )
 
@@ -650,17 +1639,133 @@ class MongoTrackerStore(TrackerStore, SerializedTrackerAsText):
 
         additional_events = self._additional_events(tracker)
 
-        self.conversations.update_one(
-            {"sender_id": tracker.sender_id},
-            {
-                "$set": self._current_tracker_state_without_events(tracker),
-                "$push": {
-                    "events": {"$each": [e.as_dict() for e in additional_events]}
-                },
-            },
+        self._push_events(
+            tracker.sender_id,
+            [e.as_dict() for e in additional_events],
+            self._current_tracker_state_without_events(tracker),
+        )
+        tracker.persisted_event_count = len(tracker.events)
+
+    async def save_new_events(
+        self, sender_id: Text, events: List[Event], expected_offset: int
+    ) -> None:
+        """Pushes `events` to the stored conversation without reading it."""
+        if self.event_broker:
+            await self._stream_new_events(self.event_broker, events, sender_id)
+
+        self._push_events(sender_id, [e.as_dict() for e in events])
+
+    def _push_events(
+        self,
+        sender_id: Text,
+        serialized_events: List[Dict[Text, Any]],
+        state: Optional[Dict[Text, Any]] = None,
+    ) -> None:
+        """Appends events to the stored conversation and updates the session index.
+
+        Args:
+            sender_id: The conversation ID.
+            serialized_events: The events to append.
+            state: Tracker state which is stored along with the events.
+        """
+        from pymongo import ReturnDocument
+
+        previous = self.conversations.find_one_and_update(
+            {"sender_id": sender_id},
+            self._push_events_update(serialized_events, state),
+            projection=self._session_index_projection(),
             upsert=True,
+            return_document=ReturnDocument.BEFORE,
+        )
+
+        if self._is_missing_session_index(previous):
+            stored = self.conversations.find_one(
+                {"sender_id": sender_id}, projection={"events": 1}
+            )
+            self.conversations.update_one(
+                {"sender_id": sender_id},
+                {"$set": self._session_index_for_events(stored["events"])},
+            )
+            return
+
+        session_start_update = self._session_start_update(previous, serialized_events)
+        if session_start_update:
+            self.conversations.update_one(
+                {"sender_id": sender_id}, session_start_update
+            )
+
+    @staticmethod
+    def _push_events_update(
+        serialized_events: List[Dict[Text, Any]],
+        state: Optional[Dict[Text, Any]] = None,
+    ) -> Dict[Text, Any]:
+        update: Dict[Text, Any] = {
+            "$push": {"events": {"$each": serialized_events}},
+            "$inc": {MONGO_NUMBER_OF_EVENTS_KEY: len(serialized_events)},
+            "$setOnInsert": {MONGO_LAST_SESSION_START_INDEX_KEY: 0},
+        }
+        if state:
+            update["$set"] = state
+        return update
+
+    @staticmethod
+    def _session_index_projection() -> Dict[Text, Any]:
+        return {
+            "_id": False,
+            MONGO_NUMBER_OF_EVENTS_KEY: True,
+            MONGO_LAST_SESSION_START_INDEX_KEY: True,
+        }
+
+    @staticmethod
+    def _is_missing_session_index(stored: Optional[Dict[Text, Any]]) -> bool:
+        """Checks whether a stored conversation lacks the session index fields.
+
+        This is the case for conversations which were stored by older versions.
+        """
+        return stored is not None and not (
+            MONGO_NUMBER_OF_EVENTS_KEY in stored
+            and MONGO_LAST_SESSION_START_INDEX_KEY in stored
         )
 
+    @staticmethod
+    def _session_start_update(
+        previous: Optional[Dict[Text, Any]], serialized_events: List[Dict[Text, Any]]
+    ) -> Optional[Dict[Text, Any]]:
+        """Creates the update which moves the session index to a new session start.
+
+        Args:
+            previous: The session index fields before the events were appended.
+            serialized_events: The appended events.
+
+        Returns:
+            The update or `None` if the events don't start a new session.
+        """
+        for offset in range(len(serialized_events) - 1, -1, -1):
+            if serialized_events[offset]["event"] == SessionStarted.type_name:
+                number_of_previous_events = (
+                    previous[MONGO_NUMBER_OF_EVENTS_KEY] if previous else 0
+                )
+                # `$max` keeps the latest session start if events are appended
+                # concurrently
+                return {
+                    "$max": {
+                        MONGO_LAST_SESSION_START_INDEX_KEY: number_of_previous_events
+                        + offset
+                    }
+                }
+        return None
+
+    @classmethod
+    def _session_index_for_events(
+        cls, serialized_events: List[Dict[Text, Any]]
+    ) -> Dict[Text, int]:
+        number_of_events = len(serialized_events)
+        return {
+            MONGO_NUMBER_OF_EVENTS_KEY: number_of_events,
+            MONGO_LAST_SESSION_START_INDEX_KEY: number_of_events
+            - len(cls._events_since_last_session_start(serialized_events)),
+        }
+
     def _additional_events(self, tracker: DialogueStateTracker) -> Iterator:
         """Return events from the tracker which aren't currently stored.
 
@@ -671,16 +1776,54 @@ class MongoTrackerStore(TrackerStore, SerializedTrackerAsText):
             List of serialised events that aren't currently stored.
 
         """
+        if tracker.persisted_event_count is not None:
+            return itertools.islice(
+                tracker.events, tracker.persisted_event_count, len(tracker.events)
+            )
 
-        stored = self.conversations.find_one({"sender_id": tracker.sender_id}) or {}
-        all_events = self._events_from_serialized_tracker(stored)
+        return itertools.islice(
+            tracker.events,
+            self._number_of_events_since_last_session_start(
+                self._stored_session_index(tracker.sender_id)
+            ),
+            len(tracker.events),
+        )
 
-        number_events_since_last_session = len(
-            self._events_since_last_session_start(all_events)
+    async def number_of_existing_events(self, sender_id: Text) -> int:
+        """Returns the number of stored events since the latest session start."""
+        return self._number_of_events_since_last_session_start(
+            self._stored_session_index(sender_id)
         )
 
-        return itertools.islice(
-            tracker.events, number_events_since_last_session, len(tracker.events)
+    def _stored_session_index(self, sender_id: Text) -> Optional[Dict[Text, Any]]:
+        """Fetches the session index fields of a stored conversation.
+
+        Args:
+            sender_id: The conversation ID.
+
+        Returns:
+            The session index fields or `None` if the conversation isn't stored.
+        """
+        stored = self.conversations.find_one(
+            {"sender_id": sender_id}, projection=self._session_index_projection()
+        )
+        if self._is_missing_session_index(stored):
+            stored = self._session_index_for_events(
+                self._events_from_serialized_tracker(
+                    self.conversations.find_one({"sender_id": sender_id})
+                )
+            )
+        return stored
+
+    @staticmethod
+    def _number_of_events_since_last_session_start(
+        stored: Optional[Dict[Text, Any]]
+    ) -> int:
+        if not stored:
+            return 0
+        return (
+            stored[MONGO_NUMBER_OF_EVENTS_KEY]
+            - stored[MONGO_LAST_SESSION_START_INDEX_KEY]
         )
 
     @staticmethod
@@ -708,10 +1851,44 @@ class MongoTrackerStore(TrackerStore, SerializedTrackerAsText):
 
         return list(reversed(events_after_session_start))
 
+    @staticmethod
+    def _latest_session_projection(stored: Dict[Text, Any]) -> Dict[Text, Any]:
+        """Creates a projection which only includes the events of the latest session.
+
+        Args:
+            stored: The session index fields of the stored conversation.
+
+        Returns:
+            The projection for the conversation document.
+        """
+        return {
+            "events": {
+                "$slice": [
+                    stored[MONGO_LAST_SESSION_START_INDEX_KEY],
+                    MONGO_MAX_SLICE_LENGTH,
+                ]
+            }
+        }
+
     async def _retrieve(
         self, sender_id: Text, fetch_events_from_all_sessions: bool
     ) -> Optional[List[Dict[Text, Any]]]:
-        stored = self.conversations.find_one({"sender_id": sender_id})
+        stored = None
+        if fetch_events_from_all_sessions:
+            stored = self.conversations.find_one({"sender_id": sender_id})
+        else:
+            session_index = self.conversations.find_one(
+                {"sender_id": sender_id}, projection=self._session_index_projection()
+            )
+            if session_index is not None:
+                projection = (
+                    None
+                    if self._is_missing_session_index(session_index)
+                    else self._latest_session_projection(session_index)
+                )
+                stored = self.conversations.find_one(
+                    {"sender_id": sender_id}, projection=projection
+                )
 
         # look for conversations which have used an `int` sender_id in the past
         # and update them.
@@ -730,6 +1907,7 @@ class MongoTrackerStore(TrackerStore, SerializedTrackerAsText):
         events = self._events_from_serialized_tracker(stored)
 
         if not fetch_events_from_all_sessions:
+            # the session index might be outdated if events are appended concurrently
             events = self._events_since_last_session_start(events)
 
         return events
@@ -741,7 +1919,10 @@ class MongoTrackerStore(TrackerStore, SerializedTrackerAsText):
         if not events:
             return None
 
-        return DialogueStateTracker.from_dict(sender_id, events, self.domain.slots)
+        tracker = DialogueStateTracker.from_dict(sender_id, events, self.domain.slots)
+        tracker.persisted_event_count = len(tracker.events)
+
+        return tracker
 
     async def retrieve_full_tracker(
         self, conversation_id: Text
@@ -754,52 +1935,345 @@ class MongoTrackerStore(TrackerStore, SerializedTrackerAsText):
         if not events:
             return None
 
-        return DialogueStateTracker.from_dict(
+        tracker = DialogueStateTracker.from_dict(
             conversation_id, events, self.domain.slots
         )
+        tracker.persisted_event_count = len(tracker.events)
+
+        return tracker
+
+    async def _retrieve_batch(
+        self, sender_ids: List[Text], fetch_events_from_all_sessions: bool
+    ) -> List[DialogueStateTracker]:
+        """Fetches the conversations of the batch with a single `$in` query."""
+        stored = self.conversations.find(
+            {"sender_id": {"$in": sender_ids}},
+            projection={"_id": False, "sender_id": True, "events": True},
+        )
+
+        return self._trackers_from_serialised_events(
+            sender_ids,
+            {
+                conversation["sender_id"]: self._events_of_stored_conversation(
+                    conversation, fetch_events_from_all_sessions
+                )
+                for conversation in stored
+            },
+        )
+
+    def _events_of_stored_conversation(
+        self, stored: Dict[Text, Any], fetch_events_from_all_sessions: bool
+    ) -> List[Dict[Text, Any]]:
+        events = self._events_from_serialized_tracker(stored)
+        if fetch_events_from_all_sessions:
+            return events
+        return self._events_since_last_session_start(events)
 
     async def keys(self) -> Iterable[Text]:
         """Returns sender_ids of the Mongo Tracker Store."""
-        return [c["sender_id"] for c in self.conversations.find()]
-
+        return [
+            c["sender_id"]
+            for c in self.conversations.find(
+                projection={"_id": False, "sender_id": True}
+            )
+        ]
 
-def _create_sequence(table_name: Text) -> "Sequence":
-    """Creates a sequence object for a specific table name.
 
-    If using Oracle you will need to create a sequence in your database,
-    as described here: https://rasa.com/docs/rasa/tracker-stores#sqltrackerstore
-    Args:
-        table_name: The name of the table, which gets a Sequence assigned
+class AsyncMongoTrackerStore(MongoTrackerStore):
+    """Stores conversation history in Mongo using the asyncio driver `motor`.
 
-    Returns: A `Sequence` object
+    Stores the same documents as the `MongoTrackerStore`, but database I/O doesn't
+    block the event loop.
     """
-    from sqlalchemy.ext.declarative import declarative_base
 
-    sequence_name = f"{table_name}_seq"
-    Base = declarative_base()
-    return sa.Sequence(sequence_name, metadata=Base.metadata, optional=True)
+    def __init__(
+        self,
+        domain: Domain,
+        host: Optional[Text] = "mongodb://localhost:27017",
+        db: Optional[Text] = "rasa",
+        username: Optional[Text] = None,
+        password: Optional[Text] = None,
+        auth_source: Optional[Text] = "admin",
+        collection: Optional[Text] = "conversations",
+        event_broker: Optional[EventBroker] = None,
+        **kwargs: Dict[Text, Any],
+    ) -> None:
+        """Creates the client.
 
+        The index on the `sender_id` is created lazily when the database is accessed
+        for the first time.
+        """
+        try:
+            from motor.motor_asyncio import AsyncIOMotorClient
+        except ImportError as e:
+            raise RasaException(
+                f"'{self.__class__.__name__}' requires the 'motor' package. Please "
+                f"install it or use the '{MongoTrackerStore.__name__}' instead."
+            ) from e
 
-def is_postgresql_url(url: Union[Text, "URL"]) -> bool:
-    """Determine whether `url` configures a PostgreSQL connection.
+        self.client = AsyncIOMotorClient(
+            host, username=username, password=password, authSource=auth_source
+        )
+        self.db = self.client[db]
+        self.collection = collection
+        self._indices_created = False
 
-    Args:
-        url: SQL connection URL.
+        # skipcq: PYL-E1003
+        # Skip `MongoTrackerStore` constructor which connects synchronously
+        super(MongoTrackerStore, self).__init__(domain, event_broker, **kwargs)
 
-    Returns:
-        `True` if `url` is a PostgreSQL connection URL.
-    """
-    if isinstance(url, str):
-        return "postgresql" in url
+    async def _ensure_indices_async(self) -> None:
+        """Create an index on the sender_id."""
+        if self._indices_created:
+            return
 
-    return url.drivername == "postgresql"
+        await self.conversations.create_index("sender_id")
+        self._indices_created = True
 
+    async def save(self, tracker: DialogueStateTracker) -> None:
+        """Saves the current conversation state."""
+        new_events = list(await self._additional_events_async(tracker))
 
-def create_engine_kwargs(url: Union[Text, "URL"]) -> Dict[Text, Any]:
-    """Get `sqlalchemy.create_engine()` kwargs.
+        if self.event_broker:
+            await self._stream_new_events(
+                self.event_broker, new_events, tracker.sender_id
+            )
 
-    Args:
-        url: SQL connection URL.
+        await self._push_events_async(
+            tracker.sender_id,
+            [e.as_dict() for e in new_events],
+            self._current_tracker_state_without_events(tracker),
+        )
+        tracker.persisted_event_count = len(tracker.events)
+
+    async def save_new_events(
+        self, sender_id: Text, events: List[Event], expected_offset: int
+    ) -> None:
+        """Pushes `events` to the stored conversation without reading it."""
+        if self.event_broker:
+            await self._stream_new_events(self.event_broker, events, sender_id)
+
+        await self._push_events_async(sender_id, [e.as_dict() for e in events])
+
+    async def _push_events_async(
+        self,
+        sender_id: Text,
+        serialized_events: List[Dict[Text, Any]],
+        state: Optional[Dict[Text, Any]] = None,
+    ) -> None:
+        """Appends events to the stored conversation and updates the session index.
+
+        Args:
+            sender_id: The conversation ID.
+            serialized_events: The events to append.
+            state: Tracker state which is stored along with the events.
+        """
+        from pymongo import ReturnDocument
+
+        await self._ensure_indices_async()
+
+        previous = await self.conversations.find_one_and_update(
+            {"sender_id": sender_id},
+            self._push_events_update(serialized_events, state),
+            projection=self._session_index_projection(),
+            upsert=True,
+            return_document=ReturnDocument.BEFORE,
+        )
+
+        if self._is_missing_session_index(previous):
+            stored = await self.conversations.find_one(
+                {"sender_id": sender_id}, projection={"events": 1}
+            )
+            await self.conversations.update_one(
+                {"sender_id": sender_id},
+                {"$set": self._session_index_for_events(stored["events"])},
+            )
+            return
+
+        session_start_update = self._session_start_update(previous, serialized_events)
+        if session_start_update:
+            await self.conversations.update_one(
+                {"sender_id": sender_id}, session_start_update
+            )
+
+    def _additional_events(self, tracker: DialogueStateTracker) -> Iterator:
+        """Return events from the tracker which aren't currently stored.
+
+        The stored conversation can't be read synchronously, so this only works if
+        the tracker knows how many of its events are stored. Use
+        `_additional_events_async` otherwise.
+
+        Args:
+            tracker: Tracker to inspect.
+
+        Returns:
+            List of serialised events that aren't currently stored.
+
+        Raises:
+            RasaException: If the tracker doesn't know how many of its events are
+                stored.
+        """
+        if tracker.persisted_event_count is None:
+            raise RasaException(
+                f"'{self.__class__.__name__}' can't read the stored conversation "
+                f"'{tracker.sender_id}' synchronously. Please use "
+                f"'_additional_events_async' instead."
+            )
+
+        return itertools.islice(
+            tracker.events, tracker.persisted_event_count, len(tracker.events)
+        )
+
+    async def _additional_events_async(self, tracker: DialogueStateTracker) -> Iterator:
+        """Return events from the tracker which aren't currently stored.
+
+        Args:
+            tracker: Tracker to inspect.
+
+        Returns:
+            List of serialised events that aren't currently stored.
+        """
+        return itertools.islice(
+            tracker.events,
+            await self.persisted_event_offset(tracker),
+            len(tracker.events),
+        )
+
+    async def number_of_existing_events(self, sender_id: Text) -> int:
+        """Returns the number of stored events since the latest session start."""
+        return self._number_of_events_since_last_session_start(
+            await self._stored_session_index_async(sender_id)
+        )
+
+    async def _stored_session_index_async(
+        self, sender_id: Text
+    ) -> Optional[Dict[Text, Any]]:
+        """Fetches the session index fields of a stored conversation.
+
+        Args:
+            sender_id: The conversation ID.
+
+        Returns:
+            The session index fields or `None` if the conversation isn't stored.
+        """
+        stored = await self.conversations.find_one(
+            {"sender_id": sender_id}, projection=self._session_index_projection()
+        )
+        if self._is_missing_session_index(stored):
+            stored = self._session_index_for_events(
+                self._events_from_serialized_tracker(
+                    await self.conversations.find_one({"sender_id": sender_id})
+                )
+            )
+        return stored
+
+    async def _retrieve(
+        self, sender_id: Text, fetch_events_from_all_sessions: bool
+    ) -> Optional[List[Dict[Text, Any]]]:
+        from pymongo import ReturnDocument
+
+        await self._ensure_indices_async()
+
+        projection = None
+        if not fetch_events_from_all_sessions:
+            session_index = await self.conversations.find_one(
+                {"sender_id": sender_id}, projection=self._session_index_projection()
+            )
+            if session_index is not None and not self._is_missing_session_index(
+                session_index
+            ):
+                projection = self._latest_session_projection(session_index)
+
+        stored = await self.conversations.find_one(
+            {"sender_id": sender_id}, projection=projection
+        )
+
+        # look for conversations which have used an `int` sender_id in the past
+        # and update them.
+        if not stored and sender_id.isdigit():
+            stored = await self.conversations.find_one_and_update(
+                {"sender_id": int(sender_id)},
+                {"$set": {"sender_id": str(sender_id)}},
+                return_document=ReturnDocument.AFTER,
+            )
+
+        if not stored:
+            return None
+
+        events = self._events_from_serialized_tracker(stored)
+
+        if not fetch_events_from_all_sessions:
+            # the session index might be outdated if events are appended concurrently
+            events = self._events_since_last_session_start(events)
+
+        return events
+
+    async def _retrieve_batch(
+        self, sender_ids: List[Text], fetch_events_from_all_sessions: bool
+    ) -> List[DialogueStateTracker]:
+        """Fetches the conversations of the batch with a single `$in` query."""
+        await self._ensure_indices_async()
+
+        events = {}
+        async for conversation in self.conversations.find(
+            {"sender_id": {"$in": sender_ids}},
+            projection={"_id": False, "sender_id": True, "events": True},
+        ):
+            events[conversation["sender_id"]] = self._events_of_stored_conversation(
+                conversation, fetch_events_from_all_sessions
+            )
+
+        return self._trackers_from_serialised_events(sender_ids, events)
+
+    async def keys(self) -> Iterable[Text]:
+        """Returns sender_ids of the Mongo Tracker Store."""
+        await self._ensure_indices_async()
+
+        return [
+            c["sender_id"]
+            async for c in self.conversations.find(
+                projection={"_id": False, "sender_id": True}
+            )
+        ]
+
+
+def _create_sequence(table_name: Text) -> "Sequence":
+    """Creates a sequence object for a specific table name.
+
+    If using Oracle you will need to create a sequence in your database,
+    as described here: https://rasa.com/docs/rasa/tracker-stores#sqltrackerstore
+    Args:
+        table_name: The name of the table, which gets a Sequence assigned
+
+    Returns: A `Sequence` object
+    """
+    from sqlalchemy.ext.declarative import declarative_base
+
+    sequence_name = f"{table_name}_seq"
+    Base = declarative_base()
+    return sa.Sequence(sequence_name, metadata=Base.metadata, optional=True)
+
+
+def is_postgresql_url(url: Union[Text, "URL"]) -> bool:
+    """Determine whether `url` configures a PostgreSQL connection.
+
+    Args:
+        url: SQL connection URL.
+
+    Returns:
+        `True` if `url` is a PostgreSQL connection URL.
+    """
+    if isinstance(url, str):
+        return "postgresql" in url
+
+    return url.drivername == "postgresql"
+
+
+def create_engine_kwargs(url: Union[Text, "URL"]) -> Dict[Text, Any]:
+    """Get `sqlalchemy.create_engine()` kwargs.
+
+    Args:
+        url: SQL connection URL.
 
     Returns:
         kwargs to be passed into `sqlalchemy.create_engine()`.
@@ -890,6 +2364,48 @@ class SQLTrackerStore(TrackerStore, SerializedTrackerAsText):
         action_name = sa.Column(sa.String(255))
         data = sa.Column(sa.Text)
 
+        __table_args__ = (
+            sa.Index("ix_events_sender_id_timestamp", "sender_id", "timestamp"),
+        )
+
+    class SQLConversation(Base):
+        """Represents the latest conversation session of a sender.
+
+        Denormalises the timestamp of the latest `SessionStarted` event so that the
+        events of the latest session can be queried without a subquery.
+        """
+
+        __tablename__ = "conversations"
+
+        sender_id = sa.Column(sa.String(255), primary_key=True)
+        latest_session_start = sa.Column(sa.Float)
+
+    class SQLSnapshot(Base):
+        """Represents the state of a conversation before its recent events.
+
+        Events which are older than `timestamp` are not needed to restore the state
+        of the conversation and are not retrieved anymore.
+        """
+
+        __tablename__ = "snapshots"
+
+        sender_id = sa.Column(sa.String(255), primary_key=True)
+        timestamp = sa.Column(sa.Float, nullable=False)
+        data = sa.Column(sa.Text, nullable=False)
+
+    class SQLArchivedEvent(Base):
+        """Represents an event which was moved out of the `events` table."""
+
+        __tablename__ = "archived_events"
+
+        id = sa.Column(sa.Integer, _create_sequence(__tablename__), primary_key=True)
+        sender_id = sa.Column(sa.String(255), nullable=False, index=True)
+        type_name = sa.Column(sa.String(255), nullable=False)
+        timestamp = sa.Column(sa.Float)
+        intent_name = sa.Column(sa.String(255))
+        action_name = sa.Column(sa.String(255))
+        data = sa.Column(sa.Text)
+
     def __init__(
         self,
         domain: Optional[Domain] = None,
@@ -902,10 +2418,13 @@ class SQLTrackerStore(TrackerStore, SerializedTrackerAsText):
         event_broker: Optional[EventBroker] = None,
         login_db: Optional[Text] = None,
         query: Optional[Dict] = None,
+        snapshot_interval: Optional[int] = None,
         **kwargs: Dict[Text, Any],
     ) -> None:
         import sqlalchemy.exc
 
+        self.snapshot_interval = snapshot_interval
+
         port = validate_port(port)
 
         engine_url = self.get_db_url(
@@ -928,6 +2447,8 @@ class SQLTrackerStore(TrackerStore, SerializedTrackerAsText):
 
                 try:
                     self.Base.metadata.create_all(self.engine)
+                    # `create_all` doesn't add indices to tables which already exist
+                    self._create_missing_indices(self.engine)
                 except (
                     sqlalchemy.exc.OperationalError,
                     sqlalchemy.exc.ProgrammingError,
@@ -951,6 +2472,13 @@ class SQLTrackerStore(TrackerStore, SerializedTrackerAsText):
 
         super().__init__(domain, event_broker, **kwargs)
 
+    @classmethod
+    def _create_missing_indices(
+        cls, connectable: Union["Engine", "Connection"]
+    ) -> None:
+        for index in cls.SQLEvent.__table__.indexes:
+            index.create(bind=connectable, checkfirst=True)
+
     @staticmethod
     def get_db_url(
         dialect: Text = "sqlite",
@@ -1047,160 +2575,782 @@ class SQLTrackerStore(TrackerStore, SerializedTrackerAsText):
             .rowcount
         )
 
-        if not matching_rows:
-            try:
-                conn.execute(f"CREATE DATABASE {database_name}")
-            except (
-                sqlalchemy.exc.ProgrammingError,
-                sqlalchemy.exc.IntegrityError,
-            ) as e:
-                logger.error(f"Could not create database '{database_name}': {e}")
+        if not matching_rows:
+            try:
+                conn.execute(f"CREATE DATABASE {database_name}")
+            except (
+                sqlalchemy.exc.ProgrammingError,
+                sqlalchemy.exc.IntegrityError,
+            ) as e:
+                logger.error(f"Could not create database '{database_name}': {e}")
+
+        conn.close()
+
+    @contextlib.contextmanager
+    def session_scope(self) -> Generator["Session", None, None]:
+        """Provide a transactional scope around a series of operations."""
+        session = self.sessionmaker()
+        try:
+            ensure_schema_exists(session)
+            yield session
+        except ValueError as e:
+            rasa.shared.utils.cli.print_error_and_exit(
+                f"Requested PostgreSQL schema '{e}' was not found in the database. To "
+                f"continue, please create the schema by running 'CREATE DATABASE {e};' "
+                f"or unset the '{POSTGRESQL_SCHEMA}' environment variable in order to "
+                f"use the default schema. Exiting application."
+            )
+        finally:
+            session.close()
+
+    async def keys(self) -> Iterable[Text]:
+        """Returns sender_ids of the SQLTrackerStore."""
+        with self.session_scope() as session:
+            sender_ids = session.query(self.SQLEvent.sender_id).distinct().all()
+            return [sender_id for (sender_id,) in sender_ids]
+
+    async def retrieve(self, sender_id: Text) -> Optional[DialogueStateTracker]:
+        """Retrieves tracker for the latest conversation session."""
+        return await self._retrieve(sender_id, fetch_events_from_all_sessions=False)
+
+    async def retrieve_full_tracker(
+        self, conversation_id: Text
+    ) -> Optional[DialogueStateTracker]:
+        """Fetching all tracker events across conversation sessions."""
+        return await self._retrieve(
+            conversation_id, fetch_events_from_all_sessions=True
+        )
+
+    async def _retrieve(
+        self, sender_id: Text, fetch_events_from_all_sessions: bool
+    ) -> Optional[DialogueStateTracker]:
+        with self.session_scope() as session:
+
+            serialised_events = self._event_query(
+                session,
+                sender_id,
+                fetch_events_from_all_sessions=fetch_events_from_all_sessions,
+            ).all()
+
+            events = [json.loads(event.data) for event in serialised_events]
+
+            snapshot = None
+            if fetch_events_from_all_sessions and self.snapshot_interval:
+                archived_events = session.execute(
+                    self._archived_events_statement(sender_id)
+                ).scalars()
+                events = [json.loads(data) for data in archived_events] + events
+            elif not fetch_events_from_all_sessions:
+                snapshot = self._stored_snapshot(session, sender_id)
+
+            if self.domain and len(events) > 0:
+                logger.debug(f"Recreating tracker from sender id '{sender_id}'")
+                tracker = DialogueStateTracker.from_dict(
+                    sender_id,
+                    events,
+                    self.domain.slots,
+                    snapshot=self._snapshot_state(snapshot),
+                )
+                tracker.persisted_event_count = len(tracker.events)
+                return tracker
+            else:
+                logger.debug(
+                    f"Can't retrieve tracker matching "
+                    f"sender id '{sender_id}' from SQL storage. "
+                    f"Returning `None` instead."
+                )
+                return None
+
+    def _event_query(
+        self, session: "Session", sender_id: Text, fetch_events_from_all_sessions: bool
+    ) -> "Query":
+        """Provide the query to retrieve the conversation events for a specific sender.
+
+        Args:
+            session: Current database session.
+            sender_id: Sender id whose conversation events should be retrieved.
+            fetch_events_from_all_sessions: Whether to fetch events from all
+                conversation sessions. If `False`, only fetch events from the
+                latest conversation session.
+
+        Returns:
+            Query to get the conversation events.
+        """
+        conversation, snapshot = None, None
+        if not fetch_events_from_all_sessions:
+            conversation = session.get(self.SQLConversation, sender_id)
+            snapshot = self._stored_snapshot(session, sender_id)
+
+        return (
+            session.query(self.SQLEvent)
+            .filter(
+                *self._event_filters(
+                    sender_id, conversation, fetch_events_from_all_sessions, snapshot
+                )
+            )
+            .order_by(self.SQLEvent.timestamp)
+        )
+
+    def _stored_snapshot(
+        self, session: "Session", sender_id: Text
+    ) -> Optional["SQLTrackerStore.SQLSnapshot"]:
+        if not self.snapshot_interval:
+            return None
+
+        return session.get(self.SQLSnapshot, sender_id)
+
+    @staticmethod
+    def _snapshot_state(
+        snapshot: Optional["SQLTrackerStore.SQLSnapshot"],
+    ) -> Optional[Dict[Text, Any]]:
+        return json.loads(snapshot.data) if snapshot is not None else None
+
+    def _archived_events_statement(self, sender_id: Text) -> "Select":
+        return (
+            sa.select(self.SQLArchivedEvent.data)
+            .where(self.SQLArchivedEvent.sender_id == sender_id)
+            .order_by(self.SQLArchivedEvent.timestamp)
+        )
+
+    def _event_filters(
+        self,
+        sender_id: Text,
+        conversation: Optional["SQLTrackerStore.SQLConversation"],
+        fetch_events_from_all_sessions: bool,
+        snapshot: Optional["SQLTrackerStore.SQLSnapshot"] = None,
+    ) -> List[Any]:
+        """Returns the filter clauses to select the conversation events of a sender.
+
+        Args:
+            sender_id: Sender id whose conversation events should be retrieved.
+            conversation: The stored latest conversation session of the sender.
+            fetch_events_from_all_sessions: Whether to fetch events from all
+                conversation sessions. If `False`, only fetch events from the
+                latest conversation session.
+            snapshot: The stored snapshot of the conversation. If given, only events
+                since the snapshot are selected.
+
+        Returns:
+            Clauses which can be passed to `filter` or `where`.
+        """
+        filters = [self.SQLEvent.sender_id == sender_id]
+
+        if fetch_events_from_all_sessions:
+            return filters
+
+        if snapshot is not None:
+            filters.append(self.SQLEvent.timestamp >= snapshot.timestamp)
+
+        if conversation is not None:
+            filters.append(self.SQLEvent.timestamp >= conversation.latest_session_start)
+            return filters
+
+        # The latest session start is unknown for conversations which don't have
+        # a `SessionStarted` event or which were stored before the `conversations`
+        # table was introduced. Find it with a subquery instead.
+        session_start_sub_query = (
+            sa.select(sa.func.max(self.SQLEvent.timestamp))
+            .where(
+                self.SQLEvent.sender_id == sender_id,
+                self.SQLEvent.type_name == SessionStarted.type_name,
+            )
+            .scalar_subquery()
+        )
+        filters.append(
+            # Find events after the latest `SessionStarted` event or return all
+            # events
+            sa.or_(
+                self.SQLEvent.timestamp >= session_start_sub_query,
+                session_start_sub_query.is_(None),
+            )
+        )
+
+        return filters
+
+    def _batch_event_statement(
+        self, sender_ids: List[Text], fetch_events_from_all_sessions: bool
+    ) -> "Select":
+        """Provide the statement to retrieve the events of several senders.
+
+        Args:
+            sender_ids: Sender ids whose conversation events should be retrieved.
+            fetch_events_from_all_sessions: Whether to fetch events from all
+                conversation sessions. If `False`, only fetch events from the
+                latest conversation session.
+
+        Returns:
+            Statement which selects the sender ids and the serialised events ordered
+            by sender id.
+        """
+        statement = sa.select(self.SQLEvent.sender_id, self.SQLEvent.data).where(
+            self.SQLEvent.sender_id.in_(sender_ids)
+        )
+
+        if not fetch_events_from_all_sessions:
+            # see `_event_filters` for conversations without `conversations` row
+            session_start_events = sa.orm.aliased(self.SQLEvent)
+            latest_session_start = sa.func.coalesce(
+                self.SQLConversation.latest_session_start,
+                sa.select(sa.func.max(session_start_events.timestamp))
+                .where(
+                    session_start_events.sender_id == self.SQLEvent.sender_id,
+                    session_start_events.type_name == SessionStarted.type_name,
+                )
+                .scalar_subquery(),
+            )
+            statement = statement.outerjoin(
+                self.SQLConversation,
+                self.SQLConversation.sender_id == self.SQLEvent.sender_id,
+            ).where(
+                sa.or_(
+                    self.SQLEvent.timestamp >= latest_session_start,
+                    latest_session_start.is_(None),
+                )
+            )
+
+        return statement.order_by(self.SQLEvent.sender_id, self.SQLEvent.timestamp)
+
+    @staticmethod
+    def _events_by_sender_id(
+        rows: Iterable[Tuple[Text, Text]]
+    ) -> Dict[Text, List[Dict[Text, Any]]]:
+        return {
+            sender_id: [json.loads(data) for _, data in sender_rows]
+            for sender_id, sender_rows in itertools.groupby(rows, key=lambda r: r[0])
+        }
+
+    async def _retrieve_batch(
+        self, sender_ids: List[Text], fetch_events_from_all_sessions: bool
+    ) -> List[DialogueStateTracker]:
+        """Fetches the events of the batch with a single query."""
+        if self.snapshot_interval:
+            # snapshots and archived events are only considered for single trackers
+            return await super()._retrieve_batch(
+                sender_ids, fetch_events_from_all_sessions
+            )
+
+        with self.session_scope() as session:
+            rows = session.execute(
+                self._batch_event_statement(sender_ids, fetch_events_from_all_sessions)
+            ).all()
+
+        return self._trackers_from_serialised_events(
+            sender_ids, self._events_by_sender_id(rows)
+        )
+
+    async def save(self, tracker: DialogueStateTracker) -> None:
+        """Update database with events from the current conversation."""
+        await self.stream_events(tracker)
+
+        with self.session_scope() as session:
+            # only store recent events
+            events = self._additional_events(session, tracker)
+            self._add_events(session, tracker.sender_id, events)
+            self._save_snapshot(session, tracker)
+            session.commit()
+
+        tracker.persisted_event_count = len(tracker.events)
+
+        logger.debug(f"Tracker with sender_id '{tracker.sender_id}' stored to database")
+
+    async def save_new_events(
+        self, sender_id: Text, events: List[Event], expected_offset: int
+    ) -> None:
+        """Inserts `events` into the database without querying the stored events."""
+        if self.event_broker:
+            await self._stream_new_events(self.event_broker, events, sender_id)
+
+        with self.session_scope() as session:
+            self._add_events(session, sender_id, events)
+            session.commit()
+
+        logger.debug(
+            f"Stored {len(events)} new events for sender_id '{sender_id}' "
+            f"to database."
+        )
+
+    def _add_events(
+        self, session: "Session", sender_id: Text, events: Iterable[Event]
+    ) -> None:
+        rows = self._event_rows(sender_id, events)
+        if not rows:
+            return
+
+        statement, parameters = self._insert_events_statement(
+            rows, session.get_bind().dialect
+        )
+        session.execute(statement, parameters)
+
+        conversation = self._updated_conversation(sender_id, rows)
+        if conversation is not None:
+            session.merge(conversation)
+
+    @staticmethod
+    def _event_rows(sender_id: Text, events: Iterable[Event]) -> List[Dict[Text, Any]]:
+        rows = []
+        for event in events:
+            data = event.as_dict()
+            rows.append(
+                {
+                    "sender_id": sender_id,
+                    "type_name": event.type_name,
+                    "timestamp": data.get("timestamp"),
+                    "intent_name": data.get("parse_data", {})
+                    .get("intent", {})
+                    .get(INTENT_NAME_KEY),
+                    "action_name": data.get("name"),
+                    "data": json.dumps(data),
+                }
+            )
+
+        return rows
+
+    def _insert_events_statement(
+        self, rows: List[Dict[Text, Any]], dialect: "Dialect"
+    ) -> Tuple["Insert", Optional[List[Dict[Text, Any]]]]:
+        """Returns a statement which inserts all `rows` in one go.
+
+        Uses a single multi-row `INSERT` if the database supports it and falls back to
+        executing the statement with many parameter sets otherwise (e.g. Oracle).
+
+        Args:
+            rows: Column values of the events to insert.
+            dialect: Dialect of the database.
+
+        Returns:
+            Statement and parameters to pass to `execute`.
+        """
+        insert = sa.insert(self.SQLEvent.__table__)
+
+        if dialect.supports_multivalues_insert:
+            return insert.values(rows), None
+
+        return insert, rows
+
+    def _updated_conversation(
+        self, sender_id: Text, rows: List[Dict[Text, Any]]
+    ) -> Optional["SQLTrackerStore.SQLConversation"]:
+        """Returns the latest conversation session if `rows` start a new one."""
+        session_starts = [
+            row["timestamp"]
+            for row in rows
+            if row["type_name"] == SessionStarted.type_name
+        ]
+        if not session_starts:
+            return None
+
+        return self.SQLConversation(
+            sender_id=sender_id, latest_session_start=max(session_starts)
+        )
+
+    def _save_snapshot(self, session: "Session", tracker: DialogueStateTracker) -> None:
+        index = self._snapshot_index(tracker)
+        if index is None:
+            return
+
+        stored = session.get(self.SQLSnapshot, tracker.sender_id)
+        if stored is None or stored.timestamp < tracker.events[index].timestamp:
+            session.merge(self._snapshot_row(tracker, index))
+
+    def _snapshot_index(self, tracker: DialogueStateTracker) -> Optional[int]:
+        """Returns the number of events which a new snapshot should replace.
+
+        A snapshot is due as soon as the events which are retrieved for the
+        conversation exceed twice the `snapshot_interval`. It is taken right before
+        the latest `action_listen` which leaves at least `snapshot_interval` events
+        after the snapshot, so that the latest user message can still be reverted.
+
+        Args:
+            tracker: The tracker which is saved.
+
+        Returns:
+            The index of the first event after the snapshot or `None` if no snapshot
+            is due.
+        """
+        if (
+            not self.snapshot_interval
+            or len(tracker.events) < 2 * self.snapshot_interval
+        ):
+            return None
+
+        events = list(tracker.events)
+        for index in range(len(events) - self.snapshot_interval, 0, -1):
+            event = events[index]
+            if (
+                isinstance(event, ActionExecuted)
+                and event.action_name == ACTION_LISTEN_NAME
+                # events before the snapshot are told apart by their timestamp
+                and event.timestamp > events[index - 1].timestamp
+            ):
+                return index
+
+        return None
+
+    def _snapshot_row(
+        self, tracker: DialogueStateTracker, index: int
+    ) -> "SQLTrackerStore.SQLSnapshot":
+        return self.SQLSnapshot(
+            sender_id=tracker.sender_id,
+            timestamp=tracker.events[index].timestamp,
+            data=json.dumps(tracker.create_snapshot(index)),
+        )
+
+    async def archive_events(self) -> int:
+        """Moves events which precede the snapshot of their conversation.
+
+        The events are moved from the `events` table to the `archived_events` table.
+        They are not needed to restore the trackers anymore but
+        `retrieve_full_tracker` still returns them.
+
+        Returns:
+            The number of archived events.
+        """
+        with self.session_scope() as session:
+            insert, delete = self._archive_statements()
+            session.execute(insert)
+            number_of_archived_events = session.execute(delete).rowcount
+            session.commit()
+
+        logger.debug(f"Archived {number_of_archived_events} events.")
+        return number_of_archived_events
+
+    def _archive_statements(self) -> Tuple["Insert", "Delete"]:
+        """Returns the statements which copy and delete the events to archive."""
+        precedes_snapshot = (
+            self.SQLSnapshot.sender_id == self.SQLEvent.sender_id,
+            self.SQLEvent.timestamp < self.SQLSnapshot.timestamp,
+        )
+        columns = [
+            "sender_id",
+            "type_name",
+            "timestamp",
+            "intent_name",
+            "action_name",
+            "data",
+        ]
+        insert = sa.insert(self.SQLArchivedEvent.__table__).from_select(
+            columns,
+            sa.select(*[getattr(self.SQLEvent, column) for column in columns])
+            .join(self.SQLSnapshot, sa.and_(*precedes_snapshot))
+            .order_by(self.SQLEvent.id),
+        )
+        delete = sa.delete(self.SQLEvent.__table__).where(
+            sa.exists().where(*precedes_snapshot)
+        )
+
+        return insert, delete
+
+    async def number_of_existing_events(self, sender_id: Text) -> int:
+        """Return number of stored events since the latest session start."""
+        with self.session_scope() as session:
+            return self._event_query(
+                session, sender_id, fetch_events_from_all_sessions=False
+            ).count()
+
+    def _additional_events(
+        self, session: "Session", tracker: DialogueStateTracker
+    ) -> Iterator:
+        """Return events from the tracker which aren't currently stored."""
+        if tracker.persisted_event_count is not None:
+            number_of_events_since_last_session = tracker.persisted_event_count
+        else:
+            number_of_events_since_last_session = self._event_query(
+                session, tracker.sender_id, fetch_events_from_all_sessions=False
+            ).count()
+
+        return itertools.islice(
+            tracker.events, number_of_events_since_last_session, len(tracker.events)
+        )
+
+
+# async drivers which `AsyncSQLTrackerStore` uses if the dialect doesn't specify one
+ASYNC_SQL_DRIVERS = {"sqlite": "aiosqlite", "postgresql": "asyncpg"}
+
+
+class AsyncSQLTrackerStore(SQLTrackerStore):
+    """Store which saves and retrieves trackers using an async SQLAlchemy engine.
+
+    Database I/O doesn't block the event loop. Requires an async database driver,
+    e.g. `asyncpg` for PostgreSQL or `aiosqlite` for SQLite.
+    """
+
+    def __init__(
+        self,
+        domain: Optional[Domain] = None,
+        dialect: Text = "sqlite",
+        host: Optional[Text] = None,
+        port: Optional[int] = None,
+        db: Text = "rasa.db",
+        username: Text = None,
+        password: Text = None,
+        event_broker: Optional[EventBroker] = None,
+        query: Optional[Dict] = None,
+        snapshot_interval: Optional[int] = None,
+        **kwargs: Dict[Text, Any],
+    ) -> None:
+        """Creates the async engine.
+
+        The tables are created lazily when the database is accessed for the first
+        time. Creating the database via `login_db` is not supported.
+        """
+        from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+
+        port = validate_port(port)
+
+        engine_url = self.get_async_db_url(
+            self.get_db_url(dialect, host, port, db, username, password, None, query)
+        )
+
+        try:
+            self.engine = create_async_engine(
+                engine_url, **self._create_async_engine_kwargs(engine_url)
+            )
+        except ImportError as e:
+            raise RasaException(
+                f"The async database driver for '{engine_url.drivername}' is not "
+                f"installed. Please install it to use the "
+                f"'{self.__class__.__name__}'."
+            ) from e
+
+        logger.debug(
+            f"Created async engine for database via '{repr(self.engine.url)}'."
+        )
+
+        self.sessionmaker = sa.orm.session.sessionmaker(
+            bind=self.engine, class_=AsyncSession, expire_on_commit=False
+        )
+        self._tables_created = False
+        self.snapshot_interval = snapshot_interval
+
+        # skipcq: PYL-E1003
+        # Skip `SQLTrackerStore` constructor which connects synchronously
+        super(SQLTrackerStore, self).__init__(domain, event_broker, **kwargs)
+
+    @staticmethod
+    def get_async_db_url(url: Union[Text, "URL"]) -> "URL":
+        """Adds the async driver to `url` if it doesn't specify a driver.
+
+        Args:
+            url: SQL connection URL.
+
+        Returns:
+            URL which can be used with an async SQLAlchemy engine.
+        """
+        url = sa.engine.make_url(url)
+
+        if "+" not in url.drivername and url.drivername in ASYNC_SQL_DRIVERS:
+            url = url.set(
+                drivername=f"{url.drivername}+{ASYNC_SQL_DRIVERS[url.drivername]}"
+            )
+
+        return url
 
-        conn.close()
+    @staticmethod
+    def _create_async_engine_kwargs(url: "URL") -> Dict[Text, Any]:
+        kwargs = create_engine_kwargs(url.set(drivername=url.get_backend_name()))
+
+        schema_name = os.environ.get(POSTGRESQL_SCHEMA)
+        if schema_name and url.get_driver_name() == "asyncpg":
+            # `asyncpg` doesn't understand the `libpq` connection options
+            kwargs["connect_args"] = {"server_settings": {"search_path": schema_name}}
+
+        return kwargs
+
+    async def _create_tables(self) -> None:
+        import sqlalchemy.exc
+
+        if self._tables_created:
+            return
 
-    @contextlib.contextmanager
-    def session_scope(self) -> Generator["Session", None, None]:
-        """Provide a transactional scope around a series of operations."""
-        session = self.sessionmaker()
         try:
-            ensure_schema_exists(session)
+            async with self.engine.begin() as connection:
+                await connection.run_sync(self.Base.metadata.create_all)
+                await connection.run_sync(self._create_missing_indices)
+        except (sqlalchemy.exc.OperationalError, sqlalchemy.exc.ProgrammingError) as e:
+            # Several Rasa services started in parallel may attempt to create
+            # tables at the same time. That is okay so long as the first services
+            # finishes the table creation.
+            logger.error(f"Could not create tables: {e}")
+
+        self._tables_created = True
+
+    @contextlib.asynccontextmanager
+    async def async_session_scope(self) -> AsyncGenerator["AsyncSession", None]:
+        """Provide a transactional scope around a series of operations."""
+        await self._create_tables()
+
+        async with self.sessionmaker() as session:
+            try:
+                await session.run_sync(ensure_schema_exists)
+            except ValueError as e:
+                rasa.shared.utils.cli.print_error_and_exit(
+                    f"Requested PostgreSQL schema '{e}' was not found in the "
+                    f"database. To continue, please create the schema by running "
+                    f"'CREATE DATABASE {e};' or unset the '{POSTGRESQL_SCHEMA}' "
+                    f"environment variable in order to use the default schema. "
+                    f"Exiting application."
+                )
             yield session
-        except ValueError as e:
-            rasa.shared.utils.cli.print_error_and_exit(
-                f"Requested PostgreSQL schema '{e}' was not found in the database. To "
-                f"continue, please create the schema by running 'CREATE DATABASE {e};' "
-                f"or unset the '{POSTGRESQL_SCHEMA}' environment variable in order to "
-                f"use the default schema. Exiting application."
-            )
-        finally:
-            session.close()
 
     async def keys(self) -> Iterable[Text]:
-        """Returns sender_ids of the SQLTrackerStore."""
-        with self.session_scope() as session:
-            sender_ids = session.query(self.SQLEvent.sender_id).distinct().all()
-            return [sender_id for (sender_id,) in sender_ids]
-
-    async def retrieve(self, sender_id: Text) -> Optional[DialogueStateTracker]:
-        """Retrieves tracker for the latest conversation session."""
-        return await self._retrieve(sender_id, fetch_events_from_all_sessions=False)
-
-    async def retrieve_full_tracker(
-        self, conversation_id: Text
-    ) -> Optional[DialogueStateTracker]:
-        """Fetching all tracker events across conversation sessions."""
-        return await self._retrieve(
-            conversation_id, fetch_events_from_all_sessions=True
-        )
+        """Returns sender_ids of the tracker store."""
+        async with self.async_session_scope() as session:
+            result = await session.execute(
+                sa.select(self.SQLEvent.sender_id).distinct()
+            )
+            return list(result.scalars())
 
     async def _retrieve(
         self, sender_id: Text, fetch_events_from_all_sessions: bool
     ) -> Optional[DialogueStateTracker]:
-        with self.session_scope() as session:
-
-            serialised_events = self._event_query(
-                session,
-                sender_id,
-                fetch_events_from_all_sessions=fetch_events_from_all_sessions,
-            ).all()
-
-            events = [json.loads(event.data) for event in serialised_events]
-
-            if self.domain and len(events) > 0:
-                logger.debug(f"Recreating tracker from sender id '{sender_id}'")
-                return DialogueStateTracker.from_dict(
-                    sender_id, events, self.domain.slots
+        async with self.async_session_scope() as session:
+            result = await session.execute(
+                await self._event_statement(
+                    session, sender_id, fetch_events_from_all_sessions
                 )
-            else:
-                logger.debug(
-                    f"Can't retrieve tracker matching "
-                    f"sender id '{sender_id}' from SQL storage. "
-                    f"Returning `None` instead."
+            )
+            events = [json.loads(data) for data in result.scalars()]
+
+            snapshot = None
+            if fetch_events_from_all_sessions and self.snapshot_interval:
+                result = await session.execute(
+                    self._archived_events_statement(sender_id)
                 )
-                return None
+                events = [json.loads(data) for data in result.scalars()] + events
+            elif not fetch_events_from_all_sessions:
+                snapshot = await self._async_stored_snapshot(session, sender_id)
 
-    def _event_query(
-        self, session: "Session", sender_id: Text, fetch_events_from_all_sessions: bool
-    ) -> "Query":
-        """Provide the query to retrieve the conversation events for a specific sender.
+        if self.domain and len(events) > 0:
+            logger.debug(f"Recreating tracker from sender id '{sender_id}'")
+            tracker = DialogueStateTracker.from_dict(
+                sender_id,
+                events,
+                self.domain.slots,
+                snapshot=self._snapshot_state(snapshot),
+            )
+            tracker.persisted_event_count = len(tracker.events)
+            return tracker
 
-        Args:
-            session: Current database session.
-            sender_id: Sender id whose conversation events should be retrieved.
-            fetch_events_from_all_sessions: Whether to fetch events from all
-                conversation sessions. If `False`, only fetch events from the
-                latest conversation session.
+        logger.debug(
+            f"Can't retrieve tracker matching sender id '{sender_id}' from SQL "
+            f"storage. Returning `None` instead."
+        )
+        return None
 
-        Returns:
-            Query to get the conversation events.
-        """
-        # Subquery to find the timestamp of the latest `SessionStarted` event
-        session_start_sub_query = (
-            session.query(sa.func.max(self.SQLEvent.timestamp).label("session_start"))
-            .filter(
-                self.SQLEvent.sender_id == sender_id,
-                self.SQLEvent.type_name == SessionStarted.type_name,
+    async def _retrieve_batch(
+        self, sender_ids: List[Text], fetch_events_from_all_sessions: bool
+    ) -> List[DialogueStateTracker]:
+        """Fetches the events of the batch with a single query."""
+        if self.snapshot_interval:
+            return await super()._retrieve_batch(
+                sender_ids, fetch_events_from_all_sessions
             )
-            .subquery()
-        )
 
-        event_query = session.query(self.SQLEvent).filter(
-            self.SQLEvent.sender_id == sender_id
+        async with self.async_session_scope() as session:
+            result = await session.execute(
+                self._batch_event_statement(sender_ids, fetch_events_from_all_sessions)
+            )
+            rows = result.all()
+
+        return self._trackers_from_serialised_events(
+            sender_ids, self._events_by_sender_id(rows)
         )
+
+    async def _event_statement(
+        self,
+        session: "AsyncSession",
+        sender_id: Text,
+        fetch_events_from_all_sessions: bool,
+    ) -> "Select":
+        conversation, snapshot = None, None
         if not fetch_events_from_all_sessions:
-            event_query = event_query.filter(
-                # Find events after the latest `SessionStarted` event or return all
-                # events
-                sa.or_(
-                    self.SQLEvent.timestamp >= session_start_sub_query.c.session_start,
-                    session_start_sub_query.c.session_start.is_(None),
+            conversation = await session.get(self.SQLConversation, sender_id)
+            snapshot = await self._async_stored_snapshot(session, sender_id)
+
+        return (
+            sa.select(self.SQLEvent.data)
+            .where(
+                *self._event_filters(
+                    sender_id, conversation, fetch_events_from_all_sessions, snapshot
                 )
             )
+            .order_by(self.SQLEvent.timestamp)
+        )
 
-        return event_query.order_by(self.SQLEvent.timestamp)
+    async def _async_stored_snapshot(
+        self, session: "AsyncSession", sender_id: Text
+    ) -> Optional["SQLTrackerStore.SQLSnapshot"]:
+        if not self.snapshot_interval:
+            return None
+
+        return await session.get(self.SQLSnapshot, sender_id)
+
+    async def number_of_existing_events(self, sender_id: Text) -> int:
+        """Return number of stored events since the latest session start."""
+        async with self.async_session_scope() as session:
+            event_statement = await self._event_statement(
+                session, sender_id, fetch_events_from_all_sessions=False
+            )
+            result = await session.execute(
+                sa.select(sa.func.count()).select_from(event_statement.subquery())
+            )
+            return result.scalar_one()
 
     async def save(self, tracker: DialogueStateTracker) -> None:
-        """Update database with events from the current conversation."""
-        await self.stream_events(tracker)
+        """Inserts the events which aren't stored yet into the database."""
+        offset = await self.persisted_event_offset(tracker)
+        new_events = list(itertools.islice(tracker.events, offset, None))
 
-        with self.session_scope() as session:
-            # only store recent events
-            events = self._additional_events(session, tracker)
+        await self.save_new_events(tracker.sender_id, new_events, offset)
 
-            for event in events:
-                data = event.as_dict()
-                intent = (
-                    data.get("parse_data", {}).get("intent", {}).get(INTENT_NAME_KEY)
-                )
-                action = data.get("name")
-                timestamp = data.get("timestamp")
-
-                # noinspection PyArgumentList
-                session.add(
-                    self.SQLEvent(
-                        sender_id=tracker.sender_id,
-                        type_name=event.type_name,
-                        timestamp=timestamp,
-                        intent_name=intent,
-                        action_name=action,
-                        data=json.dumps(data),
-                    )
-                )
-            session.commit()
+        tracker.persisted_event_count = len(tracker.events)
 
-        logger.debug(f"Tracker with sender_id '{tracker.sender_id}' stored to database")
+        index = self._snapshot_index(tracker)
+        if index is not None:
+            async with self.async_session_scope() as session:
+                stored = await session.get(self.SQLSnapshot, tracker.sender_id)
+                if stored is None or stored.timestamp < tracker.events[index].timestamp:
+                    await session.merge(self._snapshot_row(tracker, index))
+                    await session.commit()
 
-    def _additional_events(
-        self, session: "Session", tracker: DialogueStateTracker
-    ) -> Iterator:
-        """Return events from the tracker which aren't currently stored."""
-        number_of_events_since_last_session = self._event_query(
-            session, tracker.sender_id, fetch_events_from_all_sessions=False
-        ).count()
+    async def archive_events(self) -> int:
+        """Moves events which precede the snapshot of their conversation.
 
-        return itertools.islice(
-            tracker.events, number_of_events_since_last_session, len(tracker.events)
-        )
+        See `SQLTrackerStore.archive_events`.
+        """
+        async with self.async_session_scope() as session:
+            insert, delete = self._archive_statements()
+            await session.execute(insert)
+            result = await session.execute(delete)
+            await session.commit()
+
+        logger.debug(f"Archived {result.rowcount} events.")
+        return result.rowcount
+
+    async def save_new_events(
+        self, sender_id: Text, events: List[Event], expected_offset: int
+    ) -> None:
+        """Inserts `events` into the database with a single statement."""
+        rows = self._event_rows(sender_id, events)
+        if not rows:
+            return
+
+        if self.event_broker:
+            await self._stream_new_events(self.event_broker, events, sender_id)
+
+        async with self.async_session_scope() as session:
+            statement, parameters = self._insert_events_statement(
+                rows, self.engine.dialect
+            )
+            await session.execute(statement, parameters)
+
+            conversation = self._updated_conversation(sender_id, rows)
+            if conversation is not None:
+                await session.merge(conversation)
+
+            await session.commit()
+
+        logger.debug(f"Stored {len(rows)} events for sender_id '{sender_id}'.")
 
 
 class FailSafeTrackerStore(TrackerStore):
@@ -1269,6 +3419,18 @@ class FailSafeTrackerStore(TrackerStore):
             self.on_tracker_store_error(e)
             return None
 
+    async def _retrieve_batch(
+        self, sender_ids: List[Text], fetch_events_from_all_sessions: bool
+    ) -> List[DialogueStateTracker]:
+        """Calls `_retrieve_batch` method of primary tracker store."""
+        try:
+            return await self._tracker_store._retrieve_batch(
+                sender_ids, fetch_events_from_all_sessions
+            )
+        except Exception as e:
+            self.on_tracker_store_error(e)
+            return []
+
     async def keys(self) -> Iterable[Text]:
         """Calls `keys` method of primary tracker store."""
         try:
@@ -1285,6 +3447,223 @@ class FailSafeTrackerStore(TrackerStore):
             self.on_tracker_store_error(e)
             await self.fallback_tracker_store.save(tracker)
 
+    async def save_new_events(
+        self, sender_id: Text, events: List[Event], expected_offset: int
+    ) -> None:
+        """Calls `save_new_events` method of primary tracker store."""
+        try:
+            await self._tracker_store.save_new_events(
+                sender_id, events, expected_offset
+            )
+        except Exception as e:
+            self.on_tracker_store_error(e)
+            await self.fallback_tracker_store.save_new_events(
+                sender_id, events, expected_offset
+            )
+
+
+class _CachedTracker(NamedTuple):
+    tracker: DialogueStateTracker
+    size: int
+    expires_at: float
+
+
+class CachedTrackerStore(TrackerStore):
+    """Tracker store wrapper which keeps recently used trackers in memory.
+
+    Trackers are written through to the wrapped tracker store and copies of them
+    are kept in a least recently used cache which is bounded by the number of events
+    of the cached trackers. Every caller gets its own copy of the cached tracker, so
+    that changes which weren't saved don't leak into other retrievals. A cached
+    tracker is only returned if it didn't expire and (with
+    `validate_cached_trackers`) if the wrapped tracker store still has the same
+    number of events for the conversation.
+
+    The validation requires a tracker store which counts the stored events without
+    retrieving the tracker, i.e. one which overrides `number_of_existing_events`,
+    e.g. the `SQLTrackerStore`, the `MongoTrackerStore`, the `RedisTrackerStore` and
+    the `DynamoTrackerStore`. Caching is disabled for other tracker stores unless
+    the validation is turned off, since it wouldn't save any reads.
+    """
+
+    def __init__(
+        self,
+        tracker_store: TrackerStore,
+        max_events: int = DEFAULT_TRACKER_CACHE_MAX_EVENTS,
+        ttl: float = DEFAULT_TRACKER_CACHE_TTL,
+        validate_cached_trackers: bool = True,
+    ) -> None:
+        """Create a `CachedTrackerStore`.
+
+        Args:
+            tracker_store: The tracker store which persists the trackers.
+            max_events: Maximum number of events of all cached trackers together.
+            ttl: Number of seconds after which a cached tracker is retrieved from
+                the wrapped tracker store again.
+            validate_cached_trackers: Whether to compare the number of events of a
+                cached tracker with the number of stored events before returning it.
+                Only disable this if every conversation is always handled by the
+                same Rasa instance.
+        """
+        self._tracker_store = tracker_store
+        self._max_events = max_events
+        self._ttl = ttl
+        self._validate_cached_trackers = validate_cached_trackers
+        self._cache: OrderedDict[Text, _CachedTracker] = collections.OrderedDict()
+        self._cached_events = 0
+
+        self._is_caching_enabled = (
+            not validate_cached_trackers or self._counts_events_cheaply(tracker_store)
+        )
+        if not self._is_caching_enabled:
+            rasa.shared.utils.io.raise_warning(
+                f"Tracker caching is disabled since "
+                f"'{tracker_store.__class__.__name__}' can't count the stored events "
+                f"of a conversation without retrieving it, which is required to "
+                f"validate the cached trackers. Set "
+                f"'{VALIDATE_CACHED_TRACKERS_KEY}: false' to cache trackers anyway if "
+                f"every conversation is always handled by the same Rasa instance."
+            )
+
+        super().__init__(tracker_store.domain, tracker_store.event_broker)
+
+    @staticmethod
+    def _counts_events_cheaply(tracker_store: TrackerStore) -> bool:
+        return (
+            type(tracker_store).number_of_existing_events
+            is not TrackerStore.number_of_existing_events
+        )
+
+    @property
+    def domain(self) -> Domain:
+        """Returns the domain of the wrapped tracker store."""
+        return self._tracker_store.domain
+
+    @domain.setter
+    def domain(self, domain: Optional[Domain]) -> None:
+        # the slots of the cached trackers belong to the previous domain
+        self.clear_cache()
+        self._tracker_store.domain = domain or Domain.empty()
+
+    def clear_cache(self) -> None:
+        """Removes all trackers from the cache."""
+        self._cache.clear()
+        self._cached_events = 0
+
+    def _cache_tracker(self, tracker: DialogueStateTracker) -> None:
+        self._evict(tracker.sender_id)
+
+        size = len(tracker.events)
+        if not self._is_caching_enabled or size > self._max_events:
+            return
+
+        # the caller might keep modifying the tracker without saving it
+        self._cache[tracker.sender_id] = _CachedTracker(
+            self._copy(tracker), size, time.monotonic() + self._ttl
+        )
+        self._cached_events += size
+        while self._cached_events > self._max_events:
+            _, evicted = self._cache.popitem(last=False)
+            self._cached_events -= evicted.size
+
+    def _evict(self, sender_id: Text) -> None:
+        cached = self._cache.pop(sender_id, None)
+        if cached is not None:
+            self._cached_events -= cached.size
+
+    async def _cached_tracker(self, sender_id: Text) -> Optional[DialogueStateTracker]:
+        """Returns the cached tracker for `sender_id` if it's still up to date."""
+        cached = self._cache.get(sender_id)
+        if cached is None:
+            return None
+
+        is_up_to_date = cached.expires_at > time.monotonic()
+        if is_up_to_date and self._validate_cached_trackers:
+            # another instance might have added events to the conversation
+            is_up_to_date = (
+                await self._tracker_store.number_of_existing_events(sender_id)
+                == cached.tracker.persisted_event_count
+            )
+
+        if not is_up_to_date:
+            self._evict(sender_id)
+            return None
+
+        self._cache.move_to_end(sender_id)
+        return self._copy(cached.tracker)
+
+    @staticmethod
+    def _copy(tracker: DialogueStateTracker) -> DialogueStateTracker:
+        """Copies the tracker by replaying its events, which shares the events.
+
+        This is a lot faster than a deep copy and events aren't modified once
+        they were added to a tracker.
+        """
+        copied = tracker.copy()
+        copied.sender_source = tracker.sender_source
+        copied.model_id = tracker.model_id
+        copied.persisted_event_count = tracker.persisted_event_count
+        return copied
+
+    async def retrieve(self, sender_id: Text) -> Optional[DialogueStateTracker]:
+        """Returns the cached tracker or retrieves it from the wrapped store."""
+        tracker = await self._cached_tracker(sender_id)
+        if tracker is not None:
+            return tracker
+
+        tracker = await self._tracker_store.retrieve(sender_id)
+        if tracker is not None and tracker.persisted_event_count is not None:
+            self._cache_tracker(tracker)
+
+        return tracker
+
+    async def retrieve_full_tracker(
+        self, conversation_id: Text
+    ) -> Optional[DialogueStateTracker]:
+        """Calls `retrieve_full_tracker` method of the wrapped tracker store."""
+        return await self._tracker_store.retrieve_full_tracker(conversation_id)
+
+    async def _retrieve_batch(
+        self, sender_ids: List[Text], fetch_events_from_all_sessions: bool
+    ) -> List[DialogueStateTracker]:
+        """Calls `_retrieve_batch` method of the wrapped tracker store."""
+        return await self._tracker_store._retrieve_batch(
+            sender_ids, fetch_events_from_all_sessions
+        )
+
+    async def number_of_existing_events(self, sender_id: Text) -> int:
+        """Calls `number_of_existing_events` method of the wrapped tracker store."""
+        return await self._tracker_store.number_of_existing_events(sender_id)
+
+    async def exists(self, conversation_id: Text) -> bool:
+        """Calls `exists` method of the wrapped tracker store."""
+        return await self._tracker_store.exists(conversation_id)
+
+    async def keys(self) -> Iterable[Text]:
+        """Calls `keys` method of the wrapped tracker store."""
+        return await self._tracker_store.keys()
+
+    async def save(self, tracker: DialogueStateTracker) -> None:
+        """Saves the tracker to the wrapped tracker store and caches it."""
+        try:
+            await self._tracker_store.save(tracker)
+        except Exception:
+            self._evict(tracker.sender_id)
+            raise
+
+        self._cache_tracker(tracker)
+
+    async def save_new_events(
+        self, sender_id: Text, events: List[Event], expected_offset: int
+    ) -> None:
+        """Saves the events to the wrapped tracker store.
+
+        The cached tracker of the conversation is dropped since it doesn't contain
+        the new events.
+        """
+        self._evict(sender_id)
+        await self._tracker_store.save_new_events(sender_id, events, expected_offset)
+
 
 def _create_from_endpoint_config(
     endpoint_config: Optional[EndpointConfig] = None,
@@ -1297,6 +3676,15 @@ def _create_from_endpoint_config(
     if endpoint_config is None or endpoint_config.type is None:
         # default tracker store if no type is set
         tracker_store: TrackerStore = InMemoryTrackerStore(domain, event_broker)
+    elif endpoint_config.type.lower() == "redis" and endpoint_config.kwargs.get(
+        "use_event_lists"
+    ):
+        tracker_store = AsyncRedisTrackerStore(
+            domain=domain,
+            host=endpoint_config.url,
+            event_broker=event_broker,
+            **endpoint_config.kwargs,
+        )
     elif endpoint_config.type.lower() == "redis":
         tracker_store = RedisTrackerStore(
             domain=domain,
@@ -1304,6 +3692,15 @@ def _create_from_endpoint_config(
             event_broker=event_broker,
             **endpoint_config.kwargs,
         )
+    elif endpoint_config.type.lower() == "mongod" and endpoint_config.kwargs.get(
+        "use_async_driver"
+    ):
+        tracker_store = AsyncMongoTrackerStore(
+            domain=domain,
+            host=endpoint_config.url,
+            event_broker=event_broker,
+            **endpoint_config.kwargs,
+        )
     elif endpoint_config.type.lower() == "mongod":
         tracker_store = MongoTrackerStore(
             domain=domain,
@@ -1311,6 +3708,15 @@ def _create_from_endpoint_config(
             event_broker=event_broker,
             **endpoint_config.kwargs,
         )
+    elif endpoint_config.type.lower() == "sql" and endpoint_config.kwargs.get(
+        "use_async_engine"
+    ):
+        tracker_store = AsyncSQLTrackerStore(
+            domain=domain,
+            host=endpoint_config.url,
+            event_broker=event_broker,
+            **endpoint_config.kwargs,
+        )
     elif endpoint_config.type.lower() == "sql":
         tracker_store = SQLTrackerStore(
             domain=domain,
@@ -1318,6 +3724,12 @@ def _create_from_endpoint_config(
             event_broker=event_broker,
             **endpoint_config.kwargs,
         )
+    elif endpoint_config.type.lower() == "dynamo" and endpoint_config.kwargs.get(
+        "use_event_chunks"
+    ):
+        tracker_store = ChunkedDynamoTrackerStore(
+            domain=domain, event_broker=event_broker, **endpoint_config.kwargs
+        )
     elif endpoint_config.type.lower() == "dynamo":
         tracker_store = DynamoTrackerStore(
             domain=domain, event_broker=event_broker, **endpoint_config.kwargs
@@ -1426,6 +3838,24 @@ class AwaitableTrackerStore(TrackerStore):
         result = self._tracker_store.save(tracker)
         return await result if isawaitable(result) else result
 
+    async def save_new_events(
+        self, sender_id: Text, events: List[Event], expected_offset: int
+    ) -> None:
+        """Wrapper to call `save_new_events` method of primary tracker store.
+
+        Falls back to the default implementation in case the primary tracker store
+        doesn't implement it, since the inherited default expects an async
+        `retrieve` and `save`.
+        """
+        save_new_events = getattr(
+            type(self._tracker_store), "save_new_events", TrackerStore.save_new_events
+        )
+        if save_new_events is TrackerStore.save_new_events:
+            return await super().save_new_events(sender_id, events, expected_offset)
+
+        result = self._tracker_store.save_new_events(sender_id, events, expected_offset)
+        return await result if isawaitable(result) else result
+
     async def retrieve_full_tracker(
         self, conversation_id: Text
     ) -> Optional[DialogueStateTracker]:
@@ -1436,3 +3866,25 @@ class AwaitableTrackerStore(TrackerStore):
             if isawaitable(result)
             else result  # type: ignore[return-value]
         )
+
+    async def _retrieve_batch(
+        self, sender_ids: List[Text], fetch_events_from_all_sessions: bool
+    ) -> List[DialogueStateTracker]:
+        """Wrapper to call `_retrieve_batch` method of primary tracker store.
+
+        Falls back to the default implementation in case the primary tracker store
+        doesn't implement it, since the inherited default expects an async
+        `retrieve` and `retrieve_full_tracker`.
+        """
+        retrieve_batch = getattr(
+            type(self._tracker_store), "_retrieve_batch", TrackerStore._retrieve_batch
+        )
+        if retrieve_batch is TrackerStore._retrieve_batch:
+            return await super()._retrieve_batch(
+                sender_ids, fetch_events_from_all_sessions
+            )
+
+        result = self._tracker_store._retrieve_batch(
+            sender_ids, fetch_events_from_all_sessions
+        )
+        return await result if isawaitable(result) else result
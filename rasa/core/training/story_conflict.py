@@ -322,14 +322,16 @@ def _apply_tokenizer_to_states(tokenizer: Tokenizer, states: List[State]) -> Non
         tokenizer: A tokenizer to tokenize the user messages.
         states: The states to be tokenized.
     """
-    for state in states:
+    for index, state in enumerate(states):
         if USER in state and TEXT in state[USER]:
-            state[USER][TEXT] = " ".join(
+            # the states are shared with the tracker, hence they are replaced
+            text = " ".join(
                 token.text
                 for token in tokenizer.tokenize(
                     Message({TEXT: state[USER][TEXT]}), TEXT
                 )
             )
+            states[index] = {**state, USER: {**state[USER], TEXT: text}}
 
 
 def _get_previous_event(
@@ -17,6 +17,10 @@ from rasa.shared.data import TrainingType
 
 logger = logging.getLogger(__name__)
 
+# suffix of the component methods which process several items in one call (see
+# `GraphNode.run_batch`)
+BATCH_FN_SUFFIX = "_for_batch"
+
 
 @dataclass
 class SchemaNode:
@@ -436,11 +440,7 @@ class GraphNode:
         Returns:
             The node name and its output.
         """
-        received_inputs: Dict[Text, Any] = dict(inputs_from_previous_nodes)
-
-        kwargs = {}
-        for input_name, input_node in self._inputs.items():
-            kwargs[input_name] = received_inputs[input_node]
+        kwargs = self._kwargs_from_inputs(inputs_from_previous_nodes)
 
         input_hook_outputs = self._run_before_hooks(kwargs)
 
@@ -460,8 +460,70 @@ class GraphNode:
             f"'{self._component_class.__name__}.{self._fn_name}'."
         )
 
+        output = self._call_component(self._fn, **run_kwargs)
+
+        self._run_after_hooks(input_hook_outputs, output)
+
+        return self._node_name, output
+
+    def run_batch(
+        self, inputs_per_item: List[Tuple[Tuple[Text, Any], ...]]
+    ) -> List[Any]:
+        """Runs the node for several items at once.
+
+        If the component has a method with the name of the node's function plus
+        `BATCH_FN_SUFFIX` (e.g. `predict_action_probabilities_for_batch`), this method
+        is called once for all items. It receives a list with the keyword arguments
+        of the node's function for every item and has to return one output per item.
+        Otherwise the node is run for every item on its own.
+
+        Args:
+            inputs_per_item: The outputs of the parent nodes for every item (see
+                `__call__`).
+
+        Returns:
+            The output of the node for every item in the order of the items.
+        """
+        batch_fn = getattr(
+            self._component_class, f"{self._fn_name}{BATCH_FN_SUFFIX}", None
+        )
+        # components which aren't eager are loaded with the inputs of a single item
+        if batch_fn is None or not self._eager:
+            return [self(*inputs)[1] for inputs in inputs_per_item]
+
+        kwargs_per_item = [
+            self._kwargs_from_inputs(inputs) for inputs in inputs_per_item
+        ]
+        input_hook_outputs_per_item = [
+            self._run_before_hooks(kwargs) for kwargs in kwargs_per_item
+        ]
+
+        logger.debug(
+            f"Node '{self._node_name}' running "
+            f"'{self._component_class.__name__}.{batch_fn.__name__}' for "
+            f"{len(kwargs_per_item)} items."
+        )
+
+        outputs = self._call_component(batch_fn, kwargs_per_item)
+
+        for input_hook_outputs, output in zip(input_hook_outputs_per_item, outputs):
+            self._run_after_hooks(input_hook_outputs, output)
+
+        return outputs
+
+    def _kwargs_from_inputs(
+        self, inputs_from_previous_nodes: Tuple[Tuple[Text, Any], ...]
+    ) -> Dict[Text, Any]:
+        received_inputs: Dict[Text, Any] = dict(inputs_from_previous_nodes)
+
+        return {
+            input_name: received_inputs[input_node]
+            for input_name, input_node in self._inputs.items()
+        }
+
+    def _call_component(self, fn: Callable, *args: Any, **kwargs: Any) -> Any:
         try:
-            output = self._fn(self._component, **run_kwargs)
+            return fn(self._component, *args, **kwargs)
         except InvalidConfigException:
             # Pass through somewhat expected exception to allow more fine granular
             # handling of exceptions.
@@ -477,10 +539,6 @@ class GraphNode:
                 )
                 raise
 
-        self._run_after_hooks(input_hook_outputs, output)
-
-        return self._node_name, output
-
     def _run_after_hooks(self, input_hook_outputs: List[Dict], output: Any) -> None:
         for hook, hook_data in zip(self._hooks, input_hook_outputs):
             try:
@@ -556,3 +614,4 @@ class GraphModelConfiguration:
     language: Optional[Text]
     core_target: Optional[Text]
     nlu_target: Optional[Text]
+    predict_graph_config: Dict[Text, Any] = field(default_factory=dict)
@@ -32,5 +32,6 @@ def load_predict_graph_runner(
         execution_context=ExecutionContext(
             graph_schema=model_metadata.predict_schema, model_id=model_metadata.model_id
         ),
+        config=model_metadata.predict_graph_config,
     )
     return model_metadata, runner
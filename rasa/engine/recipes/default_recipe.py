@@ -223,6 +223,7 @@ class DefaultV1Recipe(Recipe):
             language=config.get("language"),
             core_target=core_target,
             nlu_target=f"run_{RegexMessageHandler.__name__}",
+            predict_graph_config=config.get("predict_graph") or {},
         )
 
     def _create_train_nodes(
@@ -74,4 +74,5 @@ class GraphV1Recipe(Recipe):
             language=config.get("language"),
             core_target=core_target,
             nlu_target=nlu_target,
+            predict_graph_config=config.get("predict_graph") or {},
         )
@@ -0,0 +1,380 @@
+from __future__ import annotations
+
+import functools
+import logging
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Dict, Iterable, List, Optional, Set, Text, Tuple, cast
+
+from rasa.engine.exceptions import GraphRunError
+from rasa.engine.graph import ExecutionContext, GraphNode, GraphNodeHook, GraphSchema
+from rasa.engine.runner.interface import GraphRunner
+from rasa.engine.storage.storage import ModelStorage
+
+logger = logging.getLogger(__name__)
+
+# keys of the `predict_graph` section of the model configuration
+MAX_WORKERS_KEY = "max_workers"
+NODE_TIMEOUT_KEY = "node_timeout"
+
+# A step of an execution plan: the node to run and the names of the nodes or inputs
+# whose outputs it needs.
+ExecutionStep = Tuple[Text, GraphNode, Tuple[Text, ...]]
+
+
+class CompiledGraphRunner(GraphRunner):
+    """Runs a `GraphSchema` by calling its nodes directly in a precompiled order.
+
+    In contrast to the `DaskGraphRunner`, the minimal schema and the execution order
+    for a set of targets are only computed once and then reused for every run. This
+    makes it a good fit for the prediction graph, which is run for every message.
+
+    With `max_workers` greater than 1, nodes which don't depend on each other (e.g.
+    the policies) run concurrently on a thread pool. With a `node_timeout`, a run
+    fails if a single node takes longer than the timeout in seconds. Python threads
+    can't be stopped, so a node which timed out keeps running until it finishes. Its
+    worker is abandoned and the thread pool is replaced so that the following runs
+    still have `max_workers` workers.
+    """
+
+    def __init__(
+        self,
+        graph_schema: GraphSchema,
+        model_storage: ModelStorage,
+        execution_context: ExecutionContext,
+        hooks: Optional[List[GraphNodeHook]] = None,
+        config: Optional[Dict[Text, Any]] = None,
+    ) -> None:
+        """Initializes a `CompiledGraphRunner`.
+
+        Args:
+            graph_schema: The graph schema that will be run.
+            model_storage: Storage which graph components can use to persist and load
+                themselves.
+            execution_context: Information about the current graph run to be passed to
+                each node.
+            hooks: These are called before and after the execution of each node.
+            config: The maximum number of nodes which run concurrently
+                (`max_workers`) and the time in seconds after which a running node
+                fails the run (`node_timeout`).
+        """
+        config = config or {}
+        self._max_workers: int = config.get(MAX_WORKERS_KEY) or 1
+        self._node_timeout: Optional[float] = config.get(NODE_TIMEOUT_KEY)
+        # timeouts require nodes to run outside of the calling thread
+        self._executor: Optional[ThreadPoolExecutor] = None
+        if self._max_workers > 1 or self._node_timeout:
+            self._executor = self._create_executor()
+        # nodes which timed out and are still running
+        self._abandoned_futures: Set[Future] = set()
+
+        self._graph_schema = graph_schema
+        self._instantiated_nodes: Dict[Text, GraphNode] = {
+            node_name: GraphNode.from_schema_node(
+                node_name, schema_node, model_storage, execution_context, hooks
+            )
+            for node_name, schema_node in graph_schema.nodes.items()
+        }
+        self._execution_context: ExecutionContext = execution_context
+        self._execution_plans: Dict[Tuple[Text, ...], List[ExecutionStep]] = {}
+
+        # compile the plans for the targets which are usually requested upfront
+        target_names = graph_schema.target_names
+        self._get_execution_plan(tuple(target_names))
+        for target_name in target_names:
+            self._get_execution_plan((target_name,))
+
+    @classmethod
+    def create(
+        cls,
+        graph_schema: GraphSchema,
+        model_storage: ModelStorage,
+        execution_context: ExecutionContext,
+        hooks: Optional[List[GraphNodeHook]] = None,
+        config: Optional[Dict[Text, Any]] = None,
+    ) -> CompiledGraphRunner:
+        """Creates the runner (see parent class for full docstring)."""
+        return cls(graph_schema, model_storage, execution_context, hooks, config)
+
+    def _get_execution_plan(self, targets: Tuple[Text, ...]) -> List[ExecutionStep]:
+        """Returns the cached execution plan for the targets or compiles it."""
+        plan = self._execution_plans.get(targets)
+        if plan is None:
+            plan = self._compile_execution_plan(targets)
+            self._execution_plans[targets] = plan
+        return plan
+
+    def _compile_execution_plan(self, targets: Tuple[Text, ...]) -> List[ExecutionStep]:
+        """Sorts the nodes which the targets depend on topologically.
+
+        Nodes which aren't a target or an ancestor of a target are not part of the
+        plan. Names which aren't nodes of the schema are expected to be inputs.
+
+        Args:
+            targets: The nodes whose outputs are requested.
+
+        Returns:
+            The nodes in the order in which they have to run.
+        """
+        plan: List[ExecutionStep] = []
+        visited: Set[Text] = set()
+
+        def visit(node_name: Text) -> None:
+            if node_name in visited:
+                return
+            visited.add(node_name)
+
+            schema_node = self._graph_schema.nodes.get(node_name)
+            if schema_node is None:
+                return
+
+            for dependency in schema_node.needs.values():
+                visit(dependency)
+            plan.append(
+                (
+                    node_name,
+                    self._instantiated_nodes[node_name],
+                    tuple(schema_node.needs.values()),
+                )
+            )
+
+        for target in targets:
+            visit(target)
+
+        return plan
+
+    def run(
+        self,
+        inputs: Optional[Dict[Text, Any]] = None,
+        targets: Optional[List[Text]] = None,
+    ) -> Dict[Text, Any]:
+        """Runs the graph (see parent class for full docstring)."""
+        run_targets = targets if targets else self._graph_schema.target_names
+        plan = self._get_execution_plan(tuple(run_targets))
+
+        outputs: Dict[Text, Any] = dict(inputs) if inputs else {}
+        self._check_input_names(outputs)
+
+        logger.debug(
+            f"Running graph with inputs: {inputs}, targets: {targets} "
+            f"and {self._execution_context}."
+        )
+
+        try:
+            if self._executor is None:
+                for node_name, node, dependencies in plan:
+                    _, outputs[node_name] = node(
+                        *[
+                            (dependency, outputs[dependency])
+                            for dependency in dependencies
+                        ]
+                    )
+            else:
+                self._run_concurrently(plan, outputs)
+            # the results are ordered by the targets, no matter in which order the
+            # nodes finished
+            return {target: outputs[target] for target in run_targets}
+        except KeyError as e:
+            raise GraphRunError(
+                f"Error running runner. No input or node was found for {e}."
+            ) from e
+        except RuntimeError as e:
+            raise GraphRunError("Error running runner.") from e
+
+    def run_batch(
+        self,
+        inputs: List[Dict[Text, Any]],
+        targets: Optional[List[Text]] = None,
+    ) -> List[Dict[Text, Any]]:
+        """Runs the graph for several sets of inputs at once.
+
+        Nodes which don't depend on the inputs run only once and share their output.
+        Every other node runs once for all sets of inputs (see `GraphNode.run_batch`),
+        so that components can e.g. make a single model call for all of them. The
+        nodes of a batch run one after another in the calling thread.
+
+        Args:
+            inputs: The inputs of every run (see `run`).
+            targets: Nodes whose output is needed and must always run.
+
+        Returns: A mapping of target node name to output value for every set of inputs
+            in the order of `inputs`.
+        """
+        if not inputs:
+            return []
+
+        run_targets = targets if targets else self._graph_schema.target_names
+        plan = self._get_execution_plan(tuple(run_targets))
+
+        outputs_per_item: List[Dict[Text, Any]] = [
+            dict(item_inputs) for item_inputs in inputs
+        ]
+        # names of the inputs and nodes whose outputs differ between the items
+        item_specific: Set[Text] = set().union(*outputs_per_item)
+        self._check_input_names(item_specific)
+        shared_outputs: Dict[Text, Any] = {}
+
+        def inputs_for_item(
+            item_outputs: Dict[Text, Any], dependencies: Tuple[Text, ...]
+        ) -> Tuple[Tuple[Text, Any], ...]:
+            return tuple(
+                (
+                    dependency,
+                    item_outputs[dependency]
+                    if dependency in item_specific
+                    else shared_outputs[dependency],
+                )
+                for dependency in dependencies
+            )
+
+        logger.debug(
+            f"Running graph for a batch of {len(inputs)} inputs with targets: "
+            f"{targets} and {self._execution_context}."
+        )
+
+        try:
+            for node_name, node, dependencies in plan:
+                if item_specific.isdisjoint(dependencies):
+                    _, shared_outputs[node_name] = node(
+                        *inputs_for_item({}, dependencies)
+                    )
+                    continue
+
+                item_specific.add(node_name)
+                node_outputs = node.run_batch(
+                    [
+                        inputs_for_item(item_outputs, dependencies)
+                        for item_outputs in outputs_per_item
+                    ]
+                )
+                for item_outputs, output in zip(outputs_per_item, node_outputs):
+                    item_outputs[node_name] = output
+
+            return [
+                {
+                    target: item_outputs[target]
+                    if target in item_specific
+                    else shared_outputs[target]
+                    for target in run_targets
+                }
+                for item_outputs in outputs_per_item
+            ]
+        except KeyError as e:
+            raise GraphRunError(
+                f"Error running runner. No input or node was found for {e}."
+            ) from e
+        except RuntimeError as e:
+            raise GraphRunError("Error running runner.") from e
+
+    def _create_executor(self) -> ThreadPoolExecutor:
+        return ThreadPoolExecutor(
+            max_workers=self._max_workers, thread_name_prefix="graph_runner"
+        )
+
+    def _check_input_names(self, input_names: Iterable[Text]) -> None:
+        for input_name in input_names:
+            if input_name in self._graph_schema.nodes:
+                raise GraphRunError(
+                    f"Input '{input_name}' clashes with a node name. Make sure "
+                    f"that none of the input names passed to the `run` method are "
+                    f"the same as node names in the graph schema."
+                )
+
+    def _run_concurrently(
+        self, plan: List[ExecutionStep], outputs: Dict[Text, Any]
+    ) -> None:
+        """Runs each node of the plan as soon as the nodes it depends on finished.
+
+        Args:
+            plan: The nodes to run in topological order.
+            outputs: The inputs of the run. The outputs of the nodes are added.
+
+        Raises:
+            GraphRunError: If a node didn't finish within the node timeout.
+        """
+        planned_nodes = {node_name for node_name, _, _ in plan}
+        # nodes which didn't start yet and the planned nodes they are waiting for
+        waiting: Dict[Text, Tuple[ExecutionStep, Set[Text]]] = {
+            step[0]: (step, {d for d in step[2] if d in planned_nodes}) for step in plan
+        }
+        running: Dict[Future, Tuple[Text, float]] = {}
+
+        def start_ready_nodes() -> None:
+            # nodes are started in the order of the plan
+            for node_name, (step, missing_dependencies) in list(waiting.items()):
+                if missing_dependencies:
+                    continue
+                del waiting[node_name]
+                _, node, dependencies = step
+                inputs = [
+                    (dependency, outputs[dependency]) for dependency in dependencies
+                ]
+                # the thread pool is replaced when a concurrent run timed out
+                executor = cast(ThreadPoolExecutor, self._executor)
+                future = executor.submit(node, *inputs)
+                running[future] = (node_name, time.monotonic())
+
+        start_ready_nodes()
+        while running:
+            timeout = None
+            if self._node_timeout:
+                earliest_start = min(start for _, start in running.values())
+                timeout = max(
+                    0.0, earliest_start + self._node_timeout - time.monotonic()
+                )
+
+            finished, _ = wait(running, timeout=timeout, return_when=FIRST_COMPLETED)
+            if not finished:
+                node_name = min(running.values(), key=lambda item: item[1])[0]
+                self._abandon(running)
+                raise GraphRunError(
+                    f"Node '{node_name}' didn't finish within the timeout of "
+                    f"{self._node_timeout} seconds."
+                )
+
+            for future in finished:
+                node_name, _ = running.pop(future)
+                # re-raises errors of the node
+                _, outputs[node_name] = future.result()
+                for _, missing_dependencies in waiting.values():
+                    missing_dependencies.discard(node_name)
+
+            start_ready_nodes()
+
+    def _abandon(self, running: Dict[Future, Tuple[Text, float]]) -> None:
+        """Gives up on the running nodes of a run which timed out.
+
+        Nodes which didn't start yet are cancelled. The nodes which are already
+        running can't be stopped and block their workers until they finish, so the
+        thread pool is replaced by a new one. The old thread pool is shut down once
+        its abandoned nodes finished.
+
+        Args:
+            running: The futures of the running nodes with their names and start
+                times.
+        """
+        for future, (node_name, started_at) in running.items():
+            if future.cancel():
+                continue
+
+            self._abandoned_futures.add(future)
+            future.add_done_callback(
+                functools.partial(self._on_abandoned_node_done, node_name, started_at)
+            )
+
+        executor, self._executor = self._executor, self._create_executor()
+        cast(ThreadPoolExecutor, executor).shutdown(wait=False)
+        logger.warning(
+            f"{len(self._abandoned_futures)} graph node(s) of runs which exceeded the "
+            f"node timeout of {self._node_timeout} seconds are still running. Each "
+            f"of them occupies a thread until it finishes."
+        )
+
+    def _on_abandoned_node_done(
+        self, node_name: Text, started_at: float, future: Future
+    ) -> None:
+        self._abandoned_futures.discard(future)
+        logger.debug(
+            f"Node '{node_name}' of a run which exceeded the node timeout finished "
+            f"{time.monotonic() - started_at:.2f} seconds after it was started."
+        )
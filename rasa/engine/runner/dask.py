@@ -46,8 +46,10 @@ class DaskGraphRunner(GraphRunner):
         model_storage: ModelStorage,
         execution_context: ExecutionContext,
         hooks: Optional[List[GraphNodeHook]] = None,
+        config: Optional[Dict[Text, Any]] = None,
     ) -> DaskGraphRunner:
         """Creates the runner (see parent class for full docstring)."""
+        # nodes are always run one after another
         return cls(graph_schema, model_storage, execution_context, hooks)
 
     @staticmethod
@@ -17,6 +17,7 @@ class GraphRunner(ABC):
         model_storage: ModelStorage,
         execution_context: ExecutionContext,
         hooks: Optional[List[GraphNodeHook]] = None,
+        config: Optional[Dict[Text, Any]] = None,
     ) -> GraphRunner:
         """Creates a new instance of a `GraphRunner`.
 
@@ -26,6 +27,9 @@ class GraphRunner(ABC):
                 themselves.
             execution_context: Context that will be passed to every `GraphComponent`.
             hooks: These are called before and after the execution of each node.
+            config: Settings for running the graph (e.g. the `predict_graph` section
+                of the model configuration). Runners ignore settings which they
+                don't support.
 
         Returns: Instantiated `GraphRunner`
         """
@@ -47,3 +51,23 @@ class GraphRunner(ABC):
         Returns: A mapping of target node name to output value.
         """
         ...
+
+    def run_batch(
+        self,
+        inputs: List[Dict[Text, Any]],
+        targets: Optional[List[Text]] = None,
+    ) -> List[Dict[Text, Any]]:
+        """Runs the instantiated graph for several sets of inputs.
+
+        Runners which can process the inputs together (e.g. to make a single model
+        call for all of them) override this. By default, the graph is run once for
+        every set of inputs.
+
+        Args:
+            inputs: The inputs of every run (see `run`).
+            targets: Nodes whose output is needed and must always run.
+
+        Returns: A mapping of target node name to output value for every set of inputs
+            in the order of `inputs`.
+        """
+        return [self.run(inputs=run_inputs, targets=targets) for run_inputs in inputs]
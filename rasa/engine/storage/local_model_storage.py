@@ -204,4 +204,5 @@ class LocalModelStorage(ModelStorage):
             language=model_configuration.language,
             core_target=model_configuration.core_target,
             nlu_target=model_configuration.nlu_target,
+            predict_graph_config=model_configuration.predict_graph_config,
         )
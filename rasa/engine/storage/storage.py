@@ -3,7 +3,7 @@ import abc
 import logging
 import typing
 from contextlib import contextmanager
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import Tuple, Union, Text, Generator, Dict, Any, Optional
@@ -138,6 +138,7 @@ class ModelMetadata:
     nlu_target: Text
     language: Optional[Text]
     training_type: TrainingType = TrainingType.BOTH
+    predict_graph_config: Dict[Text, Any] = field(default_factory=dict)
 
     def __post_init__(self) -> None:
         """Raises an exception when the meta data indicates an unsupported version.
@@ -165,6 +166,7 @@ class ModelMetadata:
             "core_target": self.core_target,
             "nlu_target": self.nlu_target,
             "language": self.language,
+            "predict_graph_config": self.predict_graph_config,
         }
 
     @classmethod
@@ -191,4 +193,6 @@ class ModelMetadata:
             core_target=serialized["core_target"],
             nlu_target=serialized["nlu_target"],
             language=serialized["language"],
+            # not present in models trained with older versions
+            predict_graph_config=serialized.get("predict_graph_config", {}),
         )
@@ -935,22 +935,96 @@ class DIETClassifier(GraphComponent, IntentClassifier, EntityExtractorMixin):
         return self._resource
 
     # process helpers
-    def _predict(
-        self, message: Message
-    ) -> Optional[Dict[Text, Union[tf.Tensor, Dict[Text, tf.Tensor]]]]:
+    def _predict_batch(
+        self, messages: List[Message]
+    ) -> List[Optional[Dict[Text, Union[tf.Tensor, Dict[Text, tf.Tensor]]]]]:
+        """Runs the model once for all messages.
+
+        Args:
+            messages: The messages to predict.
+
+        Returns:
+            The model outputs for every message. The output is `None` for messages
+            which can't be predicted as they don't have features.
+        """
+        outputs: List[Optional[Dict[Text, Any]]] = [None] * len(messages)
         if self.model is None:
             logger.debug(
                 f"There is no trained model for '{self.__class__.__name__}': The "
                 f"component is either not trained or didn't receive enough training "
                 f"data."
             )
-            return None
+            return outputs
 
-        # create session data from message and convert it into a batch of 1
-        model_data = self._create_model_data([message], training=False)
+        indices = [
+            index
+            for index, message in enumerate(messages)
+            if message.features_present(
+                attribute=TEXT, featurizers=self.component_config.get(FEATURIZERS)
+            )
+        ]
+        if not indices:
+            return outputs
+
+        messages_with_features = [messages[index] for index in indices]
+        model_data = self._create_model_data(messages_with_features, training=False)
         if model_data.is_empty():
-            return None
-        return self.model.run_inference(model_data)
+            return outputs
+
+        batch_out = self.model.run_inference(
+            model_data, batch_size=len(messages_with_features)
+        )
+        for position, (index, message) in enumerate(
+            zip(indices, messages_with_features)
+        ):
+            outputs[index] = self._slice_batch_output(
+                batch_out, position, len(message.get(TOKENS_NAMES[TEXT], []))
+            )
+
+        return outputs
+
+    @staticmethod
+    def _slice_batch_output(
+        batch_out: Dict[Text, Any], position: int, number_of_tokens: int
+    ) -> Dict[Text, Any]:
+        """Extracts the output of a single message from the output of a batch.
+
+        Outputs per token are padded to the longest message of the batch. They are
+        cut to the length of the message, so that the output is the same as if the
+        message was predicted on its own.
+
+        Args:
+            batch_out: The model output for the batch.
+            position: Position of the message in the batch.
+            number_of_tokens: Number of tokens of the message.
+
+        Returns:
+            The model output for the message with a batch dimension of 1.
+        """
+        message_out: Dict[Text, Any] = {}
+        for key, value in batch_out.items():
+            if value is None:
+                message_out[key] = None
+            elif key == DIAGNOSTIC_DATA:
+                # the diagnostic data contains the sentence token after the tokens
+                length = number_of_tokens + 1
+                diagnostic_data: Dict[Text, Any] = {}
+                for name, data in value.items():
+                    if data is None:
+                        diagnostic_data[name] = None
+                    elif name == "attention_weights":
+                        diagnostic_data[name] = data[
+                            position : position + 1, ..., :length, :length
+                        ]
+                    else:
+                        diagnostic_data[name] = data[position : position + 1, :length]
+                message_out[key] = diagnostic_data
+            elif key.startswith("e_"):
+                message_out[key] = value[position : position + 1, :number_of_tokens]
+            else:
+                message_out[key] = value[position : position + 1]
+
+        return message_out
 
     def _predict_label(
         self, predict_out: Optional[Dict[Text, tf.Tensor]]
@@ -1019,9 +1093,11 @@ class DIETClassifier(GraphComponent, IntentClassifier, EntityExtractorMixin):
         return entities
 
     def process(self, messages: List[Message]) -> List[Message]:
-        """Augments the message with intents, entities, and diagnostic data."""
-        for message in messages:
-            out = self._predict(message)
+        """Augments the messages with intents, entities, and diagnostic data.
+
+        The model runs once for all messages.
+        """
+        for message, out in zip(messages, self._predict_batch(messages)):
 
             if self.component_config[INTENT_CLASSIFICATION]:
                 label, label_ranking = self._predict_label(out)
@@ -1,8 +1,12 @@
 from __future__ import annotations
+import hashlib
+import json
 import numpy as np
 import logging
+import sqlite3
+from pathlib import Path
 
-from typing import Any, Text, List, Dict, Tuple, Type
+from typing import Any, Iterable, Iterator, Optional, Text, List, Dict, Tuple, Type
 import tensorflow as tf
 
 from rasa.engine.graph import ExecutionContext, GraphComponent
@@ -21,7 +25,9 @@ from rasa.nlu.constants import (
     NUMBER_OF_SUB_TOKENS,
     TOKENS_NAMES,
 )
+from rasa.shared.exceptions import InvalidConfigException
 from rasa.shared.nlu.constants import TEXT, ACTION_TEXT
+import rasa.shared.utils.io
 from rasa.utils import train_utils
 
 logger = logging.getLogger(__name__)
@@ -35,6 +41,71 @@ MAX_SEQUENCE_LENGTHS = {
     "roberta": 512,
 }
 
+# number of messages which are passed to the language model at once
+BATCH_SIZE = 64
+
+
+class _FeatureCache:
+    """Stores the features which the language model computed for token ids on disk.
+
+    The features are kept in a SQLite database in the cache directory, so that
+    training again on mostly the same data doesn't need the language model for the
+    messages which were featurized before.
+    """
+
+    FILE_NAME = "language_model_features.db"
+    # SQLite limits the number of parameters of a query
+    MAX_KEYS_PER_QUERY = 500
+
+    def __init__(self, cache_dir: Text) -> None:
+        path = Path(cache_dir)
+        path.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(str(path / self.FILE_NAME))
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS features (key TEXT PRIMARY KEY, "
+            "dtype TEXT, dimension INTEGER, sentence BLOB, sequence BLOB)"
+        )
+
+    def get(self, keys: List[Text]) -> Dict[Text, Tuple[np.ndarray, np.ndarray]]:
+        """Returns the sentence and sequence features of the cached keys."""
+        features = {}
+        for start in range(0, len(keys), self.MAX_KEYS_PER_QUERY):
+            chunk = keys[start : start + self.MAX_KEYS_PER_QUERY]
+            rows = self._connection.execute(
+                f"SELECT key, dtype, dimension, sentence, sequence FROM features "
+                f"WHERE key IN ({', '.join('?' * len(chunk))})",
+                chunk,
+            )
+            # the raw buffers are read much faster than the `.npy` format, they are
+            # copied since arrays of buffers are read-only
+            for key, dtype, dimension, sentence, sequence in rows:
+                features[key] = (
+                    np.frombuffer(sentence, dtype=dtype).copy(),
+                    np.frombuffer(sequence, dtype=dtype).reshape(-1, dimension).copy(),
+                )
+        return features
+
+    def add(self, features: Iterable[Tuple[Text, np.ndarray, np.ndarray]]) -> None:
+        """Stores the sentence and sequence features of keys."""
+        with self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO features VALUES (?, ?, ?, ?, ?)",
+                [
+                    (
+                        key,
+                        sequence.dtype.str,
+                        sequence.shape[-1],
+                        np.ascontiguousarray(sentence, dtype=sequence.dtype).tobytes(),
+                        np.ascontiguousarray(sequence).tobytes(),
+                    )
+                    for key, sentence, sequence in features
+                ],
+            )
+
+    def close(self) -> None:
+        """Closes the database."""
+        self._connection.close()
+
 
 @DefaultV1Recipe.register(
     DefaultV1Recipe.ComponentType.MESSAGE_FEATURIZER, is_trainable=False
@@ -63,6 +134,8 @@ class LanguageModelFeaturizer(DenseFeaturizer, GraphComponent):
         )
         self._load_model_metadata()
         self._load_model_instance()
+        # hash of the values of the loaded weights, see `_model_weights_fingerprint`
+        self._weights_fingerprint: Optional[Text] = None
 
     @staticmethod
     def get_default_config() -> Dict[Text, Any]:
@@ -76,12 +149,34 @@ class LanguageModelFeaturizer(DenseFeaturizer, GraphComponent):
             # an optional path to a specific directory to download
             # and cache the pre-trained model weights.
             "cache_dir": None,
+            # maximum number of messages which are passed to the language model at
+            # once.
+            "batch_size": BATCH_SIZE,
+            # maximum number of token ids of the messages, padded to the longest
+            # one, which are passed to the language model at once. `None` means
+            # that only the batch size limits the batches.
+            "max_tokens_per_batch": None,
+            # an optional path to a directory in which the features of training
+            # examples are cached, so that the language model doesn't have to
+            # compute them again when training on the same examples.
+            "embedding_cache_dir": None,
         }
 
     @classmethod
     def validate_config(cls, config: Dict[Text, Any]) -> None:
         """Validates the configuration."""
-        pass
+        if config["batch_size"] < 1:
+            raise InvalidConfigException(
+                f"The `batch_size` of the `{cls.__name__}` must be at least 1, but "
+                f"it is {config['batch_size']}."
+            )
+        if config["max_tokens_per_batch"] is not None and (
+            config["max_tokens_per_batch"] < 1
+        ):
+            raise InvalidConfigException(
+                f"The `max_tokens_per_batch` of the `{cls.__name__}` must be at "
+                f"least 1 or `None`, but it is {config['max_tokens_per_batch']}."
+            )
 
     @classmethod
     def create(
@@ -688,17 +783,23 @@ class LanguageModelFeaturizer(DenseFeaturizer, GraphComponent):
             batch_token_ids, batch_tokens, batch_examples, attribute, inference_mode
         )
 
+        return [
+            self._create_doc(sentence_features, sequence_features)
+            for sentence_features, sequence_features in zip(
+                batch_sentence_features, batch_sequence_features
+            )
+        ]
+
+    @staticmethod
+    def _create_doc(
+        sentence_features: np.ndarray, sequence_features: np.ndarray
+    ) -> Dict[Text, Any]:
         # A doc consists of
         # {'sequence_features': ..., 'sentence_features': ...}
-        batch_docs = []
-        for index in range(len(batch_examples)):
-            doc = {
-                SEQUENCE_FEATURES: batch_sequence_features[index],
-                SENTENCE_FEATURES: np.reshape(batch_sentence_features[index], (1, -1)),
-            }
-            batch_docs.append(doc)
-
-        return batch_docs
+        return {
+            SEQUENCE_FEATURES: sequence_features,
+            SENTENCE_FEATURES: np.reshape(sentence_features, (1, -1)),
+        }
 
     def process_training_data(self, training_data: TrainingData) -> TrainingData:
         """Computes tokens and dense features for each message in training data.
@@ -707,55 +808,179 @@ class LanguageModelFeaturizer(DenseFeaturizer, GraphComponent):
             training_data: NLU training data to be tokenized and featurized
             config: NLU pipeline config consisting of all components.
         """
-        batch_size = 64
+        feature_cache = (
+            _FeatureCache(self._config["embedding_cache_dir"])
+            if self._config["embedding_cache_dir"]
+            else None
+        )
+        try:
+            self._process_in_batches(
+                training_data.training_examples,
+                DENSE_FEATURIZABLE_ATTRIBUTES,
+                feature_cache=feature_cache,
+            )
+        finally:
+            if feature_cache:
+                feature_cache.close()
 
-        for attribute in DENSE_FEATURIZABLE_ATTRIBUTES:
+        return training_data
 
-            non_empty_examples = list(
-                filter(lambda x: x.get(attribute), training_data.training_examples)
-            )
+    def process(self, messages: List[Message]) -> List[Message]:
+        """Processes messages by computing tokens and dense features.
 
-            batch_start_index = 0
+        The messages are featurized in batches, so that several messages which are
+        processed together only need a single call of the language model.
+        """
+        # processing featurizers operates only on TEXT and ACTION_TEXT attributes,
+        # because all other attributes are labels which are featurized during
+        # training and their features are stored by the model itself.
+        self._process_in_batches(messages, [TEXT, ACTION_TEXT], inference_mode=True)
 
-            while batch_start_index < len(non_empty_examples):
+        return messages
 
-                batch_end_index = min(
-                    batch_start_index + batch_size, len(non_empty_examples)
-                )
-                # Collect batch examples
-                batch_messages = non_empty_examples[batch_start_index:batch_end_index]
+    def _process_in_batches(
+        self,
+        messages: List[Message],
+        attributes: List[Text],
+        inference_mode: bool = False,
+        feature_cache: Optional[_FeatureCache] = None,
+    ) -> None:
+        """Adds the language model features of the given attributes to the messages.
 
-                # Construct a doc with relevant features
-                # extracted(tokens, dense_features)
-                batch_docs = self._get_docs_for_batch(batch_messages, attribute)
+        Messages of similar length are passed to the language model together, so
+        that little of the computation is spent on padding.
 
-                for index, ex in enumerate(batch_messages):
-                    self._set_lm_features(batch_docs[index], ex, attribute)
-                batch_start_index += batch_size
+        Args:
+            messages: Messages to featurize.
+            attributes: Attributes which should be featurized.
+            inference_mode: Whether the messages are featurized during inference.
+                Sequences which are too long for the model are then truncated
+                instead of raising an error.
+            feature_cache: Cache of the features which were computed before.
+        """
+        for attribute in attributes:
 
-        return training_data
+            non_empty_examples = [
+                message for message in messages if message.get(attribute)
+            ]
+            if not non_empty_examples:
+                continue
 
-    def process(self, messages: List[Message]) -> List[Message]:
-        """Processes messages by computing tokens and dense features."""
-        for message in messages:
-            self._process_message(message)
-        return messages
+            tokens, token_ids = self._get_token_ids_for_batch(
+                non_empty_examples, attribute
+            )
 
-    def _process_message(self, message: Message) -> Message:
-        """Processes a message by computing tokens and dense features."""
-        # processing featurizers operates only on TEXT and ACTION_TEXT attributes,
-        # because all other attributes are labels which are featurized during
-        # training and their features are stored by the model itself.
-        for attribute in {TEXT, ACTION_TEXT}:
-            if message.get(attribute):
-                self._set_lm_features(
-                    self._get_docs_for_batch(
-                        [message], attribute=attribute, inference_mode=True
-                    )[0],
-                    message,
+            docs: List[Optional[Dict[Text, Any]]] = [None] * len(non_empty_examples)
+            cache_keys = []
+            if feature_cache:
+                cache_keys = [
+                    self._cache_key(example_tokens, example_token_ids)
+                    for example_tokens, example_token_ids in zip(tokens, token_ids)
+                ]
+                cached_features = feature_cache.get(cache_keys)
+                for index, key in enumerate(cache_keys):
+                    if key in cached_features:
+                        docs[index] = self._create_doc(*cached_features[key])
+
+            uncached_indices = [index for index, doc in enumerate(docs) if doc is None]
+            for batch_indices in self._length_bucketed_batches(
+                uncached_indices, token_ids
+            ):
+                (
+                    batch_sentence_features,
+                    batch_sequence_features,
+                ) = self._get_model_features_for_batch(
+                    [token_ids[index] for index in batch_indices],
+                    [tokens[index] for index in batch_indices],
+                    [non_empty_examples[index] for index in batch_indices],
                     attribute,
+                    inference_mode,
+                )
+                for index, sentence_features, sequence_features in zip(
+                    batch_indices, batch_sentence_features, batch_sequence_features
+                ):
+                    docs[index] = self._create_doc(sentence_features, sequence_features)
+
+                if feature_cache:
+                    feature_cache.add(
+                        (cache_keys[index], sentence_features, sequence_features)
+                        for index, sentence_features, sequence_features in zip(
+                            batch_indices,
+                            batch_sentence_features,
+                            batch_sequence_features,
+                        )
+                    )
+
+            for doc, example in zip(docs, non_empty_examples):
+                self._set_lm_features(doc, example, attribute)
+
+    def _length_bucketed_batches(
+        self, indices: List[int], token_ids: List[List[int]]
+    ) -> Iterator[List[int]]:
+        """Groups examples of similar length into batches.
+
+        Args:
+            indices: Indices of the examples to group.
+            token_ids: Token ids of all examples.
+
+        Yields:
+            Batches of indices of examples. A batch has at most `batch_size`
+            examples and, padded to its longest example, at most
+            `max_tokens_per_batch` token ids.
+        """
+        batch_size = self._config["batch_size"]
+        max_tokens_per_batch = self._config["max_tokens_per_batch"]
+
+        def length(index: int) -> int:
+            if self.max_model_sequence_length == NO_LENGTH_RESTRICTION:
+                return len(token_ids[index])
+            # longer sequences are truncated
+            return min(len(token_ids[index]), self.max_model_sequence_length)
+
+        batch: List[int] = []
+        for index in sorted(indices, key=length):
+            # examples are sorted by length, so the new one is the longest
+            if batch and (
+                len(batch) == batch_size
+                or (
+                    max_tokens_per_batch is not None
+                    and (len(batch) + 1) * length(index) > max_tokens_per_batch
                 )
-        return message
+            ):
+                yield batch
+                batch = []
+            batch.append(index)
+        if batch:
+            yield batch
+
+    def _model_weights_fingerprint(self) -> Text:
+        """Returns a hash of the values of the weights of the language model.
+
+        `model_weights` only names the weights. The files behind the name can
+        change, e.g. if a new revision of the model is published under the same
+        name, and then the cached features must not be used anymore.
+        """
+        if self._weights_fingerprint is None:
+            weights_hash = hashlib.sha256()
+            # one weight at a time, so that the weights aren't copied all at once
+            for weight in self.model.weights:
+                weights_hash.update(np.asarray(weight).tobytes())
+            self._weights_fingerprint = weights_hash.hexdigest()
+
+        return self._weights_fingerprint
+
+    def _cache_key(self, tokens: List[Token], token_ids: List[int]) -> Text:
+        """Identifies the features of an example for the language model."""
+        return rasa.shared.utils.io.get_text_hash(
+            json.dumps(
+                [
+                    self.model_name,
+                    self._model_weights_fingerprint(),
+                    token_ids,
+                    [token.get(NUMBER_OF_SUB_TOKENS) for token in tokens],
+                ]
+            )
+        )
 
     def _set_lm_features(
         self, doc: Dict[Text, Any], message: Message, attribute: Text = TEXT
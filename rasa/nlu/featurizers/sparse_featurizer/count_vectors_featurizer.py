@@ -1,8 +1,9 @@
 from __future__ import annotations
 import logging
 import re
+import numpy as np
 import scipy.sparse
-from typing import Any, Dict, List, Optional, Text, Tuple, Set, Type
+from typing import Any, Dict, List, Optional, Text, Tuple, Set, Type, Union
 from rasa.nlu.tokenizers.tokenizer import Tokenizer
 
 import rasa.shared.utils.io
@@ -14,10 +15,14 @@ from rasa.nlu.featurizers.sparse_featurizer.sparse_featurizer import SparseFeatu
 from rasa.nlu.utils.spacy_utils import SpacyModel
 from rasa.shared.constants import DOCS_URL_COMPONENTS
 import rasa.utils.io as io_utils
-from sklearn.feature_extraction.text import CountVectorizer
+from sklearn.feature_extraction.text import CountVectorizer, HashingVectorizer
 from rasa.shared.nlu.training_data.training_data import TrainingData
 from rasa.shared.nlu.training_data.message import Message
-from rasa.shared.exceptions import RasaException, FileIOException
+from rasa.shared.exceptions import (
+    RasaException,
+    FileIOException,
+    InvalidConfigException,
+)
 from rasa.nlu.constants import (
     TOKENS_NAMES,
     MESSAGE_ATTRIBUTES,
@@ -42,6 +47,10 @@ class CountVectorsFeaturizer(SparseFeaturizer, GraphComponent):
     Set `analyzer` to 'char_wb'
     to use the idea of Subword Semantic Hashing
     from https://arxiv.org/abs/1810.07150.
+
+    Set `use_hashing` to True to hash the tokens of text attributes into a fixed
+    number of features with sklearn's `HashingVectorizer` instead of learning a
+    vocabulary for them.
     """
 
     OOV_words: List[Text]
@@ -90,6 +99,12 @@ class CountVectorsFeaturizer(SparseFeaturizer, GraphComponent):
             # indicates whether the featurizer should use the lemma of a word for
             # counting (if available) or not
             "use_lemma": True,
+            # whether to hash the tokens of text attributes into a fixed number of
+            # features instead of learning a vocabulary for them, labels (e.g.
+            # intents) are always featurized using a vocabulary
+            "use_hashing": False,
+            # number of features the tokens are hashed into if `use_hashing` is True
+            "number_of_hashed_features": 65536,
         }
 
     @staticmethod
@@ -131,6 +146,10 @@ class CountVectorsFeaturizer(SparseFeaturizer, GraphComponent):
         # use the lemma of the words or not
         self.use_lemma = self._config["use_lemma"]
 
+        # hash the tokens of text attributes instead of learning a vocabulary
+        self.use_hashing = self._config["use_hashing"]
+        self.number_of_hashed_features = self._config["number_of_hashed_features"]
+
     def _load_vocabulary_params(self) -> Tuple[Text, List[Text]]:
         OOV_token = self._config["OOV_token"]
 
@@ -178,6 +197,26 @@ class CountVectorsFeaturizer(SparseFeaturizer, GraphComponent):
                     "contain single letters only."
                 )
 
+    def _check_hashing(self) -> None:
+        if not self.use_hashing:
+            return
+
+        ignored_parameters = [
+            parameter
+            for parameter in ["min_df", "max_df", "max_features"]
+            if self._config[parameter] != self.get_default_config()[parameter]
+        ]
+        if ignored_parameters:
+            logger.warning(
+                f"Tokens of text attributes are hashed since `use_hashing` is set, "
+                f"the parameters {ignored_parameters} will only be applied to the "
+                f"vocabularies of labels."
+            )
+
+    def _uses_hashing(self, attribute: Text) -> bool:
+        """Checks whether the tokens of an attribute are hashed."""
+        return self.use_hashing and attribute in DENSE_FEATURIZABLE_ATTRIBUTES
+
     @staticmethod
     def _attributes_for(analyzer: Text) -> List[Text]:
         """Create a list of attributes that should be featurized."""
@@ -193,12 +232,15 @@ class CountVectorsFeaturizer(SparseFeaturizer, GraphComponent):
         model_storage: ModelStorage,
         resource: Resource,
         execution_context: ExecutionContext,
-        vectorizers: Optional[Dict[Text, "CountVectorizer"]] = None,
+        vectorizers: Optional[
+            Dict[Text, Union[CountVectorizer, HashingVectorizer]]
+        ] = None,
         oov_token: Optional[Text] = None,
         oov_words: Optional[List[Text]] = None,
     ) -> None:
         """Constructs a new count vectorizer using the sklearn framework."""
         super().__init__(execution_context.node_name, config)
+        self.validate_config(config)
 
         self._model_storage = model_storage
         self._resource = resource
@@ -215,6 +257,7 @@ class CountVectorsFeaturizer(SparseFeaturizer, GraphComponent):
 
         # warn that some of config parameters might be ignored
         self._check_analyzer()
+        self._check_hashing()
 
         # set which attributes to featurize
         self._attributes = self._attributes_for(self.analyzer)
@@ -271,11 +314,7 @@ class CountVectorsFeaturizer(SparseFeaturizer, GraphComponent):
             attribute_vocab = self._get_attribute_vocabulary(attribute)
             if attribute_vocab is not None and self.OOV_token in attribute_vocab:
                 # CountVectorizer is trained, process for prediction
-                attribute_vocabulary_tokens = set(attribute_vocab.keys())
-                tokens = [
-                    t if t in attribute_vocabulary_tokens else self.OOV_token
-                    for t in tokens
-                ]
+                tokens = [t if t in attribute_vocab else self.OOV_token for t in tokens]
             elif self.OOV_words:
                 # CountVectorizer is not trained, process for train
                 tokens = [self.OOV_token if t in self.OOV_words else t for t in tokens]
@@ -304,6 +343,10 @@ class CountVectorsFeaturizer(SparseFeaturizer, GraphComponent):
         if not self.OOV_token or self.OOV_words or not all_tokens:
             return
 
+        if self._uses_hashing(attribute):
+            # there are no unseen words if the tokens are hashed
+            return
+
         for tokens in all_tokens:
             for text in tokens:
                 if self.OOV_token in text or (
@@ -476,6 +519,8 @@ class CountVectorsFeaturizer(SparseFeaturizer, GraphComponent):
                     "min_df": self.min_df,
                     "max_features": self.max_features,
                     "analyzer": self.analyzer,
+                    "use_hashing": self.use_hashing,
+                    "number_of_hashed_features": self.number_of_hashed_features,
                 }
             )
         for attribute in self._attributes:
@@ -484,6 +529,10 @@ class CountVectorsFeaturizer(SparseFeaturizer, GraphComponent):
                     self._fit_vectorizer_from_scratch(
                         attribute, attribute_texts[attribute]
                     )
+                elif self._uses_hashing(attribute):
+                    # hashed tokens don't need any vocabulary, so new tokens don't
+                    # change the features of the attribute
+                    pass
                 else:
                     self._fit_loaded_vectorizer(attribute, attribute_texts[attribute])
 
@@ -500,7 +549,12 @@ class CountVectorsFeaturizer(SparseFeaturizer, GraphComponent):
         Args:
             attribute: Message attribute for which vocabulary stats are logged.
         """
-        if attribute in DENSE_FEATURIZABLE_ATTRIBUTES:
+        if self._uses_hashing(attribute):
+            logger.info(
+                f"Tokens of {attribute} attribute are hashed into "
+                f"{self.number_of_hashed_features} features."
+            )
+        elif attribute in DENSE_FEATURIZABLE_ATTRIBUTES:
             vocabulary_size = len(self.vectorizers[attribute].vocabulary_)
             logger.info(
                 f"{vocabulary_size} vocabulary items "
@@ -550,44 +604,138 @@ class CountVectorsFeaturizer(SparseFeaturizer, GraphComponent):
     ) -> Tuple[
         List[Optional[scipy.sparse.spmatrix]], List[Optional[scipy.sparse.spmatrix]]
     ]:
-        if not self.vectorizers.get(attribute):
-            return [None], [None]
+        """Creates the features of an attribute for several messages at once.
 
-        sequence_features: List[Optional[scipy.sparse.spmatrix]] = []
-        sentence_features: List[Optional[scipy.sparse.spmatrix]] = []
+        The tokens of all messages are transformed in a single call of the vectorizer.
+        The resulting matrix is then split into the sequence features of the single
+        messages.
 
-        for i, tokens in enumerate(all_tokens):
-            if not tokens:
-                # nothing to featurize
-                sequence_features.append(None)
-                sentence_features.append(None)
-                continue
+        Args:
+            attribute: The attribute to featurize.
+            all_tokens: The processed tokens of the attribute for every message.
 
-            # vectorizer.transform returns a sparse matrix of size
-            # [n_samples, n_features]
-            # set input to list of tokens if sequence should be returned
-            # otherwise join all tokens to a single string and pass that as a list
-            if not tokens:
-                # attribute is not set (e.g. response not present)
-                sequence_features.append(None)
-                sentence_features.append(None)
-                continue
+        Returns:
+            The sequence and the sentence features of every message. Features are
+            `None` if a message has no tokens for the attribute.
+        """
+        sequence_features: List[Optional[scipy.sparse.spmatrix]] = [None] * len(
+            all_tokens
+        )
+        sentence_features: List[Optional[scipy.sparse.spmatrix]] = [None] * len(
+            all_tokens
+        )
+        if not self.vectorizers.get(attribute):
+            return sequence_features, sentence_features
+
+        # messages without tokens (e.g. if the response is not present) have no
+        # features
+        featurized_positions = [i for i, tokens in enumerate(all_tokens) if tokens]
+        if not featurized_positions:
+            return sequence_features, sentence_features
+
+        # the rows of the tokens of the i-th featurized message are
+        # `offsets[i]:offsets[i + 1]`
+        offsets = np.zeros(len(featurized_positions) + 1, dtype=np.int64)
+        offsets[1:] = np.cumsum([len(all_tokens[i]) for i in featurized_positions])
+
+        # tokens repeat a lot, so each distinct token is only transformed once
+        distinct_tokens: Dict[Text, int] = {}
+        token_ids = np.fromiter(
+            (
+                distinct_tokens.setdefault(token, len(distinct_tokens))
+                for i in featurized_positions
+                for token in all_tokens[i]
+            ),
+            dtype=np.int64,
+            count=offsets[-1],
+        )
+        # vectorizer.transform returns a sparse matrix of size
+        # [n_samples, n_features]
+        distinct_token_vectors = self.vectorizers[attribute].transform(
+            list(distinct_tokens)
+        )
+        token_vectors = distinct_token_vectors[token_ids]
+        token_vectors.sort_indices()
 
-            seq_vec = self.vectorizers[attribute].transform(tokens)
-            seq_vec.sort_indices()
+        for position, sequence_vectors in zip(
+            featurized_positions, self._split_rows(token_vectors, offsets)
+        ):
+            sequence_features[position] = sequence_vectors
 
-            sequence_features.append(seq_vec.tocoo())
+        if attribute in DENSE_FEATURIZABLE_ATTRIBUTES:
+            sentence_vectors = self._create_sentence_vectors(
+                attribute,
+                token_vectors,
+                offsets,
+                [all_tokens[i] for i in featurized_positions],
+            )
+            for position, sentence_vector in zip(
+                featurized_positions,
+                self._split_rows(sentence_vectors, np.arange(len(offsets))),
+            ):
+                sentence_features[position] = sentence_vector
 
-            if attribute in DENSE_FEATURIZABLE_ATTRIBUTES:
-                tokens_text = [" ".join(tokens)]
-                sentence_vec = self.vectorizers[attribute].transform(tokens_text)
-                sentence_vec.sort_indices()
+        return sequence_features, sentence_features
 
-                sentence_features.append(sentence_vec.tocoo())
-            else:
-                sentence_features.append(None)
+    def _create_sentence_vectors(
+        self,
+        attribute: Text,
+        token_vectors: scipy.sparse.csr_matrix,
+        offsets: np.ndarray,
+        all_tokens: List[List[Text]],
+    ) -> scipy.sparse.csr_matrix:
+        """Creates one row with the counts of all tokens of a message per message.
+
+        The counts of the joined tokens are the sums of the counts of the single
+        tokens, unless n-grams can span several tokens. Only then the joined tokens
+        are transformed.
+        """
+        if self.analyzer == "char_wb" or (
+            self.analyzer == "word" and self.max_ngram == 1
+        ):
+            # sums the rows of the tokens of each message
+            number_of_tokens = token_vectors.shape[0]
+            message_tokens = scipy.sparse.csr_matrix(
+                (
+                    np.ones(number_of_tokens, dtype=token_vectors.dtype),
+                    np.arange(number_of_tokens),
+                    offsets,
+                ),
+                shape=(len(offsets) - 1, number_of_tokens),
+            )
+            sentence_vectors = message_tokens @ token_vectors
+        else:
+            sentence_vectors = self.vectorizers[attribute].transform(
+                [" ".join(tokens) for tokens in all_tokens]
+            )
 
-        return sequence_features, sentence_features
+        sentence_vectors.sort_indices()
+        return sentence_vectors
+
+    @staticmethod
+    def _split_rows(
+        matrix: scipy.sparse.csr_matrix, offsets: np.ndarray
+    ) -> List[scipy.sparse.coo_matrix]:
+        """Splits a matrix into the matrices of the rows between the offsets."""
+        coo = matrix.tocoo()
+        # the non-zero entries are ordered by row, as the matrix is in CSR format
+        entry_offsets = matrix.indptr[offsets]
+
+        return [
+            scipy.sparse.coo_matrix(
+                (
+                    coo.data[entry_start:entry_end],
+                    (
+                        coo.row[entry_start:entry_end] - row_start,
+                        coo.col[entry_start:entry_end],
+                    ),
+                ),
+                shape=(row_end - row_start, matrix.shape[1]),
+            )
+            for row_start, row_end, entry_start, entry_end in zip(
+                offsets[:-1], offsets[1:], entry_offsets[:-1], entry_offsets[1:]
+            )
+        ]
 
     def _get_featurized_attribute(
         self, attribute: Text, all_tokens: List[List[Text]]
@@ -657,20 +805,19 @@ class CountVectorsFeaturizer(SparseFeaturizer, GraphComponent):
             )
             return messages
 
-        for message in messages:
-            for attribute in self._attributes:
-
-                message_tokens = self._get_processed_message_tokens_by_attribute(
-                    message, attribute
-                )
+        for attribute in self._attributes:
+            all_tokens = [
+                self._get_processed_message_tokens_by_attribute(message, attribute)
+                for message in messages
+            ]
 
-                # features shape (1, seq, dim)
-                sequence_features, sentence_features = self._create_features(
-                    attribute, [message_tokens]
-                )
-                self.add_features_to_message(
-                    sequence_features[0], sentence_features[0], attribute, message
-                )
+            sequence_features, sentence_features = self._create_features(
+                attribute, all_tokens
+            )
+            for message, sequence, sentence in zip(
+                messages, sequence_features, sentence_features
+            ):
+                self.add_features_to_message(sequence, sentence, attribute, message)
 
         return messages
 
@@ -702,7 +849,9 @@ class CountVectorsFeaturizer(SparseFeaturizer, GraphComponent):
         with self._model_storage.write_to(self._resource) as model_dir:
             # vectorizer instance was not None, some models could have been trained
             attribute_vocabularies = self._collect_vectorizer_vocabularies()
-            if self._is_any_model_trained(attribute_vocabularies):
+            # hashed attributes don't have a vocabulary but their vectorizers still
+            # have to be recreated when loading
+            if self._is_any_model_trained(attribute_vocabularies) or self.use_hashing:
                 # Definitely need to persist some vocabularies
                 featurizer_file = model_dir / "vocabularies.pkl"
 
@@ -751,12 +900,19 @@ class CountVectorsFeaturizer(SparseFeaturizer, GraphComponent):
     @classmethod
     def _create_independent_vocab_vectorizers(
         cls, parameters: Dict[Text, Any], vocabulary: Optional[Any] = None
-    ) -> Dict[Text, CountVectorizer]:
+    ) -> Dict[Text, Union[CountVectorizer, HashingVectorizer]]:
         """Create vectorizers for all attributes with independent vocabulary"""
 
-        attribute_vectorizers = {}
+        attribute_vectorizers: Dict[
+            Text, Union[CountVectorizer, HashingVectorizer]
+        ] = {}
 
         for attribute in cls._attributes_for(parameters["analyzer"]):
+            if parameters["use_hashing"] and attribute in DENSE_FEATURIZABLE_ATTRIBUTES:
+                attribute_vectorizers[attribute] = cls._create_hashing_vectorizer(
+                    parameters
+                )
+                continue
 
             attribute_vocabulary = vocabulary[attribute] if vocabulary else None
 
@@ -778,6 +934,26 @@ class CountVectorsFeaturizer(SparseFeaturizer, GraphComponent):
 
         return attribute_vectorizers
 
+    @staticmethod
+    def _create_hashing_vectorizer(parameters: Dict[Text, Any]) -> HashingVectorizer:
+        """Creates a vectorizer which hashes tokens instead of using a vocabulary.
+
+        The signs of the hashes alternate, so that colliding tokens tend to cancel
+        each other out instead of accumulating.
+        """
+        return HashingVectorizer(
+            token_pattern=r"(?u)\b\w+\b" if parameters["analyzer"] == "word" else None,
+            strip_accents=parameters["strip_accents"],
+            lowercase=parameters["lowercase"],
+            stop_words=parameters["stop_words"],
+            ngram_range=(parameters["min_ngram"], parameters["max_ngram"]),
+            analyzer=parameters["analyzer"],
+            n_features=parameters["number_of_hashed_features"],
+            alternate_sign=True,
+            # the features are counts as the ones of the `CountVectorizer`
+            norm=None,
+        )
+
     @classmethod
     def load(
         cls,
@@ -819,8 +995,9 @@ class CountVectorsFeaturizer(SparseFeaturizer, GraphComponent):
                 )
 
                 # make sure the vocabulary has been loaded correctly
-                for attribute in vectorizers:
-                    ftr.vectorizers[attribute]._validate_vocabulary()
+                for attribute, vectorizer in vectorizers.items():
+                    if isinstance(vectorizer, CountVectorizer):
+                        vectorizer._validate_vocabulary()
 
                 return ftr
 
@@ -839,4 +1016,9 @@ class CountVectorsFeaturizer(SparseFeaturizer, GraphComponent):
     @classmethod
     def validate_config(cls, config: Dict[Text, Any]) -> None:
         """Validates that the component is configured properly."""
-        pass
+        if config["use_hashing"] and config["use_shared_vocab"]:
+            raise InvalidConfigException(
+                "`CountVectorsFeaturizer` can't hash tokens when using a shared "
+                "vocabulary, since labels such as intents always need a vocabulary. "
+                "Please set either `use_hashing` or `use_shared_vocab` to False."
+            )
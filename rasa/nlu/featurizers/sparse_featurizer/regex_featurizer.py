@@ -1,7 +1,7 @@
 from __future__ import annotations
+import bisect
 import logging
-import re
-from typing import Any, Dict, List, Optional, Text, Tuple, Type
+from typing import Any, Dict, List, Optional, Set, Text, Tuple, Type
 import numpy as np
 import scipy.sparse
 from rasa.nlu.tokenizers.tokenizer import Tokenizer
@@ -75,6 +75,7 @@ class RegexFeaturizer(SparseFeaturizer, GraphComponent):
         self.known_patterns = known_patterns if known_patterns else []
         self.case_sensitive = config["case_sensitive"]
         self.finetune_mode = execution_context.is_finetuning
+        self._compile_patterns()
 
     @classmethod
     def create(
@@ -87,6 +88,26 @@ class RegexFeaturizer(SparseFeaturizer, GraphComponent):
         """Creates a new untrained component (see parent class for full docstring)."""
         return cls(config, model_storage, resource, execution_context)
 
+    def _compile_patterns(self) -> None:
+        """Compiles the known patterns once instead of for every message.
+
+        `re` only caches a limited number of compiled patterns, so with many
+        patterns they would be compiled again for every message. Lookup tables are
+        matched with a hash table of their elements instead of a regex.
+        """
+        self._pattern_matcher = pattern_utils.PatternMatcher(
+            self.known_patterns, self.case_sensitive
+        )
+        # patterns can share a name, the last of them decides the value of the name
+        # in the patterns of a token
+        last_index_of_name = {
+            pattern["name"]: index for index, pattern in enumerate(self.known_patterns)
+        }
+        self._token_pattern_indices: Set[int] = set(last_index_of_name.values())
+        self._unmatched_token_patterns: Dict[Text, bool] = dict.fromkeys(
+            last_index_of_name, False
+        )
+
     def _merge_new_patterns(self, new_patterns: List[Dict[Text, Text]]) -> None:
         """Updates already known patterns with new patterns extracted from data.
 
@@ -125,6 +146,7 @@ class RegexFeaturizer(SparseFeaturizer, GraphComponent):
             self._merge_new_patterns(patterns_from_data)
         else:
             self.known_patterns = patterns_from_data
+        self._compile_patterns()
 
         self._persist()
         return self._resource
@@ -191,40 +213,56 @@ class RegexFeaturizer(SparseFeaturizer, GraphComponent):
             # nothing to featurize
             return None, None
 
-        flags = 0  # default flag
-        if not self.case_sensitive:
-            flags = re.IGNORECASE
-
-        sequence_length = len(tokens)
+        text = message.get(attribute)
+        # tokens are ordered by their position in the text, so the tokens which
+        # overlap with a match can be found by bisecting their boundaries
+        token_starts = [token.start for token in tokens]
+        token_ends = [token.end for token in tokens]
+
+        matched: Set[Tuple[int, int]] = set()
+        for pattern_index, spans in enumerate(self._pattern_matcher.match_spans(text)):
+            for start, end in spans:
+                first_token = bisect.bisect_right(token_ends, start)
+                end_token = bisect.bisect_left(token_starts, end)
+                for token_index in range(first_token, end_token):
+                    matched.add((token_index, pattern_index))
+
+        token_patterns = []
+        for token in tokens:
+            patterns = token.get("pattern", default={})
+            patterns.update(self._unmatched_token_patterns)
+            token_patterns.append(patterns)
+
+        for token_index, pattern_index in matched:
+            if pattern_index in self._token_pattern_indices:
+                name = self.known_patterns[pattern_index]["name"]
+                token_patterns[token_index][name] = True
+
+        for token, patterns in zip(tokens, token_patterns):
+            token.set("pattern", patterns)
 
         num_patterns = len(self.known_patterns)
+        rows, columns = np.array(sorted(matched), dtype=np.int64).reshape(-1, 2).T
+        sequence_features = scipy.sparse.coo_matrix(
+            (np.ones(len(rows)), (rows, columns)),
+            shape=(len(tokens), num_patterns),
+        )
 
-        sequence_features = np.zeros([sequence_length, num_patterns])
-        sentence_features = np.zeros([1, num_patterns])
-
-        for pattern_index, pattern in enumerate(self.known_patterns):
-            matches = list(
-                re.finditer(pattern["pattern"], message.get(attribute), flags=flags)
-            )
-
-            for token_index, t in enumerate(tokens):
-                patterns = t.get("pattern", default={})
-                patterns[pattern["name"]] = False
-
-                for match in matches:
-                    if t.start < match.end() and t.end > match.start():
-                        patterns[pattern["name"]] = True
-                        sequence_features[token_index][pattern_index] = 1.0
-                        if attribute in [RESPONSE, TEXT, ACTION_TEXT]:
-                            # sentence vector should contain all patterns
-                            sentence_features[0][pattern_index] = 1.0
-
-                t.set("pattern", patterns)
-
-        return (
-            scipy.sparse.coo_matrix(sequence_features),
-            scipy.sparse.coo_matrix(sentence_features),
+        # sentence vector should contain all patterns
+        sentence_columns = (
+            np.unique(columns)
+            if attribute in [RESPONSE, TEXT, ACTION_TEXT]
+            else np.empty(0, dtype=np.int64)
         )
+        sentence_features = scipy.sparse.coo_matrix(
+            (
+                np.ones(len(sentence_columns)),
+                (np.zeros(len(sentence_columns), dtype=np.int64), sentence_columns),
+            ),
+            shape=(1, num_patterns),
+        )
+
+        return sequence_features, sentence_features
 
     @classmethod
     def load(
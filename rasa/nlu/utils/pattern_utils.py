@@ -1,5 +1,17 @@
 import re
-from typing import Dict, List, Text, Union
+import unicodedata
+from collections import defaultdict
+from typing import (
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Pattern,
+    Text,
+    Tuple,
+    Union,
+)
 
 import rasa.shared.utils.io
 from rasa.shared.nlu.training_data.training_data import TrainingData
@@ -34,7 +46,9 @@ def _convert_lookup_tables_to_regex(
 
 
 def _generate_lookup_regex(
-    lookup_table: Dict[Text, Union[Text, List[Text]]], use_word_boundaries: bool = True
+    lookup_table: Dict[Text, Union[Text, List[Text]]],
+    use_word_boundaries: bool = True,
+    escape: bool = True,
 ) -> Text:
     r"""Creates a regex pattern from the given lookup table.
 
@@ -44,6 +58,7 @@ def _generate_lookup_regex(
         lookup_table: The lookup table.
         use_word_boundaries: If True add `\b` around the regex expression
           for each lookup table expressions.
+        escape: If False the elements are already escaped.
 
     Returns:
         The regex pattern.
@@ -58,7 +73,10 @@ def _generate_lookup_regex(
         elements_to_regex = read_lookup_table_file(lookup_elements)
 
     # sanitize the regex, escape special characters
-    elements_sanitized = [re.escape(e) for e in elements_to_regex]
+    if escape:
+        elements_sanitized = [re.escape(e) for e in elements_to_regex]
+    else:
+        elements_sanitized = elements_to_regex
 
     if use_word_boundaries:
         # regex matching elements with word boundaries on either side
@@ -147,14 +165,9 @@ def extract_patterns(
 
     if use_regexes:
         patterns.extend(_collect_regex_features(training_data, use_only_entities))
-    if use_lookup_tables:
-        patterns.extend(
-            _convert_lookup_tables_to_regex(
-                training_data, use_only_entities, use_word_boundaries
-            )
-        )
 
     # validate regexes, raise Error when invalid
+    # (the escaped lookup tables are always valid and can be slow to compile)
     for pattern in patterns:
         try:
             re.compile(pattern["pattern"])
@@ -165,4 +178,248 @@ def extract_patterns(
                 f"training data configuration at {pattern}."
             )
 
+    if use_lookup_tables:
+        patterns.extend(
+            _convert_lookup_tables_to_regex(
+                training_data, use_only_entities, use_word_boundaries
+            )
+        )
+
     return patterns
+
+
+# an element of a lookup table as escaped by `re.escape`, followed by the separator
+# of the alternation of the elements
+_ESCAPED_ELEMENT = r"((?:[^\\.^$*+?{}\[\]|()]|\\[^0-9A-Za-z])+)"
+_LOOKUP_ELEMENT_WITH_WORD_BOUNDARIES = re.compile(
+    rf"\\b{_ESCAPED_ELEMENT}\\b(?:\||\Z)", re.DOTALL
+)
+_LOOKUP_ELEMENT = re.compile(rf"{_ESCAPED_ELEMENT}(?:\||\Z)", re.DOTALL)
+_ESCAPED_CHARACTER = re.compile(r"\\(.)", re.DOTALL)
+_WORD_BOUNDARY = re.compile(r"\b")
+
+
+def _lookup_table_elements(pattern: Text) -> Optional[Tuple[List[Text], bool]]:
+    r"""Gets the elements of a regex which only matches the elements of a lookup table.
+
+    Args:
+        pattern: A regex.
+
+    Returns:
+        The elements and whether they are matched at word boundaries only if the
+        regex has the form of a lookup table, e.g. `(\bMax\b|\bJohn\b)`, and `None`
+        otherwise.
+    """
+    if not pattern.startswith("(") or not pattern.endswith(")"):
+        return None
+
+    alternatives = pattern[1:-1]
+    for use_word_boundaries, element_regex in [
+        (True, _LOOKUP_ELEMENT_WITH_WORD_BOUNDARIES),
+        (False, _LOOKUP_ELEMENT),
+    ]:
+        escaped_elements = element_regex.findall(alternatives)
+        # elements are only skipped if the regex doesn't have the form of a lookup
+        # table
+        if pattern == _generate_lookup_regex(
+            {"elements": escaped_elements}, use_word_boundaries, escape=False
+        ):
+            elements = [
+                _ESCAPED_CHARACTER.sub(r"\1", element) if "\\" in element else element
+                for element in escaped_elements
+            ]
+            return elements, use_word_boundaries
+
+    return None
+
+
+class _CaseFolding(Dict[int, Text]):
+    """Maps characters to a case-insensitive form for `str.translate`.
+
+    Each character is mapped to a single character, so that the positions in the
+    folded text are the same as in the original text. Characters which `re` considers
+    equal when ignoring the case are mapped to the same character (apart from a few
+    ligatures).
+    """
+
+    def __missing__(self, character: int) -> Text:
+        original = chr(character)
+        # the characters which are equal to the original one when ignoring the case
+        # can be reached by mapping the case twice or are canonically equivalent
+        candidates = {original, unicodedata.normalize("NFC", original)}
+        mapped = [original]
+        for _ in range(2):
+            mapped = [
+                mapped_character
+                for character_to_map in mapped
+                for mapping in [
+                    character_to_map.lower(),
+                    character_to_map.upper(),
+                    character_to_map.casefold(),
+                    character_to_map.title(),
+                ]
+                for mapped_character in mapping
+            ]
+            candidates.update(mapped)
+
+        matcher = re.compile(re.escape(original), re.IGNORECASE)
+        equal = [
+            candidate
+            for candidate in candidates
+            if len(candidate) == 1 and matcher.fullmatch(candidate)
+        ]
+        # a lowercase character is reachable from all characters which are equal
+        lowercase = [
+            candidate for candidate in equal if candidate.upper().lower() == candidate
+        ]
+        folded = min(lowercase or equal)
+
+        self[character] = folded
+        return folded
+
+
+_CASE_FOLDING = _CaseFolding()
+
+
+class _LookupTables:
+    """Finds the elements of several lookup tables in texts.
+
+    A regex alternation of all elements of a lookup table is slow to compile, uses a
+    lot of memory, and tries every element at every position of a text. Instead, the
+    substrings of a text are looked up in a hash table of the elements of all lookup
+    tables, so that a text is scanned once for all lookup tables.
+    """
+
+    def __init__(self, use_word_boundaries: bool, case_sensitive: bool) -> None:
+        self._use_word_boundaries = use_word_boundaries
+        self._case_sensitive = case_sensitive
+        # maps an element to the lookup tables which contain it and the position of
+        # its first occurrence in them
+        self._elements: Dict[Text, List[Tuple[int, int]]] = {}
+        self._lengths: List[int] = []
+
+    def add(self, table_index: int, elements: Iterable[Text]) -> None:
+        """Adds the elements of a lookup table."""
+        lengths = set(self._lengths)
+        for element_index, element in enumerate(elements):
+            key = self._fold(element)
+            occurrences = self._elements.setdefault(key, [])
+            if not occurrences or occurrences[-1][0] != table_index:
+                occurrences.append((table_index, element_index))
+                lengths.add(len(key))
+        self._lengths = sorted(lengths)
+
+    def _fold(self, text: Text) -> Text:
+        if self._case_sensitive:
+            return text
+        return text.translate(_CASE_FOLDING)
+
+    def _candidate_spans(self, text: Text) -> Iterator[Tuple[int, int]]:
+        """Yields the spans of a text which have the length of an element."""
+        max_length = self._lengths[-1]
+        if self._use_word_boundaries:
+            # elements have to start and end at word boundaries
+            boundaries = [match.start() for match in _WORD_BOUNDARY.finditer(text)]
+            for index, start in enumerate(boundaries):
+                for end in boundaries[index + 1 :]:
+                    if end - start > max_length:
+                        break
+                    yield start, end
+        else:
+            for start in range(len(text)):
+                for length in self._lengths:
+                    if start + length > len(text):
+                        break
+                    yield start, start + length
+
+    def match_spans(self, text: Text) -> Dict[int, List[Tuple[int, int]]]:
+        """Finds the elements of the lookup tables in a text.
+
+        The matches are the ones of `re.finditer` with the alternation of the
+        elements: the leftmost element which occurs first in the lookup table wins,
+        and matches don't overlap.
+
+        Args:
+            text: The text to search in.
+
+        Returns:
+            The start and end of the matches of every lookup table which matches.
+        """
+        if not self._elements:
+            return {}
+
+        folded = self._fold(text)
+        candidates = defaultdict(list)
+        for start, end in self._candidate_spans(text):
+            occurrences = self._elements.get(folded[start:end])
+            if occurrences:
+                for table_index, element_index in occurrences:
+                    candidates[table_index].append((start, element_index, end))
+
+        spans = {}
+        for table_index, table_candidates in candidates.items():
+            table_spans = []
+            position = 0
+            # at each position, the element which occurs first in the table wins
+            for start, _, end in sorted(table_candidates):
+                if start >= position:
+                    table_spans.append((start, end))
+                    position = end
+            spans[table_index] = table_spans
+
+        return spans
+
+
+class PatternMatcher:
+    """Finds the matches of regexes and lookup tables in texts.
+
+    Lookup tables are matched with hash tables of their elements while all other
+    regexes are matched with `re`.
+    """
+
+    def __init__(
+        self, patterns: List[Dict[Text, Text]], case_sensitive: bool = True
+    ) -> None:
+        """Compiles the patterns.
+
+        Args:
+            patterns: The patterns as returned by `extract_patterns`.
+            case_sensitive: Whether the patterns are matched case sensitive.
+        """
+        self._number_of_patterns = len(patterns)
+        self._regexes: List[Tuple[int, Pattern]] = []
+        self._lookup_tables = {
+            use_word_boundaries: _LookupTables(use_word_boundaries, case_sensitive)
+            for use_word_boundaries in [True, False]
+        }
+
+        flags = 0 if case_sensitive else re.IGNORECASE
+        for index, pattern in enumerate(patterns):
+            lookup_table = _lookup_table_elements(pattern["pattern"])
+            if lookup_table:
+                elements, use_word_boundaries = lookup_table
+                self._lookup_tables[use_word_boundaries].add(index, elements)
+            else:
+                self._regexes.append((index, re.compile(pattern["pattern"], flags)))
+
+    def match_spans(self, text: Text) -> List[List[Tuple[int, int]]]:
+        """Finds the matches of the patterns in a text.
+
+        Args:
+            text: The text to search in.
+
+        Returns:
+            The start and end of the matches of every pattern in the order of the
+            matches, as `re.finditer` would find them.
+        """
+        spans: List[List[Tuple[int, int]]] = [
+            [] for _ in range(self._number_of_patterns)
+        ]
+        for index, regex in self._regexes:
+            spans[index] = [match.span() for match in regex.finditer(text)]
+
+        for lookup_tables in self._lookup_tables.values():
+            for index, table_spans in lookup_tables.match_spans(text).items():
+                spans[index] = table_spans
+
+        return spans
@@ -1,5 +1,6 @@
 import asyncio
 import concurrent.futures
+import json
 import logging
 import multiprocessing
 import os
@@ -739,6 +740,42 @@ def create_app(
                 f"An unexpected error occurred. Error: {e}",
             )
 
+    @app.get("/conversations/trackers")
+    @requires_auth(app, auth_token)
+    @ensure_loaded_agent(app)
+    async def retrieve_trackers(request: Request) -> response.ResponseStream:
+        """Stream the trackers of several conversations as newline-delimited JSON.
+
+        The conversations are selected with the (repeatable) `conversation_ids`
+        parameter which accepts comma-separated IDs. All conversations are returned
+        if it is missing.
+        """
+        verbosity = event_verbosity_parameter(request, EventVerbosity.AFTER_RESTART)
+        all_sessions = rasa.utils.endpoints.bool_arg(
+            request, "all_sessions", default=False
+        )
+        conversation_ids = [
+            conversation_id
+            for ids in request.args.getlist("conversation_ids", [])
+            for conversation_id in ids.split(",")
+            if conversation_id
+        ]
+
+        tracker_store = app.ctx.agent.tracker_store
+        if not conversation_ids:
+            conversation_ids = list(await tracker_store.keys())
+
+        if all_sessions:
+            trackers = tracker_store.retrieve_full_trackers(conversation_ids)
+        else:
+            trackers = tracker_store.retrieve_many(conversation_ids)
+
+        async def stream_trackers(stream: response.ResponseStream) -> None:
+            async for tracker in trackers:
+                await stream.write(json.dumps(tracker.current_state(verbosity)) + "\n")
+
+        return response.stream(stream_trackers, content_type="application/x-ndjson")
+
     @app.post("/conversations/<conversation_id:path>/tracker/events")
     @requires_auth(app, auth_token)
     @ensure_loaded_agent(app)
@@ -1338,44 +1338,96 @@ class Domain:
         last_ml_action_sub_state = None
         turn_was_hidden = False
         for tr, hide_rule_turn in tracker.generate_all_prior_trackers():
-            if ignore_rule_only_turns:
-                # remember previous ml action based on the last non hidden turn
-                # we need this to override previous action in the ml state
-                if not turn_was_hidden:
-                    last_ml_action_sub_state = self._get_prev_action_sub_state(tr)
-
-                # followup action or happy path loop prediction
-                # don't change the fact whether dialogue turn should be hidden
-                if (
-                    not tr.followup_action
-                    and not tr.latest_action_name == tr.active_loop_name
-                ):
-                    turn_was_hidden = hide_rule_turn
-
-                if turn_was_hidden:
-                    continue
+            (
+                state,
+                last_ml_action_sub_state,
+                turn_was_hidden,
+            ) = self.state_for_prior_tracker(
+                tr,
+                hide_rule_turn,
+                previous_state=states[-1] if states else None,
+                last_ml_action_sub_state=last_ml_action_sub_state,
+                turn_was_hidden=turn_was_hidden,
+                omit_unset_slots=omit_unset_slots,
+                ignore_rule_only_turns=ignore_rule_only_turns,
+                rule_only_data=rule_only_data,
+            )
+            if state is not None:
+                states.append(state)
 
-            state = self.get_active_state(tr, omit_unset_slots=omit_unset_slots)
-
-            if ignore_rule_only_turns:
-                # clean state from only rule features
-                self._remove_rule_only_features(state, rule_only_data)
-                # make sure user input is the same as for previous state
-                # for non action_listen turns
-                if states:
-                    self._substitute_rule_only_user_input(state, states[-1])
-                # substitute previous rule action with last_ml_action_sub_state
-                if last_ml_action_sub_state:
-                    # FIXME: better type annotation for `State` would require
-                    # a larger refactoring (e.g. switch to dataclass)
-                    state[rasa.shared.core.constants.PREVIOUS_ACTION] = cast(
-                        SubState,
-                        last_ml_action_sub_state,
-                    )
+        return states
 
-            states.append(self._clean_state(state))
+    def state_for_prior_tracker(
+        self,
+        prior_tracker: "DialogueStateTracker",
+        hide_rule_turn: bool,
+        previous_state: Optional[State] = None,
+        last_ml_action_sub_state: Optional[Dict[Text, Text]] = None,
+        turn_was_hidden: bool = False,
+        omit_unset_slots: bool = False,
+        ignore_rule_only_turns: bool = False,
+        rule_only_data: Optional[Dict[Text, Any]] = None,
+    ) -> Tuple[Optional[State], Optional[Dict[Text, Text]], bool]:
+        """Creates the state for a single step of a tracker's history.
 
-        return states
+        Args:
+            prior_tracker: The tracker before an action was executed (see
+                `DialogueStateTracker.generate_all_prior_trackers`).
+            hide_rule_turn: Whether the action should be hidden in the dialogue
+                history created for ML-based policies.
+            previous_state: The state of the previous step which wasn't hidden.
+            last_ml_action_sub_state: The previous action of the last step which
+                wasn't hidden.
+            turn_was_hidden: Whether the previous step was hidden.
+            omit_unset_slots: If `True` do not include the initial values of slots.
+            ignore_rule_only_turns: If True ignore dialogue turns that are present
+                only in rules.
+            rule_only_data: Slots and loops,
+                which only occur in rules but not in stories.
+
+        Returns:
+            The state (`None` if the step is hidden), the previous action of the last
+            step which wasn't hidden, and whether this step is hidden.
+        """
+        if ignore_rule_only_turns:
+            # remember previous ml action based on the last non hidden turn
+            # we need this to override previous action in the ml state
+            if not turn_was_hidden:
+                last_ml_action_sub_state = self._get_prev_action_sub_state(
+                    prior_tracker
+                )
+
+            # followup action or happy path loop prediction
+            # don't change the fact whether dialogue turn should be hidden
+            if (
+                not prior_tracker.followup_action
+                and not prior_tracker.latest_action_name
+                == prior_tracker.active_loop_name
+            ):
+                turn_was_hidden = hide_rule_turn
+
+            if turn_was_hidden:
+                return None, last_ml_action_sub_state, turn_was_hidden
+
+        state = self.get_active_state(prior_tracker, omit_unset_slots=omit_unset_slots)
+
+        if ignore_rule_only_turns:
+            # clean state from only rule features
+            self._remove_rule_only_features(state, rule_only_data)
+            # make sure user input is the same as for previous state
+            # for non action_listen turns
+            if previous_state is not None:
+                self._substitute_rule_only_user_input(state, previous_state)
+            # substitute previous rule action with last_ml_action_sub_state
+            if last_ml_action_sub_state:
+                # FIXME: better type annotation for `State` would require
+                # a larger refactoring (e.g. switch to dataclass)
+                state[rasa.shared.core.constants.PREVIOUS_ACTION] = cast(
+                    SubState,
+                    last_ml_action_sub_state,
+                )
+
+        return self._clean_state(state), last_ml_action_sub_state, turn_was_hidden
 
     def slots_for_entities(self, entities: List[Dict[Text, Any]]) -> List[SlotSet]:
         """Creates slot events for entities if from_entity mapping matches.
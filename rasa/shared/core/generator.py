@@ -121,7 +121,10 @@ class TrackerWithCachedStates(DialogueStateTracker):
         # from the events
         states_for_hashing = self._states_for_hashing
         if not states_for_hashing:
-            states = super().past_states(domain, omit_unset_slots=omit_unset_slots)
+            # the states are computed directly as they are cached here anyway
+            states = domain.states_for_tracker_history(
+                self, omit_unset_slots=omit_unset_slots
+            )
             states_for_hashing = deque(self.freeze_current_state(s) for s in states)
 
         self._states_for_hashing = states_for_hashing
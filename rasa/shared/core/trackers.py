@@ -1,7 +1,9 @@
 import copy
 import dataclasses
+import itertools
 import logging
 import os
+import threading
 import time
 from collections import deque
 from enum import Enum
@@ -19,6 +21,7 @@ from typing import (
     Iterable,
     Union,
     FrozenSet,
+    Set,
     Tuple,
     TYPE_CHECKING,
     cast,
@@ -59,6 +62,7 @@ from rasa.shared.core.events import (
     SessionStarted,
     ActionExecutionRejected,
     DefinePrevUserUtteredFeaturization,
+    EntitiesAdded,
 )
 from rasa.shared.core.domain import Domain, State
 from rasa.shared.core.slots import AnySlot, Slot
@@ -83,6 +87,13 @@ class TrackerActiveLoop:
 
 logger = logging.getLogger(__name__)
 
+# number of actions after which the past states of a tracker can still be rewound
+# cheaply, e.g. after an `UserUtteranceReverted`, without replaying all events
+MAX_PRIOR_TRACKER_CHECKPOINTS = 20
+
+# tracker attribute holding the lock which guards its incrementally updated caches
+_INCREMENTAL_CACHES_LOCK_ATTRIBUTE = "_incremental_caches_rlock"
+
 # same as State but with Dict[...] substituted with FrozenSet[Tuple[...]]
 FrozenState = FrozenSet[Tuple[Text, FrozenSet[Tuple[Text, Tuple[Union[float, Text]]]]]]
 
@@ -120,6 +131,299 @@ class AnySlotDict(dict):
         return True
 
 
+@dataclasses.dataclass
+class _AppliedEvents:
+    """Applied events of a tracker which are updated as events are added.
+
+    A new instance is created whenever the applied events have to be computed from
+    scratch, e.g. when old tracker events were dropped due to `max_event_history`.
+    """
+
+    # tracker events from which the applied events are computed
+    source: Deque[Event]
+    events: List[Event] = dataclasses.field(default_factory=list)
+    number_of_processed_events: int = 0
+    first_processed_event: Optional[Event] = None
+    last_processed_event: Optional[Event] = None
+    loop_names: Set[Text] = dataclasses.field(default_factory=set)
+    executed_action_names: Set[Text] = dataclasses.field(default_factory=set)
+    # number of unchanged events at the start of `events` after each change which
+    # wasn't an append, e.g. a removal of events or a modified user utterance
+    unchanged_prefix_lengths: List[int] = dataclasses.field(default_factory=list)
+
+    def is_valid_for(self, tracker_events: Deque[Event]) -> bool:
+        """Checks whether events were only appended since the last update."""
+        number_of_events = self.number_of_processed_events
+        if tracker_events is not self.source or len(tracker_events) < number_of_events:
+            return False
+
+        return number_of_events == 0 or (
+            tracker_events[0] is self.first_processed_event
+            and tracker_events[number_of_events - 1] is self.last_processed_event
+        )
+
+
+@dataclasses.dataclass
+class _PriorTrackerCheckpoint:
+    """State of a prior tracker before an action was applied to it."""
+
+    number_of_applied_events: int
+    number_of_states: int
+    number_of_events: int
+    last_ml_action_sub_state: Optional[Dict[Text, Text]]
+    turn_was_hidden: bool
+    slots: Dict[Text, Slot]
+    paused: bool
+    followup_action: Optional[Text]
+    latest_action: Optional[Dict[Text, Text]]
+    latest_message: Optional[UserUttered]
+    # `DefinePrevUserUtteredFeaturization` modifies the latest message in place
+    use_text_for_featurization: Optional[bool]
+    # copy of the prior tracker's initial `latest_message` as it's modified in place
+    initial_latest_message: Optional[UserUttered]
+    latest_bot_utterance: Optional[BotUttered]
+    active_loop: Optional[TrackerActiveLoop]
+
+
+class _PastStates:
+    """Past states of a tracker which are computed incrementally.
+
+    The states are created from a prior tracker to which the applied events are
+    applied one by one (see `DialogueStateTracker.generate_all_prior_trackers`).
+    Hence, new events only require states for their actions. If applied events are
+    changed, e.g. removed by `UserUtteranceReverted`, the prior tracker is restored
+    from the checkpoint before the first changed event.
+    """
+
+    def __init__(
+        self,
+        domain: Domain,
+        omit_unset_slots: bool,
+        ignore_rule_only_turns: bool,
+        rule_only_data: Optional[Dict[Text, Any]],
+    ) -> None:
+        self.domain = domain
+        self.omit_unset_slots = omit_unset_slots
+        self.ignore_rule_only_turns = ignore_rule_only_turns
+        self.rule_only_data = copy.deepcopy(rule_only_data)
+
+        self._applied_events: Optional[_AppliedEvents] = None
+        self._number_of_handled_changes = 0
+        # changes to already consumed events which were caused by the prior tracker
+        self._outdated_changes: List[int] = []
+        self._prior_tracker: Optional["DialogueStateTracker"] = None
+        # initial `latest_message` of the prior tracker which isn't part of the
+        # events but can still be modified by events like `EntitiesAdded`
+        self._initial_latest_message: Optional[UserUttered] = None
+        self._consumed_events: List[Event] = []
+        self._states: List[State] = []
+        self._last_ml_action_sub_state: Optional[Dict[Text, Text]] = None
+        self._turn_was_hidden = False
+        self._checkpoints: Deque[_PriorTrackerCheckpoint] = deque(
+            maxlen=MAX_PRIOR_TRACKER_CHECKPOINTS
+        )
+
+    def matches(
+        self, domain: Domain, rule_only_data: Optional[Dict[Text, Any]]
+    ) -> bool:
+        """Checks whether the cached states were created with the same arguments."""
+        return domain is self.domain and rule_only_data == self.rule_only_data
+
+    def states(
+        self, tracker: "DialogueStateTracker", applied_events: _AppliedEvents
+    ) -> List[State]:
+        """Returns the past states of `tracker`.
+
+        Args:
+            tracker: The tracker whose states are created.
+            applied_events: The up-to-date applied events of `tracker`.
+
+        Returns:
+            The states which are shared with this cache, hence callers must not
+            modify them.
+        """
+        prior_tracker = self._update(tracker, applied_events)
+
+        # the state for the latest event changes with every new event
+        final_state, _, _ = self.domain.state_for_prior_tracker(
+            prior_tracker,
+            False,
+            previous_state=self._states[-1] if self._states else None,
+            last_ml_action_sub_state=self._last_ml_action_sub_state,
+            turn_was_hidden=self._turn_was_hidden,
+            omit_unset_slots=self.omit_unset_slots,
+            ignore_rule_only_turns=self.ignore_rule_only_turns,
+            rule_only_data=self.rule_only_data,
+        )
+
+        if final_state is None:
+            return list(self._states)
+        return self._states + [final_state]
+
+    def _update(
+        self, tracker: "DialogueStateTracker", applied_events: _AppliedEvents
+    ) -> "DialogueStateTracker":
+        if self._prior_tracker is None or applied_events is not self._applied_events:
+            self._reset(tracker)
+            self._applied_events = applied_events
+        else:
+            new_changes = (
+                applied_events.unchanged_prefix_lengths[
+                    self._number_of_handled_changes :
+                ]
+                + self._outdated_changes
+            )
+            if new_changes:
+                self._rewind(tracker, min(new_changes))
+        self._number_of_handled_changes = len(applied_events.unchanged_prefix_lengths)
+        self._outdated_changes = []
+
+        prior_tracker = cast(DialogueStateTracker, self._prior_tracker)
+        while len(self._consumed_events) < len(applied_events.events):
+            event = applied_events.events[len(self._consumed_events)]
+            if isinstance(event, ActionExecuted):
+                self._checkpoints.append(self._create_checkpoint(prior_tracker))
+                (
+                    state,
+                    self._last_ml_action_sub_state,
+                    self._turn_was_hidden,
+                ) = self.domain.state_for_prior_tracker(
+                    prior_tracker,
+                    event.hide_rule_turn,
+                    previous_state=self._states[-1] if self._states else None,
+                    last_ml_action_sub_state=self._last_ml_action_sub_state,
+                    turn_was_hidden=self._turn_was_hidden,
+                    omit_unset_slots=self.omit_unset_slots,
+                    ignore_rule_only_turns=self.ignore_rule_only_turns,
+                    rule_only_data=self.rule_only_data,
+                )
+                if state is not None:
+                    self._states.append(state)
+
+            latest_message = prior_tracker.latest_message
+            featurization = self._featurization_of(latest_message)
+            prior_tracker.update(event)
+            self._consumed_events.append(event)
+
+            if featurization != self._featurization_of(latest_message):
+                # the event modified an earlier user utterance in place, hence
+                # states which were created after this utterance are outdated once
+                # they are requested the next time
+                self._mark_outdated_after(latest_message)
+
+        return prior_tracker
+
+    @staticmethod
+    def _featurization_of(
+        message: Optional[UserUttered],
+    ) -> Optional[Tuple[Optional[bool], int]]:
+        if message is None:
+            return None
+        return message.use_text_for_featurization, len(message.entities)
+
+    def _mark_outdated_after(self, message: Optional[UserUttered]) -> None:
+        for index in range(len(self._consumed_events) - 1, -1, -1):
+            if self._consumed_events[index] is message:
+                if (
+                    self._checkpoints
+                    and self._checkpoints[-1].number_of_applied_events > index
+                ):
+                    self._outdated_changes.append(index)
+                return
+
+    def _reset(self, tracker: "DialogueStateTracker") -> None:
+        self._prior_tracker = tracker.init_copy()
+        self._initial_latest_message = self._prior_tracker.latest_message
+        self._consumed_events = []
+        self._states = []
+        self._last_ml_action_sub_state = None
+        self._turn_was_hidden = False
+        self._checkpoints.clear()
+
+    def _rewind(
+        self, tracker: "DialogueStateTracker", number_of_unchanged_events: int
+    ) -> None:
+        if number_of_unchanged_events >= len(self._consumed_events):
+            return
+
+        if number_of_unchanged_events == 0:
+            self._reset(tracker)
+            return
+
+        while (
+            self._checkpoints
+            and self._checkpoints[-1].number_of_applied_events
+            > number_of_unchanged_events
+        ):
+            self._checkpoints.pop()
+
+        if not self._checkpoints:
+            # the checkpoint was already discarded, hence we have to start over
+            self._reset(tracker)
+            return
+
+        # the checkpoint is created again when its action is applied
+        checkpoint = self._checkpoints.pop()
+        self._restore_checkpoint(checkpoint)
+        del self._consumed_events[checkpoint.number_of_applied_events :]
+        del self._states[checkpoint.number_of_states :]
+
+    def _create_checkpoint(
+        self, prior_tracker: "DialogueStateTracker"
+    ) -> _PriorTrackerCheckpoint:
+        latest_message = prior_tracker.latest_message
+        return _PriorTrackerCheckpoint(
+            number_of_applied_events=len(self._consumed_events),
+            number_of_states=len(self._states),
+            number_of_events=len(prior_tracker.events),
+            last_ml_action_sub_state=self._last_ml_action_sub_state,
+            turn_was_hidden=self._turn_was_hidden,
+            slots={name: copy.copy(slot) for name, slot in prior_tracker.slots.items()},
+            paused=prior_tracker._paused,
+            followup_action=prior_tracker.followup_action,
+            latest_action=prior_tracker.latest_action,
+            latest_message=latest_message,
+            use_text_for_featurization=latest_message.use_text_for_featurization
+            if latest_message
+            else None,
+            initial_latest_message=copy.deepcopy(latest_message)
+            if latest_message is self._initial_latest_message
+            else None,
+            latest_bot_utterance=prior_tracker.latest_bot_utterance,
+            active_loop=copy.copy(prior_tracker.active_loop),
+        )
+
+    def _restore_checkpoint(self, checkpoint: _PriorTrackerCheckpoint) -> None:
+        prior_tracker = cast(DialogueStateTracker, self._prior_tracker)
+
+        # the checkpoint's slots are copied as the prior tracker modifies them
+        prior_tracker.slots.clear()
+        prior_tracker.slots.update(
+            {name: copy.copy(slot) for name, slot in checkpoint.slots.items()}
+        )
+        prior_tracker._paused = checkpoint.paused
+        prior_tracker.followup_action = checkpoint.followup_action
+        prior_tracker.latest_action = checkpoint.latest_action
+        if checkpoint.initial_latest_message is not None:
+            self._initial_latest_message = copy.deepcopy(
+                checkpoint.initial_latest_message
+            )
+            prior_tracker.latest_message = self._initial_latest_message
+        else:
+            prior_tracker.latest_message = checkpoint.latest_message
+            if prior_tracker.latest_message:
+                prior_tracker.latest_message.use_text_for_featurization = (
+                    checkpoint.use_text_for_featurization
+                )
+        prior_tracker.latest_bot_utterance = checkpoint.latest_bot_utterance
+        prior_tracker.active_loop = copy.copy(checkpoint.active_loop)
+        while len(prior_tracker.events) > checkpoint.number_of_events:
+            prior_tracker.events.pop()
+
+        self._last_ml_action_sub_state = checkpoint.last_ml_action_sub_state
+        self._turn_was_hidden = checkpoint.turn_was_hidden
+
+
 class DialogueStateTracker:
     """Maintains the state of a conversation.
 
@@ -133,15 +437,20 @@ class DialogueStateTracker:
         events_as_dict: List[Dict[Text, Any]],
         slots: Optional[Iterable[Slot]] = None,
         max_event_history: Optional[int] = None,
+        snapshot: Optional[Dict[Text, Any]] = None,
     ) -> "DialogueStateTracker":
         """Create a tracker from dump.
 
         The dump should be an array of dumped events. When restoring
         the tracker, these events will be replayed to recreate the state.
+        If a `snapshot` is given, the events are replayed on top of the state
+        of the snapshot.
         """
         evts = events.deserialise_events(events_as_dict)
 
-        return cls.from_events(sender_id, evts, slots, max_event_history)
+        return cls.from_events(
+            sender_id, evts, slots, max_event_history, snapshot=snapshot
+        )
 
     @classmethod
     def from_events(
@@ -152,6 +461,7 @@ class DialogueStateTracker:
         max_event_history: Optional[int] = None,
         sender_source: Optional[Text] = None,
         domain: Optional[Domain] = None,
+        snapshot: Optional[Dict[Text, Any]] = None,
     ) -> "DialogueStateTracker":
         """Creates tracker from existing events.
 
@@ -162,12 +472,16 @@ class DialogueStateTracker:
             max_event_history: Maximum number of events which should be stored.
             sender_source: File source of the messages.
             domain: The current model domain.
+            snapshot: State of the conversation before `evts` which was created
+                with `create_snapshot`.
 
         Returns:
             Instantiated tracker with its state updated according to the given
             events.
         """
         tracker = cls(sender_id, slots, max_event_history, sender_source)
+        if snapshot is not None:
+            tracker.restore_snapshot(snapshot)
 
         for e in evts:
             tracker.update(e, domain)
@@ -223,6 +537,23 @@ class DialogueStateTracker:
         # Optional model_id to add to all events.
         self.model_id: Optional[Text] = None
 
+        # Number of `events` which are already persisted in a `TrackerStore`.
+        # Set by the tracker store when the tracker is loaded or saved so that
+        # subsequent saves only need to write the events added in between.
+        # `None` if unknown, e.g. for trackers which were never persisted.
+        self.persisted_event_count: Optional[int] = None
+
+        # State of the conversation before the first of `events` in case older
+        # events were not loaded, see `restore_snapshot`.
+        self._snapshot: Optional[Dict[Text, Any]] = None
+
+        # applied events and past states are updated incrementally as events are
+        # added instead of being recomputed from all events on every call. They are
+        # guarded by a lock of the tracker which is created on first use, see
+        # `_incremental_caches_lock`.
+        self._applied_events_cache: Optional[_AppliedEvents] = None
+        self._past_states_caches: Dict[Tuple[int, bool, bool], _PastStates] = {}
+
     ###
     # Public tracker interface
     ###
@@ -312,14 +643,19 @@ class DialogueStateTracker:
                 which only occur in rules but not in stories.
 
         Returns:
-            A list of states
+            A list of states. The states of previous turns are cached by the
+            tracker and must not be modified, copy them before changing them.
         """
-        return domain.states_for_tracker_history(
-            self,
-            omit_unset_slots=omit_unset_slots,
-            ignore_rule_only_turns=ignore_rule_only_turns,
-            rule_only_data=rule_only_data,
-        )
+        key = (id(domain), omit_unset_slots, ignore_rule_only_turns)
+        with self._incremental_caches_lock():
+            past_states = self._past_states_caches.get(key)
+            if past_states is None or not past_states.matches(domain, rule_only_data):
+                past_states = _PastStates(
+                    domain, omit_unset_slots, ignore_rule_only_turns, rule_only_data
+                )
+                self._past_states_caches[key] = past_states
+
+            return past_states.states(self, self._updated_applied_events())
 
     def change_loop_to(self, loop_name: Optional[Text]) -> None:
         """Set the currently active loop.
@@ -443,7 +779,18 @@ class DialogueStateTracker:
         return list(self.events)[self.idx_after_latest_restart() :]
 
     def init_copy(self) -> "DialogueStateTracker":
-        """Creates a new state tracker with the same initial values."""
+        """Creates a new state tracker with the same initial values.
+
+        The state of the snapshot is only included if the applied events build on
+        top of it, i.e. if the events don't contain a restart or session start.
+        """
+        tracker = self._copy_without_events()
+        if self._snapshot_applies():
+            tracker.restore_snapshot(cast(Dict[Text, Any], self._snapshot))
+
+        return tracker
+
+    def _copy_without_events(self) -> "DialogueStateTracker":
         return DialogueStateTracker(
             self.sender_id or DEFAULT_SENDER_ID,
             self.slots.values(),
@@ -478,40 +825,109 @@ class DialogueStateTracker:
         Returns:
             The events applied to the tracker.
         """
-        loop_names = [
+        with self._incremental_caches_lock():
+            return list(self._updated_applied_events().events)
+
+    def _incremental_caches_lock(self) -> threading.RLock:
+        """Returns the lock which guards the incrementally updated caches.
+
+        E.g. policies which run concurrently request the past states of the same
+        tracker. The lock is created on first use since trackers are also created
+        without `__init__`, e.g. when they are unpickled.
+        """
+        lock = self.__dict__.get(_INCREMENTAL_CACHES_LOCK_ATTRIBUTE)
+        if lock is None:
+            # `setdefault` is atomic, so concurrent callers get the same lock
+            lock = self.__dict__.setdefault(
+                _INCREMENTAL_CACHES_LOCK_ATTRIBUTE, threading.RLock()
+            )
+        return lock
+
+    def _updated_applied_events(self) -> _AppliedEvents:
+        """Processes the events which were added since the last call.
+
+        Returns:
+            The applied events for all tracker events.
+        """
+        applied_events = self._applied_events_cache
+        if applied_events is None or not applied_events.is_valid_for(self.events):
+            applied_events = self._applied_events_cache = _AppliedEvents(self.events)
+
+        number_of_new_events = (
+            len(self.events) - applied_events.number_of_processed_events
+        )
+        if not number_of_new_events:
+            return applied_events
+
+        new_events = list(itertools.islice(reversed(self.events), number_of_new_events))
+        new_events.reverse()
+
+        new_loop_names = {
             event.name
-            for event in self.events
+            for event in new_events
             if isinstance(event, ActiveLoop) and event.name
-        ]
+        }
+        if new_loop_names & applied_events.executed_action_names:
+            # loop executions before the loop activation have to be reevaluated
+            applied_events = self._applied_events_cache = _AppliedEvents(self.events)
+            new_events = list(self.events)
+            new_loop_names = {
+                event.name
+                for event in new_events
+                if isinstance(event, ActiveLoop) and event.name
+            }
+        applied_events.loop_names.update(new_loop_names)
+
+        for event in new_events:
+            self._apply_to_applied_events(event, applied_events)
+
+        applied_events.number_of_processed_events = len(self.events)
+        applied_events.first_processed_event = self.events[0]
+        applied_events.last_processed_event = self.events[-1]
 
-        applied_events: List[Event] = []
+        return applied_events
 
-        for event in self.events:
-            if isinstance(event, (Restarted, SessionStarted)):
-                applied_events = []
-            elif isinstance(event, ActionReverted):
-                self._undo_till_previous(ActionExecuted, applied_events)
-            elif isinstance(event, UserUtteranceReverted):
-                # Seeing a user uttered event automatically implies there was
-                # a listen event right before it, so we'll first rewind the
-                # user utterance, then get the action right before it (also removes
-                # the `action_listen` action right before it).
-                self._undo_till_previous(UserUttered, applied_events)
-                self._undo_till_previous(ActionExecuted, applied_events)
-            elif (
-                isinstance(event, ActionExecuted)
-                and event.action_name in loop_names
-                and not self._first_loop_execution_or_unhappy_path(
-                    event.action_name, applied_events
-                )
-            ):
-                self._undo_till_previous_loop_execution(
-                    event.action_name, applied_events
-                )
-            else:
-                applied_events.append(event)
+    def _apply_to_applied_events(
+        self, event: Event, applied_events: _AppliedEvents
+    ) -> None:
+        events = applied_events.events
+
+        if isinstance(event, (DefinePrevUserUtteredFeaturization, EntitiesAdded)):
+            # these events modify the latest user utterance in place
+            for index in range(len(events) - 1, -1, -1):
+                if isinstance(events[index], UserUttered):
+                    applied_events.unchanged_prefix_lengths.append(index)
+                    break
+
+        if isinstance(event, (Restarted, SessionStarted)):
+            events.clear()
+            applied_events.unchanged_prefix_lengths.append(0)
+        elif isinstance(event, ActionReverted):
+            self._undo_till_previous(ActionExecuted, events)
+            applied_events.unchanged_prefix_lengths.append(len(events))
+        elif isinstance(event, UserUtteranceReverted):
+            # Seeing a user uttered event automatically implies there was
+            # a listen event right before it, so we'll first rewind the
+            # user utterance, then get the action right before it (also removes
+            # the `action_listen` action right before it).
+            self._undo_till_previous(UserUttered, events)
+            self._undo_till_previous(ActionExecuted, events)
+            applied_events.unchanged_prefix_lengths.append(len(events))
+        elif (
+            isinstance(event, ActionExecuted)
+            and event.action_name in applied_events.loop_names
+            and not self._first_loop_execution_or_unhappy_path(
+                event.action_name, events
+            )
+        ):
+            applied_events.unchanged_prefix_lengths.append(
+                self._undo_till_previous_loop_execution(event.action_name, events)
+            )
+        else:
+            events.append(event)
 
-        return applied_events
+        if isinstance(event, ActionExecuted) and event.action_name:
+            applied_events.executed_action_names.add(event.action_name)
 
     @staticmethod
     def _undo_till_previous(event_type: Type[Event], done_events: List[Event]) -> None:
@@ -520,10 +936,8 @@ class DialogueStateTracker:
         Removes events from `done_events` until the first occurrence `event_type`
         is found which is also removed.
         """
-        # list gets modified - hence we need to copy events!
-        for e in reversed(done_events[:]):
-            del done_events[-1]
-            if isinstance(e, event_type):
+        while done_events:
+            if isinstance(done_events.pop(), event_type):
                 break
 
     def _first_loop_execution_or_unhappy_path(
@@ -577,27 +991,120 @@ class DialogueStateTracker:
     @staticmethod
     def _undo_till_previous_loop_execution(
         loop_action_name: Text, done_events: List[Event]
-    ) -> None:
-        offset = 0
-        for e in reversed(done_events[:]):
+    ) -> int:
+        """Removes the actions and user utterances since the last loop execution.
+
+        Returns:
+            The number of events at the start of `done_events` which are unchanged.
+        """
+        number_of_unchanged_events = len(done_events)
+        for index in range(len(done_events) - 1, -1, -1):
+            e = done_events[index]
             if isinstance(e, ActionExecuted) and e.action_name == loop_action_name:
                 break
 
             if isinstance(
                 e, (ActionExecuted, UserUttered, DefinePrevUserUtteredFeaturization)
             ):
-                del done_events[-1 - offset]
-            else:
-                # Remember events which aren't unfeaturized to get the index right
-                offset += 1
+                del done_events[index]
+                number_of_unchanged_events = index
+
+        return number_of_unchanged_events
 
     def replay_events(self) -> None:
         """Update the tracker based on a list of events."""
 
         applied_events = self.applied_events()
+        if self._snapshot_applies():
+            self._apply_snapshot(cast(Dict[Text, Any], self._snapshot))
         for event in applied_events:
             event.apply_to(self)
 
+    def create_snapshot(
+        self, number_of_events: Optional[int] = None
+    ) -> Dict[Text, Any]:
+        """Returns the state of the conversation which events would recreate.
+
+        Together with the events which follow it, a snapshot allows to restore a
+        tracker without replaying all previous events of the conversation.
+
+        Args:
+            number_of_events: Creates the snapshot for the state after this number
+                of `events`. Defaults to all events.
+
+        Returns:
+            The JSON serialisable state of the conversation.
+        """
+        if number_of_events is not None and number_of_events < len(self.events):
+            tracker = self._copy_without_events()
+            if self._snapshot is not None:
+                tracker.restore_snapshot(self._snapshot)
+            for event in itertools.islice(self.events, number_of_events):
+                tracker.update(event)
+            return tracker.create_snapshot()
+
+        latest_message = self.latest_message
+        return {
+            "slots": self.current_slot_values(),
+            "paused": self._paused,
+            "followup_action": self.followup_action,
+            "latest_action": copy.copy(self.latest_action),
+            "latest_message": latest_message.as_dict() if latest_message else None,
+            "use_text_for_featurization": latest_message.use_text_for_featurization
+            if latest_message
+            else None,
+            "latest_bot_utterance": self.latest_bot_utterance.as_dict()
+            if self.latest_bot_utterance
+            else None,
+            "active_loop": dataclasses.asdict(self.active_loop)
+            if self.active_loop
+            else None,
+        }
+
+    def restore_snapshot(self, snapshot: Dict[Text, Any]) -> None:
+        """Restores the state of a snapshot as the state before the tracker's events.
+
+        Must be called before events are added to the tracker. Events which are
+        added afterwards are applied on top of the restored state unless they
+        reset the conversation (e.g. `Restarted`).
+
+        Args:
+            snapshot: A snapshot created by `create_snapshot`.
+        """
+        self._snapshot = snapshot
+        self._apply_snapshot(snapshot)
+
+    def _apply_snapshot(self, snapshot: Dict[Text, Any]) -> None:
+        for name, value in snapshot.get("slots", {}).items():
+            # slots might have been removed from the domain since
+            if name in self.slots:
+                self.slots[name].value = value
+        self._paused = snapshot.get("paused", False)
+        self.followup_action = snapshot.get("followup_action")
+        self.latest_action = copy.copy(snapshot.get("latest_action"))
+
+        latest_message = snapshot.get("latest_message")
+        if latest_message:
+            self.latest_message = cast(
+                UserUttered, UserUttered.from_parameters(latest_message)
+            )
+            self.latest_message.use_text_for_featurization = snapshot.get(
+                "use_text_for_featurization"
+            )
+        latest_bot_utterance = snapshot.get("latest_bot_utterance")
+        if latest_bot_utterance:
+            self.latest_bot_utterance = cast(
+                BotUttered, BotUttered.from_parameters(latest_bot_utterance)
+            )
+        active_loop = snapshot.get("active_loop")
+        self.active_loop = TrackerActiveLoop(**active_loop) if active_loop else None
+
+    def _snapshot_applies(self) -> bool:
+        """Checks whether the state of the snapshot is the base of the events."""
+        return self._snapshot is not None and not any(
+            isinstance(event, (Restarted, SessionStarted)) for event in self.events
+        )
+
     def recreate_from_dialogue(self, dialogue: Dialogue) -> None:
         """Use a serialised `Dialogue` to update the trackers state.
 
@@ -626,7 +1133,9 @@ class DialogueStateTracker:
         passed time stamp will be replayed. Events that occur exactly
         at the target time will be included."""
 
-        tracker = self.init_copy()
+        tracker = self._copy_without_events()
+        if self._snapshot is not None:
+            tracker.restore_snapshot(self._snapshot)
 
         for event in self.events:
             if event.timestamp <= target_time:
@@ -808,6 +1317,27 @@ class DialogueStateTracker:
             raise ValueError("events, if given, must be a list of events")
         return deque(evts, self._max_event_history)
 
+    def __getstate__(self) -> Dict[Text, Any]:
+        # locks can't be pickled or copied, the copy creates its own lock on first use
+        state = self.__dict__.copy()
+        state.pop(_INCREMENTAL_CACHES_LOCK_ATTRIBUTE, None)
+        # the caches are rebuilt from the events instead of being copied
+        state.pop("_applied_events_cache", None)
+        state.pop("_past_states_caches", None)
+        return state
+
+    def __setstate__(self, state: Dict[Text, Any]) -> None:
+        self.__dict__.update(state)
+        self.__dict__.pop(_INCREMENTAL_CACHES_LOCK_ATTRIBUTE, None)
+        self._applied_events_cache = None
+        self._past_states_caches = {}
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "DialogueStateTracker":
+        copied = self.__class__.__new__(self.__class__)
+        memo[id(self)] = copied
+        copied.__setstate__(copy.deepcopy(self.__getstate__(), memo))
+        return copied
+
     def __eq__(self, other: Any) -> bool:
         if isinstance(self, type(other)):
             return other.events == self.events and self.sender_id == other.sender_id
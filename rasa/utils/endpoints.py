@@ -1,11 +1,14 @@
+import asyncio
+import contextlib
 import ssl
+import weakref
 
 import aiohttp
 import logging
 import os
 from aiohttp.client_exceptions import ContentTypeError
 from sanic.request import Request
-from typing import Any, Optional, Text, Dict
+from typing import Any, AsyncIterator, Optional, Text, Dict, MutableMapping
 
 from rasa.shared.exceptions import FileNotFoundException
 import rasa.shared.utils.io
@@ -15,6 +18,21 @@ from rasa.core.constants import DEFAULT_REQUEST_TIMEOUT
 
 logger = logging.getLogger(__name__)
 
+# default settings of the connection pool which is shared by all requests to an
+# endpoint, see https://docs.aiohttp.org/en/stable/client_reference.html#tcpconnector
+DEFAULT_CONNECTION_POOL_CONFIG: Dict[Text, Any] = {
+    # set to `False` to create a new connection for every request
+    "enabled": True,
+    # maximum number of simultaneous connections, `0` means no limit
+    "limit": 100,
+    # maximum number of simultaneous connections to the same host, `0` means no limit
+    "limit_per_host": 0,
+    # seconds for which resolved DNS entries are cached, `None` caches forever
+    "dns_cache_ttl": 10,
+    # seconds for which idle connections are kept open
+    "keepalive_timeout": 15,
+}
+
 
 def read_endpoint_config(
     filename: Text, endpoint_type: Text
@@ -83,6 +101,7 @@ class EndpointConfig:
         token: Optional[Text] = None,
         token_name: Text = "token",
         cafile: Optional[Text] = None,
+        connection_pool: Optional[Dict[Text, Any]] = None,
         **kwargs: Any,
     ) -> None:
         """Creates an `EndpointConfig` instance."""
@@ -94,10 +113,33 @@ class EndpointConfig:
         self.token_name = token_name
         self.type = kwargs.pop("store_type", kwargs.pop("type", None))
         self.cafile = cafile
+        self.connection_pool = {
+            **DEFAULT_CONNECTION_POOL_CONFIG,
+            **(connection_pool or {}),
+        }
         self.kwargs = kwargs
 
-    def session(self) -> aiohttp.ClientSession:
-        """Creates and returns a configured aiohttp client session."""
+        self._ssl_context: Optional[ssl.SSLContext] = None
+        # sessions can't be shared across event loops, hence we keep one per loop
+        self._pooled_sessions: MutableMapping[
+            asyncio.AbstractEventLoop, aiohttp.ClientSession
+        ] = weakref.WeakKeyDictionary()
+
+    def session(
+        self, connector: Optional[aiohttp.BaseConnector] = None
+    ) -> aiohttp.ClientSession:
+        """Creates and returns a configured aiohttp client session.
+
+        The caller is responsible for closing the session. Use `pooled_session` to
+        reuse connections across requests.
+
+        Args:
+            connector: Connector which the session should use. If `None`, aiohttp
+                creates a new connector for the session.
+
+        Returns:
+            The created session.
+        """
         # create authentication parameters
         if self.basic_auth:
             auth = aiohttp.BasicAuth(
@@ -110,8 +152,73 @@ class EndpointConfig:
             headers=self.headers,
             auth=auth,
             timeout=aiohttp.ClientTimeout(total=DEFAULT_REQUEST_TIMEOUT),
+            connector=connector,
         )
 
+    def pooled_session(self) -> aiohttp.ClientSession:
+        """Returns a long-lived session for the current event loop.
+
+        The session keeps connections to the endpoint alive so that subsequent
+        requests don't pay for the TCP and TLS handshake again. It must not be
+        closed by the caller. Use `close` to release the pooled connections.
+
+        Returns:
+            The session which is shared by all requests to this endpoint which are
+            made from the current event loop.
+        """
+        loop = asyncio.get_event_loop()
+        session = self._pooled_sessions.get(loop)
+
+        if session is None or session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.connection_pool["limit"],
+                limit_per_host=self.connection_pool["limit_per_host"],
+                use_dns_cache=self.connection_pool["dns_cache_ttl"] != 0,
+                ttl_dns_cache=self.connection_pool["dns_cache_ttl"],
+                keepalive_timeout=self.connection_pool["keepalive_timeout"],
+            )
+            session = self.session(connector=connector)
+            self._pooled_sessions[loop] = session
+
+        return session
+
+    @contextlib.asynccontextmanager
+    async def request_session(self) -> AsyncIterator[aiohttp.ClientSession]:
+        """Provides the session for a request to the endpoint.
+
+        This is the pooled session (see `pooled_session`) unless the connection pool
+        is disabled, in which case a new session is created and closed afterwards.
+
+        Yields:
+            The session to make the request with.
+        """
+        if not self.connection_pool["enabled"]:
+            async with self.session() as session:
+                yield session
+        else:
+            yield self.pooled_session()
+
+    async def close(self) -> None:
+        """Closes the pooled session of the current event loop, if there is one."""
+        session = self._pooled_sessions.pop(asyncio.get_event_loop(), None)
+        if session is not None and not session.closed:
+            await session.close()
+
+    def _get_ssl_context(self) -> Optional[ssl.SSLContext]:
+        if not self.cafile:
+            return None
+
+        if self._ssl_context is None:
+            try:
+                self._ssl_context = ssl.create_default_context(cafile=self.cafile)
+            except FileNotFoundError as e:
+                raise FileNotFoundException(
+                    f"Failed to find certificate file, "
+                    f"'{os.path.abspath(self.cafile)}' does not exist."
+                ) from e
+
+        return self._ssl_context
+
     def combine_parameters(
         self, kwargs: Optional[Dict[Text, Any]] = None
     ) -> Dict[Text, Any]:
@@ -150,33 +257,38 @@ class EndpointConfig:
 
         url = concat_url(self.url, subpath)
 
-        sslcontext = None
-        if self.cafile:
-            try:
-                sslcontext = ssl.create_default_context(cafile=self.cafile)
-            except FileNotFoundError as e:
-                raise FileNotFoundException(
-                    f"Failed to find certificate file, "
-                    f"'{os.path.abspath(self.cafile)}' does not exist."
-                ) from e
+        sslcontext = self._get_ssl_context()
+
+        async with self.request_session() as session:
+            return await self._request(
+                session, method, url, headers, sslcontext, **kwargs
+            )
 
-        async with self.session() as session:
-            async with session.request(
-                method,
-                url,
-                headers=headers,
-                params=self.combine_parameters(kwargs),
-                ssl=sslcontext,
-                **kwargs,
-            ) as response:
-                if response.status >= 400:
-                    raise ClientResponseError(
-                        response.status, response.reason, await response.content.read()
-                    )
-                try:
-                    return await response.json()
-                except ContentTypeError:
-                    return None
+    async def _request(
+        self,
+        session: aiohttp.ClientSession,
+        method: Text,
+        url: Text,
+        headers: Dict[Text, Any],
+        sslcontext: Optional[ssl.SSLContext],
+        **kwargs: Any,
+    ) -> Optional[Any]:
+        async with session.request(
+            method,
+            url,
+            headers=headers,
+            params=self.combine_parameters(kwargs),
+            ssl=sslcontext,
+            **kwargs,
+        ) as response:
+            if response.status >= 400:
+                raise ClientResponseError(
+                    response.status, response.reason, await response.content.read()
+                )
+            try:
+                return await response.json()
+            except ContentTypeError:
+                return None
 
     @classmethod
     def from_dict(cls, data: Dict[Text, Any]) -> "EndpointConfig":
@@ -190,6 +302,7 @@ class EndpointConfig:
             self.basic_auth,
             self.token,
             self.token_name,
+            connection_pool=self.connection_pool,
             **self.kwargs,
         )
 
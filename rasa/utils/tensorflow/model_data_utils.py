@@ -317,13 +317,9 @@ def convert_to_data_format(
         attributes = list(fake_features.keys())
 
     # In case an attribute is not present during prediction, replace it with
-    # None values that will then be replaced by fake features
-    dialogue_length = 1
-    num_examples = 1
-    for _features in attribute_to_features.values():
-        num_examples = max(num_examples, len(_features))
-        dialogue_length = max(dialogue_length, len(_features[0]))
-    absent_features = [[None] * dialogue_length] * num_examples
+    # None values that will then be replaced by fake features; the examples can
+    # have dialogues of different lengths
+    absent_features = [[None] * len(example_features) for example_features in features]
 
     for attribute in attributes:
         attribute_data[attribute] = _feature_arrays_for_attribute(
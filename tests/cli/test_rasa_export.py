@@ -1,6 +1,6 @@
 import argparse
 from pathlib import Path
-from typing import Callable, Optional, Text, List, Tuple
+from typing import AsyncIterator, Callable, Iterable, Optional, Text, List, Tuple
 from unittest.mock import Mock
 
 import pytest
@@ -73,10 +73,13 @@ async def test_get_event_broker_and_tracker_store_from_endpoint_config(tmp_path:
         tmp_path,
         {
             "event_broker": {
+                "type": "sql",
+                "db": str(tmp_path / "events.db").replace("\\", "\\\\"),
+            },
+            "tracker_store": {
                 "type": "sql",
                 "db": str(tmp_path / "rasa.db").replace("\\", "\\\\"),
             },
-            "tracker_store": {"type": "sql"},
         },
     )
 
@@ -91,7 +94,13 @@ async def test_get_event_broker_and_tracker_store_from_endpoint_config(tmp_path:
 async def test_get_event_broker_from_endpoint_config_error_exit(tmp_path: Path):
     # write config without event broker to file
     endpoints_path = write_endpoint_config_to_yaml(
-        tmp_path, {"tracker_store": {"type": "sql"}}
+        tmp_path,
+        {
+            "tracker_store": {
+                "type": "sql",
+                "db": str(tmp_path / "rasa.db").replace("\\", "\\\\"),
+            }
+        },
     )
 
     available_endpoints = rasa_core_utils.read_endpoints_from_path(endpoints_path)
@@ -186,7 +195,13 @@ def prepare_namespace_and_mocked_tracker_store_with_events(
 ) -> Tuple[List[UserUttered], argparse.Namespace]:
     endpoints_path = write_endpoint_config_to_yaml(
         temporary_path,
-        {"event_broker": {"type": "pika"}, "tracker_store": {"type": "sql"}},
+        {
+            "event_broker": {"type": "pika"},
+            "tracker_store": {
+                "type": "sql",
+                "db": str(temporary_path / "rasa.db").replace("\\", "\\\\"),
+            },
+        },
     )
 
     # export these conversation IDs
@@ -210,15 +225,18 @@ def prepare_namespace_and_mocked_tracker_store_with_events(
         all_conversation_ids[2]: [events[5]],
     }
 
-    async def _get_tracker(conversation_id: Text) -> DialogueStateTracker:
-        return DialogueStateTracker.from_events(
-            conversation_id, events_for_conversation_id[conversation_id]
-        )
+    async def _get_trackers(
+        conversation_ids: Iterable[Text],
+    ) -> AsyncIterator[DialogueStateTracker]:
+        for conversation_id in conversation_ids:
+            yield DialogueStateTracker.from_events(
+                conversation_id, events_for_conversation_id[conversation_id]
+            )
 
     # mock tracker store
     tracker_store = Mock()
     tracker_store.keys = AsyncMock(return_value=all_conversation_ids)
-    tracker_store.retrieve_full_tracker = _get_tracker
+    tracker_store.retrieve_full_trackers = _get_trackers
 
     monkeypatch.setattr(export, "_get_tracker_store", lambda _: tracker_store)
 
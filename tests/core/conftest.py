@@ -5,7 +5,7 @@ from sanic.request import Request
 import uuid
 from datetime import datetime
 
-from typing import Generator, Callable, Dict, Text
+from typing import Any, AsyncGenerator, Generator, Callable, Dict, Text
 
 from scipy import sparse
 
@@ -19,7 +19,7 @@ from rasa.shared.core.events import ReminderScheduled, UserUttered, ActionExecut
 from rasa.core.nlg import TemplatedNaturalLanguageGenerator, NaturalLanguageGenerator
 from rasa.core.processor import MessageProcessor
 from rasa.shared.core.slots import Slot
-from rasa.core.tracker_store import MongoTrackerStore
+from rasa.core.tracker_store import AsyncMongoTrackerStore, MongoTrackerStore
 from rasa.shared.core.trackers import DialogueStateTracker
 from rasa.shared.nlu.training_data.features import Features
 from rasa.shared.nlu.constants import INTENT, ACTION_NAME, FEATURE_TYPE_SENTENCE
@@ -49,6 +49,46 @@ class MockedMongoTrackerStore(MongoTrackerStore):
         super(MongoTrackerStore, self).__init__(_domain, None)
 
 
+class AsyncMongomockCollection:
+    """Wraps a `mongomock` collection so that it can be used like a `motor` one."""
+
+    def __init__(self, collection: Any) -> None:
+        self._collection = collection
+
+    def __getattr__(self, name: Text) -> Callable:
+        method = getattr(self._collection, name)
+
+        async def call(*args: Any, **kwargs: Any) -> Any:
+            return method(*args, **kwargs)
+
+        return call
+
+    def find(self, *args: Any, **kwargs: Any) -> AsyncGenerator[Dict, None]:
+        async def cursor() -> AsyncGenerator[Dict, None]:
+            for document in self._collection.find(*args, **kwargs):
+                yield document
+
+        return cursor()
+
+
+class MockedAsyncMongoTrackerStore(AsyncMongoTrackerStore):
+    """In-memory mocked version of `AsyncMongoTrackerStore`."""
+
+    def __init__(self, _domain: Domain) -> None:
+        from mongomock import MongoClient
+
+        self.db = {
+            "conversations": AsyncMongomockCollection(MongoClient().rasa.conversations)
+        }
+        self.collection = "conversations"
+        self._indices_created = False
+
+        # skipcq: PYL-E1003
+        # Skip `AsyncMongoTrackerStore` constructor to avoid that an actual Mongo
+        # client is created.
+        super(MongoTrackerStore, self).__init__(_domain, None)
+
+
 # https://github.com/pytest-dev/pytest-asyncio/issues/68
 # this event_loop is used by pytest-asyncio, and redefining it
 # is currently the only way of changing the scope of this fixture
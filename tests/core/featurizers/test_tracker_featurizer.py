@@ -16,14 +16,14 @@ from rasa.core.featurizers.tracker_featurizers import FullDialogueTrackerFeaturi
 from rasa.shared.core.domain import Domain
 from tests.core.utilities import user_uttered
 from rasa.shared.nlu.training_data.features import Features
-from rasa.shared.nlu.constants import INTENT, ACTION_NAME
+from rasa.shared.nlu.constants import INTENT, ACTION_NAME, INTENT_NAME_KEY
 from rasa.shared.core.constants import (
     ACTION_LISTEN_NAME,
     ACTION_UNLIKELY_INTENT_NAME,
     USER,
     PREVIOUS_ACTION,
 )
-from rasa.shared.core.events import ActionExecuted
+from rasa.shared.core.events import ActionExecuted, UserUttered
 from rasa.shared.core.trackers import DialogueStateTracker
 from rasa.utils.tensorflow.constants import LABEL_PAD_ID
 from rasa.core.exceptions import InvalidTrackerFeaturizerUsageError
@@ -2333,3 +2333,38 @@ def test_multilabels_with_intent_max_history_tracker_featurizer(
         actual_labels, expected_labels
     ):
         assert sorted(actual_label_indices) == sorted(expected_label_indices)
+
+
+@pytest.mark.parametrize(
+    "tracker_featurizer",
+    [
+        FullDialogueTrackerFeaturizer(SingleStateFeaturizer()),
+        MaxHistoryTrackerFeaturizer(SingleStateFeaturizer(), max_history=2),
+    ],
+)
+@pytest.mark.parametrize("use_text_for_last_user_input", [True, False])
+def test_prediction_states_do_not_modify_cached_tracker_states(
+    tracker_featurizer: TrackerFeaturizer,
+    use_text_for_last_user_input: bool,
+    moodbot_domain: Domain,
+):
+    tracker = DialogueStateTracker.from_events(
+        "default",
+        [
+            ActionExecuted(ACTION_LISTEN_NAME),
+            UserUttered("hi there", {INTENT_NAME_KEY: "greet"}),
+            ActionExecuted("utter_greet"),
+            ActionExecuted(ACTION_LISTEN_NAME),
+            UserUttered("I am sad", {INTENT_NAME_KEY: "mood_unhappy"}),
+        ],
+        moodbot_domain.slots,
+    )
+    expected_states = moodbot_domain.states_for_tracker_history(tracker)
+
+    tracker_featurizer.prediction_states(
+        [tracker],
+        moodbot_domain,
+        use_text_for_last_user_input=use_text_for_last_user_input,
+    )
+
+    assert tracker.past_states(moodbot_domain) == expected_states
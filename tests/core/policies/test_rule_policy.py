@@ -2,6 +2,7 @@ from pathlib import Path
 from typing import Text, Callable, Dict, Any, Optional, cast
 
 import dataclasses
+import json
 import pytest
 
 from rasa.engine.graph import ExecutionContext
@@ -33,6 +34,8 @@ from rasa.shared.core.constants import (
     RULE_ONLY_SLOTS,
     RULE_ONLY_LOOPS,
     ACTION_UNLIKELY_INTENT_NAME,
+    SHOULD_NOT_BE_SET,
+    SLOTS,
 )
 from rasa.shared.nlu.constants import TEXT, INTENT, ACTION_NAME, ENTITY_ATTRIBUTE_TYPE
 from rasa.shared.core.domain import Domain, InvalidDomain
@@ -46,7 +49,13 @@ from rasa.shared.core.events import (
     FollowupAction,
 )
 from rasa.core.nlg import TemplatedNaturalLanguageGenerator
-from rasa.core.policies.rule_policy import RulePolicy, InvalidRule, RULES
+from rasa.core.policies.rule_policy import (
+    RulePolicy,
+    InvalidRule,
+    RuleIndex,
+    RULES,
+    RULES_FOR_LOOP_UNHAPPY_PATH,
+)
 from rasa.graph_components.providers.rule_only_provider import RuleOnlyDataProvider
 from rasa.shared.core.trackers import DialogueStateTracker
 from rasa.shared.core.generator import TrackerWithCachedStates
@@ -720,6 +729,78 @@ def test_all_policy_attributes_are_persisted(
     assert loaded.lookup == lookup
 
 
+def test_rule_index_is_persisted(
+    trained_rule_policy: RulePolicy,
+    default_model_storage: ModelStorage,
+    default_execution_context: ExecutionContext,
+    resource: Resource,
+):
+    loaded = RulePolicy.load(
+        RulePolicy.get_default_config(),
+        default_model_storage,
+        resource,
+        default_execution_context,
+    )
+
+    for lookup_name in [RULES, RULES_FOR_LOOP_UNHAPPY_PATH]:
+        lookup, rule_index = loaded._rule_indices[lookup_name]
+        assert lookup is loaded.lookup[lookup_name]
+        assert len(rule_index) == len(lookup)
+        assert (
+            rule_index.as_dict()
+            == RuleIndex.create(trained_rule_policy.lookup[lookup_name]).as_dict()
+        )
+
+
+def test_rule_index_candidates():
+    greet_rule = json.dumps(
+        [{PREVIOUS_ACTION: {ACTION_NAME: ACTION_LISTEN_NAME}, USER: {INTENT: "greet"}}]
+    )
+    greet_after_goodbye_rule = json.dumps(
+        [
+            {PREVIOUS_ACTION: {ACTION_NAME: "utter_goodbye"}},
+            {
+                PREVIOUS_ACTION: {ACTION_NAME: ACTION_LISTEN_NAME},
+                USER: {INTENT: "greet"},
+            },
+        ]
+    )
+    loop_rule = json.dumps(
+        [
+            {
+                PREVIOUS_ACTION: {ACTION_NAME: ACTION_LISTEN_NAME},
+                ACTIVE_LOOP: {LOOP_NAME: "loop"},
+                SLOTS: {"name": SHOULD_NOT_BE_SET},
+            }
+        ]
+    )
+    conversation_start_rule = json.dumps([{}])
+    rule_index = RuleIndex.create(
+        [greet_rule, greet_after_goodbye_rule, loop_rule, conversation_start_rule]
+    )
+
+    assert rule_index.candidates({}) == {conversation_start_rule}
+    assert rule_index.candidates(
+        {
+            PREVIOUS_ACTION: {ACTION_NAME: ACTION_LISTEN_NAME},
+            USER: {INTENT: "greet"},
+            SLOTS: {"name": (1.0,)},
+        }
+    ) == {greet_rule, greet_after_goodbye_rule}
+    assert rule_index.candidates(
+        {
+            PREVIOUS_ACTION: {ACTION_NAME: ACTION_LISTEN_NAME},
+            USER: {INTENT: "goodbye"},
+            ACTIVE_LOOP: {LOOP_NAME: "loop"},
+        }
+    ) == {loop_rule}
+
+    assert (
+        RuleIndex.from_dict(json.loads(json.dumps(rule_index.as_dict()))).as_dict()
+        == rule_index.as_dict()
+    )
+
+
 def test_rule_policy_finetune(
     trained_rule_policy: RulePolicy,
     trained_rule_policy_domain: Domain,
@@ -537,6 +537,51 @@ class TestTEDPolicy(PolicyTestCollection):
             == prediction_without_action.probabilities
         )
 
+    def test_predict_action_probabilities_for_batch(
+        self, trained_policy: TEDPolicy, default_domain: Domain
+    ):
+        trackers = [
+            DialogueStateTracker.from_events(
+                "short",
+                evts=[
+                    ActionExecuted(ACTION_LISTEN_NAME),
+                    UserUttered(text="hello", intent={"name": "greet"}),
+                ],
+            ),
+            DialogueStateTracker(DEFAULT_SENDER_ID, default_domain.slots),
+            DialogueStateTracker.from_events(
+                "long",
+                evts=[
+                    ActionExecuted(ACTION_LISTEN_NAME),
+                    UserUttered(text="hello", intent={"name": "greet"}),
+                    ActionExecuted("utter_greet"),
+                    ActionExecuted(ACTION_LISTEN_NAME),
+                    UserUttered(text="default", intent={"name": "default"}),
+                ],
+            ),
+        ]
+
+        predictions = trained_policy.predict_action_probabilities_for_batch(
+            [{"tracker": tracker, "domain": default_domain} for tracker in trackers]
+        )
+
+        assert len(predictions) == len(trackers)
+        for tracker, prediction in zip(trackers, predictions):
+            expected = trained_policy.predict_action_probabilities(
+                tracker, default_domain
+            )
+            assert prediction.probabilities == pytest.approx(
+                expected.probabilities, abs=1e-5
+            )
+            assert (
+                prediction.is_end_to_end_prediction == expected.is_end_to_end_prediction
+            )
+            if expected.diagnostic_data:
+                assert (
+                    prediction.diagnostic_data["attention_weights"].shape
+                    == expected.diagnostic_data["attention_weights"].shape
+                )
+
     @pytest.mark.parametrize(
         "featurizer_config, tracker_featurizer, state_featurizer",
         [
@@ -176,6 +176,29 @@ async def test_wait_time_between_pulls_without_interval(
     await rasa.core.agent.load_from_server(agent, model_server=model_endpoint_config)
 
 
+@pytest.mark.parametrize("enabled", [True, False])
+async def test_pull_model_with_connection_pool(tmp_path: Path, enabled: bool):
+    model_server = EndpointConfig(
+        "https://example.com/model", connection_pool={"enabled": enabled}
+    )
+    with aioresponses() as mocked:
+        mocked.get(
+            "https://example.com/model",
+            body=b"model",
+            headers={"ETag": "new-hash", "filename": "model.tar.gz"},
+        )
+
+        fingerprint = await rasa.core.agent._pull_model_and_fingerprint(
+            model_server, "old-hash", str(tmp_path)
+        )
+
+    assert fingerprint == "new-hash"
+    assert (tmp_path / "model.tar.gz").read_bytes() == b"model"
+    assert bool(model_server._pooled_sessions) == enabled
+
+    await model_server.close()
+
+
 async def test_load_agent(trained_rasa_model: Text):
     agent = await load_agent(model_path=trained_rasa_model)
 
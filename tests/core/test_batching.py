@@ -0,0 +1,101 @@
+import asyncio
+import threading
+import time
+from typing import List
+
+import pytest
+
+from rasa.core.batching import MicroBatcher
+
+
+class RecordingBatchProcessor:
+    def __init__(self, latency: float = 0) -> None:
+        self.batches: List[List[int]] = []
+        self.latency = latency
+
+    def __call__(self, items: List[int]) -> List[int]:
+        time.sleep(self.latency)
+        self.batches.append(items)
+        return [item * 2 for item in items]
+
+
+async def test_micro_batcher_processes_concurrent_items_together():
+    processor = RecordingBatchProcessor()
+    batcher = MicroBatcher(processor, max_batch_size=10, max_wait_in_seconds=0.05)
+
+    results = await asyncio.gather(*[batcher.submit(item) for item in range(5)])
+
+    assert results == [0, 2, 4, 6, 8]
+    assert processor.batches == [[0, 1, 2, 3, 4]]
+
+
+async def test_micro_batcher_does_not_wait_for_full_batches():
+    processor = RecordingBatchProcessor()
+    # items would wait for a minute if full batches were waiting as well
+    batcher = MicroBatcher(processor, max_batch_size=2, max_wait_in_seconds=60)
+
+    results = await asyncio.wait_for(
+        asyncio.gather(*[batcher.submit(item) for item in range(4)]), timeout=5
+    )
+
+    assert results == [0, 2, 4, 6]
+    assert processor.batches == [[0, 1], [2, 3]]
+
+
+async def test_micro_batcher_collects_items_while_processing_a_batch():
+    processor = RecordingBatchProcessor(latency=0.1)
+    batcher = MicroBatcher(processor, max_batch_size=10, max_wait_in_seconds=0.01)
+
+    first = asyncio.ensure_future(batcher.submit(0))
+    await asyncio.sleep(0.05)
+    # the first batch is being processed in a thread meanwhile
+    rest = await asyncio.gather(*[batcher.submit(item) for item in range(1, 4)])
+
+    assert await first == 0
+    assert rest == [2, 4, 6]
+    assert processor.batches == [[0], [1, 2, 3]]
+
+
+async def test_micro_batcher_processes_batches_in_a_worker_thread():
+    threads = []
+
+    def process(items: List[int]) -> List[int]:
+        threads.append(threading.current_thread())
+        return items
+
+    batcher = MicroBatcher(process, max_batch_size=2, max_wait_in_seconds=0)
+
+    assert await batcher.submit(1) == 1
+    assert threads[0] is not threading.current_thread()
+
+
+async def test_micro_batcher_passes_errors_to_all_callers():
+    def fail(items: List[int]) -> List[int]:
+        raise ValueError("invalid items")
+
+    batcher = MicroBatcher(fail, max_batch_size=10, max_wait_in_seconds=0.01)
+
+    results = await asyncio.gather(
+        *[batcher.submit(item) for item in range(3)], return_exceptions=True
+    )
+
+    assert all(isinstance(result, ValueError) for result in results)
+
+    # the batcher keeps working after a failed batch
+    batcher.process_batch = RecordingBatchProcessor()
+    assert await batcher.submit(1) == 2
+
+
+async def test_micro_batcher_skips_cancelled_items():
+    processor = RecordingBatchProcessor()
+    batcher = MicroBatcher(processor, max_batch_size=10, max_wait_in_seconds=0.05)
+
+    cancelled = asyncio.ensure_future(batcher.submit(0))
+    other = asyncio.ensure_future(batcher.submit(1))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+
+    assert await other == 2
+    with pytest.raises(asyncio.CancelledError):
+        await cancelled
+    assert processor.batches == [[1]]
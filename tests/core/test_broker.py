@@ -1,8 +1,10 @@
+import asyncio
 import json
 import logging
 import textwrap
+import time
 from pathlib import Path
-from typing import Union, Text, List, Optional, Type
+from typing import Any, Dict, Union, Text, List, Optional, Type
 
 import aio_pika.exceptions
 import aiormq.exceptions
@@ -11,6 +13,7 @@ import kafka
 import pytest
 from _pytest.logging import LogCaptureFixture
 from _pytest.monkeypatch import MonkeyPatch
+from unittest.mock import Mock
 from aiormq import ChannelNotFoundEntity
 
 from rasa.core.brokers import pika
@@ -18,9 +21,14 @@ from tests.conftest import AsyncMock
 
 import rasa.shared.utils.io
 import rasa.utils.io
+from rasa.core.brokers.batching import BatchingEventBroker
 from rasa.core.brokers.broker import EventBroker
 from rasa.core.brokers.file import FileEventBroker
-from rasa.core.brokers.kafka import KafkaEventBroker, KafkaProducerInitializationError
+from rasa.core.brokers.kafka import (
+    AsyncKafkaEventBroker,
+    KafkaEventBroker,
+    KafkaProducerInitializationError,
+)
 from rasa.core.brokers.pika import PikaEventBroker, DEFAULT_QUEUE_NAME
 from rasa.core.brokers.sql import SQLEventBroker
 from rasa.shared.core.events import Event, Restarted, SlotSet, UserUttered
@@ -374,3 +382,415 @@ async def test_sql_connection_error(monkeypatch: MonkeyPatch):
     )
     with pytest.raises(ConnectionException):
         await EventBroker.create(cfg)
+
+
+async def test_sql_broker_publish_batch(tmp_path: Path):
+    # the events are inserted in another thread which doesn't share the connection
+    # to an in-memory database
+    broker = SQLEventBroker(db=str(tmp_path / "events.db"))
+
+    await broker.publish_batch([event.as_dict() for event in TEST_EVENTS])
+
+    with broker.session_scope() as session:
+        events = [
+            Event.from_parameters(json.loads(event.data))
+            for event in session.query(broker.SQLBrokerEvent).all()
+        ]
+
+    assert events == TEST_EVENTS
+
+
+async def test_file_broker_publish_batch(tmp_path: Path):
+    log_file_path = tmp_path / "events.log"
+    broker = FileEventBroker(str(log_file_path))
+
+    await broker.publish_batch([event.as_dict() for event in TEST_EVENTS])
+
+    lines = log_file_path.read_text().splitlines()
+    assert [Event.from_parameters(json.loads(line)) for line in lines] == TEST_EVENTS
+
+
+async def test_pika_publish_batch_waits_for_all_events():
+    broker = PikaEventBroker("host", "username", "password", queues=["queue"])
+    broker._exchange = AsyncMock()
+
+    await broker.publish_batch([event.as_dict() for event in TEST_EVENTS])
+
+    assert broker._exchange.publish.call_count == len(TEST_EVENTS)
+
+
+async def test_kafka_publish_batch_waits_for_delivery():
+    broker = KafkaEventBroker("localhost")
+    broker.producer = Mock()
+
+    await broker.publish_batch([event.as_dict() for event in TEST_EVENTS])
+
+    assert broker.producer.send.call_count == len(TEST_EVENTS)
+    broker.producer.flush.assert_called_once()
+
+
+class FakeAIOKafkaProducer:
+    def __init__(self) -> None:
+        self.sent: List[Dict[Text, Any]] = []
+        self.deliveries: List[asyncio.Future] = []
+        self.stopped = False
+
+    async def send(self, topic: Text, **kwargs: Any) -> asyncio.Future:
+        # yield to the event loop so that concurrent sends could overtake each other
+        await asyncio.sleep(0)
+        self.sent.append({"topic": topic, **kwargs})
+        delivery = asyncio.get_running_loop().create_future()
+        self.deliveries.append(delivery)
+        return delivery
+
+    def acknowledge(self) -> None:
+        for delivery in self.deliveries:
+            if not delivery.done():
+                delivery.set_result(None)
+
+    async def stop(self) -> None:
+        self.stopped = True
+
+
+async def test_async_kafka_broker_keeps_order_of_conversations():
+    broker = AsyncKafkaEventBroker("localhost", topic="topic")
+    broker.producer = FakeAIOKafkaProducer()
+    events = [UserUttered(f"message {i}", timestamp=i).as_dict() for i in range(10)]
+    for i, event in enumerate(events):
+        event["sender_id"] = f"sender {i % 2}"
+
+    for event in events:
+        broker.publish(event)
+    await asyncio.sleep(0.01)
+
+    sent = broker.producer.sent
+    assert [message["value"] for message in sent] == events
+    assert [message["key"] for message in sent] == [
+        event["sender_id"].encode() for event in events
+    ]
+    assert all(message["topic"] == "topic" for message in sent)
+
+    # `close` waits for the delivery of the published events
+    close = asyncio.ensure_future(broker.close())
+    await asyncio.sleep(0.01)
+    assert not close.done()
+
+    producer = broker.producer
+    producer.acknowledge()
+    await close
+    assert producer.stopped
+    assert not broker.is_ready()
+
+
+async def test_async_kafka_publish_batch_waits_for_delivery():
+    broker = AsyncKafkaEventBroker("localhost", partition_by_sender=False)
+    broker.producer = FakeAIOKafkaProducer()
+
+    publish = asyncio.ensure_future(
+        broker.publish_batch([event.as_dict() for event in TEST_EVENTS])
+    )
+    await asyncio.sleep(0.01)
+    assert not publish.done()
+
+    broker.producer.acknowledge()
+    await publish
+    assert len(broker.producer.sent) == len(TEST_EVENTS)
+    assert all(message["key"] is None for message in broker.producer.sent)
+
+
+def test_async_kafka_broker_with_invalid_compression_type():
+    with pytest.raises(KafkaProducerInitializationError):
+        AsyncKafkaEventBroker("localhost", compression_type="brotli")
+
+
+async def test_create_async_kafka_broker_from_endpoint_config(
+    monkeypatch: MonkeyPatch,
+):
+    pytest.importorskip("aiokafka")
+    monkeypatch.setattr(AsyncKafkaEventBroker, "connect", AsyncMock())
+    config = EndpointConfig(
+        "localhost",
+        type="kafka",
+        use_async_producer=True,
+        security_protocol="PLAINTEXT",
+        linger_ms=20,
+        compression_type="gzip",
+        enable_idempotence=True,
+    )
+
+    broker = await EventBroker.create(config)
+
+    assert isinstance(broker, AsyncKafkaEventBroker)
+    assert broker.partition_by_sender
+
+    assert broker.linger_ms == 20
+    assert broker.compression_type == "gzip"
+    assert broker.enable_idempotence
+
+    # noinspection PyProtectedMember
+    producer = broker._create_async_producer()
+    assert producer._compression_type == "gzip"
+    await producer.stop()
+
+
+class RecordingEventBroker(EventBroker):
+    def __init__(self, latency: float = 0, fail: bool = False) -> None:
+        self.batches: List[List[Dict[Text, Any]]] = []
+        self.latency = latency
+        self.fail = fail
+        self.closed = False
+
+    def publish(self, event: Dict[Text, Any]) -> None:
+        self.batches.append([event])
+
+    async def publish_batch(self, events: List[Dict[Text, Any]]) -> None:
+        await asyncio.sleep(self.latency)
+        if self.fail:
+            raise ConnectionError()
+        self.batches.append(events)
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+def _events(number_of_events: int) -> List[Dict[Text, Any]]:
+    return [
+        UserUttered(f"message {i}", timestamp=i).as_dict()
+        for i in range(number_of_events)
+    ]
+
+
+async def test_batching_event_broker_publishes_batches():
+    recording_broker = RecordingEventBroker()
+    broker = BatchingEventBroker(recording_broker, batch_size=2, flush_interval=0.05)
+    events = _events(5)
+
+    for event in events:
+        broker.publish(event)
+
+    assert recording_broker.batches == []
+    await asyncio.sleep(0.01)
+    # full batches are published right away
+    assert recording_broker.batches == [events[:2], events[2:4]]
+    await asyncio.sleep(0.1)
+    assert recording_broker.batches == [events[:2], events[2:4], events[4:]]
+
+    metrics = broker.metrics
+    assert metrics.queue_depth == 0
+    assert metrics.published_events == 5
+    assert metrics.flushes == 3
+    assert metrics.max_flush_latency >= metrics.mean_flush_latency > 0
+
+    await broker.close()
+
+
+async def test_batching_event_broker_does_not_wait_for_broker():
+    recording_broker = RecordingEventBroker(latency=0.5)
+    broker = BatchingEventBroker(recording_broker, flush_interval=0)
+
+    start = time.perf_counter()
+    for event in _events(10):
+        broker.publish(event)
+        await asyncio.sleep(0)
+
+    assert time.perf_counter() - start < 0.1
+    assert broker.metrics.queue_depth > 0
+
+    await broker.close()
+
+    assert broker.metrics.queue_depth == 0
+    assert sum(len(batch) for batch in recording_broker.batches) == 10
+    assert recording_broker.closed
+
+
+@pytest.mark.parametrize(
+    "overflow, expected_indices",
+    [("drop_newest", [0, 1, 2]), ("drop_oldest", [2, 3, 4])],
+)
+async def test_batching_event_broker_drops_events_if_queue_is_full(
+    overflow: Text, expected_indices: List[int]
+):
+    recording_broker = RecordingEventBroker()
+    broker = BatchingEventBroker(recording_broker, max_queue_size=3, overflow=overflow)
+    events = _events(5)
+
+    for event in events:
+        broker.publish(event)
+    await broker.close()
+
+    assert recording_broker.batches == [[events[i] for i in expected_indices]]
+    assert broker.metrics.dropped_events == 2
+
+
+async def test_batching_event_broker_spills_events(tmp_path: Path):
+    spill_path = tmp_path / "spilled.jsonl"
+    recording_broker = RecordingEventBroker()
+    broker = BatchingEventBroker(
+        recording_broker,
+        max_queue_size=3,
+        batch_size=3,
+        overflow="spill",
+        spill_path=str(spill_path),
+    )
+    events = _events(5)
+
+    for event in events:
+        broker.publish(event)
+
+    assert broker.metrics.spilled_events == 2
+    # spilled events are written to the file by the worker
+    assert not spill_path.exists()
+
+    await broker.close()
+
+    assert recording_broker.batches == [events[:3], events[3:]]
+    assert not spill_path.exists()
+
+
+async def test_batching_event_broker_resumes_spilled_events(tmp_path: Path):
+    spill_path = tmp_path / "spilled.jsonl"
+    events = _events(5)
+    spilled_lines = "".join(json.dumps(event) + "\n" for event in events)
+    spill_path.write_text(spilled_lines)
+
+    recording_broker = RecordingEventBroker()
+    broker = BatchingEventBroker(
+        recording_broker,
+        max_queue_size=2,
+        batch_size=2,
+        overflow="spill",
+        spill_path=str(spill_path),
+    )
+    await broker._publish_next_batch()
+
+    assert recording_broker.batches == [events[:2]]
+    # the spill file isn't rewritten when events are restored from it
+    assert spill_path.read_text() == spilled_lines
+
+    # a new run continues where the previous one stopped
+    recording_broker = RecordingEventBroker()
+    broker = BatchingEventBroker(
+        recording_broker, overflow="spill", spill_path=str(spill_path)
+    )
+    await broker.close()
+
+    assert recording_broker.batches == [events[2:]]
+    assert not spill_path.exists()
+    assert not Path(str(spill_path) + ".offset").exists()
+
+
+async def test_batching_event_broker_spills_failed_batches(tmp_path: Path):
+    spill_path = tmp_path / "spilled.jsonl"
+    failing_broker = RecordingEventBroker(fail=True)
+    broker = BatchingEventBroker(
+        failing_broker, overflow="spill", spill_path=str(spill_path)
+    )
+    events = _events(2)
+
+    for event in events:
+        broker.publish(event)
+    await broker.close()
+
+    assert broker.metrics.spilled_events == 2
+    assert [json.loads(line) for line in spill_path.read_text().splitlines()] == events
+
+    # the spilled events are published once the broker works again
+    recording_broker = RecordingEventBroker()
+    broker = BatchingEventBroker(
+        recording_broker, overflow="spill", spill_path=str(spill_path)
+    )
+    await broker.close()
+
+    assert recording_broker.batches == [events]
+
+
+async def test_batching_event_broker_keeps_order_of_spilled_events(tmp_path: Path):
+    recording_broker = RecordingEventBroker(latency=0.05)
+    broker = BatchingEventBroker(
+        recording_broker,
+        max_queue_size=3,
+        batch_size=2,
+        flush_interval=0,
+        overflow="spill",
+        spill_path=str(tmp_path / "spilled.jsonl"),
+    )
+    events = _events(6)
+
+    for event in events[:5]:
+        broker.publish(event)
+    # the first batch is being published
+    await asyncio.sleep(0.01)
+    # the queue has space again, but the event has to wait for the spilled events
+    broker.publish(events[5])
+    await broker.close()
+
+    published = [event for batch in recording_broker.batches for event in batch]
+    assert published == events
+
+
+async def test_batching_event_broker_keeps_order_of_failed_batches(tmp_path: Path):
+    recording_broker = RecordingEventBroker(fail=True)
+    broker = BatchingEventBroker(
+        recording_broker,
+        batch_size=2,
+        flush_interval=0,
+        overflow="spill",
+        spill_path=str(tmp_path / "spilled.jsonl"),
+    )
+    events = _events(5)
+
+    for event in events[:4]:
+        broker.publish(event)
+    await asyncio.sleep(0.01)
+    # the failed batch is retried before any newer event is published
+    assert broker.metrics.queue_depth == 4
+    assert broker.metrics.spilled_events == 0
+
+    recording_broker.fail = False
+    broker.publish(events[4])
+    await broker.close()
+
+    published = [event for batch in recording_broker.batches for event in batch]
+    assert published == events
+
+
+async def test_batching_event_broker_counts_failed_events():
+    broker = BatchingEventBroker(RecordingEventBroker(fail=True))
+
+    for event in _events(3):
+        broker.publish(event)
+    await broker.close()
+
+    assert broker.metrics.failed_events == 3
+    assert broker.metrics.published_events == 0
+
+
+def test_batching_event_broker_with_invalid_overflow_policy():
+    with pytest.raises(RasaException):
+        BatchingEventBroker(RecordingEventBroker(), overflow="block")
+
+    with pytest.raises(RasaException):
+        BatchingEventBroker(RecordingEventBroker(), overflow="spill")
+
+
+async def test_create_batching_event_broker_from_endpoint_config(tmp_path: Path):
+    log_file_path = tmp_path / "events.log"
+    config = EndpointConfig(
+        type="file",
+        path=str(log_file_path),
+        use_publish_queue=True,
+        publish_batch_size=10,
+    )
+
+    broker = await EventBroker.create(config)
+
+    assert isinstance(broker, BatchingEventBroker)
+    assert isinstance(broker.event_broker, FileEventBroker)
+    assert broker.batch_size == 10
+
+    for event in TEST_EVENTS:
+        broker.publish(event.as_dict())
+    await broker.close()
+
+    lines = log_file_path.read_text().splitlines()
+    assert [Event.from_parameters(json.loads(line)) for line in lines] == TEST_EVENTS
@@ -1,6 +1,6 @@
 import uuid
 from pathlib import Path
-from typing import Optional, Text, List
+from typing import AsyncIterator, Iterable, Optional, Text, List
 from unittest.mock import Mock
 
 import pytest
@@ -12,7 +12,7 @@ from rasa.core.brokers.pika import PikaEventBroker
 from rasa.core.brokers.sql import SQLEventBroker
 from rasa.core.constants import RASA_EXPORT_PROCESS_ID_HEADER_NAME
 from rasa.shared.core.events import SessionStarted, ActionExecuted
-from rasa.core.tracker_store import SQLTrackerStore
+from rasa.core.tracker_store import InMemoryTrackerStore, SQLTrackerStore
 from rasa.shared.core.trackers import DialogueStateTracker
 from rasa.exceptions import (
     NoConversationsInTrackerStoreError,
@@ -79,14 +79,17 @@ async def test_fetch_events_within_time_range():
     event_3 = random_user_uttered_event(1)
     events = {conversation_ids[0]: [event_1, event_2], conversation_ids[1]: [event_3]}
 
-    def _get_tracker(conversation_id: Text) -> DialogueStateTracker:
-        return DialogueStateTracker.from_events(
-            conversation_id, events[conversation_id]
-        )
+    async def _get_trackers(
+        conversation_ids: Iterable[Text],
+    ) -> AsyncIterator[DialogueStateTracker]:
+        for conversation_id in conversation_ids:
+            yield DialogueStateTracker.from_events(
+                conversation_id, events[conversation_id]
+            )
 
     # create mock tracker store
     tracker_store = AsyncMock()
-    tracker_store.retrieve_full_tracker.side_effect = _get_tracker
+    tracker_store.retrieve_full_trackers = _get_trackers
     tracker_store.keys = AsyncMock(return_value=conversation_ids)
 
     exporter = MockExporter(tracker_store)
@@ -106,11 +109,10 @@ async def test_fetch_events_within_time_range():
 
 
 async def test_fetch_events_within_time_range_tracker_does_not_err():
-    # create mock tracker store that returns `None` on `retrieve_full_tracker()`
-    tracker_store = Mock()
+    # create tracker store which doesn't contain the conversation of its keys
+    tracker_store = InMemoryTrackerStore(Domain.empty())
 
-    tracker_store.keys = AsyncMock(return_value=[uuid.uuid4()])
-    tracker_store.retrieve_full_tracker = AsyncMock(return_value=None)
+    tracker_store.keys = AsyncMock(return_value=[uuid.uuid4().hex])
 
     exporter = MockExporter(tracker_store)
 
@@ -121,13 +123,16 @@ async def test_fetch_events_within_time_range_tracker_does_not_err():
 
 
 async def test_fetch_events_within_time_range_tracker_contains_no_events():
-    # create mock tracker store that returns `None` on `retrieve_full_tracker()`
+    # create mock tracker store that returns a tracker without events
+    async def _get_trackers(
+        conversation_ids: Iterable[Text],
+    ) -> AsyncIterator[DialogueStateTracker]:
+        yield DialogueStateTracker.from_events("a great ID", [])
+
     tracker_store = Mock()
 
     tracker_store.keys = AsyncMock(return_value=["a great ID"])
-    tracker_store.retrieve_full_tracker = AsyncMock(
-        return_value=DialogueStateTracker.from_events("a great ID", [])
-    )
+    tracker_store.retrieve_full_trackers = _get_trackers
 
     exporter = MockExporter(tracker_store)
 
@@ -284,8 +289,8 @@ async def test_publishing_error():
         await exporter.publish_events()
 
 
-async def test_closing_broker():
-    exporter = MockExporter(event_broker=SQLEventBroker())
+async def test_closing_broker(tmp_path: Path):
+    exporter = MockExporter(event_broker=SQLEventBroker(db=str(tmp_path / "events.db")))
 
     # noinspection PyProtectedMember
     exporter._fetch_events_within_time_range = AsyncMock(return_value=[])
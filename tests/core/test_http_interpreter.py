@@ -30,3 +30,20 @@ async def test_http_interpreter(endpoint_url, joined_url):
         response = {"text": "message_text", "token": None, "message_id": "message_id"}
 
         assert query == response
+
+
+@pytest.mark.parametrize("enabled", [True, False])
+async def test_http_interpreter_with_connection_pool(enabled: bool):
+    with aioresponses() as mocked:
+        mocked.post("https://example.com/model/parse", payload={"text": "hi"})
+
+        endpoint = EndpointConfig(
+            "https://example.com", connection_pool={"enabled": enabled}
+        )
+        interpreter = RasaNLUHttpInterpreter(endpoint_config=endpoint)
+        result = await interpreter.parse(UserMessage(text="hi", sender_id="some-id"))
+
+        assert result == {"text": "hi"}
+        assert bool(endpoint._pooled_sessions) == enabled
+
+    await endpoint.close()
@@ -2,6 +2,7 @@ import asyncio
 import logging
 import sys
 from pathlib import Path
+from typing import Text
 
 import numpy as np
 import pytest
@@ -384,3 +385,76 @@ async def test_redis_lock_store_with_valid_prefix(monkeypatch: MonkeyPatch):
     with pytest.raises(LockError):
         async with lock_store.lock("some sender"):
             pass
+
+
+class FakeRedisLockStoreWithNotifications(FakeRedisLockStore):
+    """Fake `RedisLockStore` which subscribes to lock releases."""
+
+    def __init__(self):
+        import fakeredis
+        import fakeredis.aioredis
+
+        super().__init__()
+
+        server = fakeredis.FakeServer()
+        self.red = fakeredis.FakeStrictRedis(server=server)
+        self.async_red = fakeredis.aioredis.FakeRedis(server=server)
+
+    def _pubsub_client(self):
+        return self.async_red
+
+
+async def _time_waiting_for_second_ticket(
+    lock_store: LockStore, conversation_id: Text
+) -> float:
+    first_ticket_acquired = asyncio.Event()
+
+    async def first_ticket() -> None:
+        async with lock_store.lock(conversation_id, wait_time_in_seconds=10):
+            first_ticket_acquired.set()
+            await asyncio.sleep(0.05)
+
+    async def second_ticket() -> float:
+        await first_ticket_acquired.wait()
+        start = time.perf_counter()
+        async with lock_store.lock(conversation_id, wait_time_in_seconds=10):
+            return time.perf_counter() - start
+
+    _, waiting_time = await asyncio.gather(first_ticket(), second_ticket())
+    return waiting_time
+
+
+@pytest.mark.parametrize(
+    "lock_store", [InMemoryLockStore(), FakeRedisLockStoreWithNotifications()]
+)
+async def test_waiting_ticket_is_woken_up_on_release(lock_store: LockStore):
+    conversation_id = "test_waiting_ticket_is_woken_up_on_release"
+
+    waiting_time = await _time_waiting_for_second_ticket(lock_store, conversation_id)
+
+    # the second ticket doesn't wait for the polling interval of 10 seconds
+    assert waiting_time < 1
+    assert not lock_store.get_lock(conversation_id)
+
+
+async def test_redis_lock_store_publishes_release(monkeypatch: MonkeyPatch):
+    lock_store = FakeRedisLockStore()
+    publish = Mock()
+    monkeypatch.setattr(lock_store.red, "publish", publish)
+
+    async with lock_store.lock("some sender"):
+        publish.assert_not_called()
+
+    publish.assert_called_once_with(
+        DEFAULT_REDIS_LOCK_STORE_KEY_PREFIX + "released:some sender", "some sender"
+    )
+
+
+async def test_redis_lock_store_without_notifications_polls():
+    lock_store = FakeRedisLockStore()
+    assert lock_store._pubsub_client() is None
+
+    start = time.perf_counter()
+    await lock_store._wait_for_release("some sender", 1, 0.05)
+
+    assert time.perf_counter() - start >= 0.05
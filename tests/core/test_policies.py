@@ -21,6 +21,7 @@ from rasa.shared.core.events import (
     EntitiesAdded,
     SlotSet,
 )
+import rasa.shared.utils.io
 from rasa.core import training
 from rasa.core.constants import POLICY_MAX_HISTORY
 from rasa.core.featurizers.tracker_featurizers import (
@@ -35,7 +36,11 @@ from rasa.core.featurizers.single_state_featurizer import (
 from rasa.core.policies.policy import SupportedData, InvalidPolicyConfig, Policy
 from rasa.core.policies.rule_policy import RulePolicy
 from rasa.core.policies.ted_policy import TEDPolicy
-from rasa.core.policies.memoization import AugmentedMemoizationPolicy, MemoizationPolicy
+from rasa.core.policies.memoization import (
+    AugmentedMemoizationPolicy,
+    MemoizationPolicy,
+    MAX_CACHED_STATE_ENCODINGS,
+)
 
 from rasa.shared.core.trackers import DialogueStateTracker
 from rasa.shared.core.generator import TrackerWithCachedStates
@@ -376,7 +381,7 @@ class TestMemoizationPolicy(PolicyTestCollection):
         trackers = train_trackers(default_domain, stories_path, augmentation_factor=20)
 
         trained_policy.train(trackers, default_domain)
-        lookup_with_augmentation = trained_policy.lookup
+        lookup_with_augmentation = trained_policy._hashed_lookup
 
         trackers = [
             t for t in trackers if not hasattr(t, "is_augmented") or not t.is_augmented
@@ -403,7 +408,7 @@ class TestMemoizationPolicy(PolicyTestCollection):
         )
 
         trained_policy.train(trackers_no_augmentation, default_domain)
-        lookup_no_augmentation = trained_policy.lookup
+        lookup_no_augmentation = trained_policy._hashed_lookup
 
         assert lookup_no_augmentation == lookup_with_augmentation
 
@@ -416,6 +421,65 @@ class TestMemoizationPolicy(PolicyTestCollection):
         recalled = trained_policy.recall(states, tracker, default_domain, None)
         assert recalled is not None
 
+    @pytest.mark.parametrize("enable_feature_string_compression", [True, False])
+    def test_recall_after_load(
+        self,
+        enable_feature_string_compression: bool,
+        default_domain: Domain,
+        stories_path: Text,
+        model_storage: ModelStorage,
+        execution_context: ExecutionContext,
+    ):
+        resource = Resource(uuid.uuid4().hex)
+        config = {
+            "enable_feature_string_compression": enable_feature_string_compression
+        }
+        policy = self.create_policy(
+            MaxHistoryTrackerFeaturizer(None, max_history=self.max_history),
+            model_storage,
+            resource,
+            execution_context,
+            config=config,
+        )
+        trackers = train_trackers(default_domain, stories_path, augmentation_factor=0)
+        policy.train(trackers, default_domain)
+
+        loaded = policy.__class__.load(
+            self._config(config), model_storage, resource, execution_context
+        )
+        assert loaded._hashed_lookup == policy._hashed_lookup
+
+        with model_storage.read_from(resource) as path:
+            persisted_lookup = rasa.shared.utils.io.read_json_file(
+                path / loaded._metadata_filename()
+            )["lookup"]
+
+        all_states, all_actions = loaded.featurizer.training_states_and_labels(
+            trackers, default_domain
+        )
+        for states, actions in zip(all_states, all_actions):
+            # the persisted lookup stays readable
+            assert persisted_lookup[loaded._create_feature_key(states)] == actions[0]
+            assert loaded._recall_states(states) == actions[0]
+
+    def test_state_encodings_are_not_kept_after_training(
+        self,
+        trained_policy: MemoizationPolicy,
+        default_domain: Domain,
+        stories_path: Text,
+    ):
+        trackers = train_trackers(default_domain, stories_path, augmentation_factor=0)
+        trained_policy.train(trackers, default_domain)
+
+        # only the digests of the feature strings are kept in memory
+        assert not hasattr(trained_policy, "lookup")
+        assert not trained_policy._state_encodings
+
+        tracker = tracker_from_dialogue(TEST_DEFAULT_DIALOGUE, default_domain)
+        for _ in range(3):
+            trained_policy.predict_action_probabilities(tracker, default_domain)
+        assert 0 < len(trained_policy._state_encodings) <= MAX_CACHED_STATE_ENCODINGS
+
     def test_finetune_after_load(
         self,
         trained_policy: MemoizationPolicy,
@@ -457,8 +521,7 @@ class TestMemoizationPolicy(PolicyTestCollection):
 
         # Feature keys for each new state should be present in the lookup
         for states in new_story_states:
-            state_key = loaded_policy._create_feature_key(states)
-            assert state_key in loaded_policy.lookup
+            assert loaded_policy._recall_states(states) is not None
 
     @pytest.mark.parametrize(
         "tracker_events_with_action, tracker_events_without_action",
@@ -72,6 +72,7 @@ from rasa.shared.core.constants import (
     ACTION_LISTEN_NAME,
     ACTION_SESSION_START_NAME,
     EXTERNAL_MESSAGE_PREFIX,
+    FOLLOWUP_ACTION,
     IS_EXTERNAL,
     SESSION_START_METADATA_SLOT,
 )
@@ -110,6 +111,43 @@ async def test_parsing(default_processor: MessageProcessor):
     assert parsed["entities"][0]["entity"] == "name"
 
 
+async def test_parsing_concurrent_messages_in_batches(
+    default_processor: MessageProcessor, monkeypatch: MonkeyPatch
+):
+    processor = MessageProcessor(
+        default_processor.model_path,
+        default_processor.tracker_store,
+        default_processor.lock_store,
+        default_processor.nlg,
+        nlu_max_batch_size=10,
+        nlu_max_batch_wait_in_ms=50,
+    )
+    batch_sizes = []
+    run_nlu_graph = processor._run_nlu_graph
+
+    def spy_run_nlu_graph(messages: List[UserMessage]) -> List[Message]:
+        batch_sizes.append(len(messages))
+        return run_nlu_graph(messages)
+
+    monkeypatch.setattr(processor.nlu_batcher, "process_batch", spy_run_nlu_graph)
+    messages = [
+        UserMessage("hi"),
+        UserMessage('/greet{"name": "boy"}'),
+        UserMessage("goodbye"),
+    ]
+
+    parsed = await asyncio.gather(
+        *[processor.parse_message(message) for message in messages]
+    )
+
+    assert batch_sizes == [3]
+    for message, parse_data in zip(messages, parsed):
+        expected = await default_processor.parse_message(message)
+        assert parse_data["text"] == message.text
+        assert parse_data["intent"] == pytest.approx(expected["intent"])
+        assert parse_data["entities"] == expected["entities"]
+
+
 async def test_check_for_unseen_feature(default_processor: MessageProcessor):
     message = UserMessage('/greet{"name": "Joe"}')
     old_domain = default_processor.domain
@@ -1473,6 +1511,110 @@ def test_predict_next_with_tracker_full_model(trained_rasa_model: Text):
     assert result["policy"] == "MemoizationPolicy"
 
 
+def test_predict_next_with_trackers(
+    default_processor: MessageProcessor, monkeypatch: MonkeyPatch
+):
+    trackers = [
+        DialogueStateTracker.from_events(
+            "greeted",
+            [
+                ActionExecuted(ACTION_LISTEN_NAME),
+                UserUttered("hi", intent={"name": "greet"}),
+            ],
+        ),
+        DialogueStateTracker.from_events(
+            "said_goodbye",
+            [
+                ActionExecuted(ACTION_LISTEN_NAME),
+                UserUttered("bye", intent={"name": "goodbye"}),
+            ],
+        ),
+        DialogueStateTracker("with_followup_action", []),
+    ]
+    trackers[2].trigger_followup_action("utter_greet")
+    batches = []
+    run_core_graph = default_processor._run_core_graph
+
+    def spy_run_core_graph(
+        trackers: List[DialogueStateTracker],
+    ) -> List[PolicyPrediction]:
+        batches.append([tracker.sender_id for tracker in trackers])
+        return run_core_graph(trackers)
+
+    monkeypatch.setattr(default_processor, "_run_core_graph", spy_run_core_graph)
+
+    results = default_processor.predict_next_with_trackers(trackers)
+
+    # the tracker with the follow-up action doesn't need the graph
+    assert batches == [["greeted", "said_goodbye"]]
+    assert results[2]["policy"] == FOLLOWUP_ACTION
+    assert results[2]["confidence"] == 1.0
+    for tracker, result in zip(trackers[:2], results[:2]):
+        expected = default_processor.predict_next_with_tracker(tracker)
+        assert result["policy"] == expected["policy"]
+        assert result["confidence"] == pytest.approx(expected["confidence"])
+        assert result["tracker"] == expected["tracker"]
+
+
+def test_predict_next_with_trackers_nlu_only(trained_nlu_model: Text):
+    processor = Agent.load(model_path=trained_nlu_model).processor
+    trackers = [DialogueStateTracker("some_id", []), DialogueStateTracker("other", [])]
+
+    assert processor.predict_next_with_trackers(trackers) == [None, None]
+
+
+async def test_predicting_next_actions_of_concurrent_conversations_in_batches(
+    default_processor: MessageProcessor,
+    default_channel: CollectingOutputChannel,
+    monkeypatch: MonkeyPatch,
+):
+    processor = MessageProcessor(
+        default_processor.model_path,
+        default_processor.tracker_store,
+        default_processor.lock_store,
+        default_processor.nlg,
+        core_max_batch_size=10,
+        core_max_batch_wait_in_ms=50,
+    )
+    batch_sizes = []
+    run_core_graph = processor._run_core_graph
+
+    def spy_run_core_graph(
+        trackers: List[DialogueStateTracker],
+    ) -> List[PolicyPrediction]:
+        batch_sizes.append(len(trackers))
+        return run_core_graph(trackers)
+
+    monkeypatch.setattr(processor.core_batcher, "process_batch", spy_run_core_graph)
+    trackers = [
+        await processor.tracker_store.get_or_create_tracker(uuid.uuid4().hex)
+        for _ in range(3)
+    ]
+
+    await asyncio.gather(
+        *[
+            processor.trigger_external_user_uttered(
+                "greet", None, tracker, default_channel
+            )
+            for tracker in trackers
+        ]
+    )
+
+    assert batch_sizes[0] == 3
+    executed_actions = []
+    for tracker in trackers:
+        tracker = await processor.tracker_store.retrieve(tracker.sender_id)
+        assert tracker.latest_action_name == ACTION_LISTEN_NAME
+        executed_actions.append(
+            [
+                event.action_name
+                for event in tracker.events
+                if isinstance(event, ActionExecuted)
+            ]
+        )
+    assert executed_actions[0] == executed_actions[1] == executed_actions[2]
+
+
 async def test_get_tracker_adds_model_id(default_processor: MessageProcessor):
     model_id = default_processor.model_metadata.model_id
     tracker = await default_processor.get_tracker("bloop")
@@ -78,8 +78,8 @@ async def test_load_agent_on_start_with_bad_model_file(
         assert any("No valid model found at" in str(w.message) for w in warnings)
 
 
-async def test_close_resources(loop: AbstractEventLoop):
-    broker = SQLEventBroker()
+async def test_close_resources(loop: AbstractEventLoop, tmp_path: Path):
+    broker = SQLEventBroker(db=str(tmp_path / "events.db"))
     app = Mock()
     app.ctx.agent.tracker_store.event_broker = broker
 
@@ -0,0 +1,112 @@
+import json
+from typing import Any, Dict, List, Text
+
+import pytest
+
+from rasa.core.tracker_serialisation import (
+    ENVELOPE_MARKER,
+    ENVELOPE_VERSION,
+    MsgpackTrackerSerialiser,
+    TrackerSerialisationException,
+    TrackerSerialiser,
+)
+from rasa.shared.exceptions import RasaException
+
+SERIALISED_DIALOGUE = {
+    "name": "some-sender",
+    "events": [
+        {
+            "event": "user",
+            "timestamp": 1660000000.123,
+            "text": "hi",
+            "parse_data": {"intent": {"name": "greet", "confidence": 0.98}},
+            "metadata": {"model_id": "some-model"},
+        },
+        {"event": "bot", "timestamp": 1660000001.5, "text": "hey", "data": None},
+    ],
+}
+
+
+def _serialisers() -> List[Any]:
+    return [
+        "json",
+        "msgpack",
+        pytest.param(
+            "orjson",
+            marks=pytest.mark.skipif(
+                not _is_installed("orjson"), reason="orjson is not installed"
+            ),
+        ),
+    ]
+
+
+def _is_installed(package: Text) -> bool:
+    try:
+        __import__(package)
+        return True
+    except ImportError:
+        return False
+
+
+@pytest.mark.parametrize("name", _serialisers())
+def test_serialiser_round_trip(name: Text):
+    serialiser = TrackerSerialiser.create(name)
+
+    payload = serialiser.dumps(SERIALISED_DIALOGUE)
+
+    assert TrackerSerialiser.loads(payload) == SERIALISED_DIALOGUE
+
+
+def test_default_serialiser_writes_plain_json():
+    payload = TrackerSerialiser.create().dumps(SERIALISED_DIALOGUE)
+
+    assert json.loads(payload) == SERIALISED_DIALOGUE
+
+
+def test_binary_payload_has_envelope():
+    serialiser = MsgpackTrackerSerialiser()
+
+    payload = serialiser.dumps(SERIALISED_DIALOGUE)
+
+    assert payload.startswith(
+        ENVELOPE_MARKER + bytes([ENVELOPE_VERSION, serialiser.codec_id])
+    )
+
+
+@pytest.mark.parametrize(
+    "legacy_payload",
+    [json.dumps(SERIALISED_DIALOGUE), json.dumps(SERIALISED_DIALOGUE).encode()],
+)
+def test_legacy_json_payload_is_detected(legacy_payload: Any):
+    serialiser = MsgpackTrackerSerialiser()
+
+    assert serialiser.loads(legacy_payload) == json.loads(legacy_payload)
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        ENVELOPE_MARKER,
+        ENVELOPE_MARKER + bytes([ENVELOPE_VERSION + 1, 2]) + b"\x80",
+        ENVELOPE_MARKER + bytes([ENVELOPE_VERSION, 255]) + b"\x80",
+    ],
+)
+def test_invalid_envelope(payload: bytes):
+    with pytest.raises(TrackerSerialisationException):
+        TrackerSerialiser.loads(payload)
+
+
+def test_unknown_serialiser():
+    with pytest.raises(RasaException):
+        TrackerSerialiser.create("pickle")
+
+
+def test_serialiser_requires_codec():
+    class IncompleteTrackerSerialiser(TrackerSerialiser):
+        name = "incomplete"
+
+        def encode(self, data: Dict[Text, Any]) -> Text:
+            return json.dumps(data)
+
+    with pytest.raises(TypeError):
+        IncompleteTrackerSerialiser()
@@ -9,6 +9,7 @@ import uuid
 from _pytest.capture import CaptureFixture
 from _pytest.logging import LogCaptureFixture
 from _pytest.monkeypatch import MonkeyPatch
+from boto3.dynamodb.conditions import Key
 from moto import mock_dynamodb2
 from pymongo.errors import OperationFailure
 
@@ -19,7 +20,18 @@ from sqlalchemy.dialects.postgresql.base import PGDialect
 from sqlalchemy.dialects.sqlite.base import SQLiteDialect
 from sqlalchemy.dialects.oracle.base import OracleDialect
 from sqlalchemy.engine.url import URL
-from typing import Tuple, Text, Type, Dict, List, Union, Optional, ContextManager
+from typing import (
+    Any,
+    Tuple,
+    Text,
+    Type,
+    Dict,
+    List,
+    Union,
+    Optional,
+    ContextManager,
+    Iterator,
+)
 from unittest.mock import Mock
 
 import rasa.core.tracker_store
@@ -34,23 +46,37 @@ from rasa.shared.core.events import (
     SessionStarted,
     BotUttered,
     Event,
+    UserUtteranceReverted,
 )
 from rasa.shared.exceptions import ConnectionException, RasaException
 from rasa.core.tracker_store import (
     TrackerStore,
     InMemoryTrackerStore,
     RedisTrackerStore,
+    AsyncRedisTrackerStore,
     DEFAULT_REDIS_TRACKER_STORE_KEY_PREFIX,
     SQLTrackerStore,
+    AsyncSQLTrackerStore,
     DynamoTrackerStore,
+    ChunkedDynamoTrackerStore,
+    CachedTrackerStore,
+    DYNAMO_CHUNK_KEY,
     FailSafeTrackerStore,
     AwaitableTrackerStore,
+    MongoTrackerStore,
+    AsyncMongoTrackerStore,
+    MONGO_LAST_SESSION_START_INDEX_KEY,
+    MONGO_NUMBER_OF_EVENTS_KEY,
 )
 from rasa.shared.core.trackers import DialogueStateTracker
 from rasa.shared.nlu.training_data.message import Message
 from rasa.utils.endpoints import EndpointConfig, read_endpoint_config
 from tests.conftest import AsyncMock
-from tests.core.conftest import MockedMongoTrackerStore
+from tests.core.conftest import (
+    AsyncMongomockCollection,
+    MockedAsyncMongoTrackerStore,
+    MockedMongoTrackerStore,
+)
 
 test_domain = Domain.load("data/test_domains/default.yml")
 
@@ -101,6 +127,108 @@ async def test_dynamo_tracker_floats():
     assert retrieved_timestamp == timestamp
 
 
+async def test_dynamo_tracker_store_keys():
+    with mock_dynamodb2():
+        tracker_store = DynamoTrackerStore(test_domain, scan_segments=3)
+        sender_ids = {uuid.uuid4().hex for _ in range(5)}
+        for sender_id in sender_ids:
+            await tracker_store.save(
+                DialogueStateTracker.from_events(sender_id, [SessionStarted()])
+            )
+
+        assert set(await tracker_store.keys()) == sender_ids
+
+
+@pytest.fixture
+def chunked_dynamo_tracker_store() -> Iterator[ChunkedDynamoTrackerStore]:
+    with mock_dynamodb2():
+        yield ChunkedDynamoTrackerStore(test_domain, table_name="chunks")
+
+
+async def test_chunked_dynamo_tracker_store_save_and_retrieve(
+    chunked_dynamo_tracker_store: ChunkedDynamoTrackerStore,
+):
+    tracker_store = chunked_dynamo_tracker_store
+    sender_id = uuid.uuid4().hex
+    events = [
+        UserUttered("Hola", {"name": "greet"}, timestamp=1),
+        BotUttered("Hi", timestamp=2),
+        SessionStarted(timestamp=3),
+        UserUttered("Ciao", {"name": "greet"}, timestamp=4),
+        SlotSet("key", "val", timestamp=13423.23434623),
+        SessionStarted(timestamp=6),
+        UserUttered("Hallo", {"name": "greet"}, timestamp=7),
+    ]
+    tracker = DialogueStateTracker.from_events(sender_id, events[:4])
+    await tracker_store.save(tracker)
+
+    tracker = await tracker_store.retrieve(sender_id)
+    assert list(tracker.events) == events[2:4]
+
+    tracker.update(events[4])
+    await tracker_store.save(tracker)
+    await tracker_store.save(tracker)
+    await tracker_store.save_new_events(sender_id, events[5:], 5)
+
+    # every session starts a new chunk and saves without new events write nothing
+    items = tracker_store.db.query(
+        KeyConditionExpression=Key("sender_id").eq(sender_id)
+    )["Items"]
+    assert [int(item[DYNAMO_CHUNK_KEY]) for item in items] == [0, 1, 2, 3, 4]
+    assert int(items[0]["session_start_chunk"]) == 4
+
+    tracker = await tracker_store.retrieve(sender_id)
+    assert list(tracker.events) == events[5:]
+    assert await tracker_store.number_of_existing_events(sender_id) == 2
+
+    full_tracker = await tracker_store.retrieve_full_tracker(sender_id)
+    assert list(full_tracker.events) == events
+    assert isinstance(full_tracker.events[4].timestamp, float)
+
+    # moto doesn't split the table into segments but returns all items for each
+    assert set(await tracker_store.keys()) == {sender_id}
+    assert await tracker_store.retrieve("unknown") is None
+
+
+async def test_chunked_dynamo_tracker_store_splits_large_conversations(
+    chunked_dynamo_tracker_store: ChunkedDynamoTrackerStore, monkeypatch: MonkeyPatch
+):
+    monkeypatch.setattr(rasa.core.tracker_store, "DYNAMO_MAX_CHUNK_SIZE", 1000)
+    tracker_store = chunked_dynamo_tracker_store
+    sender_id = uuid.uuid4().hex
+    events = [SessionStarted(timestamp=1)] + [
+        UserUttered(f"message {i}", timestamp=i + 2) for i in range(100)
+    ]
+
+    await tracker_store.save(DialogueStateTracker.from_events(sender_id, events))
+
+    items = tracker_store.db.query(
+        KeyConditionExpression=Key("sender_id").eq(sender_id)
+    )["Items"]
+    assert len(items) > 10
+    assert all(len(item.get("events", "")) <= 1000 for item in items)
+
+    tracker = await tracker_store.retrieve(sender_id)
+    assert list(tracker.events) == events
+
+
+@mock_dynamodb2
+def test_chunked_dynamo_tracker_store_with_legacy_table():
+    DynamoTrackerStore(test_domain, table_name="states")
+
+    with pytest.raises(RasaException):
+        ChunkedDynamoTrackerStore(test_domain, table_name="states")
+
+
+@mock_dynamodb2
+def test_create_chunked_dynamo_tracker_store_from_endpoint_config(domain: Domain):
+    store = EndpointConfig(type="dynamo", table_name="chunks", use_event_chunks=True)
+
+    tracker_store = TrackerStore.create(store, domain)
+
+    assert isinstance(tracker_store, ChunkedDynamoTrackerStore)
+
+
 async def test_restart_after_retrieval_from_tracker_store(domain: Domain):
     store = InMemoryTrackerStore(domain)
     tr = await store.get_or_create_tracker("myuser")
@@ -203,6 +331,80 @@ def test_redis_tracker_store_valid_key_prefix(domain: Domain):
     )
 
 
+@pytest.fixture
+def async_redis_tracker_store(domain: Domain) -> AsyncRedisTrackerStore:
+    import fakeredis.aioredis
+
+    tracker_store = AsyncRedisTrackerStore(domain, record_exp=3000)
+    tracker_store.red = fakeredis.aioredis.FakeRedis(decode_responses=True)
+    return tracker_store
+
+
+async def test_async_redis_tracker_store_appends_only_new_events(
+    async_redis_tracker_store: AsyncRedisTrackerStore,
+):
+    sender_id = uuid.uuid4().hex
+    tracker = DialogueStateTracker.from_events(sender_id, [UserUttered("hi")])
+    await async_redis_tracker_store.save(tracker)
+
+    tracker = await async_redis_tracker_store.retrieve(sender_id)
+    tracker.update(BotUttered("hey"))
+    await async_redis_tracker_store.save(tracker)
+    await async_redis_tracker_store.save(tracker)
+
+    events_key = async_redis_tracker_store._events_key(sender_id)
+    assert await async_redis_tracker_store.red.llen(events_key) == 2
+    assert 0 < await async_redis_tracker_store.red.ttl(events_key) <= 3000
+
+    retrieved = await async_redis_tracker_store.retrieve(sender_id)
+    assert list(retrieved.events) == [UserUttered("hi"), BotUttered("hey")]
+
+
+async def test_async_redis_tracker_store_retrieve_latest_session(
+    async_redis_tracker_store: AsyncRedisTrackerStore,
+):
+    sender_id = uuid.uuid4().hex
+    events = [
+        UserUttered("Hola", {"name": "greet"}, timestamp=1),
+        BotUttered("Hi", timestamp=2),
+        SessionStarted(timestamp=3),
+        UserUttered("Ciao", {"name": "greet"}, timestamp=4),
+    ]
+    await async_redis_tracker_store.save(
+        DialogueStateTracker.from_events(sender_id, events[:2])
+    )
+    await async_redis_tracker_store.save_new_events(sender_id, events[2:], 2)
+
+    tracker = await async_redis_tracker_store.retrieve(sender_id)
+    assert list(tracker.events) == events[2:]
+    assert await async_redis_tracker_store.number_of_existing_events(sender_id) == 2
+
+    full_tracker = await async_redis_tracker_store.retrieve_full_tracker(sender_id)
+    assert list(full_tracker.events) == events
+
+
+async def test_async_redis_tracker_store_keys(
+    async_redis_tracker_store: AsyncRedisTrackerStore,
+):
+    sender_ids = {uuid.uuid4().hex for _ in range(3)}
+    for sender_id in sender_ids:
+        await async_redis_tracker_store.save(
+            DialogueStateTracker.from_events(sender_id, [SessionStarted()])
+        )
+
+    assert set(await async_redis_tracker_store.keys()) == sender_ids
+    assert await async_redis_tracker_store.exists(sender_ids.pop())
+    assert not await async_redis_tracker_store.exists("unknown")
+
+
+def test_create_async_redis_tracker_store_from_endpoint_config(domain: Domain):
+    store = EndpointConfig(type="redis", url="localhost", use_event_lists=True)
+
+    tracker_store = TrackerStore.create(store, domain)
+
+    assert isinstance(tracker_store, AsyncRedisTrackerStore)
+
+
 def test_exception_tracker_store_from_endpoint_config(
     domain: Domain, monkeypatch: MonkeyPatch, endpoints_path: Text
 ):
@@ -323,6 +525,21 @@ async def test_tracker_serialisation():
     assert tracker == store.deserialise_tracker(DEFAULT_SENDER_ID, serialised)
 
 
+class TrackerStoreWithoutConstructorCall(TrackerStore):
+    def __init__(self, domain: Domain) -> None:
+        self._domain = domain
+        self.max_event_history = None
+
+
+async def test_tracker_deserialisation_without_constructor_call():
+    store, tracker = await _tracker_store_and_tracker_with_slot_set()
+    serialised = store.serialise_tracker(tracker)
+
+    custom_store = TrackerStoreWithoutConstructorCall(test_domain)
+
+    assert tracker == custom_store.deserialise_tracker(DEFAULT_SENDER_ID, serialised)
+
+
 @pytest.mark.parametrize(
     "full_url",
     [
@@ -511,6 +728,255 @@ def test_set_fail_safe_tracker_store_domain(domain: Domain):
     assert fallback_tracker_store.domain is failsafe_store.domain
 
 
+@pytest.fixture
+def sql_tracker_store() -> SQLTrackerStore:
+    return SQLTrackerStore(Domain.empty(), host="sqlite:///")
+
+
+async def test_cached_tracker_store_does_not_reread_saved_tracker(
+    sql_tracker_store: SQLTrackerStore,
+):
+    tracker_store = CachedTrackerStore(sql_tracker_store)
+    tracker = DialogueStateTracker.from_events("some-sender", [UserUttered("hi")])
+    await tracker_store.save(tracker)
+
+    sql_tracker_store.retrieve = AsyncMock()
+
+    actual = await tracker_store.retrieve("some-sender")
+    assert list(actual.events) == list(tracker.events)
+    sql_tracker_store.retrieve.assert_not_called()
+
+
+async def test_cached_tracker_store_writes_through(
+    sql_tracker_store: SQLTrackerStore,
+):
+    tracker_store = CachedTrackerStore(sql_tracker_store)
+    tracker = DialogueStateTracker.from_events("some-sender", [UserUttered("hi")])
+    await tracker_store.save(tracker)
+
+    tracker.update(BotUttered("hey"))
+    await tracker_store.save(tracker)
+
+    stored = await sql_tracker_store.retrieve("some-sender")
+    assert list(stored.events) == list(tracker.events)
+
+
+async def test_cached_tracker_store_with_events_from_other_instance(
+    sql_tracker_store: SQLTrackerStore,
+):
+    tracker_store = CachedTrackerStore(sql_tracker_store)
+    other_tracker_store = CachedTrackerStore(sql_tracker_store)
+    await tracker_store.save(
+        DialogueStateTracker.from_events("some-sender", [UserUttered("hi")])
+    )
+
+    tracker = await other_tracker_store.retrieve("some-sender")
+    tracker.update(BotUttered("hey"))
+    await other_tracker_store.save(tracker)
+
+    actual = await tracker_store.retrieve("some-sender")
+    assert list(actual.events) == list(tracker.events)
+
+
+async def test_cached_tracker_store_without_validation(
+    sql_tracker_store: SQLTrackerStore,
+):
+    tracker_store = CachedTrackerStore(
+        sql_tracker_store, validate_cached_trackers=False
+    )
+    tracker = DialogueStateTracker.from_events("some-sender", [UserUttered("hi")])
+    await tracker_store.save(tracker)
+
+    sql_tracker_store.number_of_existing_events = AsyncMock()
+    sql_tracker_store.retrieve = AsyncMock()
+
+    actual = await tracker_store.retrieve("some-sender")
+    assert list(actual.events) == list(tracker.events)
+    sql_tracker_store.number_of_existing_events.assert_not_called()
+    sql_tracker_store.retrieve.assert_not_called()
+
+
+async def test_cached_tracker_store_with_unsaved_events(
+    sql_tracker_store: SQLTrackerStore,
+):
+    tracker_store = CachedTrackerStore(sql_tracker_store)
+    tracker = DialogueStateTracker.from_events("some-sender", [UserUttered("hi")])
+    await tracker_store.save(tracker)
+
+    tracker.update(BotUttered("hey"))
+
+    actual = await tracker_store.retrieve("some-sender")
+    assert actual is not tracker
+    assert list(actual.events) == [UserUttered("hi")]
+
+
+async def test_cached_tracker_store_returns_copies(
+    sql_tracker_store: SQLTrackerStore,
+):
+    tracker_store = CachedTrackerStore(sql_tracker_store)
+    await tracker_store.save(
+        DialogueStateTracker.from_events("some-sender", [UserUttered("hi")])
+    )
+
+    tracker = await tracker_store.retrieve("some-sender")
+    tracker.update(BotUttered("hey"))
+
+    actual = await tracker_store.retrieve("some-sender")
+    assert actual is not tracker
+    assert list(actual.events) == [UserUttered("hi")]
+
+
+async def test_cached_tracker_store_with_expired_tracker(
+    sql_tracker_store: SQLTrackerStore,
+):
+    tracker_store = CachedTrackerStore(sql_tracker_store, ttl=0)
+    tracker = DialogueStateTracker.from_events("some-sender", [UserUttered("hi")])
+    await tracker_store.save(tracker)
+
+    actual = await tracker_store.retrieve("some-sender")
+    assert actual is not tracker
+    assert list(actual.events) == list(tracker.events)
+
+
+async def test_cached_tracker_store_evicts_least_recently_used_trackers(
+    sql_tracker_store: SQLTrackerStore,
+):
+    tracker_store = CachedTrackerStore(sql_tracker_store, max_events=5)
+    trackers = [
+        DialogueStateTracker.from_events(
+            sender_id, [UserUttered("hi"), BotUttered("hey")]
+        )
+        for sender_id in ["first", "second", "third"]
+    ]
+    await tracker_store.save(trackers[0])
+    await tracker_store.save(trackers[1])
+    # the first tracker is now used more recently than the second one
+    await tracker_store.retrieve("first")
+    await tracker_store.save(trackers[2])
+
+    assert list(tracker_store._cache) == ["first", "third"]
+
+
+async def test_cached_tracker_store_save_new_events(
+    sql_tracker_store: SQLTrackerStore,
+):
+    tracker_store = CachedTrackerStore(sql_tracker_store)
+    tracker = DialogueStateTracker.from_events("some-sender", [UserUttered("hi")])
+    await tracker_store.save(tracker)
+
+    await tracker_store.save_new_events("some-sender", [BotUttered("hey")], 1)
+
+    actual = await tracker_store.retrieve("some-sender")
+    assert list(actual.events) == [UserUttered("hi"), BotUttered("hey")]
+
+
+async def _assert_counts_events_without_retrieving(tracker_store: TrackerStore):
+    await tracker_store.save(
+        DialogueStateTracker.from_events(
+            "some-sender", [UserUttered("hi"), BotUttered("hey")]
+        )
+    )
+    await tracker_store.save_new_events("some-sender", [UserUttered("bye")], 2)
+
+    tracker_store.retrieve = AsyncMock()
+
+    assert await tracker_store.number_of_existing_events("some-sender") == 3
+    assert await tracker_store.number_of_existing_events("other-sender") == 0
+    tracker_store.retrieve.assert_not_called()
+
+
+async def test_in_memory_tracker_store_number_of_existing_events():
+    await _assert_counts_events_without_retrieving(InMemoryTrackerStore(Domain.empty()))
+
+
+async def test_redis_tracker_store_number_of_existing_events():
+    import fakeredis
+
+    tracker_store = RedisTrackerStore(Domain.empty())
+    tracker_store.red = fakeredis.FakeStrictRedis(decode_responses=True)
+
+    await _assert_counts_events_without_retrieving(tracker_store)
+    assert await tracker_store.keys() == [
+        DEFAULT_REDIS_TRACKER_STORE_KEY_PREFIX + "some-sender"
+    ]
+
+
+async def test_redis_tracker_store_number_of_existing_events_without_count():
+    import fakeredis
+
+    tracker_store = RedisTrackerStore(Domain.empty())
+    tracker_store.red = fakeredis.FakeStrictRedis(decode_responses=True)
+    await tracker_store.save(
+        DialogueStateTracker.from_events("some-sender", [UserUttered("hi")])
+    )
+    # conversations stored by older versions of Rasa don't have a count
+    tracker_store.red.delete(tracker_store._event_count_key("some-sender"))
+
+    assert await tracker_store.number_of_existing_events("some-sender") == 1
+
+
+async def test_dynamo_tracker_store_number_of_existing_events():
+    with mock_dynamodb2():
+        await _assert_counts_events_without_retrieving(
+            DynamoTrackerStore(Domain.empty())
+        )
+
+
+def test_cached_tracker_store_without_cheap_event_counts():
+    with pytest.warns(UserWarning, match="Tracker caching is disabled"):
+        tracker_store = CachedTrackerStore(
+            AwaitableTrackerStore(NonAsyncTrackerStore(Domain.empty()))
+        )
+    tracker_store._cache_tracker(
+        DialogueStateTracker.from_events("some-sender", [UserUttered("hi")])
+    )
+
+    assert not tracker_store._cache
+
+
+def test_cached_tracker_store_without_cheap_event_counts_and_validation():
+    tracker_store = CachedTrackerStore(
+        AwaitableTrackerStore(NonAsyncTrackerStore(Domain.empty())),
+        validate_cached_trackers=False,
+    )
+    tracker_store._cache_tracker(
+        DialogueStateTracker.from_events("some-sender", [UserUttered("hi")])
+    )
+
+    assert list(tracker_store._cache) == ["some-sender"]
+
+
+def test_set_cached_tracker_store_domain(domain: Domain):
+    tracker_store = CachedTrackerStore(InMemoryTrackerStore(Domain.empty()))
+    tracker_store._cache_tracker(
+        DialogueStateTracker.from_events("some-sender", [UserUttered("hi")])
+    )
+
+    tracker_store.domain = domain
+
+    assert tracker_store._tracker_store.domain is domain
+    assert not tracker_store._cache
+
+
+def test_create_cached_tracker_store_from_endpoint_config(domain: Domain):
+    endpoint_config = EndpointConfig(
+        type="sql",
+        url="sqlite:///",
+        use_tracker_cache=True,
+        tracker_cache_max_events=100,
+        tracker_cache_ttl=10,
+        validate_cached_trackers=False,
+    )
+
+    tracker_store = TrackerStore.create(endpoint_config, domain)
+
+    assert isinstance(tracker_store, CachedTrackerStore)
+    assert isinstance(tracker_store._tracker_store, SQLTrackerStore)
+    assert tracker_store._max_events == 100
+    assert tracker_store._ttl == 10
+    assert not tracker_store._validate_cached_trackers
+
+
 async def create_tracker_with_partially_saved_events(
     tracker_store: TrackerStore,
 ) -> Tuple[List[Event], DialogueStateTracker]:
@@ -572,10 +1038,116 @@ async def test_mongo_additional_events_with_session_start(domain: Domain):
     assert isinstance(additional_events[0], UserUttered)
 
 
+async def test_async_mongo_additional_events_without_persisted_event_count(
+    domain: Domain,
+):
+    tracker_store = MockedAsyncMongoTrackerStore(domain)
+    events, tracker = await create_tracker_with_partially_saved_events(tracker_store)
+    # e.g. a tracker which wasn't loaded from this tracker store
+    tracker.persisted_event_count = None
+
+    # noinspection PyProtectedMember
+    assert list(await tracker_store._additional_events_async(tracker)) == events
+    with pytest.raises(RasaException):
+        # noinspection PyProtectedMember
+        tracker_store._additional_events(tracker)
+
+    await tracker_store.save(tracker)
+
+    stored = await tracker_store.retrieve(tracker.sender_id)
+    assert list(stored.events) == list(tracker.events)
+    assert stored.persisted_event_count == len(tracker.events)
+
+
+def _mongomock_conversations(tracker_store: MongoTrackerStore) -> Any:
+    conversations = tracker_store.conversations
+    if isinstance(conversations, AsyncMongomockCollection):
+        return conversations._collection
+    return conversations
+
+
+@pytest.mark.parametrize(
+    "tracker_store_type", [MockedMongoTrackerStore, MockedAsyncMongoTrackerStore]
+)
+async def test_mongo_tracker_store_retrieves_only_latest_session(
+    domain: Domain, tracker_store_type: Type[MongoTrackerStore]
+):
+    tracker_store = tracker_store_type(domain)
+    sender_id = uuid.uuid4().hex
+    events = [
+        SessionStarted(timestamp=1),
+        UserUttered("Hola", {"name": "greet"}, timestamp=2),
+        SessionStarted(timestamp=3),
+        UserUttered("Ciao", {"name": "greet"}, timestamp=4),
+        BotUttered("Hi", timestamp=5),
+        SessionStarted(timestamp=6),
+        UserUttered("Hallo", {"name": "greet"}, timestamp=7),
+    ]
+    await tracker_store.save(DialogueStateTracker.from_events(sender_id, events[:4]))
+    await tracker_store.save_new_events(sender_id, events[4:], 4)
+
+    stored = _mongomock_conversations(tracker_store).find_one({"sender_id": sender_id})
+    assert stored[MONGO_NUMBER_OF_EVENTS_KEY] == 7
+    assert stored[MONGO_LAST_SESSION_START_INDEX_KEY] == 5
+
+    tracker = await tracker_store.retrieve(sender_id)
+    assert list(tracker.events) == events[5:]
+    assert await tracker_store.number_of_existing_events(sender_id) == 2
+
+    full_tracker = await tracker_store.retrieve_full_tracker(sender_id)
+    assert list(full_tracker.events) == events
+
+    assert list(await tracker_store.keys()) == [sender_id]
+
+
+@pytest.mark.parametrize(
+    "tracker_store_type", [MockedMongoTrackerStore, MockedAsyncMongoTrackerStore]
+)
+async def test_mongo_tracker_store_with_conversation_without_session_index(
+    domain: Domain, tracker_store_type: Type[MongoTrackerStore]
+):
+    tracker_store = tracker_store_type(domain)
+    sender_id = uuid.uuid4().hex
+    events = [
+        UserUttered("Hola", {"name": "greet"}, timestamp=1),
+        SessionStarted(timestamp=2),
+        UserUttered("Ciao", {"name": "greet"}, timestamp=3),
+    ]
+    # conversations stored by older versions don't have the session index
+    conversations = _mongomock_conversations(tracker_store)
+    conversations.insert_one(
+        {"sender_id": sender_id, "events": [e.as_dict() for e in events]}
+    )
+
+    tracker = await tracker_store.retrieve(sender_id)
+    assert list(tracker.events) == events[1:]
+    assert await tracker_store.number_of_existing_events(sender_id) == 2
+
+    await tracker_store.save_new_events(sender_id, [BotUttered("Hi", timestamp=4)], 3)
+
+    stored = conversations.find_one({"sender_id": sender_id})
+    assert stored[MONGO_NUMBER_OF_EVENTS_KEY] == 4
+    assert stored[MONGO_LAST_SESSION_START_INDEX_KEY] == 1
+
+    tracker = await tracker_store.retrieve(sender_id)
+    assert list(tracker.events) == events[1:] + [BotUttered("Hi", timestamp=4)]
+
+
+def test_create_async_mongo_tracker_store_from_endpoint_config(domain: Domain):
+    pytest.importorskip("motor")
+    store = EndpointConfig(
+        type="mongod", url="mongodb://localhost:27017", use_async_driver=True
+    )
+
+    tracker_store = TrackerStore.create(store, domain)
+
+    assert isinstance(tracker_store, AsyncMongoTrackerStore)
+
+
 # we cannot parametrise over this and the previous test due to the different ways of
 # calling _additional_events()
-async def test_sql_additional_events(domain: Domain):
-    tracker_store = SQLTrackerStore(domain)
+async def test_sql_additional_events(domain: Domain, tmp_path: Path):
+    tracker_store = SQLTrackerStore(domain, db=str(tmp_path / "rasa.db"))
     additional_events, tracker = await create_tracker_with_partially_saved_events(
         tracker_store
     )
@@ -589,9 +1161,9 @@ async def test_sql_additional_events(domain: Domain):
         )
 
 
-async def test_sql_additional_events_with_session_start(domain: Domain):
+async def test_sql_additional_events_with_session_start(domain: Domain, tmp_path: Path):
     sender = "test_sql_additional_events_with_session_start"
-    tracker_store = SQLTrackerStore(domain)
+    tracker_store = SQLTrackerStore(domain, db=str(tmp_path / "rasa.db"))
     tracker = await _saved_tracker_with_multiple_session_starts(tracker_store, sender)
 
     tracker.update(UserUttered("hi2"), domain)
@@ -604,6 +1176,168 @@ async def test_sql_additional_events_with_session_start(domain: Domain):
         assert isinstance(additional_events[0], UserUttered)
 
 
+async def test_sql_save_denormalises_latest_session_start(domain: Domain):
+    tracker_store = SQLTrackerStore(domain, host="sqlite:///")
+    sender_id = uuid.uuid4().hex
+    tracker = DialogueStateTracker.from_events(
+        sender_id,
+        [
+            UserUttered("hi", timestamp=1),
+            SessionStarted(timestamp=2),
+            UserUttered("hi again", timestamp=3),
+            SessionStarted(timestamp=4),
+        ],
+    )
+    await tracker_store.save(tracker)
+
+    with tracker_store.session_scope() as session:
+        conversation = session.get(tracker_store.SQLConversation, sender_id)
+        assert conversation.latest_session_start == 4
+
+        query = tracker_store._event_query(
+            session, sender_id, fetch_events_from_all_sessions=False
+        )
+        # the latest session start is known, hence no subquery is needed
+        assert "max" not in str(query.statement).lower()
+        assert [event.timestamp for event in query.all()] == [4]
+
+
+def test_sql_tracker_store_creates_sender_id_timestamp_index(domain: Domain):
+    tracker_store = SQLTrackerStore(domain, host="sqlite:///")
+
+    indices = {
+        index["name"]: index["column_names"]
+        for index in sqlalchemy.inspect(tracker_store.engine).get_indexes("events")
+    }
+
+    assert indices["ix_events_sender_id_timestamp"] == ["sender_id", "timestamp"]
+
+
+async def _save_turns(
+    tracker_store: TrackerStore, sender_id: Text, number_of_turns: int
+) -> None:
+    for turn in range(number_of_turns):
+        tracker = await tracker_store.retrieve(sender_id) or DialogueStateTracker(
+            sender_id, tracker_store.domain.slots
+        )
+        tracker.update_with_events(
+            [
+                ActionExecuted(ACTION_LISTEN_NAME, timestamp=turn * 10 + 1),
+                UserUttered("hi", {"name": "greet"}, timestamp=turn * 10 + 2),
+                SlotSet("name", str(turn), timestamp=turn * 10 + 3),
+                BotUttered("hey", timestamp=turn * 10 + 4),
+            ],
+            tracker_store.domain,
+        )
+        await tracker_store.save(tracker)
+
+
+async def test_sql_tracker_store_retrieves_events_since_snapshot(domain: Domain):
+    tracker_store = SQLTrackerStore(domain, host="sqlite:///", snapshot_interval=10)
+    sender_id = uuid.uuid4().hex
+    await _save_turns(tracker_store, sender_id, 20)
+
+    tracker = await tracker_store.retrieve(sender_id)
+    full_tracker = await tracker_store.retrieve_full_tracker(sender_id)
+
+    assert 10 <= len(tracker.events) < 20
+    assert len(full_tracker.events) == 80
+    assert tracker.get_slot("name") == "19"
+    assert tracker.current_state() == full_tracker.current_state()
+    assert tracker.persisted_event_count == len(tracker.events)
+    assert await tracker_store.number_of_existing_events(sender_id) == len(
+        tracker.events
+    )
+
+    # the state of the previous turn is restored from the snapshot after a revert
+    tracker.update(UserUtteranceReverted())
+    full_tracker.update(UserUtteranceReverted())
+    assert tracker.get_slot("name") == full_tracker.get_slot("name") == "18"
+
+
+async def test_sql_tracker_store_archive_events(domain: Domain):
+    tracker_store = SQLTrackerStore(domain, host="sqlite:///", snapshot_interval=10)
+    sender_ids = [uuid.uuid4().hex, uuid.uuid4().hex]
+    await _save_turns(tracker_store, sender_ids[0], 20)
+    await _save_turns(tracker_store, sender_ids[1], 2)
+
+    tracker = await tracker_store.retrieve(sender_ids[0])
+    number_of_archived_events = await tracker_store.archive_events()
+
+    assert number_of_archived_events == 80 - len(tracker.events)
+    assert await tracker_store.archive_events() == 0
+    with tracker_store.session_scope() as session:
+        assert session.query(tracker_store.SQLEvent).count() == len(
+            tracker.events
+        ) + len(list((await tracker_store.retrieve(sender_ids[1])).events))
+
+    assert list((await tracker_store.retrieve(sender_ids[0])).events) == list(
+        tracker.events
+    )
+    full_tracker = await tracker_store.retrieve_full_tracker(sender_ids[0])
+    assert len(full_tracker.events) == 80
+    assert [event.timestamp for event in full_tracker.events] == sorted(
+        event.timestamp for event in full_tracker.events
+    )
+    assert len((await tracker_store.retrieve_full_tracker(sender_ids[1])).events) == 8
+
+
+@pytest.fixture
+def async_sql_tracker_store(domain: Domain) -> AsyncSQLTrackerStore:
+    pytest.importorskip("aiosqlite")
+
+    return AsyncSQLTrackerStore(domain, host="sqlite:///")
+
+
+async def test_async_sql_tracker_store_save_and_retrieve(
+    async_sql_tracker_store: AsyncSQLTrackerStore,
+):
+    sender_id = uuid.uuid4().hex
+    events = [
+        UserUttered("Hola", {"name": "greet"}, timestamp=1),
+        BotUttered("Hi", timestamp=2),
+        SessionStarted(timestamp=3),
+        UserUttered("Ciao", {"name": "greet"}, timestamp=4),
+    ]
+    tracker = DialogueStateTracker.from_events(sender_id, events[:3])
+    await async_sql_tracker_store.save(tracker)
+
+    tracker = await async_sql_tracker_store.retrieve(sender_id)
+    assert list(tracker.events) == events[2:3]
+
+    tracker.update(events[3])
+    await async_sql_tracker_store.save(tracker)
+    await async_sql_tracker_store.save(tracker)
+
+    tracker = await async_sql_tracker_store.retrieve(sender_id)
+    assert list(tracker.events) == events[2:]
+    assert await async_sql_tracker_store.number_of_existing_events(sender_id) == 2
+
+    full_tracker = await async_sql_tracker_store.retrieve_full_tracker(sender_id)
+    assert list(full_tracker.events) == events
+
+    assert list(await async_sql_tracker_store.keys()) == [sender_id]
+
+
+def test_async_sql_tracker_store_adds_async_driver():
+    url = AsyncSQLTrackerStore.get_async_db_url("postgresql://user:pw@localhost/db")
+
+    assert url.drivername == "postgresql+asyncpg"
+    assert (
+        AsyncSQLTrackerStore.get_async_db_url("sqlite+pysqlite:///").drivername
+        == "sqlite+pysqlite"
+    )
+
+
+def test_create_async_sql_tracker_store_from_endpoint_config(domain: Domain):
+    pytest.importorskip("aiosqlite")
+    store = EndpointConfig(type="sql", url="sqlite:///", use_async_engine=True)
+
+    tracker_store = TrackerStore.create(store, domain)
+
+    assert isinstance(tracker_store, AsyncSQLTrackerStore)
+
+
 @pytest.mark.parametrize(
     "tracker_store_type,tracker_store_kwargs",
     [(MockedMongoTrackerStore, {}), (SQLTrackerStore, {"host": "sqlite:///"})],
@@ -699,10 +1433,178 @@ async def test_tracker_store_retrieve_with_events_from_previous_sessions(
     assert len(actual.events) == len(tracker.events)
 
 
+@pytest.mark.parametrize(
+    "tracker_store_type,tracker_store_kwargs",
+    [
+        (MockedMongoTrackerStore, {}),
+        (SQLTrackerStore, {"host": "sqlite:///"}),
+        (InMemoryTrackerStore, {}),
+    ],
+)
+async def test_tracker_store_save_does_not_reread_loaded_tracker(
+    tracker_store_type: Type[TrackerStore], tracker_store_kwargs: Dict
+):
+    tracker_store = tracker_store_type(Domain.empty(), **tracker_store_kwargs)
+    tracker_store.event_broker = Mock()
+
+    sender_id = uuid.uuid4().hex
+    await tracker_store.save(
+        DialogueStateTracker.from_events(sender_id, [UserUttered("hi")])
+    )
+    tracker_store.event_broker.reset_mock()
+
+    tracker = await tracker_store.retrieve(sender_id)
+    assert tracker.persisted_event_count == 1
+
+    tracker.update(BotUttered("hey"))
+
+    tracker_store.number_of_existing_events = AsyncMock()
+    await tracker_store.save(tracker)
+
+    tracker_store.number_of_existing_events.assert_not_called()
+    assert tracker.persisted_event_count == 2
+    tracker_store.event_broker.publish.assert_called_once()
+
+    actual = await tracker_store.retrieve(sender_id)
+    assert list(actual.events) == list(tracker.events)
+
+
+@pytest.mark.parametrize(
+    "tracker_store_type,tracker_store_kwargs",
+    [
+        (MockedMongoTrackerStore, {}),
+        (SQLTrackerStore, {"host": "sqlite:///"}),
+        (InMemoryTrackerStore, {}),
+    ],
+)
+async def test_tracker_store_save_new_events(
+    tracker_store_type: Type[TrackerStore], tracker_store_kwargs: Dict
+):
+    tracker_store = tracker_store_type(Domain.empty(), **tracker_store_kwargs)
+    tracker_store.event_broker = Mock()
+
+    sender_id = uuid.uuid4().hex
+    tracker = DialogueStateTracker.from_events(sender_id, [UserUttered("hi")])
+    await tracker_store.save(tracker)
+    tracker_store.event_broker.reset_mock()
+
+    new_events = [BotUttered("hey"), ActionExecuted(ACTION_LISTEN_NAME)]
+    await tracker_store.save_new_events(
+        sender_id, new_events, tracker.persisted_event_count
+    )
+
+    assert tracker_store.event_broker.publish.call_count == len(new_events)
+
+    actual = await tracker_store.retrieve(sender_id)
+    assert list(actual.events) == [*tracker.events, *new_events]
+
+
+async def _assert_retrieves_many_conversations(tracker_store: TrackerStore) -> None:
+    sender_ids = [uuid.uuid4().hex for _ in range(3)]
+    for sender_id in sender_ids:
+        await _saved_tracker_with_multiple_session_starts(tracker_store, sender_id)
+    requested = [sender_ids[2], "unknown", sender_ids[0], sender_ids[1]]
+
+    # trackers are returned in the requested order and unknown ones are skipped
+    trackers = [
+        tracker
+        async for tracker in tracker_store.retrieve_many(requested, batch_size=2)
+    ]
+    assert [tracker.sender_id for tracker in trackers] == [
+        sender_ids[2],
+        sender_ids[0],
+        sender_ids[1],
+    ]
+    # the batches contain the same events as the trackers which are retrieved one
+    # after another
+    for tracker in trackers:
+        expected = await tracker_store.retrieve(tracker.sender_id)
+        assert list(tracker.events) == list(expected.events)
+        assert tracker.persisted_event_count == expected.persisted_event_count
+
+    full_trackers = [
+        tracker
+        async for tracker in tracker_store.retrieve_full_trackers(
+            requested, batch_size=2
+        )
+    ]
+    assert [tracker.sender_id for tracker in full_trackers] == [
+        sender_ids[2],
+        sender_ids[0],
+        sender_ids[1],
+    ]
+    for tracker in full_trackers:
+        assert len(tracker.events) == 5
+        assert tracker.persisted_event_count == 5
+
+
+@pytest.mark.parametrize(
+    "tracker_store_type,tracker_store_kwargs",
+    [
+        (MockedMongoTrackerStore, {}),
+        (MockedAsyncMongoTrackerStore, {}),
+        (SQLTrackerStore, {"host": "sqlite:///"}),
+        (InMemoryTrackerStore, {}),
+    ],
+)
+async def test_tracker_store_retrieve_many(
+    tracker_store_type: Type[TrackerStore], tracker_store_kwargs: Dict
+):
+    tracker_store = tracker_store_type(Domain.empty(), **tracker_store_kwargs)
+
+    await _assert_retrieves_many_conversations(tracker_store)
+
+
+async def test_async_redis_tracker_store_retrieve_many(
+    async_redis_tracker_store: AsyncRedisTrackerStore,
+):
+    await _assert_retrieves_many_conversations(async_redis_tracker_store)
+
+
+async def test_dynamo_tracker_store_retrieve_many():
+    with mock_dynamodb2():
+        await _assert_retrieves_many_conversations(DynamoTrackerStore(test_domain))
+
+
+async def test_chunked_dynamo_tracker_store_retrieve_many(
+    chunked_dynamo_tracker_store: ChunkedDynamoTrackerStore,
+):
+    await _assert_retrieves_many_conversations(chunked_dynamo_tracker_store)
+
+
+async def test_fail_safe_tracker_store_retrieve_many_with_error():
+    tracker_store = Mock()
+    tracker_store._retrieve_batch = AsyncMock(side_effect=Exception())
+    on_tracker_store_error = Mock()
+    fail_safe_tracker_store = FailSafeTrackerStore(
+        tracker_store, on_tracker_store_error
+    )
+
+    trackers = [
+        tracker async for tracker in fail_safe_tracker_store.retrieve_many(["some-id"])
+    ]
+
+    assert trackers == []
+    on_tracker_store_error.assert_called_once()
+
+
+async def test_awaitable_tracker_store_save_new_events_with_non_async_store(
+    domain: Domain,
+):
+    tracker_store = AwaitableTrackerStore(NonAsyncTrackerStore(domain))
+    tracker_store._tracker_store.retrieve = Mock(return_value=None)
+    tracker_store._tracker_store.save = Mock()
+
+    await tracker_store.save_new_events("some-sender", [UserUttered("hi")], 0)
+
+    saved_tracker = tracker_store._tracker_store.save.call_args[0][0]
+    assert list(saved_tracker.events) == [UserUttered("hi")]
+
+
 def test_session_scope_error(
-    monkeypatch: MonkeyPatch, capsys: CaptureFixture, domain: Domain
+    monkeypatch: MonkeyPatch, capsys: CaptureFixture, domain: Domain, tmp_path: Path
 ):
-    tracker_store = SQLTrackerStore(domain)
+    tracker_store = SQLTrackerStore(domain, db=str(tmp_path / "rasa.db"))
     tracker_store.sessionmaker = Mock()
 
     requested_schema = uuid.uuid4().hex
@@ -976,3 +1878,50 @@ def test_create_awaitable_tracker_store_with_endpoint_config():
 
     assert isinstance(tracker_store, AwaitableTrackerStore)
     assert isinstance(tracker_store._tracker_store, NonAsyncTrackerStore)
+
+
+async def _assert_switching_to_binary_tracker_serialiser(
+    legacy_tracker_store: TrackerStore, tracker_store: TrackerStore
+) -> None:
+    # conversations which were stored as JSON before can still be read
+    await legacy_tracker_store.save(
+        DialogueStateTracker.from_events("some-sender", [UserUttered("hi")])
+    )
+
+    tracker = await tracker_store.retrieve("some-sender")
+    tracker.update(BotUttered("hey"))
+    await tracker_store.save(tracker)
+    await tracker_store.save_new_events(
+        "some-sender", [ActionExecuted(ACTION_LISTEN_NAME)], len(tracker.events)
+    )
+
+    actual = await tracker_store.retrieve("some-sender")
+    assert list(actual.events) == [
+        UserUttered("hi"),
+        BotUttered("hey"),
+        ActionExecuted(ACTION_LISTEN_NAME),
+    ]
+
+
+async def test_in_memory_tracker_store_with_binary_tracker_serialiser():
+    legacy_tracker_store = InMemoryTrackerStore(Domain.empty())
+    tracker_store = InMemoryTrackerStore(Domain.empty(), tracker_serialiser="msgpack")
+    tracker_store.store = legacy_tracker_store.store
+
+    await _assert_switching_to_binary_tracker_serialiser(
+        legacy_tracker_store, tracker_store
+    )
+    assert isinstance(tracker_store.store["some-sender"], bytes)
+
+
+async def test_redis_tracker_store_with_binary_tracker_serialiser():
+    import fakeredis
+
+    legacy_tracker_store = RedisTrackerStore(Domain.empty())
+    legacy_tracker_store.red = fakeredis.FakeStrictRedis()
+    tracker_store = RedisTrackerStore(Domain.empty(), tracker_serialiser="msgpack")
+    tracker_store.red = legacy_tracker_store.red
+
+    await _assert_switching_to_binary_tracker_serialiser(
+        legacy_tracker_store, tracker_store
+    )
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import time
 from pathlib import Path
 from typing import Dict, Optional, Text, Any, List
 
@@ -48,6 +49,34 @@ class SubtractByX(GraphComponent):
         return int(i) - self._x
 
 
+class MultiplyByX(GraphComponent):
+    @staticmethod
+    def get_default_config() -> Dict[Text, Any]:
+        return {"x": 1}
+
+    def __init__(self, x: int) -> None:
+        self._x = x
+        self.batch_sizes: List[int] = []
+
+    @classmethod
+    def create(
+        cls,
+        config: Dict,
+        model_storage: ModelStorage,
+        resource: Resource,
+        execution_context: ExecutionContext,
+        **kwargs: Any,
+    ) -> MultiplyByX:
+        return cls(config["x"])
+
+    def multiply_x(self, i: Any) -> int:
+        return int(i) * self._x
+
+    def multiply_x_for_batch(self, batch: List[Dict[Text, Any]]) -> List[int]:
+        self.batch_sizes.append(len(batch))
+        return [self.multiply_x(**kwargs) for kwargs in batch]
+
+
 class AssertComponent(GraphComponent):
     def __init__(self, value_to_assert: Any) -> None:
         self._value_to_assert = value_to_assert
@@ -104,6 +133,26 @@ class ProvideX(GraphComponent):
         return self.x
 
 
+class SleepAndProvideX(GraphComponent):
+    def __init__(self, config: Dict[Text, Any]) -> None:
+        self._seconds = config["seconds"]
+        self._x = config["x"]
+
+    @classmethod
+    def create(
+        cls,
+        config: Dict[Text, Any],
+        model_storage: ModelStorage,
+        resource: Resource,
+        execution_context: ExecutionContext,
+    ) -> SleepAndProvideX:
+        return cls(config)
+
+    def provide(self, **kwargs: Any) -> int:
+        time.sleep(self._seconds)
+        return self._x
+
+
 class FileReader(GraphComponent):
     def __init__(self, file_path: Path) -> None:
         self._file_path = file_path
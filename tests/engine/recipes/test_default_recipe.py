@@ -235,6 +235,29 @@ def test_language_returning():
     assert model_config.language == "xy"
 
 
+def test_predict_graph_config_returning():
+    config = rasa.shared.utils.io.read_yaml(
+        """
+    version: '2.0'
+
+    predict_graph:
+      max_workers: 4
+      node_timeout: 10
+
+    policies:
+    - name: RulePolicy
+    """
+    )
+
+    recipe = Recipe.recipe_for_name(DefaultV1Recipe.name)
+    model_config = recipe.graph_config_for_recipe(config, {})
+
+    assert model_config.predict_graph_config == {"max_workers": 4, "node_timeout": 10}
+
+    model_config = recipe.graph_config_for_recipe({"policies": config["policies"]}, {})
+    assert model_config.predict_graph_config == {}
+
+
 def test_tracker_generator_parameter_interpolation():
     config = rasa.shared.utils.io.read_yaml(
         """
@@ -0,0 +1,401 @@
+from __future__ import annotations
+
+import logging
+import time
+from typing import Any, Dict, Text
+
+import pytest
+from _pytest.logging import LogCaptureFixture
+
+from rasa.engine.exceptions import GraphComponentException, GraphRunError
+from rasa.engine.graph import ExecutionContext, GraphSchema, SchemaNode
+from rasa.engine.runner.compiled import (
+    MAX_WORKERS_KEY,
+    NODE_TIMEOUT_KEY,
+    CompiledGraphRunner,
+)
+from rasa.engine.storage.storage import ModelStorage
+from tests.engine.graph_components_test_classes import (
+    AddInputs,
+    AssertComponent,
+    MultiplyByX,
+    ProvideX,
+    SleepAndProvideX,
+    SubtractByX,
+)
+
+
+@pytest.fixture
+def graph_schema() -> GraphSchema:
+    return GraphSchema(
+        {
+            "add": SchemaNode(
+                needs={"i1": "first_input", "i2": "second_input"},
+                uses=AddInputs,
+                fn="add",
+                constructor_name="create",
+                config={},
+            ),
+            "subtract_2": SchemaNode(
+                needs={"i": "add"},
+                uses=SubtractByX,
+                fn="subtract_x",
+                constructor_name="create",
+                config={"x": 2},
+                is_target=True,
+            ),
+            "provide": SchemaNode(
+                needs={},
+                uses=ProvideX,
+                fn="provide",
+                constructor_name="create",
+                config={},
+                is_target=True,
+            ),
+            # This node will not fail as it will be pruned because it is not a target
+            # or a target's ancestor.
+            "assert_false": SchemaNode(
+                needs={"i": "first_input"},
+                uses=AssertComponent,
+                fn="run_assert",
+                constructor_name="create",
+                config={"value_to_assert": "some_value"},
+            ),
+        }
+    )
+
+
+@pytest.fixture
+def runner(
+    graph_schema: GraphSchema, default_model_storage: ModelStorage
+) -> CompiledGraphRunner:
+    return CompiledGraphRunner.create(
+        graph_schema=graph_schema,
+        model_storage=default_model_storage,
+        execution_context=ExecutionContext(graph_schema=graph_schema, model_id="1"),
+    )
+
+
+def test_multi_node_graph_run(runner: CompiledGraphRunner):
+    results = runner.run(inputs={"first_input": 3, "second_input": 4})
+    assert results == {"subtract_2": 5, "provide": 1}
+
+
+def test_target_override(runner: CompiledGraphRunner):
+    results = runner.run(inputs={"first_input": 3, "second_input": 4}, targets=["add"])
+    assert results == {"add": 7}
+
+
+def test_execution_plans_are_compiled_once(runner: CompiledGraphRunner):
+    # plans for all targets and for each single target are compiled upfront
+    assert set(runner._execution_plans.keys()) == {
+        ("subtract_2", "provide"),
+        ("subtract_2",),
+        ("provide",),
+    }
+    plan = runner._execution_plans[("subtract_2",)]
+    assert [node_name for node_name, _, _ in plan] == ["add", "subtract_2"]
+
+    runner.run(inputs={"first_input": 3, "second_input": 4}, targets=["subtract_2"])
+    assert runner._execution_plans[("subtract_2",)] is plan
+
+    runner.run(inputs={"first_input": 3, "second_input": 4}, targets=["add"])
+    assert [node_name for node_name, _, _ in runner._execution_plans[("add",)]] == [
+        "add"
+    ]
+
+
+def test_shared_ancestor_runs_once(default_model_storage: ModelStorage):
+    graph_schema = GraphSchema(
+        {
+            "add": SchemaNode(
+                needs={"i1": "first_input", "i2": "second_input"},
+                uses=AddInputs,
+                fn="add",
+                constructor_name="create",
+                config={},
+            ),
+            "subtract_1": SchemaNode(
+                needs={"i": "add"},
+                uses=SubtractByX,
+                fn="subtract_x",
+                constructor_name="create",
+                config={"x": 1},
+            ),
+            "subtract_2": SchemaNode(
+                needs={"i": "add"},
+                uses=SubtractByX,
+                fn="subtract_x",
+                constructor_name="create",
+                config={"x": 2},
+            ),
+            "add_differences": SchemaNode(
+                needs={"i1": "subtract_1", "i2": "subtract_2"},
+                uses=AddInputs,
+                fn="add",
+                constructor_name="create",
+                config={},
+                is_target=True,
+            ),
+        }
+    )
+    runner = CompiledGraphRunner(
+        graph_schema=graph_schema,
+        model_storage=default_model_storage,
+        execution_context=ExecutionContext(graph_schema=graph_schema, model_id="1"),
+    )
+
+    plan = runner._execution_plans[("add_differences",)]
+    assert [node_name for node_name, _, _ in plan] == [
+        "add",
+        "subtract_1",
+        "subtract_2",
+        "add_differences",
+    ]
+    assert runner.run(inputs={"first_input": 3, "second_input": 4}) == {
+        "add_differences": 11
+    }
+
+
+def test_input_name_is_node_name(runner: CompiledGraphRunner):
+    with pytest.raises(GraphRunError):
+        runner.run(inputs={"provide": 5})
+
+
+def test_missing_input(runner: CompiledGraphRunner):
+    with pytest.raises(GraphRunError):
+        runner.run(inputs={"first_input": 3})
+
+
+def test_component_error_is_raised(runner: CompiledGraphRunner):
+    with pytest.raises(GraphComponentException):
+        runner.run(
+            inputs={"first_input": 3, "second_input": 4}, targets=["assert_false"]
+        )
+
+
+@pytest.fixture
+def graph_schema_with_independent_nodes() -> GraphSchema:
+    nodes = {
+        f"provide_{i}": SchemaNode(
+            needs={},
+            uses=SleepAndProvideX,
+            fn="provide",
+            constructor_name="create",
+            config={"seconds": 0.2, "x": i},
+            eager=True,
+        )
+        for i in range(4)
+    }
+    nodes["add_0_1"] = SchemaNode(
+        needs={"i1": "provide_0", "i2": "provide_1"},
+        uses=AddInputs,
+        fn="add",
+        constructor_name="create",
+        config={},
+        eager=True,
+    )
+    nodes["add_2_3"] = SchemaNode(
+        needs={"i1": "provide_2", "i2": "provide_3"},
+        uses=AddInputs,
+        fn="add",
+        constructor_name="create",
+        config={},
+        eager=True,
+    )
+    nodes["add_all"] = SchemaNode(
+        needs={"i1": "add_0_1", "i2": "add_2_3"},
+        uses=AddInputs,
+        fn="add",
+        constructor_name="create",
+        config={},
+        eager=True,
+        is_target=True,
+    )
+    return GraphSchema(nodes)
+
+
+def test_independent_nodes_run_concurrently(
+    graph_schema_with_independent_nodes: GraphSchema,
+    default_model_storage: ModelStorage,
+):
+    graph_schema = graph_schema_with_independent_nodes
+    runner = CompiledGraphRunner.create(
+        graph_schema=graph_schema,
+        model_storage=default_model_storage,
+        execution_context=ExecutionContext(graph_schema=graph_schema, model_id="1"),
+        config={MAX_WORKERS_KEY: 4},
+    )
+
+    start = time.perf_counter()
+    results = runner.run()
+    duration = time.perf_counter() - start
+
+    assert results == {"add_all": 0 + 1 + 2 + 3}
+    # the nodes would take 0.8 seconds when running one after another
+    assert duration < 0.6
+
+
+def test_node_timeout(
+    graph_schema_with_independent_nodes: GraphSchema,
+    default_model_storage: ModelStorage,
+):
+    graph_schema = graph_schema_with_independent_nodes
+    runner = CompiledGraphRunner.create(
+        graph_schema=graph_schema,
+        model_storage=default_model_storage,
+        execution_context=ExecutionContext(graph_schema=graph_schema, model_id="1"),
+        config={NODE_TIMEOUT_KEY: 0.05},
+    )
+
+    with pytest.raises(GraphRunError, match="provide_0"):
+        runner.run()
+
+
+def test_nodes_which_timed_out_do_not_block_workers(
+    default_model_storage: ModelStorage, caplog: LogCaptureFixture
+):
+    graph_schema = GraphSchema(
+        {
+            "sleep": SchemaNode(
+                needs={},
+                uses=SleepAndProvideX,
+                fn="provide",
+                constructor_name="create",
+                config={"seconds": 1, "x": 1},
+                eager=True,
+            ),
+            "provide": SchemaNode(
+                needs={},
+                uses=ProvideX,
+                fn="provide",
+                constructor_name="create",
+                config={},
+                eager=True,
+            ),
+        }
+    )
+    runner = CompiledGraphRunner.create(
+        graph_schema=graph_schema,
+        model_storage=default_model_storage,
+        execution_context=ExecutionContext(graph_schema=graph_schema, model_id="1"),
+        config={MAX_WORKERS_KEY: 2, NODE_TIMEOUT_KEY: 0.1},
+    )
+
+    with caplog.at_level(logging.WARNING):
+        for _ in range(2):
+            with pytest.raises(GraphRunError, match="sleep"):
+                runner.run(targets=["sleep"])
+
+    assert "2 graph node(s)" in caplog.text
+    # both nodes which timed out are still sleeping
+    assert runner.run(targets=["provide"]) == {"provide": 1}
+
+
+@pytest.mark.parametrize("config", [{MAX_WORKERS_KEY: 2}, {NODE_TIMEOUT_KEY: 10}])
+def test_run_concurrently(
+    graph_schema: GraphSchema,
+    default_model_storage: ModelStorage,
+    config: Dict[Text, Any],
+):
+    runner = CompiledGraphRunner.create(
+        graph_schema=graph_schema,
+        model_storage=default_model_storage,
+        execution_context=ExecutionContext(graph_schema=graph_schema, model_id="1"),
+        config=config,
+    )
+
+    results = runner.run(inputs={"first_input": 3, "second_input": 4})
+    assert list(results.items()) == [("subtract_2", 5), ("provide", 1)]
+
+    with pytest.raises(GraphComponentException):
+        runner.run(
+            inputs={"first_input": 3, "second_input": 4}, targets=["assert_false"]
+        )
+
+    with pytest.raises(GraphRunError):
+        runner.run(inputs={"first_input": 3})
+
+
+def test_run_batch(runner: CompiledGraphRunner):
+    inputs = [{"first_input": i, "second_input": 4} for i in range(3)]
+
+    results = runner.run_batch(inputs)
+
+    assert results == [runner.run(inputs=item_inputs) for item_inputs in inputs]
+    assert runner.run_batch(inputs, targets=["add"]) == [
+        {"add": 4},
+        {"add": 5},
+        {"add": 6},
+    ]
+    assert runner.run_batch([]) == []
+
+
+def test_run_batch_calls_batch_methods_once(default_model_storage: ModelStorage):
+    graph_schema = GraphSchema(
+        {
+            "provide": SchemaNode(
+                needs={},
+                uses=ProvideX,
+                fn="provide",
+                constructor_name="create",
+                config={},
+            ),
+            "add": SchemaNode(
+                needs={"i1": "first_input", "i2": "provide"},
+                uses=AddInputs,
+                fn="add",
+                constructor_name="create",
+                config={},
+            ),
+            "multiply": SchemaNode(
+                needs={"i": "add"},
+                uses=MultiplyByX,
+                fn="multiply_x",
+                constructor_name="create",
+                config={"x": 3},
+                eager=True,
+                is_target=True,
+            ),
+            "multiply_provided": SchemaNode(
+                needs={"i": "provide"},
+                uses=MultiplyByX,
+                fn="multiply_x",
+                constructor_name="create",
+                config={"x": 2},
+                eager=True,
+                is_target=True,
+            ),
+        }
+    )
+    runner = CompiledGraphRunner(
+        graph_schema=graph_schema,
+        model_storage=default_model_storage,
+        execution_context=ExecutionContext(graph_schema=graph_schema, model_id="1"),
+    )
+
+    results = runner.run_batch([{"first_input": i} for i in range(4)])
+
+    assert results == [
+        {"multiply": 3, "multiply_provided": 2},
+        {"multiply": 6, "multiply_provided": 2},
+        {"multiply": 9, "multiply_provided": 2},
+        {"multiply": 12, "multiply_provided": 2},
+    ]
+    # nodes which depend on the inputs run once for all of them
+    assert runner._instantiated_nodes["multiply"]._component.batch_sizes == [4]
+    # nodes which don't depend on the inputs run once and share their output
+    assert runner._instantiated_nodes["multiply_provided"]._component.batch_sizes == []
+
+
+def test_run_batch_with_invalid_inputs(runner: CompiledGraphRunner):
+    with pytest.raises(GraphRunError):
+        runner.run_batch([{"first_input": 3, "second_input": 4}, {"provide": 5}])
+
+    with pytest.raises(GraphRunError):
+        runner.run_batch([{"first_input": 3, "second_input": 4}, {"first_input": 3}])
+
+    with pytest.raises(GraphComponentException):
+        runner.run_batch(
+            [{"first_input": 3, "second_input": 4}], targets=["assert_false"]
+        )
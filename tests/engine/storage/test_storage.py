@@ -59,6 +59,7 @@ def test_metadata_serialization(domain: Domain, tmp_path: Path):
         core_target="core",
         nlu_target="nlu",
         language="zh",
+        predict_graph_config={"max_workers": 4},
     )
 
     serialized = metadata.as_dict()
@@ -81,6 +82,12 @@ def test_metadata_serialization(domain: Domain, tmp_path: Path):
     assert loaded_metadata.core_target == "core"
     assert loaded_metadata.nlu_target == "nlu"
     assert loaded_metadata.language == "zh"
+    assert loaded_metadata.predict_graph_config == {"max_workers": 4}
+
+    # models trained with older versions don't have a `predict_graph_config`
+    serialized = metadata.as_dict()
+    del serialized["predict_graph_config"]
+    assert ModelMetadata.from_dict(serialized).predict_graph_config == {}
 
 
 def test_metadata_version_check():
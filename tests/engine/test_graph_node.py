@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import Any, Dict, Optional, Text
+from typing import Any, Dict, List, Optional, Text
 from unittest.mock import Mock
 
 import pytest
@@ -14,6 +14,7 @@ from rasa.engine.storage.resource import Resource
 from tests.engine.graph_components_test_classes import (
     AddInputs,
     ExecutionContextAware,
+    MultiplyByX,
     ProvideX,
     SubtractByX,
     PersistableTestComponent,
@@ -125,6 +126,54 @@ def test_eager_and_not_eager(eager: bool, default_model_storage: ModelStorage):
     assert run_mock.called
 
 
+@pytest.mark.parametrize("eager, batch_sizes", [(True, [3]), (False, [])])
+def test_run_batch(
+    eager: bool, batch_sizes: List[int], default_model_storage: ModelStorage
+):
+    node = GraphNode(
+        node_name="multiply",
+        component_class=MultiplyByX,
+        constructor_name="create",
+        component_config={"x": 2},
+        fn_name="multiply_x",
+        inputs={"i": "input_node"},
+        eager=eager,
+        model_storage=default_model_storage,
+        resource=None,
+        execution_context=ExecutionContext(GraphSchema({}), "1"),
+    )
+
+    results = node.run_batch([(("input_node", i),) for i in range(3)])
+
+    assert results == [0, 2, 4]
+    # components which aren't eager are loaded and run for every item on their own
+    assert node._component.batch_sizes == batch_sizes
+
+
+def test_run_batch_without_batch_method(default_model_storage: ModelStorage):
+    node = GraphNode(
+        node_name="add_node",
+        component_class=AddInputs,
+        constructor_name="create",
+        component_config={},
+        fn_name="add",
+        inputs={"i1": "input_node1", "i2": "input_node2"},
+        eager=True,
+        model_storage=default_model_storage,
+        resource=None,
+        execution_context=ExecutionContext(GraphSchema({}), "1"),
+    )
+
+    results = node.run_batch(
+        [
+            (("input_node1", 3), ("input_node2", 4)),
+            (("input_node1", 1), ("input_node2", 1)),
+        ]
+    )
+
+    assert results == [7, 2]
+
+
 def test_non_eager_can_use_inputs_for_constructor(default_model_storage: ModelStorage):
     node = GraphNode(
         node_name="provide",
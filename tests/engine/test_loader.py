@@ -1,14 +1,18 @@
 from datetime import datetime
 from pathlib import Path
+from typing import Type
 
 from _pytest.tmpdir import TempPathFactory
 import freezegun
+import pytest
 
 import rasa
 from rasa.engine.caching import TrainingCache
 from rasa.engine.graph import GraphModelConfiguration, GraphSchema, SchemaNode
 from rasa.engine import loader
+from rasa.engine.runner.compiled import CompiledGraphRunner
 from rasa.engine.runner.dask import DaskGraphRunner
+from rasa.engine.runner.interface import GraphRunner
 from rasa.engine.storage.local_model_storage import LocalModelStorage
 from rasa.engine.storage.resource import Resource
 from rasa.engine.storage.storage import ModelMetadata, ModelStorage
@@ -19,7 +23,11 @@ from rasa.shared.importers.importer import TrainingDataImporter
 from tests.engine.graph_components_test_classes import PersistableTestComponent
 
 
+@pytest.mark.parametrize(
+    "predict_graph_runner_class", [DaskGraphRunner, CompiledGraphRunner]
+)
 def test_loader_loads_graph_runner(
+    predict_graph_runner_class: Type[GraphRunner],
     default_model_storage: ModelStorage,
     temp_cache: TrainingCache,
     tmp_path: Path,
@@ -97,9 +105,10 @@ def test_loader_loads_graph_runner(
         storage_path=loaded_model_storage_path,
         model_archive_path=output_filename,
         model_storage_class=LocalModelStorage,
-        graph_runner_class=DaskGraphRunner,
+        graph_runner_class=predict_graph_runner_class,
     )
 
+    assert isinstance(loaded_predict_graph_runner, predict_graph_runner_class)
     assert loaded_predict_graph_runner.run() == {"load": test_value}
 
     assert model_metadata.predict_schema == predict_schema
@@ -0,0 +1,13 @@
+from rasa.core.brokers.kafka import AsyncKafkaEventBroker
+from .conftest import KAFKA_HOST, KAFKA_PORT
+
+
+async def test_async_kafka_event_broker_connect():
+    broker = AsyncKafkaEventBroker(
+        f"{KAFKA_HOST}:{KAFKA_PORT}", security_protocol="PLAINTEXT"
+    )
+    try:
+        await broker.connect()
+        assert broker.is_ready()
+    finally:
+        await broker.close()
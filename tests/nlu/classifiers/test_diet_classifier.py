@@ -547,6 +547,56 @@ async def test_process_unfeaturized_input(
     assert not classified_message.get(ENTITIES)
 
 
+@pytest.mark.timeout(120, func_only=True)
+async def test_process_batch_of_messages(
+    create_diet: Callable[..., DIETClassifier],
+    train_and_preprocess: Callable[..., Tuple[TrainingData, List[GraphComponent]]],
+    process_message: Callable[..., Message],
+    default_execution_context: ExecutionContext,
+):
+    default_execution_context.should_add_diagnostic_data = True
+    default_execution_context.node_name = "DIETClassifier_node_name"
+    pipeline = [
+        {"component": WhitespaceTokenizer},
+        {"component": CountVectorsFeaturizer},
+    ]
+    training_data, loaded_pipeline = train_and_preprocess(
+        pipeline, "data/test/demo-rasa-composite-entities.yml"
+    )
+    diet = create_diet({EPOCHS: 1, RANDOM_SEED: 42})
+    diet.train(training_data=training_data)
+
+    texts = [
+        "I am looking for an italian restaurant",
+        "hi",
+        "show me a mexican place in the centre of berlin please",
+    ]
+    messages = [
+        process_message(loaded_pipeline, Message(data={TEXT: text})) for text in texts
+    ]
+    # messages without features are skipped
+    messages.insert(1, Message(data={TEXT: "unfeaturized"}))
+    single_messages = copy.deepcopy(messages)
+
+    batch_results = diet.process(messages)
+    single_results = [diet.process([message])[0] for message in single_messages]
+
+    assert not batch_results[1].get(INTENT)[INTENT_NAME_KEY]
+    for batch_result, single_result in zip(batch_results, single_results):
+        assert batch_result.get(INTENT) == pytest.approx(single_result.get(INTENT))
+        batch_entities = batch_result.get(ENTITIES)
+        single_entities = single_result.get(ENTITIES)
+        assert len(batch_entities) == len(single_entities)
+        for batch_entity, single_entity in zip(batch_entities, single_entities):
+            assert batch_entity == pytest.approx(single_entity)
+
+        if batch_result.get(DIAGNOSTIC_DATA):
+            batch_data = batch_result.get(DIAGNOSTIC_DATA)["DIETClassifier_node_name"]
+            single_data = single_result.get(DIAGNOSTIC_DATA)["DIETClassifier_node_name"]
+            for name in ["attention_weights", "text_transformed"]:
+                assert np.allclose(batch_data[name], single_data[name], atol=1e-5)
+
+
 async def test_train_model_not_checkpointing(
     default_model_storage: ModelStorage,
     default_diet_resource: Resource,
@@ -14,6 +14,7 @@ from rasa.nlu.constants import TOKENS_NAMES, SPACY_DOCS
 from rasa.nlu.utils.spacy_utils import SpacyModel
 from rasa.shared.nlu.constants import TEXT, INTENT, RESPONSE, ACTION_TEXT, ACTION_NAME
 from rasa.nlu.tokenizers.tokenizer import Token
+from rasa.shared.exceptions import InvalidConfigException
 from rasa.shared.nlu.training_data.training_data import TrainingData
 from rasa.shared.nlu.training_data.message import Message
 from rasa.nlu.featurizers.sparse_featurizer.count_vectors_featurizer import (
@@ -415,6 +416,58 @@ def test_count_vector_featurizer_char(
     assert sen_vec is not None
 
 
+@pytest.mark.parametrize(
+    "config",
+    [
+        {},
+        {"max_ngram": 2},
+        {"analyzer": "char_wb", "min_ngram": 1, "max_ngram": 3},
+        {"analyzer": "char", "min_ngram": 1, "max_ngram": 2},
+        {"OOV_token": "oov", "use_shared_vocab": True},
+        {"analyzer": "char_wb", "max_ngram": 3, "use_hashing": True},
+    ],
+)
+def test_count_vector_featurizer_process_batch(
+    config: Dict[Text, Any],
+    create_featurizer: Callable[..., CountVectorsFeaturizer],
+    whitespace_tokenizer: WhitespaceTokenizer,
+):
+    ftr = create_featurizer(config)
+
+    train_messages = [
+        Message(data={TEXT: "hello there oov", INTENT: "greet"}),
+        Message(data={TEXT: "what is the weather in Berlin", INTENT: "ask_weather"}),
+        Message(data={TEXT: "bye 42 bye", INTENT: "bye", RESPONSE: "see you"}),
+        Message(data={ACTION_NAME: "utter_greet"}),
+    ]
+    whitespace_tokenizer.process_training_data(TrainingData(train_messages))
+    ftr.train(TrainingData(train_messages))
+
+    def test_messages() -> List[Message]:
+        messages = [
+            Message(data={TEXT: "hello hello there"}),
+            Message(data={TEXT: "weather in Paris 7", RESPONSE: "see you later"}),
+            Message(data={ACTION_NAME: "utter_greet"}),
+            Message(data={TEXT: "bye", INTENT: "bye"}),
+        ]
+        whitespace_tokenizer.process(messages)
+        return messages
+
+    batch = ftr.process(test_messages())
+    one_by_one = [ftr.process([message])[0] for message in test_messages()]
+
+    for batch_message, message in zip(batch, one_by_one):
+        assert len(batch_message.features) == len(message.features)
+        for batch_features, features in zip(batch_message.features, message.features):
+            assert batch_features.type == features.type
+            assert batch_features.attribute == features.attribute
+            assert isinstance(batch_features.features, scipy.sparse.coo_matrix)
+            assert batch_features.features.shape == features.features.shape
+            assert np.all(
+                batch_features.features.toarray() == features.features.toarray()
+            )
+
+
 def test_count_vector_featurizer_persist_load(
     create_featurizer: Callable[..., CountVectorsFeaturizer],
     load_featurizer: Callable[..., CountVectorsFeaturizer],
@@ -806,3 +859,84 @@ def test_use_shared_vocab_exception(
         )
     else:
         new_cvf.train(data)
+
+
+@pytest.mark.parametrize(
+    "config",
+    [
+        {"use_hashing": True, "number_of_hashed_features": 64},
+        {
+            "use_hashing": True,
+            "number_of_hashed_features": 256,
+            "analyzer": "char_wb",
+            "max_ngram": 4,
+        },
+    ],
+)
+def test_count_vector_featurizer_hashing(
+    config: Dict[Text, Any],
+    create_featurizer: Callable[..., CountVectorsFeaturizer],
+    load_featurizer: Callable[..., CountVectorsFeaturizer],
+    whitespace_tokenizer: WhitespaceTokenizer,
+):
+    train_ftr = create_featurizer(config)
+    train_message = Message(data={TEXT: "hello there hello", INTENT: "greet"})
+    whitespace_tokenizer.process([train_message])
+    train_ftr.train(TrainingData([train_message]))
+    train_ftr.process([train_message])
+
+    seq_vec, sen_vec = train_message.get_sparse_features(TEXT, [])
+    assert seq_vec.features.shape == (3, config["number_of_hashed_features"])
+    assert sen_vec.features.shape == (1, config["number_of_hashed_features"])
+    assert np.all(sen_vec.features.toarray() == seq_vec.features.toarray().sum(axis=0))
+    if config.get("analyzer", "word") == "word":
+        # labels still have a vocabulary
+        intent_seq_vec, _ = train_message.get_sparse_features(INTENT, [])
+        assert intent_seq_vec.features.shape == (1, 1)
+
+    test_ftr = load_featurizer(config)
+    # unseen tokens are featurized as well
+    test_message = Message(data={TEXT: "hello there hello Berlin"})
+    whitespace_tokenizer.process([test_message])
+    test_ftr.process([test_message])
+
+    test_seq_vec, test_sen_vec = test_message.get_sparse_features(TEXT, [])
+    assert np.all(test_seq_vec.features.toarray()[:3] == seq_vec.features.toarray())
+    assert test_seq_vec.features.toarray()[3].any()
+    assert test_sen_vec.features.shape == (1, config["number_of_hashed_features"])
+
+
+def test_cvf_incremental_training_with_hashing(
+    create_featurizer: Callable[..., CountVectorsFeaturizer],
+    load_featurizer: Callable[..., CountVectorsFeaturizer],
+    whitespace_tokenizer: WhitespaceTokenizer,
+):
+    config = {"use_hashing": True, "number_of_hashed_features": 32}
+    initial_cvf = create_featurizer(config)
+    train_message = Message(data={TEXT: "am I the coolest person?"})
+    data = TrainingData([train_message])
+    whitespace_tokenizer.process_training_data(data)
+    initial_cvf.train(data)
+    initial_cvf.process_training_data(data)
+
+    new_cvf = load_featurizer(config, is_finetuning=True)
+    additional_train_message = Message(data={TEXT: "yes, I am the coolest rasa"})
+    data = TrainingData(
+        [Message(data={TEXT: "am I the coolest person?"}), additional_train_message]
+    )
+    whitespace_tokenizer.process_training_data(data)
+    new_cvf.train(data)
+    new_cvf.process_training_data(data)
+
+    # new tokens don't change the features of previously seen tokens
+    initial_seq_vec, _ = train_message.get_sparse_features(TEXT, [])
+    seq_vec, _ = data.training_examples[0].get_sparse_features(TEXT, [])
+    assert seq_vec.features.shape == (5, 32)
+    assert np.all(seq_vec.features.toarray() == initial_seq_vec.features.toarray())
+
+
+def test_use_hashing_with_shared_vocab_exception(
+    create_featurizer: Callable[..., CountVectorsFeaturizer]
+):
+    with pytest.raises(InvalidConfigException):
+        create_featurizer({"use_hashing": True, "use_shared_vocab": True})
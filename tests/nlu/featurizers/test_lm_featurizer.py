@@ -1,4 +1,6 @@
 import os
+from pathlib import Path
+from types import SimpleNamespace
 from typing import Text, List, Dict, Tuple, Any, Callable
 
 import numpy as np
@@ -18,6 +20,7 @@ from rasa.shared.nlu.training_data.message import Message
 from rasa.nlu.featurizers.dense_featurizer.lm_featurizer import LanguageModelFeaturizer
 from rasa.shared.nlu.constants import TEXT, INTENT
 from rasa.nlu.tokenizers.tokenizer import Token
+from rasa.shared.exceptions import InvalidConfigException
 
 
 @pytest.fixture
@@ -791,3 +794,160 @@ def test_lm_featurizer_correctly_handle_whitespace_token(
     result, _ = lm_featurizer._tokenize_example(message, TEXT)
 
     assert [(token.text, token.start) for token in result] == expected_feature_tokens
+
+
+def _fake_lm_tokenize(
+    _: LanguageModelFeaturizer, text: Text
+) -> Tuple[List[int], List[Text]]:
+    # every character is a sub-token
+    return [ord(character) for character in text], list(text)
+
+
+def _fake_model_loader(
+    weights: List[np.ndarray],
+) -> Callable[[LanguageModelFeaturizer], None]:
+    def load_model_instance(featurizer: LanguageModelFeaturizer) -> None:
+        featurizer.pad_token_id = 0
+        featurizer.model = SimpleNamespace(weights=weights)
+
+    return load_model_instance
+
+
+@pytest.fixture
+def fake_language_model(monkeypatch: MonkeyPatch) -> List[Tuple[int, int]]:
+    """Replaces the language model and records the shapes of its inputs."""
+    input_shapes = []
+
+    def compute_batch_sequence_features(
+        _: LanguageModelFeaturizer,
+        batch_attention_mask: np.ndarray,
+        padded_token_ids: List[List[int]],
+    ) -> np.ndarray:
+        input_shapes.append(batch_attention_mask.shape)
+        token_ids = np.array(padded_token_ids, dtype=np.float32) * batch_attention_mask
+        # features which depend on the preceding tokens, but not on the padding
+        return np.stack([token_ids, np.cumsum(token_ids, axis=-1)], axis=-1)
+
+    monkeypatch.setattr(
+        LanguageModelFeaturizer,
+        "_load_model_instance",
+        _fake_model_loader(weights=[np.ones((2, 2))]),
+    )
+    monkeypatch.setattr(LanguageModelFeaturizer, "_lm_tokenize", _fake_lm_tokenize)
+    monkeypatch.setattr(
+        LanguageModelFeaturizer,
+        "_compute_batch_sequence_features",
+        compute_batch_sequence_features,
+    )
+    return input_shapes
+
+
+def _tokenized_messages(
+    texts: List[Text], whitespace_tokenizer: WhitespaceTokenizer
+) -> List[Message]:
+    messages = [Message.build(text=text) for text in texts]
+    whitespace_tokenizer.process(messages)
+    return messages
+
+
+def test_process_passes_messages_of_similar_length_together(
+    fake_language_model: List[Tuple[int, int]],
+    create_language_model_featurizer: Callable[
+        [Dict[Text, Any]], LanguageModelFeaturizer
+    ],
+    whitespace_tokenizer: WhitespaceTokenizer,
+):
+    texts = ["a", "hello there", "hi", "how are you doing", "hey you", "good day"]
+    one_by_one = _tokenized_messages(texts, whitespace_tokenizer)
+    create_language_model_featurizer({"batch_size": 1}).process(one_by_one)
+    fake_language_model.clear()
+
+    messages = _tokenized_messages(texts, whitespace_tokenizer)
+    featurizer = create_language_model_featurizer(
+        {"batch_size": 3, "max_tokens_per_batch": 30}
+    )
+    featurizer.process(messages)
+
+    # the sequences have two special tokens, and are padded to the longest one
+    assert fake_language_model == [(3, 8), (2, 12), (1, 16)]
+    for message, expected in zip(messages, one_by_one):
+        for features, expected_features in zip(
+            message.get_dense_features(TEXT), expected.get_dense_features(TEXT)
+        ):
+            assert np.array_equal(features.features, expected_features.features)
+
+
+def test_process_training_data_with_embedding_cache(
+    fake_language_model: List[Tuple[int, int]],
+    create_language_model_featurizer: Callable[
+        [Dict[Text, Any]], LanguageModelFeaturizer
+    ],
+    whitespace_tokenizer: WhitespaceTokenizer,
+    tmp_path: Path,
+):
+    config = {"embedding_cache_dir": str(tmp_path)}
+    texts = ["hello there", "hi", "how are you doing"]
+    cached_messages = _tokenized_messages(texts, whitespace_tokenizer)
+    create_language_model_featurizer(config).process_training_data(
+        TrainingData(cached_messages)
+    )
+    fake_language_model.clear()
+
+    messages = _tokenized_messages(texts + ["good day"], whitespace_tokenizer)
+    create_language_model_featurizer(config).process_training_data(
+        TrainingData(messages)
+    )
+
+    # only the new message is passed to the language model
+    assert fake_language_model == [(1, 9)]
+    for message, expected in zip(messages, cached_messages):
+        for features, expected_features in zip(
+            message.get_dense_features(TEXT), expected.get_dense_features(TEXT)
+        ):
+            assert np.array_equal(features.features, expected_features.features)
+    assert all(message.get_dense_features(TEXT) != (None, None) for message in messages)
+
+
+def test_embedding_cache_with_changed_model_weights(
+    fake_language_model: List[Tuple[int, int]],
+    create_language_model_featurizer: Callable[
+        [Dict[Text, Any]], LanguageModelFeaturizer
+    ],
+    whitespace_tokenizer: WhitespaceTokenizer,
+    tmp_path: Path,
+    monkeypatch: MonkeyPatch,
+):
+    config = {"embedding_cache_dir": str(tmp_path)}
+    texts = ["hello there", "hi"]
+    create_language_model_featurizer(config).process_training_data(
+        TrainingData(_tokenized_messages(texts, whitespace_tokenizer))
+    )
+    fake_language_model.clear()
+
+    # e.g. a new revision of the weights was published under the same name
+    monkeypatch.setattr(
+        LanguageModelFeaturizer,
+        "_load_model_instance",
+        _fake_model_loader(weights=[np.zeros((2, 2))]),
+    )
+    create_language_model_featurizer(config).process_training_data(
+        TrainingData(_tokenized_messages(texts, whitespace_tokenizer))
+    )
+
+    assert fake_language_model == [(2, 12)]
+
+
+@pytest.mark.parametrize(
+    "config",
+    [{"batch_size": 0}, {"max_tokens_per_batch": 0}],
+)
+def test_invalid_batch_config(
+    config: Dict[Text, Any],
+    create_language_model_featurizer: Callable[
+        [Dict[Text, Any]], LanguageModelFeaturizer
+    ],
+    monkeypatch: MonkeyPatch,
+):
+    monkeypatch.setattr(LanguageModelFeaturizer, "_load_model_instance", lambda _: None)
+    with pytest.raises(InvalidConfigException):
+        create_language_model_featurizer(config)
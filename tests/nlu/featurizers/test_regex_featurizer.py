@@ -311,6 +311,36 @@ def test_regex_featurizer_no_sequence(
     )
 
 
+def test_regex_featurizer_overlapping_matches(
+    create_featurizer: Callable[..., RegexFeaturizer],
+    whitespace_tokenizer: WhitespaceTokenizer,
+):
+    patterns = [
+        {"pattern": "a", "name": "a"},
+        {"pattern": "a b", "name": "span"},
+        # patterns can share names, the last one sets the patterns of the tokens
+        {"pattern": "c+", "name": "a"},
+    ]
+    ftr = create_featurizer(known_patterns=patterns)
+
+    message = Message(data={TEXT: "aaa bab ccc"})
+    whitespace_tokenizer.process([message])
+
+    sequence_features, sentence_features = ftr._features_for_patterns(message, TEXT)
+
+    # tokens which overlap with several matches of a pattern are marked once
+    assert np.all(
+        sequence_features.toarray()
+        == [[1.0, 1.0, 0.0], [1.0, 1.0, 0.0], [0.0, 0.0, 1.0]]
+    )
+    assert np.all(sentence_features.toarray() == [[1.0, 1.0, 1.0]])
+    assert [token.get("pattern") for token in message.get(TOKENS_NAMES[TEXT])] == [
+        {"a": False, "span": True},
+        {"a": False, "span": True},
+        {"a": True, "span": False},
+    ]
+
+
 def test_regex_featurizer_train(
     create_featurizer: Callable[..., RegexFeaturizer],
     whitespace_tokenizer: WhitespaceTokenizer,
@@ -1,4 +1,5 @@
-from typing import Dict, List, Text
+import re
+from typing import Dict, List, Optional, Text, Tuple
 
 import pytest
 
@@ -218,3 +219,44 @@ def test_regex_validation(
     assert "Model training failed." in str(e.value)
     assert "not a valid regex." in str(e.value)
     assert "Please update your nlu training data configuration" in str(e.value)
+
+
+@pytest.mark.parametrize(
+    "pattern, expected",
+    [
+        ("(\\bMax\\b|\\bJohn\\b)", (["Max", "John"], True)),
+        ("(Max|John)", (["Max", "John"], False)),
+        ("(\\bclub\\?mate\\b|\\bmapo\\ tofu\\b)", (["club?mate", "mapo tofu"], True)),
+        ("(\\bMax\\b|[0-9]+)", None),
+        ("(\\bMax\\b)|(\\bJohn\\b)", None),
+        ("[0-9]{5}", None),
+    ],
+)
+def test_lookup_table_elements(pattern: Text, expected: Optional[Tuple]):
+    assert pattern_utils._lookup_table_elements(pattern) == expected
+
+
+@pytest.mark.parametrize("use_word_boundaries", [True, False])
+@pytest.mark.parametrize("case_sensitive", [True, False])
+def test_pattern_matcher_matches_like_re(
+    use_word_boundaries: bool, case_sensitive: bool
+):
+    training_data = TrainingData(
+        regex_features=[{"name": "number", "pattern": "[0-9]+"}],
+        lookup_tables=[
+            {"name": "drink", "elements": ["tea", "Tea", "ice tea", "club?mate"]},
+            {"name": "food", "elements": ["tofu", "mapo tofu", "Straße", "ICE"]},
+        ],
+    )
+    patterns = pattern_utils.extract_patterns(
+        training_data, use_word_boundaries=use_word_boundaries
+    )
+    text = "2 ice tea, mapo tofu and CLUB?MATE in der STRASSE strasse steam1"
+
+    matcher = pattern_utils.PatternMatcher(patterns, case_sensitive)
+
+    flags = 0 if case_sensitive else re.IGNORECASE
+    assert matcher.match_spans(text) == [
+        [match.span() for match in re.finditer(pattern["pattern"], text, flags)]
+        for pattern in patterns
+    ]
@@ -0,0 +1,27 @@
+import logging
+from typing import Any, Callable, Text
+
+import pytest
+from _pytest.fixtures import FixtureRequest
+
+logger = logging.getLogger(__name__)
+
+
+@pytest.fixture
+def report_metrics(
+    request: FixtureRequest, record_property: Callable[[Text, Any], None]
+) -> Callable[..., None]:
+    """Reports the measurements of a benchmark.
+
+    Timings depend on the machine which runs the benchmark, so they are reported
+    instead of being compared with fixed limits. The metrics are added to the
+    properties of the test case in the JUnit XML report (`--junitxml`) and are
+    logged with level `INFO` (shown with `--log-cli-level=INFO`).
+    """
+
+    def report(**metrics: Any) -> None:
+        for name, value in metrics.items():
+            record_property(name, value)
+            logger.info(f"{request.node.name}: {name} = {value}")
+
+    return report
@@ -0,0 +1,58 @@
+import statistics
+import time
+import uuid
+from typing import Callable
+
+import pytest
+
+from rasa.core.tracker_store import CachedTrackerStore, SQLTrackerStore, TrackerStore
+from rasa.shared.core.domain import Domain
+from rasa.shared.core.events import BotUttered, UserUttered
+from rasa.shared.core.trackers import DialogueStateTracker
+
+NUMBER_OF_EVENTS = 200
+NUMBER_OF_TURNS = 50
+# a turn with the cache is about 8 times as fast as without it; the margin is
+# generous so that the test is stable on slow or busy machines
+MINIMAL_SPEEDUP = 2
+
+
+async def _median_turn_latency(tracker_store: TrackerStore) -> float:
+    sender_id = uuid.uuid4().hex
+    events = [UserUttered(f"message {i}") for i in range(NUMBER_OF_EVENTS)]
+    await tracker_store.save(DialogueStateTracker.from_events(sender_id, events))
+
+    latencies = []
+    for i in range(NUMBER_OF_TURNS):
+        # a turn retrieves the tracker, adds the new events and saves it
+        start = time.perf_counter()
+        tracker = await tracker_store.retrieve(sender_id)
+        tracker.update(UserUttered(f"new message {i}"))
+        tracker.update(BotUttered(f"response {i}"))
+        await tracker_store.save(tracker)
+        latencies.append(time.perf_counter() - start)
+
+    assert len(tracker.events) == NUMBER_OF_EVENTS + 2 * NUMBER_OF_TURNS
+    return statistics.median(latencies)
+
+
+@pytest.mark.timeout(600, func_only=True)
+async def test_cached_tracker_store_skips_retrieving_trackers(
+    report_metrics: Callable[..., None]
+):
+    sql_tracker_store = SQLTrackerStore(Domain.empty(), host="sqlite:///")
+    latencies = {
+        "uncached": await _median_turn_latency(sql_tracker_store),
+        "cached": await _median_turn_latency(CachedTrackerStore(sql_tracker_store)),
+    }
+
+    report_metrics(
+        **{
+            f"{name}_turn_ms": round(latency * 1000, 3)
+            for name, latency in latencies.items()
+        }
+    )
+
+    # the cached tracker is only validated with a count query instead of being read
+    # and deserialised
+    assert latencies["cached"] * MINIMAL_SPEEDUP < latencies["uncached"]
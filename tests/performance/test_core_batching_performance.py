@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import asyncio
+import gc
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Text, Tuple
+
+import numpy as np
+import pytest
+
+from rasa.core.batching import MicroBatcher
+from rasa.engine.graph import (
+    ExecutionContext,
+    GraphComponent,
+    GraphSchema,
+    SchemaNode,
+)
+from rasa.engine.runner.compiled import CompiledGraphRunner
+from rasa.engine.storage.resource import Resource
+from rasa.engine.storage.storage import ModelStorage
+from tests.engine.graph_components_test_classes import AddInputs, ProvideX
+
+# conversations which are triggered at once, e.g. by a broadcast campaign
+NUMBER_OF_CONVERSATIONS = 200
+FEATURE_DIMENSION = 256
+# seconds which a model call takes regardless of the number of trackers, e.g. to
+# dispatch the TensorFlow graph
+MODEL_CALL_OVERHEAD = 0.002
+# batching makes 15 to 20 times as many predictions per second; the margin is
+# generous so that the test is stable on slow or busy machines
+MINIMAL_THROUGHPUT_SPEEDUP = 3
+
+
+class SimulatedTEDPolicy(GraphComponent):
+    def __init__(self) -> None:
+        rng = np.random.default_rng(42)
+        self.weights = [
+            rng.standard_normal((FEATURE_DIMENSION, FEATURE_DIMENSION))
+            for _ in range(3)
+        ]
+
+    @classmethod
+    def create(
+        cls,
+        config: Dict[Text, Any],
+        model_storage: ModelStorage,
+        resource: Resource,
+        execution_context: ExecutionContext,
+    ) -> SimulatedTEDPolicy:
+        return cls()
+
+    def predict_action_probabilities(self, tracker: np.ndarray, domain: int) -> int:
+        return self._run_inference([tracker])[0]
+
+    def predict_action_probabilities_for_batch(
+        self, batch: List[Dict[Text, Any]]
+    ) -> List[int]:
+        return self._run_inference([inputs["tracker"] for inputs in batch])
+
+    def _run_inference(self, trackers: List[np.ndarray]) -> List[int]:
+        time.sleep(MODEL_CALL_OVERHEAD)
+        hidden = np.stack(trackers)
+        for weights in self.weights:
+            hidden = np.tanh(hidden @ weights)
+        return [int(index) for index in np.argmax(hidden, axis=-1)]
+
+
+def _prediction_graph_runner(model_storage: ModelStorage) -> CompiledGraphRunner:
+    graph_schema = GraphSchema(
+        {
+            "domain_provider": SchemaNode(
+                needs={},
+                uses=ProvideX,
+                fn="provide",
+                constructor_name="create",
+                config={},
+                eager=True,
+            ),
+            "run_TEDPolicy0": SchemaNode(
+                needs={"tracker": "tracker", "domain": "domain_provider"},
+                uses=SimulatedTEDPolicy,
+                fn="predict_action_probabilities",
+                constructor_name="create",
+                config={},
+                eager=True,
+            ),
+            "select_prediction": SchemaNode(
+                needs={"i1": "run_TEDPolicy0", "i2": "domain_provider"},
+                uses=AddInputs,
+                fn="add",
+                constructor_name="create",
+                config={},
+                eager=True,
+                is_target=True,
+            ),
+        }
+    )
+    return CompiledGraphRunner.create(
+        graph_schema=graph_schema,
+        model_storage=model_storage,
+        execution_context=ExecutionContext(graph_schema=graph_schema, model_id="1"),
+    )
+
+
+async def _predictions_per_second(
+    predict: Callable[[np.ndarray], Awaitable[int]], trackers: List[np.ndarray]
+) -> Tuple[List[int], float]:
+    # a garbage collection during the measurement would distort the result
+    gc.collect()
+    start = time.perf_counter()
+    predictions = await asyncio.gather(*[predict(tracker) for tracker in trackers])
+    duration = time.perf_counter() - start
+
+    return predictions, len(trackers) / duration
+
+
+@pytest.mark.timeout(600, func_only=True)
+async def test_batched_core_prediction_of_concurrent_conversations(
+    default_model_storage: ModelStorage, report_metrics: Callable[..., None]
+):
+    runner = _prediction_graph_runner(default_model_storage)
+    rng = np.random.default_rng(0)
+    trackers = [
+        rng.standard_normal(FEATURE_DIMENSION) for _ in range(NUMBER_OF_CONVERSATIONS)
+    ]
+
+    async def predict_one_by_one(tracker: np.ndarray) -> int:
+        # the processor runs the graph for every conversation on its own
+        return runner.run(inputs={"tracker": tracker})["select_prediction"]
+
+    def predict_batch(batch: List[np.ndarray]) -> List[int]:
+        results = runner.run_batch([{"tracker": tracker} for tracker in batch])
+        return [result["select_prediction"] for result in results]
+
+    batcher = MicroBatcher(predict_batch, max_batch_size=32, max_wait_in_seconds=0.005)
+
+    single_predictions, single_throughput = await _predictions_per_second(
+        predict_one_by_one, trackers
+    )
+    batched_predictions, batched_throughput = await _predictions_per_second(
+        batcher.submit, trackers
+    )
+
+    report_metrics(
+        one_by_one_predictions_per_s=round(single_throughput),
+        batched_predictions_per_s=round(batched_throughput),
+    )
+
+    assert batched_predictions == single_predictions
+    assert batched_throughput > MINIMAL_THROUGHPUT_SPEEDUP * single_throughput
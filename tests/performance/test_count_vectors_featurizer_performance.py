@@ -0,0 +1,213 @@
+import gc
+import random
+import string
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Text, Tuple
+
+import pytest
+
+from rasa.engine.graph import ExecutionContext
+from rasa.engine.storage.resource import Resource
+from rasa.engine.storage.storage import ModelStorage
+from rasa.nlu.featurizers.sparse_featurizer.count_vectors_featurizer import (
+    CountVectorsFeaturizer,
+)
+from rasa.nlu.tokenizers.whitespace_tokenizer import WhitespaceTokenizer
+from rasa.shared.nlu.constants import INTENT, TEXT
+from rasa.shared.nlu.training_data.message import Message
+from rasa.shared.nlu.training_data.training_data import TrainingData
+
+NUMBER_OF_TRAINING_EXAMPLES = 100_000
+# featurizing the messages one by one takes long, its speed is measured on a sample
+NUMBER_OF_MESSAGES_ONE_BY_ONE = 5_000
+VOCABULARY_SIZE = 5_000
+NUMBER_OF_INTENTS = 50
+# character n-grams of a multilingual vocabulary make up a large vocabulary
+NUMBER_OF_MULTILINGUAL_EXAMPLES = 20_000
+MULTILINGUAL_VOCABULARY_SIZE = 30_000
+# featurizing the training data at once is about 5 times as fast as one by one,
+# and a hashing featurizer loads thousands of times as fast as one with a
+# vocabulary; the margins are generous so that the tests are stable on slow or
+# busy machines
+MINIMAL_BATCH_SPEEDUP = 3
+MINIMAL_LOAD_SPEEDUP = 10
+ALPHABETS = [
+    string.ascii_lowercase,
+    "абвгдежзийклмнопрстуфхцчшщъыьэюя",
+    "αβγδεζηθικλμνξοπρστυφχψω",
+    "अआइईउऊएऐओऔकखगघचछजझटठडढणतथदधनपफबभमयरलवशसह",
+]
+
+
+def _training_examples(number_of_examples: int) -> List[Message]:
+    rng = random.Random(42)
+    vocabulary = [
+        "".join(rng.choices(string.ascii_lowercase, k=rng.randint(2, 10)))
+        for _ in range(VOCABULARY_SIZE)
+    ]
+    messages = [
+        Message(
+            data={
+                TEXT: " ".join(rng.choices(vocabulary, k=rng.randint(3, 15))),
+                INTENT: f"intent_{rng.randrange(NUMBER_OF_INTENTS)}",
+            }
+        )
+        for _ in range(number_of_examples)
+    ]
+    tokenizer = WhitespaceTokenizer(WhitespaceTokenizer.get_default_config())
+    tokenizer.process_training_data(TrainingData(messages))
+    return messages
+
+
+def _multilingual_training_examples() -> List[Message]:
+    rng = random.Random(42)
+    vocabulary = []
+    for _ in range(MULTILINGUAL_VOCABULARY_SIZE):
+        alphabet = rng.choice(ALPHABETS)
+        vocabulary.append("".join(rng.choices(alphabet, k=rng.randint(3, 12))))
+    messages = [
+        Message(
+            data={
+                TEXT: " ".join(rng.choices(vocabulary, k=rng.randint(3, 15))),
+                INTENT: f"intent_{rng.randrange(NUMBER_OF_INTENTS)}",
+            }
+        )
+        for _ in range(NUMBER_OF_MULTILINGUAL_EXAMPLES)
+    ]
+    tokenizer = WhitespaceTokenizer(WhitespaceTokenizer.get_default_config())
+    tokenizer.process_training_data(TrainingData(messages))
+    return messages
+
+
+@pytest.mark.timeout(600, func_only=True)
+@pytest.mark.parametrize("analyzer", ["word", "char_wb"])
+def test_count_vectors_featurizer_training_data_featurization(
+    analyzer: str,
+    default_model_storage: ModelStorage,
+    default_execution_context: ExecutionContext,
+    report_metrics: Callable[..., None],
+):
+    featurizer = CountVectorsFeaturizer.create(
+        {
+            **CountVectorsFeaturizer.get_default_config(),
+            "analyzer": analyzer,
+            "max_ngram": 1 if analyzer == "word" else 4,
+        },
+        default_model_storage,
+        Resource("count_vectors_featurizer"),
+        default_execution_context,
+    )
+    training_data = TrainingData(_training_examples(NUMBER_OF_TRAINING_EXAMPLES))
+    featurizer.train(training_data)
+    # the first messages of the training data, which are featurized one by one
+    messages = _training_examples(NUMBER_OF_MESSAGES_ONE_BY_ONE)
+
+    # a garbage collection during the measurement would distort the result
+    gc.collect()
+    start = time.perf_counter()
+    for message in messages:
+        featurizer.process([message])
+    one_by_one_per_message = (
+        time.perf_counter() - start
+    ) / NUMBER_OF_MESSAGES_ONE_BY_ONE
+
+    gc.collect()
+    start = time.perf_counter()
+    featurizer.process_training_data(training_data)
+    batched = time.perf_counter() - start
+
+    one_by_one = one_by_one_per_message * NUMBER_OF_TRAINING_EXAMPLES
+    report_metrics(
+        one_by_one_extrapolated_s=round(one_by_one, 2),
+        batched_s=round(batched, 2),
+    )
+
+    for message, example in zip(messages[:100], training_data.training_examples):
+        features, _ = message.get_sparse_features(TEXT, [])
+        batched_features, _ = example.get_sparse_features(TEXT, [])
+        assert (features.features != batched_features.features).nnz == 0
+    assert batched * MINIMAL_BATCH_SPEEDUP < one_by_one
+
+
+def _train_and_load(
+    config: Dict[Text, Any],
+    training_data: TrainingData,
+    resource: Resource,
+    model_storage: ModelStorage,
+    execution_context: ExecutionContext,
+) -> Tuple[int, float, int, int]:
+    """Trains a featurizer and loads it again.
+
+    Returns:
+        The size of the persisted featurizer in bytes, the time to load it in
+        seconds, the memory which the loaded featurizer allocates in bytes, and the
+        number of text features.
+    """
+    config = {**CountVectorsFeaturizer.get_default_config(), **config}
+    featurizer = CountVectorsFeaturizer.create(
+        config, model_storage, resource, execution_context
+    )
+    featurizer.train(training_data)
+    with model_storage.read_from(resource) as directory:
+        size = sum(path.stat().st_size for path in directory.glob("**/*"))
+
+    gc.collect()
+    start = time.perf_counter()
+    CountVectorsFeaturizer.load(config, model_storage, resource, execution_context)
+    load_time = time.perf_counter() - start
+
+    gc.collect()
+    tracemalloc.start()
+    loaded = CountVectorsFeaturizer.load(
+        config, model_storage, resource, execution_context
+    )
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    message = Message(data={TEXT: training_data.training_examples[0].get(TEXT)})
+    WhitespaceTokenizer(WhitespaceTokenizer.get_default_config()).process([message])
+    loaded.process([message])
+    sequence_features, _ = message.get_sparse_features(TEXT, [])
+
+    return size, load_time, memory, sequence_features.features.shape[-1]
+
+
+@pytest.mark.timeout(600, func_only=True)
+def test_count_vectors_featurizer_hashing_size_and_load_time(
+    default_model_storage: ModelStorage,
+    default_execution_context: ExecutionContext,
+    report_metrics: Callable[..., None],
+):
+    config = {"analyzer": "char_wb", "min_ngram": 1, "max_ngram": 5}
+    training_data = TrainingData(_multilingual_training_examples())
+
+    results = {
+        name: _train_and_load(
+            config_overrides,
+            training_data,
+            Resource(f"count_vectors_featurizer_{name}"),
+            default_model_storage,
+            default_execution_context,
+        )
+        for name, config_overrides in [
+            ("vocabulary", config),
+            ("hashing", {**config, "use_hashing": True}),
+        ]
+    }
+
+    for name, (size, load_time, memory, number_of_features) in results.items():
+        report_metrics(
+            **{
+                f"{name}_features": number_of_features,
+                f"{name}_persisted_bytes": size,
+                f"{name}_load_ms": round(load_time * 1000, 1),
+                f"{name}_allocated_bytes": memory,
+            }
+        )
+
+    vocabulary_size, vocabulary_load_time, vocabulary_memory, _ = results["vocabulary"]
+    hashing_size, hashing_load_time, hashing_memory, _ = results["hashing"]
+    assert hashing_size < vocabulary_size / 10
+    assert hashing_load_time * MINIMAL_LOAD_SPEEDUP < vocabulary_load_time
+    assert hashing_memory < vocabulary_memory / 10
@@ -0,0 +1,96 @@
+import statistics
+import time
+import uuid
+from typing import Callable, Dict, Text
+
+import pytest
+from moto import mock_dynamodb2
+
+from rasa.core.tracker_store import (
+    ChunkedDynamoTrackerStore,
+    DynamoTrackerStore,
+    TrackerStore,
+)
+from rasa.shared.core.domain import Domain
+from rasa.shared.core.events import BotUttered, SessionStarted, UserUttered
+from rasa.shared.core.trackers import DialogueStateTracker
+
+NUMBERS_OF_PREVIOUS_EVENTS = [10, 1_000]
+NUMBER_OF_MEASUREMENTS = 10
+# with 1,000 events in previous sessions the chunked layout saves and retrieves as
+# fast as with 10 events, and more than 50 times as fast as the single item
+# layout; the margins are generous so that the test is stable on slow or busy
+# machines
+MAXIMAL_LATENCY_GROWTH = 5
+MINIMAL_SPEEDUP = 10
+
+
+async def _median_latencies(
+    tracker_store: TrackerStore, number_of_previous_events: int
+) -> Dict[Text, float]:
+    sender_id = uuid.uuid4().hex
+    events = [UserUttered(f"old message {i}") for i in range(number_of_previous_events)]
+    events.append(SessionStarted())
+    await tracker_store.save(DialogueStateTracker.from_events(sender_id, events))
+
+    save_latencies, retrieve_latencies = [], []
+    for i in range(NUMBER_OF_MEASUREMENTS):
+        start = time.perf_counter()
+        tracker = await tracker_store.retrieve(sender_id)
+        retrieve_latencies.append(time.perf_counter() - start)
+
+        expected_number_of_events = 1 + i
+        if not isinstance(tracker_store, ChunkedDynamoTrackerStore):
+            expected_number_of_events += number_of_previous_events
+        assert len(tracker.events) == expected_number_of_events
+
+        tracker.update(BotUttered(f"response {i}"))
+
+        start = time.perf_counter()
+        await tracker_store.save(tracker)
+        save_latencies.append(time.perf_counter() - start)
+
+    return {
+        "save": statistics.median(save_latencies),
+        "retrieve": statistics.median(retrieve_latencies),
+    }
+
+
+@pytest.mark.timeout(600, func_only=True)
+async def test_chunked_dynamo_tracker_store_latency_is_independent_of_history(
+    report_metrics: Callable[..., None]
+):
+    latencies = {}
+    with mock_dynamodb2():
+        for tracker_store in [
+            DynamoTrackerStore(Domain.empty(), table_name="states"),
+            ChunkedDynamoTrackerStore(Domain.empty(), table_name="chunks"),
+        ]:
+            for number_of_events in NUMBERS_OF_PREVIOUS_EVENTS:
+                latency = await _median_latencies(tracker_store, number_of_events)
+                latencies[(type(tracker_store), number_of_events)] = latency
+
+    report_metrics(
+        **{
+            f"{tracker_store_class.__name__}_{operation}_{number_of_events}_"
+            f"previous_events_ms": round(latency * 1000, 3)
+            for (tracker_store_class, number_of_events), latency_per_operation in (
+                latencies.items()
+            )
+            for operation, latency in latency_per_operation.items()
+        }
+    )
+
+    shortest = min(NUMBERS_OF_PREVIOUS_EVENTS)
+    longest = max(NUMBERS_OF_PREVIOUS_EVENTS)
+    for operation in ["save", "retrieve"]:
+        # only new events are written and only the latest session is read
+        assert (
+            latencies[(ChunkedDynamoTrackerStore, longest)][operation]
+            < MAXIMAL_LATENCY_GROWTH
+            * latencies[(ChunkedDynamoTrackerStore, shortest)][operation]
+        )
+        assert (
+            latencies[(ChunkedDynamoTrackerStore, longest)][operation] * MINIMAL_SPEEDUP
+            < latencies[(DynamoTrackerStore, longest)][operation]
+        )
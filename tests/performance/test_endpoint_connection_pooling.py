@@ -0,0 +1,70 @@
+import time
+from typing import Callable, Dict, List, Text
+
+import numpy as np
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from rasa.core.actions.action import RemoteAction
+from rasa.shared.core.domain import Domain
+from rasa.shared.core.events import UserUttered
+from rasa.shared.core.trackers import DialogueStateTracker
+from rasa.utils.endpoints import EndpointConfig
+
+NUMBER_OF_ACTION_CALLS = 500
+
+
+async def _stub_action_server_webhook(_: web.Request) -> web.Response:
+    return web.json_response({"events": [], "responses": []})
+
+
+async def _action_call_latencies(endpoint: EndpointConfig) -> List[float]:
+    # the action server is called directly, as running the action validates its
+    # response, which would outweigh the cost of the connection
+    action = RemoteAction("action_stub", endpoint)
+    tracker = DialogueStateTracker.from_events("benchmark", [UserUttered("hi")])
+    payload = action._action_call_format(tracker, Domain.empty())
+
+    latencies = []
+    for _ in range(NUMBER_OF_ACTION_CALLS):
+        start = time.perf_counter()
+        response = await endpoint.request(json=payload, method="post")
+        latencies.append(time.perf_counter() - start)
+
+        assert response == {"events": [], "responses": []}
+
+    await endpoint.close()
+    return latencies
+
+
+def _percentiles_in_ms(name: Text, latencies: List[float]) -> Dict[Text, float]:
+    p50, p99 = np.percentile(latencies, [50, 99]) * 1000
+    return {f"{name}_p50_ms": round(p50, 3), f"{name}_p99_ms": round(p99, 3)}
+
+
+@pytest.mark.timeout(300, func_only=True)
+async def test_action_call_latency_with_and_without_connection_pool(
+    report_metrics: Callable[..., None]
+):
+    app = web.Application()
+    app.router.add_post("/webhook", _stub_action_server_webhook)
+
+    server = TestServer(app)
+    await server.start_server()
+    url = str(server.make_url("/webhook"))
+
+    try:
+        without_pool = await _action_call_latencies(
+            EndpointConfig(url, connection_pool={"enabled": False})
+        )
+        with_pool = await _action_call_latencies(EndpointConfig(url))
+    finally:
+        await server.close()
+
+    # a connection to a local server is cheap, hence the difference is too small
+    # to be asserted reliably
+    report_metrics(
+        **_percentiles_in_ms("without_pool", without_pool),
+        **_percentiles_in_ms("with_pool", with_pool),
+    )
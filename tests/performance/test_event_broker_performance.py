@@ -0,0 +1,106 @@
+import statistics
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Text
+
+import pytest
+
+from rasa.core.brokers.batching import BatchingEventBroker
+from rasa.core.brokers.broker import EventBroker
+from rasa.core.brokers.sql import SQLEventBroker
+from rasa.shared.core.events import ActionExecuted, BotUttered, UserUttered
+
+NUMBER_OF_TURNS = 50
+# queueing the events is thousands of times as fast as writing them to the
+# database, and writing them in one transaction is more than 50 times as fast as
+# writing them one by one; the margins are generous so that the tests are stable
+# on slow or busy machines
+MINIMAL_QUEUEING_SPEEDUP = 10
+MINIMAL_BATCH_SPEEDUP = 5
+
+
+def _turn_events(sender_id: Text, turn: int) -> List[Dict[Text, Any]]:
+    events = [
+        UserUttered(f"message {turn}", {"name": "greet"}),
+        ActionExecuted("utter_greet"),
+        BotUttered(f"response {turn}"),
+        ActionExecuted("action_listen"),
+    ]
+    return [{"sender_id": sender_id, **event.as_dict()} for event in events]
+
+
+def _median_publish_latency(event_broker: EventBroker) -> float:
+    latencies = []
+    for turn in range(NUMBER_OF_TURNS):
+        events = _turn_events("sender", turn)
+        # the tracker store publishes the new events of a turn one by one
+        start = time.perf_counter()
+        for event in events:
+            event_broker.publish(event)
+        latencies.append(time.perf_counter() - start)
+
+    return statistics.median(latencies)
+
+
+def _number_of_stored_events(event_broker: SQLEventBroker) -> int:
+    with event_broker.session_scope() as session:
+        return session.query(event_broker.SQLBrokerEvent).count()
+
+
+@pytest.mark.timeout(600, func_only=True)
+async def test_batching_event_broker_takes_publishing_off_the_response_path(
+    tmp_path: Path, report_metrics: Callable[..., None]
+):
+    sql_broker = SQLEventBroker(db=str(tmp_path / "direct.db"))
+    direct_latency = _median_publish_latency(sql_broker)
+
+    batching_broker = BatchingEventBroker(
+        SQLEventBroker(db=str(tmp_path / "batched.db"))
+    )
+    batched_latency = _median_publish_latency(batching_broker)
+    start = time.perf_counter()
+    await batching_broker.close()
+    flush_duration = time.perf_counter() - start
+
+    report_metrics(
+        direct_turn_ms=round(direct_latency * 1000, 3),
+        batched_turn_ms=round(batched_latency * 1000, 3),
+        flush_ms=round(flush_duration * 1000, 1),
+        published_events=batching_broker.metrics.published_events,
+        flushes=batching_broker.metrics.flushes,
+    )
+
+    assert _number_of_stored_events(batching_broker.event_broker) == (
+        _number_of_stored_events(sql_broker)
+    )
+    assert batched_latency * MINIMAL_QUEUEING_SPEEDUP < direct_latency
+
+
+@pytest.mark.timeout(600, func_only=True)
+async def test_sql_event_broker_publish_batch_throughput(
+    tmp_path: Path, report_metrics: Callable[..., None]
+):
+    events = [
+        event
+        for turn in range(NUMBER_OF_TURNS)
+        for event in _turn_events("sender", turn)
+    ]
+
+    broker = SQLEventBroker(db=str(tmp_path / "single.db"))
+    start = time.perf_counter()
+    for event in events:
+        broker.publish(event)
+    single_duration = time.perf_counter() - start
+
+    batch_broker = SQLEventBroker(db=str(tmp_path / "batch.db"))
+    start = time.perf_counter()
+    await batch_broker.publish_batch(events)
+    batch_duration = time.perf_counter() - start
+
+    report_metrics(
+        one_by_one_ms=round(single_duration * 1000, 1),
+        batch_ms=round(batch_duration * 1000, 1),
+    )
+
+    assert _number_of_stored_events(batch_broker) == len(events)
+    assert batch_duration * MINIMAL_BATCH_SPEEDUP < single_duration
@@ -0,0 +1,180 @@
+import statistics
+import time
+from typing import Callable, Type
+
+import pytest
+
+from rasa.engine.graph import ExecutionContext, GraphSchema, SchemaNode
+from rasa.engine.runner.compiled import MAX_WORKERS_KEY, CompiledGraphRunner
+from rasa.engine.runner.dask import DaskGraphRunner
+from rasa.engine.runner.interface import GraphRunner
+from rasa.engine.storage.storage import ModelStorage
+from tests.engine.graph_components_test_classes import (
+    AddInputs,
+    SleepAndProvideX,
+    SubtractByX,
+)
+
+# roughly the size of the prediction graph of a default pipeline, whose nodes
+# are all eager
+NUMBER_OF_NODES = 20
+NUMBER_OF_MEASUREMENTS = 500
+# the compiled graph runner is more than 10 times as fast as the dask graph runner;
+# the margin is generous so that the test is stable on slow or busy machines
+MINIMAL_SPEEDUP = 2
+
+# seconds which each of the independent "policies" takes for a prediction
+POLICY_LATENCIES = [0.01, 0.02, 0.03, 0.04]
+# running the policies concurrently takes about as long as the slowest policy
+# instead of the sum of all, which is 2.5 times as fast; the margin is generous so
+# that the test is stable on slow or busy machines
+MINIMAL_CONCURRENCY_SPEEDUP = 1.5
+
+
+def _graph_schema() -> GraphSchema:
+    nodes = {
+        "node_0": SchemaNode(
+            needs={"i": "input"},
+            uses=SubtractByX,
+            fn="subtract_x",
+            constructor_name="create",
+            config={"x": 1},
+            eager=True,
+        )
+    }
+    for i in range(1, NUMBER_OF_NODES - 1):
+        nodes[f"node_{i}"] = SchemaNode(
+            needs={"i": f"node_{i - 1}"},
+            uses=SubtractByX,
+            fn="subtract_x",
+            constructor_name="create",
+            config={"x": 1},
+            eager=True,
+        )
+    # a second target which is not needed by the first one, like the NLU target
+    nodes["nlu_target"] = SchemaNode(
+        needs={"i1": "input", "i2": "node_0"},
+        uses=AddInputs,
+        fn="add",
+        constructor_name="create",
+        config={},
+        eager=True,
+        is_target=True,
+    )
+    nodes[f"node_{NUMBER_OF_NODES - 2}"].is_target = True
+    return GraphSchema(nodes)
+
+
+def _median_run_latency(
+    graph_runner_class: Type[GraphRunner], model_storage: ModelStorage
+) -> float:
+    graph_schema = _graph_schema()
+    runner = graph_runner_class.create(
+        graph_schema=graph_schema,
+        model_storage=model_storage,
+        execution_context=ExecutionContext(graph_schema=graph_schema, model_id="1"),
+    )
+    core_target = f"node_{NUMBER_OF_NODES - 2}"
+
+    latencies = []
+    for _ in range(NUMBER_OF_MEASUREMENTS):
+        start = time.perf_counter()
+        results = runner.run(inputs={"input": 100}, targets=[core_target])
+        latencies.append(time.perf_counter() - start)
+
+    assert results == {core_target: 100 - (NUMBER_OF_NODES - 1)}
+    return statistics.median(latencies)
+
+
+@pytest.mark.timeout(600, func_only=True)
+def test_compiled_graph_runner_overhead(
+    default_model_storage: ModelStorage, report_metrics: Callable[..., None]
+):
+    latencies = {
+        graph_runner_class: _median_run_latency(
+            graph_runner_class, default_model_storage
+        )
+        for graph_runner_class in [DaskGraphRunner, CompiledGraphRunner]
+    }
+
+    report_metrics(
+        **{
+            f"{graph_runner_class.__name__}_us": round(latency * 1e6, 1)
+            for graph_runner_class, latency in latencies.items()
+        },
+        speedup=round(latencies[DaskGraphRunner] / latencies[CompiledGraphRunner], 2),
+    )
+
+    assert latencies[CompiledGraphRunner] * MINIMAL_SPEEDUP < latencies[DaskGraphRunner]
+
+
+def _graph_schema_with_policies() -> GraphSchema:
+    nodes = {
+        f"policy_{i}": SchemaNode(
+            needs={"tracker": "input"},
+            uses=SleepAndProvideX,
+            fn="provide",
+            constructor_name="create",
+            config={"seconds": latency, "x": i},
+            eager=True,
+        )
+        for i, latency in enumerate(POLICY_LATENCIES)
+    }
+    nodes["ensemble_0"] = SchemaNode(
+        needs={"i1": "policy_0", "i2": "policy_1"},
+        uses=AddInputs,
+        fn="add",
+        constructor_name="create",
+        config={},
+        eager=True,
+    )
+    nodes["ensemble_1"] = SchemaNode(
+        needs={"i1": "policy_2", "i2": "policy_3"},
+        uses=AddInputs,
+        fn="add",
+        constructor_name="create",
+        config={},
+        eager=True,
+    )
+    nodes["select_prediction"] = SchemaNode(
+        needs={"i1": "ensemble_0", "i2": "ensemble_1"},
+        uses=AddInputs,
+        fn="add",
+        constructor_name="create",
+        config={},
+        eager=True,
+        is_target=True,
+    )
+    return GraphSchema(nodes)
+
+
+@pytest.mark.timeout(600, func_only=True)
+def test_independent_policies_run_concurrently(
+    default_model_storage: ModelStorage, report_metrics: Callable[..., None]
+):
+    graph_schema = _graph_schema_with_policies()
+    latencies = {}
+    for max_workers in [1, len(POLICY_LATENCIES)]:
+        runner = CompiledGraphRunner.create(
+            graph_schema=graph_schema,
+            model_storage=default_model_storage,
+            execution_context=ExecutionContext(graph_schema=graph_schema, model_id="1"),
+            config={MAX_WORKERS_KEY: max_workers},
+        )
+        measurements = []
+        for _ in range(10):
+            start = time.perf_counter()
+            results = runner.run(inputs={"input": None})
+            measurements.append(time.perf_counter() - start)
+
+        assert results == {"select_prediction": sum(range(len(POLICY_LATENCIES)))}
+        latencies[max_workers] = statistics.median(measurements)
+
+    report_metrics(
+        **{
+            f"{max_workers}_workers_ms": round(latency * 1000, 1)
+            for max_workers, latency in latencies.items()
+        }
+    )
+
+    assert latencies[len(POLICY_LATENCIES)] * MINIMAL_CONCURRENCY_SPEEDUP < latencies[1]
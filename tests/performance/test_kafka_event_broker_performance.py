@@ -0,0 +1,74 @@
+import os
+import time
+import uuid
+from typing import Any, Callable, Dict, List, Text
+
+import pytest
+
+from rasa.core.brokers.kafka import AsyncKafkaEventBroker, KafkaEventBroker
+from rasa.shared.core.events import UserUttered
+
+KAFKA_HOST = os.getenv("KAFKA_HOST")
+KAFKA_PORT = os.getenv("KAFKA_PORT", 9092)
+
+NUMBER_OF_EVENTS = 10_000
+NUMBER_OF_CONVERSATIONS = 100
+
+
+def _events() -> List[Dict[Text, Any]]:
+    return [
+        {
+            **UserUttered(f"message {i}", timestamp=i).as_dict(),
+            "sender_id": f"sender {i % NUMBER_OF_CONVERSATIONS}",
+        }
+        for i in range(NUMBER_OF_EVENTS)
+    ]
+
+
+def _topic() -> Text:
+    return f"rasa_core_events_{uuid.uuid4().hex}"
+
+
+@pytest.mark.skipif(KAFKA_HOST is None, reason="requires a Kafka server")
+@pytest.mark.sequential
+@pytest.mark.timeout(120, func_only=True)
+async def test_kafka_event_broker_throughput(report_metrics: Callable[..., None]):
+    pytest.importorskip("aiokafka")
+    events = _events()
+
+    broker = KafkaEventBroker(
+        f"{KAFKA_HOST}:{KAFKA_PORT}",
+        topic=_topic(),
+        partition_by_sender=True,
+        security_protocol="PLAINTEXT",
+    )
+    start = time.perf_counter()
+    for event in events:
+        broker.publish(event)
+    broker.producer.flush()
+    report_metrics(
+        sync_events_per_second=round(NUMBER_OF_EVENTS / (time.perf_counter() - start))
+    )
+    broker._close()
+
+    for compression_type in [None, "lz4", "zstd"]:
+        broker = AsyncKafkaEventBroker(
+            f"{KAFKA_HOST}:{KAFKA_PORT}",
+            topic=_topic(),
+            compression_type=compression_type,
+            enable_idempotence=True,
+            security_protocol="PLAINTEXT",
+        )
+        await broker.connect()
+        start = time.perf_counter()
+        for event in events:
+            broker.publish(event)
+        # `close` waits until Kafka acknowledged all events
+        await broker.close()
+        report_metrics(
+            **{
+                f"async_{compression_type or 'uncompressed'}_events_per_second": round(
+                    NUMBER_OF_EVENTS / (time.perf_counter() - start)
+                )
+            }
+        )
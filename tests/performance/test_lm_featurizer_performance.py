@@ -0,0 +1,182 @@
+import gc
+import random
+import string
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Text, Tuple
+
+import numpy as np
+import pytest
+from _pytest.monkeypatch import MonkeyPatch
+
+from rasa.engine.graph import ExecutionContext
+from rasa.engine.storage.resource import Resource
+from rasa.engine.storage.storage import ModelStorage
+from rasa.nlu.featurizers.dense_featurizer.lm_featurizer import (
+    BATCH_SIZE,
+    LanguageModelFeaturizer,
+)
+from rasa.nlu.tokenizers.whitespace_tokenizer import WhitespaceTokenizer
+from rasa.shared.nlu.constants import TEXT
+from rasa.shared.nlu.training_data.message import Message
+from rasa.shared.nlu.training_data.training_data import TrainingData
+
+NUMBER_OF_TRAINING_EXAMPLES = 2_000
+# share of the training examples which changed since the last training
+CHANGED_EXAMPLES = 0.05
+HIDDEN_SIZE = 256
+NUMBER_OF_LAYERS = 4
+# length bucketing featurizes the training data about 3 times as fast as fixed
+# chunks and the embedding cache about 8 times as fast as length bucketing; the
+# margins are generous so that the test is stable on slow or busy machines
+MINIMAL_BUCKETING_SPEEDUP = 1.5
+MINIMAL_CACHE_SPEEDUP = 2
+
+
+class SimulatedLanguageModel:
+    """Computes features like a transformer, with a cost which depends on padding."""
+
+    def __init__(self) -> None:
+        rng = np.random.default_rng(42)
+        self.embeddings = rng.standard_normal((128, HIDDEN_SIZE)).astype(np.float32)
+        self.weights = [
+            rng.standard_normal((HIDDEN_SIZE, HIDDEN_SIZE)).astype(np.float32)
+            / np.sqrt(HIDDEN_SIZE)
+            for _ in range(NUMBER_OF_LAYERS)
+        ]
+        self.padded_tokens = 0
+
+    def __call__(
+        self, attention_mask: np.ndarray, padded_token_ids: List[List[int]]
+    ) -> np.ndarray:
+        self.padded_tokens += attention_mask.size
+        hidden = self.embeddings[np.array(padded_token_ids) % 128]
+        for weights in self.weights:
+            scores = hidden @ hidden.transpose(0, 2, 1) / np.sqrt(HIDDEN_SIZE)
+            scores = np.where(attention_mask[:, None, :] > 0, scores, -1e9)
+            scores = np.exp(scores - scores.max(axis=-1, keepdims=True))
+            attention = scores / scores.sum(axis=-1, keepdims=True)
+            hidden = np.tanh((attention @ hidden) @ weights)
+        return hidden
+
+
+@pytest.fixture
+def simulated_language_model(monkeypatch: MonkeyPatch) -> SimulatedLanguageModel:
+    model = SimulatedLanguageModel()
+
+    def load_model_instance(featurizer: LanguageModelFeaturizer) -> None:
+        featurizer.pad_token_id = 0
+        featurizer.model = model
+
+    def lm_tokenize(
+        _: LanguageModelFeaturizer, text: Text
+    ) -> Tuple[List[int], List[Text]]:
+        # a word is split into sub-tokens of up to 3 characters
+        sub_tokens = [text[index : index + 3] for index in range(0, len(text), 3)]
+        return [hash(sub_token) % 30_000 for sub_token in sub_tokens], sub_tokens
+
+    monkeypatch.setattr(
+        LanguageModelFeaturizer, "_load_model_instance", load_model_instance
+    )
+    monkeypatch.setattr(LanguageModelFeaturizer, "_lm_tokenize", lm_tokenize)
+    monkeypatch.setattr(
+        LanguageModelFeaturizer,
+        "_compute_batch_sequence_features",
+        lambda _, attention_mask, token_ids: model(attention_mask, token_ids),
+    )
+    return model
+
+
+def _training_data(seed: int = 42) -> TrainingData:
+    rng = random.Random(seed)
+    messages = []
+    for _ in range(NUMBER_OF_TRAINING_EXAMPLES):
+        # most messages are short, some are long
+        number_of_words = min(int(rng.expovariate(1 / 8)) + 1, 60)
+        words = [
+            "".join(rng.choices(string.ascii_lowercase, k=rng.randint(2, 9)))
+            for _ in range(number_of_words)
+        ]
+        messages.append(Message(data={TEXT: " ".join(words)}))
+
+    training_data = TrainingData(messages)
+    WhitespaceTokenizer(WhitespaceTokenizer.get_default_config()).process_training_data(
+        training_data
+    )
+    return training_data
+
+
+def _featurize_in_fixed_chunks(
+    featurizer: LanguageModelFeaturizer, training_data: TrainingData
+) -> None:
+    """Featurizes the examples in the order of the training data."""
+    examples = training_data.training_examples
+    for start in range(0, len(examples), BATCH_SIZE):
+        batch = examples[start : start + BATCH_SIZE]
+        for doc, example in zip(featurizer._get_docs_for_batch(batch, TEXT), batch):
+            featurizer._set_lm_features(doc, example, TEXT)
+
+
+def _measure(featurize: Callable[[], Any]) -> float:
+    # a garbage collection during the measurement would distort the result
+    gc.collect()
+    start = time.perf_counter()
+    featurize()
+    return time.perf_counter() - start
+
+
+@pytest.mark.timeout(600, func_only=True)
+def test_lm_featurizer_length_bucketing_and_embedding_cache(
+    simulated_language_model: SimulatedLanguageModel,
+    default_model_storage: ModelStorage,
+    default_execution_context: ExecutionContext,
+    tmp_path: Path,
+    report_metrics: Callable[..., None],
+):
+    def create(config: Dict[Text, Any]) -> LanguageModelFeaturizer:
+        return LanguageModelFeaturizer.create(
+            {**LanguageModelFeaturizer.get_default_config(), **config},
+            default_model_storage,
+            Resource("lm_featurizer"),
+            default_execution_context,
+        )
+
+    featurizer = create({})
+    fixed_chunks = _measure(
+        lambda: _featurize_in_fixed_chunks(featurizer, _training_data())
+    )
+    fixed_chunks_tokens = simulated_language_model.padded_tokens
+
+    simulated_language_model.padded_tokens = 0
+    bucketed_training_data = _training_data()
+    bucketed = _measure(
+        lambda: featurizer.process_training_data(bucketed_training_data)
+    )
+    bucketed_tokens = simulated_language_model.padded_tokens
+
+    cache_config = {"embedding_cache_dir": str(tmp_path)}
+    create(cache_config).process_training_data(_training_data())
+    # some examples changed since the features were cached
+    number_of_changed = int(NUMBER_OF_TRAINING_EXAMPLES * CHANGED_EXAMPLES)
+    training_data = TrainingData(
+        _training_data(seed=0).training_examples[:number_of_changed]
+        + _training_data().training_examples[number_of_changed:]
+    )
+    cached = _measure(lambda: create(cache_config).process_training_data(training_data))
+
+    report_metrics(
+        fixed_chunks_s=round(fixed_chunks, 2),
+        fixed_chunks_padded_tokens=fixed_chunks_tokens,
+        bucketed_s=round(bucketed, 2),
+        bucketed_padded_tokens=bucketed_tokens,
+        cached_s=round(cached, 2),
+    )
+
+    assert all(
+        example.get_dense_features(TEXT) != (None, None)
+        for example in bucketed_training_data.training_examples
+    )
+    # the padding does not depend on the machine
+    assert bucketed_tokens < fixed_chunks_tokens / 2
+    assert bucketed * MINIMAL_BUCKETING_SPEEDUP < fixed_chunks
+    assert cached * MINIMAL_CACHE_SPEEDUP < bucketed
@@ -0,0 +1,59 @@
+import asyncio
+import time
+from typing import Callable, List
+
+import numpy as np
+import pytest
+
+from rasa.core.lock_store import InMemoryLockStore, LockStore
+
+NUMBER_OF_MESSAGES = 20
+PROCESSING_TIME_IN_SECONDS = 0.02
+# waiting messages which poll the lock every second would take about
+# `NUMBER_OF_MESSAGES` seconds; the margin keeps the test stable on busy machines
+MAXIMAL_LOCK_OVERHEAD_IN_SECONDS = 1
+
+
+async def _handle_burst(lock_store: LockStore, conversation_id: str) -> List[float]:
+    """Processes a burst of messages for one conversation.
+
+    Returns:
+        How long each message waited for the conversation lock.
+    """
+    messages_in_progress = 0
+
+    async def handle_message() -> float:
+        nonlocal messages_in_progress
+        start = time.perf_counter()
+        async with lock_store.lock(conversation_id):
+            waiting_time = time.perf_counter() - start
+            messages_in_progress += 1
+            assert messages_in_progress == 1
+            await asyncio.sleep(PROCESSING_TIME_IN_SECONDS)
+            messages_in_progress -= 1
+        return waiting_time
+
+    return await asyncio.gather(*(handle_message() for _ in range(NUMBER_OF_MESSAGES)))
+
+
+@pytest.mark.timeout(60, func_only=True)
+async def test_in_memory_lock_store_burst_latency(report_metrics: Callable[..., None]):
+    lock_store = InMemoryLockStore()
+
+    start = time.perf_counter()
+    waiting_times = await _handle_burst(lock_store, "bursty conversation")
+    total_time = time.perf_counter() - start
+
+    p50, p99 = np.percentile(waiting_times, [50, 99]) * 1000
+    report_metrics(
+        total_time_s=round(total_time, 3),
+        waiting_time_p50_ms=round(p50, 3),
+        waiting_time_p99_ms=round(p99, 3),
+    )
+
+    # messages are processed back to back instead of once per polling interval
+    assert (
+        total_time
+        < NUMBER_OF_MESSAGES * PROCESSING_TIME_IN_SECONDS
+        + MAXIMAL_LOCK_OVERHEAD_IN_SECONDS
+    )
@@ -0,0 +1,114 @@
+import gc
+import random
+import re
+import string
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Pattern, Text, Tuple, TypeVar
+
+import pytest
+
+import rasa.nlu.utils.pattern_utils as pattern_utils
+from rasa.shared.nlu.training_data.training_data import TrainingData
+
+NUMBER_OF_ELEMENTS = 50_000
+NUMBER_OF_MESSAGES = 200
+# compared with a regex alternation, the hash table is prepared about 13 times as
+# fast, allocates about 3 times less memory and matches more than 200 times as
+# fast; the margins are generous so that the test is stable on slow or busy
+# machines
+MINIMAL_PREPARATION_SPEEDUP = 5
+MINIMAL_MEMORY_REDUCTION = 2
+MINIMAL_MATCHING_SPEEDUP = 10
+
+T = TypeVar("T")
+
+
+def _elements() -> List[Text]:
+    rng = random.Random(42)
+    words = [
+        "".join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 10))).title()
+        for _ in range(NUMBER_OF_ELEMENTS)
+    ]
+    # some elements like city or product names consist of several words
+    return [
+        word if rng.random() < 0.8 else f"{word} {rng.choice(words)}" for word in words
+    ]
+
+
+def _messages(elements: List[Text]) -> List[Text]:
+    rng = random.Random(0)
+    messages = []
+    for _ in range(NUMBER_OF_MESSAGES):
+        words = [
+            "".join(rng.choices(string.ascii_lowercase, k=rng.randint(2, 8)))
+            for _ in range(rng.randint(3, 15))
+        ]
+        words.insert(rng.randrange(len(words)), rng.choice(elements).lower())
+        messages.append(" ".join(words))
+    return messages
+
+
+def _measure(create: Callable[[], T]) -> Tuple[T, float, int]:
+    """Returns the created object, the time to create it and the memory it uses."""
+    # `re` caches compiled patterns
+    re.purge()
+    gc.collect()
+    start = time.perf_counter()
+    created = create()
+    duration = time.perf_counter() - start
+
+    # tracing the allocations slows down the creation
+    re.purge()
+    gc.collect()
+    tracemalloc.start()
+    create()
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return created, duration, peak_memory
+
+
+@pytest.mark.timeout(600, func_only=True)
+def test_lookup_table_matching(report_metrics: Callable[..., None]):
+    elements = _elements()
+    patterns = pattern_utils.extract_patterns(
+        TrainingData(lookup_tables=[{"name": "city", "elements": elements}])
+    )
+    messages = _messages(elements)
+
+    regex: Pattern
+    regex, regex_preparation, regex_memory = _measure(
+        lambda: re.compile(patterns[0]["pattern"], re.IGNORECASE)
+    )
+    matcher, matcher_preparation, matcher_memory = _measure(
+        lambda: pattern_utils.PatternMatcher(patterns, case_sensitive=False)
+    )
+
+    gc.collect()
+    start = time.perf_counter()
+    expected_spans = [
+        [match.span() for match in regex.finditer(message)] for message in messages
+    ]
+    regex_matching = (time.perf_counter() - start) / NUMBER_OF_MESSAGES
+
+    gc.collect()
+    start = time.perf_counter()
+    spans = [matcher.match_spans(message)[0] for message in messages]
+    matcher_matching = (time.perf_counter() - start) / NUMBER_OF_MESSAGES
+
+    results: Dict[Text, Tuple[float, int, float]] = {
+        "regex": (regex_preparation, regex_memory, regex_matching),
+        "hash_table": (matcher_preparation, matcher_memory, matcher_matching),
+    }
+    metrics: Dict[Text, Any] = {}
+    for name, (preparation, memory, matching) in results.items():
+        metrics[f"{name}_preparation_ms"] = round(preparation * 1000, 1)
+        metrics[f"{name}_allocated_bytes"] = memory
+        metrics[f"{name}_matching_per_message_ms"] = round(matching * 1000, 3)
+    report_metrics(**metrics)
+
+    assert spans == expected_spans
+    assert all(spans)
+    assert matcher_preparation * MINIMAL_PREPARATION_SPEEDUP < regex_preparation
+    assert matcher_memory * MINIMAL_MEMORY_REDUCTION < regex_memory
+    assert matcher_matching * MINIMAL_MATCHING_SPEEDUP < regex_matching
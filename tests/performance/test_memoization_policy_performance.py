@@ -0,0 +1,114 @@
+import base64
+import json
+import statistics
+import time
+import tracemalloc
+import zlib
+from typing import Callable, List, Optional, Text
+
+import pytest
+
+from rasa.core.policies.memoization import MemoizationPolicy
+from rasa.engine.graph import ExecutionContext
+from rasa.engine.storage.resource import Resource
+from rasa.engine.storage.storage import ModelStorage
+from rasa.shared.core.constants import ACTION_LISTEN_NAME, PREVIOUS_ACTION, SLOTS, USER
+from rasa.shared.core.domain import State
+from rasa.shared.nlu.constants import ACTION_NAME, ENTITIES, INTENT
+
+NUMBERS_OF_EXAMPLES = [1_000, 20_000]
+NUMBER_OF_MEASUREMENTS = 500
+# recalling with digests is about three times as fast as with feature strings; the
+# test only fails if the speedup is lost entirely so that it's stable on slow or
+# busy machines
+MINIMAL_SPEEDUP = 1
+# the lookup keyed by digests takes about 3.5 times less memory than the readable
+# lookup; memory doesn't depend on the machine, but the margin allows for changes
+# of the memory layout between Python versions
+MINIMAL_MEMORY_REDUCTION = 2
+
+
+def _states(i: int) -> List[State]:
+    slots = {"name": (1.0,), "city": (0.0,)}
+    return [
+        {
+            PREVIOUS_ACTION: {ACTION_NAME: ACTION_LISTEN_NAME},
+            USER: {INTENT: f"intent_{i}", ENTITIES: ("name", "city")},
+            SLOTS: slots,
+        },
+        {PREVIOUS_ACTION: {ACTION_NAME: f"utter_{i}"}, SLOTS: slots},
+        {
+            PREVIOUS_ACTION: {ACTION_NAME: ACTION_LISTEN_NAME},
+            USER: {INTENT: "greet"},
+            SLOTS: slots,
+        },
+    ]
+
+
+def _median_latency(recall: Callable[[List[State]], Optional[Text]]) -> float:
+    states = _states(0)
+    assert recall(states) == "utter_greet"
+
+    latencies = []
+    for _ in range(NUMBER_OF_MEASUREMENTS):
+        start = time.perf_counter()
+        recall(states)
+        latencies.append(time.perf_counter() - start)
+
+    return statistics.median(latencies)
+
+
+@pytest.mark.timeout(600, func_only=True)
+def test_memoization_recall_with_hashed_lookup(
+    default_model_storage: ModelStorage,
+    default_execution_context: ExecutionContext,
+    report_metrics: Callable[..., None],
+):
+    for number_of_examples in NUMBERS_OF_EXAMPLES:
+        policy = MemoizationPolicy(
+            MemoizationPolicy.get_default_config(),
+            default_model_storage,
+            Resource(f"memoization_policy_{number_of_examples}"),
+            default_execution_context,
+        )
+        trackers_as_states = [_states(i) for i in range(number_of_examples)]
+
+        tracemalloc.start()
+        lookup = policy._create_lookup_from_states(
+            trackers_as_states, [["utter_greet"]] * number_of_examples
+        )
+        readable_lookup_memory, _ = tracemalloc.get_traced_memory()
+        policy._memorize(lookup)
+        memorized_memory, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        # the readable lookup was kept in memory before it was keyed by digests
+        hashed_lookup_memory = memorized_memory - readable_lookup_memory
+
+        def recall_with_feature_string(states: List[State]) -> Optional[Text]:
+            # how the lookup was queried before it was keyed by digests
+            feature_str = json.dumps(states, sort_keys=True).replace('"', "")
+            compressed = zlib.compress(bytes(feature_str, "utf-8"))
+            return lookup.get(base64.b64encode(compressed).decode("utf-8"))
+
+        feature_string_latency = _median_latency(recall_with_feature_string)
+        hashed_latency = _median_latency(policy._recall_states)
+
+        report_metrics(
+            **{
+                f"feature_string_{number_of_examples}_examples_us": round(
+                    feature_string_latency * 1e6, 1
+                ),
+                f"digest_{number_of_examples}_examples_us": round(
+                    hashed_latency * 1e6, 1
+                ),
+                f"readable_lookup_{number_of_examples}_examples_bytes": (
+                    readable_lookup_memory
+                ),
+                f"hashed_lookup_{number_of_examples}_examples_bytes": (
+                    hashed_lookup_memory
+                ),
+            }
+        )
+
+        assert hashed_latency * MINIMAL_SPEEDUP < feature_string_latency
+        assert hashed_lookup_memory * MINIMAL_MEMORY_REDUCTION < readable_lookup_memory
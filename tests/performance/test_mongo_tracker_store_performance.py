@@ -0,0 +1,85 @@
+import statistics
+import time
+import uuid
+from typing import Callable, Dict, Text
+
+import pytest
+
+from rasa.core.tracker_store import MongoTrackerStore
+from rasa.shared.core.domain import Domain
+from rasa.shared.core.events import SessionStarted, UserUttered
+from rasa.shared.core.trackers import DialogueStateTracker
+from tests.core.conftest import MockedMongoTrackerStore
+
+NUMBERS_OF_PREVIOUS_EVENTS = [10, 1_000, 10_000]
+EVENTS_IN_LATEST_SESSION = 10
+NUMBER_OF_MEASUREMENTS = 20
+# retrieving the latest session takes about as long with 10 as with 10,000 events
+# in previous sessions, and is more than 100 times as fast as reading all 10,000
+# events; the margins are generous so that the test is stable on slow or busy
+# machines
+MAXIMAL_LATENCY_GROWTH = 5
+MINIMAL_SPEEDUP = 10
+
+
+async def _median_latencies(
+    tracker_store: MongoTrackerStore, number_of_previous_events: int
+) -> Dict[Text, float]:
+    sender_id = uuid.uuid4().hex
+    events = [UserUttered(f"old message {i}") for i in range(number_of_previous_events)]
+    events.append(SessionStarted())
+    events.extend(
+        UserUttered(f"message {i}") for i in range(EVENTS_IN_LATEST_SESSION - 1)
+    )
+    await tracker_store.save(DialogueStateTracker.from_events(sender_id, events))
+
+    retrieve_latencies, retrieve_full_latencies = [], []
+    for _ in range(NUMBER_OF_MEASUREMENTS):
+        start = time.perf_counter()
+        tracker = await tracker_store.retrieve(sender_id)
+        retrieve_latencies.append(time.perf_counter() - start)
+
+        # reads all events like `retrieve` did before the session index was stored
+        start = time.perf_counter()
+        await tracker_store.retrieve_full_tracker(sender_id)
+        retrieve_full_latencies.append(time.perf_counter() - start)
+
+    assert len(tracker.events) == EVENTS_IN_LATEST_SESSION
+    return {
+        "retrieve": statistics.median(retrieve_latencies),
+        "retrieve_full_tracker": statistics.median(retrieve_full_latencies),
+    }
+
+
+@pytest.mark.timeout(600, func_only=True)
+async def test_mongo_tracker_store_retrieve_latency_is_independent_of_history(
+    report_metrics: Callable[..., None]
+):
+    tracker_store = MockedMongoTrackerStore(Domain.empty())
+
+    latencies = {
+        number_of_events: await _median_latencies(tracker_store, number_of_events)
+        for number_of_events in NUMBERS_OF_PREVIOUS_EVENTS
+    }
+
+    report_metrics(
+        **{
+            f"{operation}_{number_of_events}_previous_events_ms": round(
+                latency * 1000, 3
+            )
+            for number_of_events, latency_per_operation in latencies.items()
+            for operation, latency in latency_per_operation.items()
+        }
+    )
+
+    # only the events of the latest session are transferred and deserialized
+    shortest = min(NUMBERS_OF_PREVIOUS_EVENTS)
+    longest = max(NUMBERS_OF_PREVIOUS_EVENTS)
+    assert (
+        latencies[longest]["retrieve"]
+        < MAXIMAL_LATENCY_GROWTH * latencies[shortest]["retrieve"]
+    )
+    assert (
+        latencies[longest]["retrieve"] * MINIMAL_SPEEDUP
+        < latencies[longest]["retrieve_full_tracker"]
+    )
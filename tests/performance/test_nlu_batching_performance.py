@@ -0,0 +1,136 @@
+import asyncio
+import gc
+import statistics
+import time
+from typing import Awaitable, Callable, List, Tuple
+
+import numpy as np
+import pytest
+
+from rasa.core.batching import MicroBatcher
+
+NUMBER_OF_REQUESTS = 200
+FEATURE_DIMENSION = 256
+# seconds which a model call takes regardless of the number of messages, e.g. to
+# dispatch the TensorFlow graph
+MODEL_CALL_OVERHEAD = 0.002
+MAX_WAIT_IN_SECONDS = 0.005
+# batching handles 9 to 15 times as many requests per second, and a lone request
+# takes about 6 ms longer because of the batch window and the worker thread; the
+# margins are generous so that the tests are stable on slow or busy machines
+MINIMAL_THROUGHPUT_SPEEDUP = 3
+LATENCY_TOLERANCE_IN_SECONDS = 0.01
+
+
+class SimulatedNLUModel:
+    def __init__(self) -> None:
+        rng = np.random.default_rng(42)
+        self.weights = [
+            rng.standard_normal((FEATURE_DIMENSION, FEATURE_DIMENSION))
+            for _ in range(3)
+        ]
+
+    def process(self, messages: List[np.ndarray]) -> List[int]:
+        time.sleep(MODEL_CALL_OVERHEAD)
+        hidden = np.stack(messages)
+        for weights in self.weights:
+            hidden = np.tanh(hidden @ weights)
+        return list(np.argmax(hidden, axis=-1))
+
+
+async def _serve(
+    parse: Callable[[np.ndarray], Awaitable[int]], messages: List[np.ndarray]
+) -> Tuple[List[int], float, float]:
+    """Handles a request per message which all arrive at the same time.
+
+    Returns:
+        The results of the requests, the number of requests per second and the
+        median latency of a request.
+    """
+    latencies = []
+
+    async def handle_request(message: np.ndarray) -> int:
+        result = await parse(message)
+        latencies.append(time.perf_counter() - start)
+        return result
+
+    # a garbage collection during the measurement would distort the result
+    gc.collect()
+    start = time.perf_counter()
+    results = await asyncio.gather(*[handle_request(message) for message in messages])
+    duration = time.perf_counter() - start
+
+    return results, NUMBER_OF_REQUESTS / duration, statistics.median(latencies)
+
+
+@pytest.mark.timeout(600, func_only=True)
+async def test_micro_batched_nlu_throughput_under_load(
+    report_metrics: Callable[..., None]
+):
+    model = SimulatedNLUModel()
+    rng = np.random.default_rng(0)
+    messages = [
+        rng.standard_normal(FEATURE_DIMENSION) for _ in range(NUMBER_OF_REQUESTS)
+    ]
+
+    async def parse_one_by_one(message: np.ndarray) -> int:
+        # the processor runs the graph for every message on its own
+        return model.process([message])[0]
+
+    batcher = MicroBatcher(
+        model.process, max_batch_size=32, max_wait_in_seconds=MAX_WAIT_IN_SECONDS
+    )
+
+    single_results, single_throughput, single_latency = await _serve(
+        parse_one_by_one, messages
+    )
+    batched_results, batched_throughput, batched_latency = await _serve(
+        batcher.submit, messages
+    )
+
+    report_metrics(
+        one_by_one_requests_per_s=round(single_throughput),
+        one_by_one_latency_ms=round(single_latency * 1000, 1),
+        batched_requests_per_s=round(batched_throughput),
+        batched_latency_ms=round(batched_latency * 1000, 1),
+    )
+
+    assert batched_results == single_results
+    assert batched_throughput > MINIMAL_THROUGHPUT_SPEEDUP * single_throughput
+
+
+@pytest.mark.timeout(600, func_only=True)
+async def test_micro_batched_nlu_latency_without_load(
+    report_metrics: Callable[..., None]
+):
+    model = SimulatedNLUModel()
+    message = np.random.default_rng(0).standard_normal(FEATURE_DIMENSION)
+    batcher = MicroBatcher(
+        model.process, max_batch_size=32, max_wait_in_seconds=MAX_WAIT_IN_SECONDS
+    )
+
+    single_latencies = []
+    batched_latencies = []
+    for _ in range(50):
+        start = time.perf_counter()
+        expected = model.process([message])[0]
+        single_latencies.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        result = await batcher.submit(message)
+        batched_latencies.append(time.perf_counter() - start)
+
+        assert result == expected
+
+    single_latency = statistics.median(single_latencies)
+    batched_latency = statistics.median(batched_latencies)
+    report_metrics(
+        one_by_one_latency_ms=round(single_latency * 1000, 1),
+        batched_latency_ms=round(batched_latency * 1000, 1),
+    )
+
+    # a lone request only waits for the batch window
+    assert (
+        batched_latency
+        < single_latency + MAX_WAIT_IN_SECONDS + LATENCY_TOLERANCE_IN_SECONDS
+    )
@@ -0,0 +1,136 @@
+import gc
+import random
+import re
+import string
+import time
+from typing import Any, Callable, Dict, List, Text
+
+import numpy as np
+import pytest
+import scipy.sparse
+
+from rasa.engine.graph import ExecutionContext
+from rasa.engine.storage.resource import Resource
+from rasa.engine.storage.storage import ModelStorage
+from rasa.nlu.constants import TOKENS_NAMES
+from rasa.nlu.featurizers.sparse_featurizer.regex_featurizer import RegexFeaturizer
+from rasa.nlu.tokenizers.whitespace_tokenizer import WhitespaceTokenizer
+import rasa.nlu.utils.pattern_utils as pattern_utils
+from rasa.shared.nlu.constants import TEXT
+from rasa.shared.nlu.training_data.message import Message
+from rasa.shared.nlu.training_data.training_data import TrainingData
+
+NUMBER_OF_MESSAGES = 200
+VOCABULARY_SIZE = 5_000
+ELEMENTS_PER_LOOKUP_TABLE = 20
+
+
+def _vocabulary() -> List[Text]:
+    rng = random.Random(42)
+    return [
+        "".join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 10)))
+        for _ in range(VOCABULARY_SIZE)
+    ]
+
+
+def _patterns(number_of_patterns: int) -> List[Dict[Text, Text]]:
+    """Creates as many regexes as lookup tables."""
+    rng = random.Random(42)
+    vocabulary = _vocabulary()
+    training_data = TrainingData(
+        regex_features=[
+            {"name": f"regex_{index}", "pattern": rf"\b{rng.choice(vocabulary)}\w*"}
+            for index in range(number_of_patterns // 2)
+        ],
+        lookup_tables=[
+            {
+                "name": f"lookup_{index}",
+                "elements": rng.sample(vocabulary, ELEMENTS_PER_LOOKUP_TABLE),
+            }
+            for index in range(number_of_patterns - number_of_patterns // 2)
+        ],
+    )
+    return pattern_utils.extract_patterns(training_data)
+
+
+def _messages() -> List[Message]:
+    rng = random.Random(0)
+    vocabulary = _vocabulary()
+    messages = [
+        Message(data={TEXT: " ".join(rng.choices(vocabulary, k=rng.randint(3, 15)))})
+        for _ in range(NUMBER_OF_MESSAGES)
+    ]
+    WhitespaceTokenizer(WhitespaceTokenizer.get_default_config()).process(messages)
+    return messages
+
+
+def _features_with_pattern_strings(
+    patterns: List[Dict[Text, Any]], message: Message
+) -> scipy.sparse.coo_matrix:
+    """Matches the patterns as the `RegexFeaturizer` did before compiling them."""
+    tokens = message.get(TOKENS_NAMES[TEXT])
+    sequence_features = np.zeros([len(tokens), len(patterns)])
+    for pattern_index, pattern in enumerate(patterns):
+        matches = list(re.finditer(pattern["pattern"], message.get(TEXT)))
+        for token_index, token in enumerate(tokens):
+            token_patterns = token.get("pattern", default={})
+            token_patterns[pattern["name"]] = False
+            for match in matches:
+                if token.start < match.end() and token.end > match.start():
+                    token_patterns[pattern["name"]] = True
+                    sequence_features[token_index][pattern_index] = 1.0
+            token.set("pattern", token_patterns)
+
+    return scipy.sparse.coo_matrix(sequence_features)
+
+
+@pytest.mark.timeout(600, func_only=True)
+# `re` caches only 512 compiled patterns, beyond that the patterns were compiled
+# again for every message; with 2000 patterns the compiled patterns are more than
+# 100 times as fast, the margin is generous so that the test is stable on slow or
+# busy machines
+@pytest.mark.parametrize(
+    "number_of_patterns, minimal_speedup", [(100, 1), (500, 1), (2_000, 10)]
+)
+def test_regex_featurizer_with_many_patterns(
+    number_of_patterns: int,
+    minimal_speedup: float,
+    default_model_storage: ModelStorage,
+    default_execution_context: ExecutionContext,
+    report_metrics: Callable[..., None],
+):
+    patterns = _patterns(number_of_patterns)
+    featurizer = RegexFeaturizer(
+        RegexFeaturizer.get_default_config(),
+        default_model_storage,
+        Resource("regex_featurizer"),
+        default_execution_context,
+        known_patterns=patterns,
+    )
+    messages = _messages()
+
+    # a garbage collection during the measurement would distort the result
+    gc.collect()
+    start = time.perf_counter()
+    expected_features = [
+        _features_with_pattern_strings(patterns, message) for message in messages
+    ]
+    uncompiled = (time.perf_counter() - start) / NUMBER_OF_MESSAGES
+
+    gc.collect()
+    start = time.perf_counter()
+    features = [
+        featurizer._features_for_patterns(message, TEXT)[0] for message in messages
+    ]
+    compiled = (time.perf_counter() - start) / NUMBER_OF_MESSAGES
+
+    report_metrics(
+        uncompiled_per_message_ms=round(uncompiled * 1000, 3),
+        compiled_per_message_ms=round(compiled * 1000, 3),
+    )
+
+    assert all(
+        np.all(actual.toarray() == expected.toarray())
+        for actual, expected in zip(features, expected_features)
+    )
+    assert compiled * minimal_speedup < uncompiled
@@ -0,0 +1,115 @@
+import json
+import statistics
+import time
+from typing import Callable, Dict, Text
+
+import pytest
+
+from rasa.core.policies.rule_policy import (
+    RULES,
+    RULES_FOR_LOOP_UNHAPPY_PATH,
+    RulePolicy,
+)
+from rasa.engine.graph import ExecutionContext
+from rasa.engine.storage.resource import Resource
+from rasa.engine.storage.storage import ModelStorage
+from rasa.shared.core.constants import ACTION_LISTEN_NAME, PREVIOUS_ACTION, USER
+from rasa.shared.core.domain import Domain
+from rasa.shared.core.events import ActionExecuted, UserUttered
+from rasa.shared.core.trackers import DialogueStateTracker
+from rasa.shared.nlu.constants import ACTION_NAME, INTENT
+
+NUMBERS_OF_RULES = [50, 5_000, 20_000]
+NUMBER_OF_MEASUREMENTS = 20
+# checking every rule makes the latency grow linearly with the number of rules;
+# the margin is generous so that the test is stable on slow or busy machines
+MAXIMAL_LATENCY_GROWTH = 5
+
+DOMAIN = Domain.from_yaml(
+    """
+    intents:
+    - greet
+    - goodbye
+    actions:
+    - utter_greet
+    - utter_goodbye
+    """
+)
+
+
+def _rules(number_of_rules: int) -> Dict[Text, Text]:
+    rules = {}
+    for i in range(number_of_rules):
+        rule = [
+            {
+                PREVIOUS_ACTION: {ACTION_NAME: ACTION_LISTEN_NAME},
+                USER: {INTENT: f"intent_{i}"},
+            }
+        ]
+        if i % 2:
+            # rules with a previous turn
+            rule.insert(0, {PREVIOUS_ACTION: {ACTION_NAME: f"utter_{i}"}})
+        rules[json.dumps(rule, sort_keys=True)] = "utter_goodbye"
+
+    greet_rule = [
+        {PREVIOUS_ACTION: {ACTION_NAME: ACTION_LISTEN_NAME}, USER: {INTENT: "greet"}}
+    ]
+    rules[json.dumps(greet_rule, sort_keys=True)] = "utter_greet"
+    return rules
+
+
+def _median_prediction_latency(
+    number_of_rules: int,
+    model_storage: ModelStorage,
+    execution_context: ExecutionContext,
+) -> float:
+    policy = RulePolicy(
+        RulePolicy.get_default_config(),
+        model_storage,
+        Resource(f"rule_policy_{number_of_rules}"),
+        execution_context,
+        lookup={RULES: _rules(number_of_rules), RULES_FOR_LOOP_UNHAPPY_PATH: {}},
+    )
+    tracker = DialogueStateTracker.from_events(
+        "benchmark",
+        [
+            ActionExecuted(ACTION_LISTEN_NAME),
+            UserUttered("hi", intent={"name": "greet"}),
+        ],
+    )
+    # the first prediction indexes the rules
+    prediction = policy.predict_action_probabilities(tracker, DOMAIN)
+    assert prediction.max_confidence_index == DOMAIN.index_for_action("utter_greet")
+
+    latencies = []
+    for _ in range(NUMBER_OF_MEASUREMENTS):
+        start = time.perf_counter()
+        policy.predict_action_probabilities(tracker, DOMAIN)
+        latencies.append(time.perf_counter() - start)
+
+    return statistics.median(latencies)
+
+
+@pytest.mark.timeout(600, func_only=True)
+def test_rule_policy_prediction_latency_is_independent_of_number_of_rules(
+    default_model_storage: ModelStorage,
+    default_execution_context: ExecutionContext,
+    report_metrics: Callable[..., None],
+):
+    latencies = {
+        number_of_rules: _median_prediction_latency(
+            number_of_rules, default_model_storage, default_execution_context
+        )
+        for number_of_rules in NUMBERS_OF_RULES
+    }
+
+    report_metrics(
+        **{
+            f"prediction_{number_of_rules}_rules_ms": round(latency * 1000, 3)
+            for number_of_rules, latency in latencies.items()
+        }
+    )
+
+    # only the rules which match the latest state are checked
+    fewest, most = min(NUMBERS_OF_RULES), max(NUMBERS_OF_RULES)
+    assert latencies[most] < MAXIMAL_LATENCY_GROWTH * latencies[fewest]
@@ -0,0 +1,87 @@
+import statistics
+import time
+import uuid
+from pathlib import Path
+from typing import Callable, Dict, Text
+
+import pytest
+
+from rasa.core.tracker_store import (
+    AsyncSQLTrackerStore,
+    SQLTrackerStore,
+    TrackerStore,
+)
+from rasa.shared.core.domain import Domain
+from rasa.shared.core.events import BotUttered, SessionStarted, UserUttered
+from rasa.shared.core.trackers import DialogueStateTracker
+
+CONVERSATION_LENGTHS = [10, 1_000, 10_000]
+NUMBER_OF_MEASUREMENTS = 20
+# saving 10,000 events at once takes seconds, while appending new events to such a
+# conversation takes about twice as long as appending them to a short one; the
+# margin is generous so that the test is stable on slow or busy machines
+MAXIMAL_SAVE_LATENCY_GROWTH = 10
+
+
+async def _median_latencies(
+    tracker_store: TrackerStore, number_of_events: int
+) -> Dict[Text, float]:
+    sender_id = uuid.uuid4().hex
+    tracker = DialogueStateTracker.from_events(
+        sender_id,
+        [SessionStarted()]
+        + [UserUttered(f"message {i}") for i in range(number_of_events - 1)],
+    )
+    await tracker_store.save(tracker)
+
+    save_latencies, retrieve_latencies = [], []
+    for i in range(NUMBER_OF_MEASUREMENTS):
+        start = time.perf_counter()
+        tracker = await tracker_store.retrieve(sender_id)
+        retrieve_latencies.append(time.perf_counter() - start)
+
+        assert len(tracker.events) == number_of_events + i
+
+        tracker.update(BotUttered(f"response {i}"))
+
+        start = time.perf_counter()
+        await tracker_store.save(tracker)
+        save_latencies.append(time.perf_counter() - start)
+
+    return {
+        "save": statistics.median(save_latencies),
+        "retrieve": statistics.median(retrieve_latencies),
+    }
+
+
+@pytest.mark.timeout(600, func_only=True)
+@pytest.mark.parametrize("use_async_engine", [False, True])
+async def test_sql_tracker_store_save_latency_is_independent_of_history(
+    tmp_path: Path, use_async_engine: bool, report_metrics: Callable[..., None]
+):
+    db = str(tmp_path / "rasa.db")
+    if use_async_engine:
+        pytest.importorskip("aiosqlite")
+        tracker_store = AsyncSQLTrackerStore(Domain.empty(), db=db)
+    else:
+        tracker_store = SQLTrackerStore(Domain.empty(), db=db)
+
+    latencies = {
+        number_of_events: await _median_latencies(tracker_store, number_of_events)
+        for number_of_events in CONVERSATION_LENGTHS
+    }
+
+    report_metrics(
+        **{
+            f"{operation}_{number_of_events}_events_ms": round(latency * 1000, 3)
+            for number_of_events, latency_per_operation in latencies.items()
+            for operation, latency in latency_per_operation.items()
+        }
+    )
+
+    # saving only appends the new events, hence it must not grow with the history
+    shortest, longest = min(CONVERSATION_LENGTHS), max(CONVERSATION_LENGTHS)
+    assert (
+        latencies[longest]["save"]
+        < MAXIMAL_SAVE_LATENCY_GROWTH * latencies[shortest]["save"]
+    )
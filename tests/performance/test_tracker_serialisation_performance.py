@@ -0,0 +1,138 @@
+import statistics
+import time
+from typing import Any, Callable, Dict, List, Text
+
+import pytest
+
+from rasa.core.tracker_serialisation import TrackerSerialiser
+from rasa.core.tracker_store import InMemoryTrackerStore
+from rasa.shared.core.constants import ACTION_LISTEN_NAME
+from rasa.shared.core.domain import Domain
+from rasa.shared.core.events import ActionExecuted, BotUttered, SlotSet, UserUttered
+from rasa.shared.core.trackers import DialogueStateTracker
+
+NUMBER_OF_TURNS = 200
+NUMBER_OF_MEASUREMENTS = 20
+INTENTS = [f"intent_{i}" for i in range(10)]
+# msgpack serialises 5 to 12 times as fast as JSON; the margin is generous so
+# that the test is stable on slow or busy machines
+MINIMAL_SPEEDUP = 2
+
+
+def _realistic_tracker() -> DialogueStateTracker:
+    events = []
+    for turn in range(NUMBER_OF_TURNS):
+        timestamp = 1_660_000_000 + turn * 10.123456
+        text = f"I would like to book a table for {turn} people in Berlin"
+        events.append(
+            UserUttered(
+                text,
+                intent={"name": INTENTS[turn % 10], "confidence": 0.9731},
+                entities=[
+                    {
+                        "entity": "city",
+                        "start": 48,
+                        "end": 54,
+                        "value": "Berlin",
+                        "extractor": "DIETClassifier",
+                        "confidence_entity": 0.9912,
+                    }
+                ],
+                parse_data={
+                    "intent_ranking": [
+                        {"name": intent, "confidence": 0.1 / (i + 1)}
+                        for i, intent in enumerate(INTENTS)
+                    ],
+                    "text": text,
+                },
+                timestamp=timestamp,
+                metadata={"model_id": "1f2e3d4c5b6a"},
+            )
+        )
+        events.append(SlotSet("city", "Berlin", timestamp=timestamp + 0.1))
+        events.append(
+            ActionExecuted(
+                "utter_ask_time",
+                policy="TEDPolicy",
+                confidence=0.9845,
+                timestamp=timestamp + 0.2,
+            )
+        )
+        events.append(
+            BotUttered(
+                "At what time?",
+                data={"elements": None, "quick_replies": None, "buttons": None},
+                metadata={"utter_action": "utter_ask_time"},
+                timestamp=timestamp + 0.3,
+            )
+        )
+        events.append(
+            ActionExecuted(
+                ACTION_LISTEN_NAME,
+                policy="TEDPolicy",
+                confidence=0.9999,
+                timestamp=timestamp + 0.4,
+            )
+        )
+
+    return DialogueStateTracker.from_events("some-sender", events)
+
+
+def _median_duration(function: Callable[[], Any]) -> float:
+    durations = []
+    for _ in range(NUMBER_OF_MEASUREMENTS):
+        start = time.perf_counter()
+        function()
+        durations.append(time.perf_counter() - start)
+
+    return statistics.median(durations)
+
+
+def _available_serialisers() -> List[Text]:
+    names = ["json", "msgpack"]
+    try:
+        import orjson  # noqa: F401
+
+        names.append("orjson")
+    except ImportError:
+        pass
+
+    return names
+
+
+def _metrics(name: Text, result: Dict[Text, float]) -> Dict[Text, float]:
+    metrics = {f"{name}_size_bytes": result["size"]}
+    for operation in ["dumps", "loads", "deserialise_tracker"]:
+        metrics[f"{name}_{operation}_ms"] = round(result[operation] * 1000, 3)
+    return metrics
+
+
+@pytest.mark.timeout(600, func_only=True)
+def test_tracker_serialiser_throughput_and_payload_size(
+    report_metrics: Callable[..., None]
+):
+    tracker = _realistic_tracker()
+    serialised_dialogue = tracker.as_dialogue().as_dict()
+
+    results = {}
+    for name in _available_serialisers():
+        tracker_store = InMemoryTrackerStore(Domain.empty(), tracker_serialiser=name)
+        payload = tracker_store.serialiser.dumps(serialised_dialogue)
+
+        results[name] = {
+            "size": len(payload),
+            "dumps": _median_duration(
+                lambda: tracker_store.serialiser.dumps(serialised_dialogue)
+            ),
+            "loads": _median_duration(lambda: TrackerSerialiser.loads(payload)),
+            "deserialise_tracker": _median_duration(
+                lambda: tracker_store.deserialise_tracker("some-sender", payload)
+            ),
+        }
+        assert TrackerSerialiser.loads(payload) == serialised_dialogue
+
+    for name, result in results.items():
+        report_metrics(**_metrics(name, result))
+
+    assert results["msgpack"]["size"] < results["json"]["size"]
+    assert results["msgpack"]["dumps"] * MINIMAL_SPEEDUP < results["json"]["dumps"]
@@ -0,0 +1,69 @@
+import statistics
+import time
+import uuid
+from typing import Callable, Optional
+
+import pytest
+
+from rasa.core.tracker_store import SQLTrackerStore
+from rasa.shared.core.constants import ACTION_LISTEN_NAME
+from rasa.shared.core.domain import Domain
+from rasa.shared.core.events import ActionExecuted, BotUttered, UserUttered
+from rasa.shared.core.trackers import DialogueStateTracker
+
+SNAPSHOT_INTERVAL = 100
+NUMBER_OF_MEASUREMENTS = 20
+# with snapshots a conversation with 3,000 turns is retrieved 40 to 50 times as fast
+# as without them; the margin is generous so that the test is stable on slow or
+# busy machines
+MINIMAL_SPEEDUP = 5
+
+
+async def _median_retrieve_latency(
+    number_of_turns: int, snapshot_interval: Optional[int]
+) -> float:
+    tracker_store = SQLTrackerStore(
+        Domain.empty(), host="sqlite:///", snapshot_interval=snapshot_interval
+    )
+    sender_id = uuid.uuid4().hex
+    events = []
+    for turn in range(number_of_turns):
+        events += [
+            ActionExecuted(ACTION_LISTEN_NAME, timestamp=3 * turn),
+            UserUttered(f"message {turn}", timestamp=3 * turn + 1),
+            BotUttered(f"response {turn}", timestamp=3 * turn + 2),
+        ]
+    await tracker_store.save(DialogueStateTracker.from_events(sender_id, events))
+
+    latencies = []
+    for _ in range(NUMBER_OF_MEASUREMENTS):
+        start = time.perf_counter()
+        tracker = await tracker_store.retrieve(sender_id)
+        latencies.append(time.perf_counter() - start)
+
+    assert tracker.latest_message.text == f"message {number_of_turns - 1}"
+    return statistics.median(latencies)
+
+
+@pytest.mark.timeout(600, func_only=True)
+async def test_snapshot_bounds_retrieve_latency(report_metrics: Callable[..., None]):
+    latencies = {
+        (number_of_turns, snapshot_interval): await _median_retrieve_latency(
+            number_of_turns, snapshot_interval
+        )
+        for number_of_turns in [100, 3000]
+        for snapshot_interval in [None, SNAPSHOT_INTERVAL]
+    }
+
+    report_metrics(
+        **{
+            f"retrieve_{number_of_turns}_turns_snapshot_interval_{snapshot_interval}_"
+            f"ms": round(latency * 1000, 3)
+            for (number_of_turns, snapshot_interval), latency in latencies.items()
+        }
+    )
+
+    # only the events since the snapshot are read and replayed
+    assert (
+        latencies[(3000, SNAPSHOT_INTERVAL)] * MINIMAL_SPEEDUP < latencies[(3000, None)]
+    )
@@ -0,0 +1,91 @@
+import statistics
+import time
+from typing import Callable, List, Tuple
+
+import pytest
+
+from rasa.shared.core.constants import ACTION_LISTEN_NAME
+from rasa.shared.core.domain import Domain
+from rasa.shared.core.events import (
+    ActionExecuted,
+    DefinePrevUserUtteredFeaturization,
+    Event,
+    SlotSet,
+    UserUttered,
+)
+from rasa.shared.core.trackers import DialogueStateTracker
+
+CONVERSATION_LENGTHS = [10, 100, 1_000, 5_000]
+NUMBER_OF_MEASUREMENTS = 20
+# without caching the latency grows linearly with the number of events, with
+# caching it's about the same for 10 and 5,000 events; the margins are generous
+# so that the test is stable on slow or busy machines
+MAXIMAL_LATENCY_GROWTH = 10
+LATENCY_TOLERANCE_IN_SECONDS = 0.01
+
+
+def _turn(domain: Domain, turn: int) -> List[Event]:
+    intent = domain.intents[turn % len(domain.intents)]
+    return [
+        ActionExecuted(ACTION_LISTEN_NAME),
+        UserUttered(f"message {turn}", {"name": intent}),
+        DefinePrevUserUtteredFeaturization(False),
+        SlotSet(domain.slots[turn % len(domain.slots)].name, f"value {turn}"),
+        ActionExecuted(domain.user_actions[turn % len(domain.user_actions)]),
+    ]
+
+
+def _median_turn_latency(
+    domain: Domain, number_of_events: int
+) -> Tuple[float, DialogueStateTracker]:
+    events = []
+    turn = 0
+    while len(events) < number_of_events:
+        events.extend(_turn(domain, turn))
+        turn += 1
+    tracker = DialogueStateTracker.from_events("benchmark", events, domain.slots)
+    tracker.past_states(domain)
+
+    latencies = []
+    for _ in range(NUMBER_OF_MEASUREMENTS):
+        new_events = _turn(domain, turn)
+        turn += 1
+
+        start = time.perf_counter()
+        for event in new_events:
+            tracker.update(event)
+            # policies compute the states for every prediction within a turn
+            tracker.past_states(domain)
+            tracker.past_states(domain, ignore_rule_only_turns=True)
+        latencies.append(time.perf_counter() - start)
+
+    return statistics.median(latencies), tracker
+
+
+@pytest.mark.timeout(600, func_only=True)
+def test_past_states_latency_is_independent_of_history(
+    domain: Domain, report_metrics: Callable[..., None]
+):
+    latencies = {}
+    for number_of_events in CONVERSATION_LENGTHS:
+        latency, tracker = _median_turn_latency(domain, number_of_events)
+        latencies[number_of_events] = latency
+
+        # the cached states are the same as the ones computed from scratch
+        uncached_tracker = DialogueStateTracker.from_events(
+            "benchmark", list(tracker.events), domain.slots
+        )
+        assert tracker.past_states(domain) == uncached_tracker.past_states(domain)
+
+    report_metrics(
+        **{
+            f"turn_{number_of_events}_events_ms": round(latency * 1000, 3)
+            for number_of_events, latency in latencies.items()
+        }
+    )
+
+    # the states of previous turns are cached, only copying the list of states
+    # grows with the conversation
+    shortest = latencies[min(CONVERSATION_LENGTHS)]
+    longest = latencies[max(CONVERSATION_LENGTHS)]
+    assert longest < MAXIMAL_LATENCY_GROWTH * shortest + LATENCY_TOLERANCE_IN_SECONDS
@@ -1,11 +1,13 @@
+import copy
 import json
 import logging
 import os
+import pickle
 import textwrap
 import time
 from pathlib import Path
 import tempfile
-from typing import List, Text, Dict, Any, Type
+from typing import Callable, List, Text, Dict, Any, Type
 
 import fakeredis
 import freezegun
@@ -1559,3 +1561,232 @@ def test_model_id_is_not_added_to_events_with_id():
         ActionExecuted(action_name="test", metadata={METADATA_MODEL_ID: "old_id"})
     )
     assert tracker.events[-1].metadata[METADATA_MODEL_ID] == "old_id"
+
+
+@pytest.mark.parametrize(
+    "events",
+    [
+        [
+            ActionExecuted(ACTION_LISTEN_NAME),
+            user_uttered("greet"),
+            DefinePrevUserUtteredFeaturization(False),
+            ActionExecuted("utter_greet"),
+            ActionExecuted(ACTION_LISTEN_NAME),
+            user_uttered("goodbye"),
+            EntitiesAdded([{"entity": "name", "value": "Rasa"}]),
+            ActionExecuted("utter_goodbye"),
+            ActionReverted(),
+            ActionExecuted(ACTION_LISTEN_NAME),
+            UserUtteranceReverted(),
+            ActionExecuted(ACTION_LISTEN_NAME),
+            user_uttered("greet"),
+            Restarted(),
+            ActionExecuted(ACTION_LISTEN_NAME),
+            user_uttered("greet"),
+        ],
+        [
+            # the loop is executed before it's activated for the first time
+            ActionExecuted(ACTION_LISTEN_NAME),
+            user_uttered("greet"),
+            ActionExecuted("loop"),
+            ActionExecuted(ACTION_LISTEN_NAME),
+            user_uttered("inform"),
+            ActionExecuted("loop"),
+            ActiveLoop("loop"),
+            SlotSet(REQUESTED_SLOT, "name"),
+            ActionExecuted(ACTION_LISTEN_NAME),
+            user_uttered("inform"),
+            ActionExecuted("loop"),
+            SlotSet("name", "Rasa"),
+            ActionExecuted(ACTION_LISTEN_NAME),
+            user_uttered("chitchat"),
+            ActionExecutionRejected("loop"),
+            ActionExecuted("utter_chitchat"),
+            ActionExecuted("loop"),
+            ActiveLoop(None),
+            SessionStarted(),
+            ActionExecuted(ACTION_LISTEN_NAME),
+        ],
+    ],
+)
+def test_incremental_past_states_and_applied_events(
+    domain: Domain, events: List[Event]
+):
+    tracker = DialogueStateTracker("default", domain.slots)
+
+    for event in events:
+        tracker.update(event)
+        expected = DialogueStateTracker.from_events(
+            "default", list(tracker.events), domain.slots
+        )
+
+        assert tracker.applied_events() == expected.applied_events()
+        for kwargs in [
+            {},
+            {"omit_unset_slots": True},
+            {"ignore_rule_only_turns": True},
+        ]:
+            assert tracker.past_states(
+                domain, **kwargs
+            ) == domain.states_for_tracker_history(expected, **kwargs)
+
+
+def test_incremental_past_states_with_max_event_history(domain: Domain):
+    tracker = DialogueStateTracker("default", domain.slots, max_event_history=3)
+
+    for intent in ["greet", "goodbye", "affirm", "deny"]:
+        tracker.update(ActionExecuted(ACTION_LISTEN_NAME))
+        tracker.update(user_uttered(intent))
+        expected = DialogueStateTracker.from_events(
+            "default", list(tracker.events), domain.slots
+        )
+
+        assert tracker.past_states(domain) == domain.states_for_tracker_history(
+            expected
+        )
+
+
+def test_past_states_of_previous_turns_are_cached(domain: Domain):
+    tracker = DialogueStateTracker.from_events(
+        "default",
+        [
+            ActionExecuted(ACTION_LISTEN_NAME),
+            user_uttered("greet"),
+            ActionExecuted("utter_greet"),
+        ],
+        domain.slots,
+    )
+
+    states = tracker.past_states(domain)
+    tracker.update(ActionExecuted(ACTION_LISTEN_NAME))
+    new_states = tracker.past_states(domain)
+
+    assert new_states[: len(states)] == states
+    # the state of the latest turn is created for every call
+    assert all(old is new for old, new in zip(states[:-1], new_states))
+    assert new_states == domain.states_for_tracker_history(tracker)
+
+
+def test_incremental_caches_are_locked_per_tracker(domain: Domain):
+    tracker = DialogueStateTracker.from_events(
+        "default", [ActionExecuted(ACTION_LISTEN_NAME)], domain.slots
+    )
+    other_tracker = DialogueStateTracker.from_events(
+        "other", [ActionExecuted(ACTION_LISTEN_NAME)], domain.slots
+    )
+
+    lock = tracker._incremental_caches_lock()
+
+    assert tracker._incremental_caches_lock() is lock
+    assert other_tracker._incremental_caches_lock() is not lock
+    with lock:
+        # the lock of one tracker doesn't block the other trackers
+        assert other_tracker._incremental_caches_lock().acquire(blocking=False)
+        other_tracker._incremental_caches_lock().release()
+
+
+@pytest.mark.parametrize(
+    "copy_tracker",
+    [copy.deepcopy, lambda tracker: pickle.loads(pickle.dumps(tracker))],
+)
+def test_copied_tracker_has_own_incremental_caches_lock(
+    domain: Domain,
+    copy_tracker: Callable[[DialogueStateTracker], DialogueStateTracker],
+):
+    tracker = DialogueStateTracker.from_events(
+        "default",
+        [ActionExecuted(ACTION_LISTEN_NAME), user_uttered("greet")],
+        domain.slots,
+    )
+    states = tracker.past_states(domain)
+
+    copied = copy_tracker(tracker)
+
+    assert copied._incremental_caches_lock() is not tracker._incremental_caches_lock()
+    assert copied.past_states(domain) == states
+    copied.update(ActionExecuted("utter_greet"))
+    assert copied.past_states(domain) == domain.states_for_tracker_history(copied)
+    assert tracker.past_states(domain) == states
+
+
+@pytest.mark.parametrize(
+    "copy_tracker",
+    [copy.deepcopy, lambda tracker: pickle.loads(pickle.dumps(tracker))],
+)
+def test_copied_tracker_starts_with_empty_caches(
+    domain: Domain,
+    copy_tracker: Callable[[DialogueStateTracker], DialogueStateTracker],
+):
+    tracker = DialogueStateTracker.from_events(
+        "default",
+        [ActionExecuted(ACTION_LISTEN_NAME), user_uttered("greet")],
+        domain.slots,
+    )
+    states = tracker.past_states(domain)
+    assert tracker._past_states_caches
+    assert tracker._applied_events_cache is not None
+
+    copied = copy_tracker(tracker)
+
+    assert copied._past_states_caches == {}
+    assert copied._applied_events_cache is None
+    assert copied.past_states(domain) == states
+    # copying doesn't drop the caches of the original tracker
+    assert tracker._past_states_caches
+
+
+@pytest.mark.parametrize("number_of_events", [1, 4, 9, 13])
+def test_tracker_from_snapshot_and_remaining_events(
+    domain: Domain, number_of_events: int
+):
+    events = [
+        ActionExecuted(ACTION_LISTEN_NAME),
+        user_uttered("greet"),
+        ActionExecuted("loop"),
+        ActiveLoop("loop"),
+        ActionExecuted(ACTION_LISTEN_NAME),
+        user_uttered("inform"),
+        DefinePrevUserUtteredFeaturization(True),
+        ActionExecuted("loop"),
+        SlotSet("name", "Rasa"),
+        ActionExecuted(ACTION_LISTEN_NAME),
+        user_uttered("chitchat"),
+        ActionExecutionRejected("loop"),
+        BotUttered("chitchat"),
+        ActionExecuted(ACTION_LISTEN_NAME),
+        user_uttered("goodbye"),
+        ActionExecuted("utter_goodbye"),
+        ActionReverted(),
+        ActionExecuted(ACTION_LISTEN_NAME),
+        UserUtteranceReverted(),
+    ]
+    expected = DialogueStateTracker.from_events("default", events, domain.slots)
+
+    # the snapshot is stored as JSON
+    snapshot = json.loads(json.dumps(expected.create_snapshot(number_of_events)))
+    tracker = DialogueStateTracker.from_events(
+        "default", events[number_of_events:], domain.slots, snapshot=snapshot
+    )
+
+    assert tracker.current_state() == expected.current_state()
+    assert tracker.create_snapshot() == expected.create_snapshot()
+    assert tracker.past_states(domain)[-1] == expected.past_states(domain)[-1]
+
+
+def test_events_which_reset_the_tracker_ignore_snapshot(domain: Domain):
+    tracker = DialogueStateTracker.from_events(
+        "default",
+        [ActionExecuted(ACTION_LISTEN_NAME), user_uttered("greet")],
+        domain.slots,
+        snapshot={
+            "slots": {"name": "Rasa"},
+            "latest_action": {ACTION_NAME: "utter_greet"},
+        },
+    )
+    assert tracker.get_slot("name") == "Rasa"
+
+    tracker.update(Restarted())
+    tracker.update(ActionReverted())
+
+    assert tracker.get_slot("name") is None
+    assert tracker.init_copy().get_slot("name") is None
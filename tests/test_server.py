@@ -1447,6 +1447,29 @@ async def test_put_tracker(rasa_app: SanicASGITestClient):
     assert events.deserialise_events(evts) == test_events
 
 
+async def test_get_trackers(rasa_app: SanicASGITestClient):
+    tracker_store = rasa_app.sanic_app.ctx.agent.tracker_store
+    sender_ids = [uuid.uuid4().hex for _ in range(3)]
+    for sender_id in sender_ids:
+        await tracker_store.save(
+            DialogueStateTracker.from_events(sender_id, test_events[:3])
+        )
+
+    _, response = await rasa_app.get(
+        "/conversations/trackers",
+        params={"conversation_ids": f"{sender_ids[2]},unknown,{sender_ids[0]}"},
+    )
+    assert response.status == HTTPStatus.OK
+    assert response.headers["Content-Type"] == "application/x-ndjson"
+
+    trackers = [json.loads(line) for line in response.text.splitlines()]
+    assert [tracker["sender_id"] for tracker in trackers] == [
+        sender_ids[2],
+        sender_ids[0],
+    ]
+    assert events.deserialise_events(trackers[0]["events"]) == test_events[:3]
+
+
 async def test_predict_without_conversation_id(rasa_app: SanicASGITestClient):
     _, response = await rasa_app.post("/conversations/non_existent_id/predict")
 
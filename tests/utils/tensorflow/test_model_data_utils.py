@@ -27,7 +27,7 @@ from rasa.shared.nlu.constants import (
     FEATURE_TYPE_SENTENCE,
     FEATURE_TYPE_SEQUENCE,
 )
-from rasa.utils.tensorflow.constants import SENTENCE
+from rasa.utils.tensorflow.constants import MASK, SENTENCE
 from rasa.shared.nlu.training_data.message import Message
 from rasa.shared.nlu.training_data.training_data import TrainingData
 from rasa.utils.tensorflow.model_data_utils import TAG_ID_ORIGIN
@@ -146,6 +146,49 @@ def test_surface_attributes():
     )
 
 
+def test_convert_to_data_format_with_absent_attribute():
+    intent_features = {
+        INTENT: [
+            Features(
+                features=np.random.rand(1, shape),
+                attribute=INTENT,
+                feature_type=SENTENCE,
+                origin="featurizer-a",
+            )
+        ]
+    }
+    fake_features = {
+        INTENT: model_data_utils._create_fake_features([[intent_features[INTENT]]]),
+        ACTION_NAME: model_data_utils._create_fake_features(
+            [
+                [
+                    [
+                        Features(
+                            np.random.rand(1, shape),
+                            ACTION_NAME,
+                            SENTENCE,
+                            "featurizer-b",
+                        )
+                    ]
+                ]
+            ]
+        ),
+    }
+    # dialogs of different lengths which don't contain `ACTION_NAME` features
+    dialogs = [
+        [intent_features, intent_features],
+        [intent_features, intent_features, intent_features],
+    ]
+
+    attribute_data, _ = model_data_utils.convert_to_data_format(dialogs, fake_features)
+
+    intent_masks = attribute_data[INTENT][MASK][0]
+    action_name_masks = attribute_data[ACTION_NAME][MASK][0]
+    assert [mask.shape for mask in action_name_masks] == [(2, 1), (3, 1)]
+    assert [mask.shape for mask in intent_masks] == [(2, 1), (3, 1)]
+    assert not any(np.any(mask) for mask in action_name_masks)
+
+
 def test_extract_features():
     fake_features = np.zeros(shape)
     fake_features_as_features = Features(
@@ -154,6 +154,74 @@ async def test_request_non_json_response():
         assert not response
 
 
+async def test_request_reuses_pooled_session():
+    with aioresponses() as mocked:
+        endpoint = endpoint_utils.EndpointConfig("https://example.com/")
+        mocked.post("https://example.com/test", payload={}, repeat=True)
+
+        await endpoint.request("post", subpath="test")
+        session = endpoint.pooled_session()
+        await endpoint.request("post", subpath="test")
+
+        assert endpoint.pooled_session() is session
+        assert len(latest_request(mocked, "post", "https://example.com/test")) == 2
+
+    await endpoint.close()
+    assert session.closed
+    assert endpoint.pooled_session() is not session
+
+    await endpoint.close()
+
+
+async def test_request_without_connection_pool():
+    with aioresponses() as mocked:
+        endpoint = endpoint_utils.EndpointConfig(
+            "https://example.com/", connection_pool={"enabled": False}
+        )
+        mocked.post("https://example.com/test", payload={})
+
+        await endpoint.request("post", subpath="test")
+
+        assert not endpoint._pooled_sessions
+
+
+async def test_request_session_with_connection_pool():
+    endpoint = endpoint_utils.EndpointConfig("https://example.com/")
+
+    async with endpoint.request_session() as session:
+        pass
+
+    assert not session.closed
+    assert endpoint.pooled_session() is session
+
+    await endpoint.close()
+
+
+async def test_request_session_without_connection_pool():
+    endpoint = endpoint_utils.EndpointConfig(
+        "https://example.com/", connection_pool={"enabled": False}
+    )
+
+    async with endpoint.request_session() as session:
+        assert not session.closed
+
+    assert session.closed
+    assert not endpoint._pooled_sessions
+
+
+def test_endpoint_config_connection_pool_defaults():
+    endpoint = endpoint_utils.EndpointConfig.from_dict(
+        {"url": "http://test", "connection_pool": {"limit": 10}}
+    )
+
+    assert endpoint.connection_pool == {
+        **endpoint_utils.DEFAULT_CONNECTION_POOL_CONFIG,
+        "limit": 10,
+    }
+    assert endpoint.copy().connection_pool == endpoint.connection_pool
+    assert "connection_pool" not in endpoint.kwargs
+
+
 @pytest.mark.parametrize(
     "filename, endpoint_type",
     [("data/test_endpoints/example_endpoints.yml", "tracker_store")],